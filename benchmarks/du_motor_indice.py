@@ -0,0 +1,69 @@
+"""Compara os motores de dias úteis de ``du`` em 10 milhões de pares de datas.
+
+Uso: ``python benchmarks/du_motor_indice.py [numero_de_pares]``
+
+Os pares são processados em lotes: com ``motor="polars"`` e calendário
+``"auto"``, a lista de feriados é materializada por linha e um único
+``select`` sobre 10 milhões de linhas não cabe na memória.
+"""
+
+import sys
+import time
+from collections.abc import Callable
+
+import polars as pl
+
+from pyield import du
+
+PARES_PADRAO = 10_000_000
+TAMANHO_LOTE = 250_000
+# 1990-01-01 e 2100-12-31 em dias desde 1970-01-01
+PRIMEIRO_DIA, ULTIMO_DIA = 7_305, 47_847
+
+
+def _gerar_pares(n: int) -> pl.DataFrame:
+    def amostrar(inicio: int, fim: int, semente: int) -> pl.Series:
+        valores = pl.int_range(inicio, fim, eager=True)
+        return valores.sample(n, with_replacement=True, seed=semente)
+
+    return pl.DataFrame(
+        {
+            "inicio": amostrar(PRIMEIRO_DIA, ULTIMO_DIA + 1, 1).cast(pl.Date),
+            "fim": amostrar(PRIMEIRO_DIA, ULTIMO_DIA + 1, 2).cast(pl.Date),
+            "deslocamento": amostrar(-500, 500, 3),
+        }
+    )
+
+
+def _cronometrar(df: pl.DataFrame, expr: pl.Expr) -> tuple[float, pl.Series]:
+    inicio = time.perf_counter()
+    resultados = [
+        lote.select(expr.alias("resultado")).get_column("resultado")
+        for lote in df.iter_slices(TAMANHO_LOTE)
+    ]
+    return time.perf_counter() - inicio, pl.concat(resultados)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else PARES_PADRAO
+    df = _gerar_pares(n)
+    casos: dict[str, Callable[[str], pl.Expr]] = {
+        "contar": lambda motor: du.contar_expr("inicio", "fim", motor=motor),
+        "deslocar": lambda motor: du.deslocar_expr(
+            "inicio", "deslocamento", motor=motor
+        ),
+    }
+    print(f"{n:,} pares em lotes de {TAMANHO_LOTE:,}")
+    for nome, criar_expr in casos.items():
+        t_polars, r_polars = _cronometrar(df, criar_expr("polars"))
+        t_indice, r_indice = _cronometrar(df, criar_expr("indice"))
+        # O índice devolve nulo quando o resultado sai de 1990-2100
+        iguais = (r_indice.is_null() | (r_indice == r_polars)).all()
+        print(
+            f"{nome:>8}: polars {t_polars:7.2f}s | indice {t_indice:7.2f}s | "
+            f"{t_polars / t_indice:5.1f}x | resultados iguais: {iguais}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Compara o bootstrap de ``ntnb.taxas_zero`` com a versão que reconstruía o
+DataFrame a cada vértice, sobre o painel histórico de NTN-B.
+
+Uso: ``python benchmarks/ntnb_taxas_zero.py [numero_de_datas]``
+
+Sem argumento, percorre todas as datas do painel (a versão de referência leva
+perto de um segundo por data). Com ``numero_de_datas``, usa uma amostra de
+datas igualmente espaçadas. Para cada data, as duas versões devem produzir o
+mesmo DataFrame, bit a bit.
+"""
+
+import datetime as dt
+import importlib
+import sys
+import time
+
+import polars as pl
+
+import pyield as yd
+from pyield import du
+
+ntnb = importlib.import_module("pyield.tpf.titulos.ntnb")
+utils = importlib.import_module("pyield.tpf.titulos._utils")
+
+
+def _taxas_zero_referencia(
+    data_liquidacao: dt.date, vencimentos: pl.Series, taxas: pl.Series
+) -> pl.DataFrame:
+    """Bootstrap anterior: reconstrói e filtra o DataFrame a cada vértice."""
+    liquidacao, vencimentos, taxas = ntnb._validar_entradas_taxas_zero(
+        data_liquidacao, vencimentos, taxas
+    )
+    df = ntnb._criar_df_bootstrap(liquidacao, taxas, vencimentos).with_columns(
+        cupom=pl.lit(ntnb.VALOR_CUPOM),
+        taxa_zero=pl.lit(None, dtype=pl.Float64),
+    )
+
+    def atualizar(df: pl.DataFrame, vencimento: dt.date, taxa: float):
+        return df.with_columns(
+            pl.when(pl.col("data_vencimento") == vencimento)
+            .then(taxa)
+            .otherwise("taxa_zero")
+            .alias("taxa_zero")
+        )
+
+    primeiro_vencimento = vencimentos.min()
+    for linha in df.to_dicts():
+        vencimento = linha["data_vencimento"]
+        if vencimento <= primeiro_vencimento:
+            df = atualizar(df, vencimento, linha["taxa_tir"])
+            continue
+        anteriores = ntnb.datas_pagamento(liquidacao, vencimento).to_list()[:-1]
+        df_cupons = df.filter(pl.col("data_vencimento").is_in(anteriores))
+        vp_cupons = utils.calcular_pv(
+            df_cupons["cupom"], df_cupons["taxa_zero"], df_cupons["anos_uteis"]
+        )
+        cotacao = float(ntnb.cotacao(liquidacao, vencimento, linha["taxa_tir"]))
+        fator_preco = ntnb.VALOR_FINAL / (cotacao - vp_cupons)
+        df = atualizar(df, vencimento, fator_preco ** (1 / linha["anos_uteis"]) - 1)
+
+    df = df.filter(pl.col("data_vencimento").is_in(vencimentos.to_list()))
+    return df.select(["data_vencimento", "dias_uteis", "taxa_zero"])
+
+
+def _cronometrar(funcao, paineis) -> tuple[float, list[pl.DataFrame]]:
+    inicio = time.perf_counter()
+    resultados = [
+        funcao(data, df["data_vencimento"], df["taxa_indicativa"])
+        for data, df in paineis
+    ]
+    return time.perf_counter() - inicio, resultados
+
+
+def main() -> None:
+    painel = yd.tpf.taxas_historicas(titulo="NTN-B")
+    datas = painel["data_referencia"].unique().sort()
+    if len(sys.argv) > 1:
+        n = min(int(sys.argv[1]), len(datas))
+        datas = datas.gather(
+            pl.int_range(0, n, eager=True) * (len(datas) - 1) // max(n - 1, 1)
+        )
+    paineis = [
+        (data, painel.filter(pl.col("data_referencia") == data))
+        for data in datas.to_list()
+    ]
+    total_vertices = sum(
+        len(utils.gerar_datas_pagamento(data, df["data_vencimento"].max(), 3))
+        for data, df in paineis
+    )
+    print(f"{len(paineis):,} datas, {total_vertices:,} vértices trimestrais")
+    # Aquece o calendário de dias úteis antes de cronometrar
+    du.contar(datas[0], datas[-1])
+
+    t_referencia, r_referencia = _cronometrar(_taxas_zero_referencia, paineis)
+    t_atual, r_atual = _cronometrar(ntnb.taxas_zero, paineis)
+    iguais = all(a.equals(b) for a, b in zip(r_referencia, r_atual, strict=True))
+    print(
+        f"referência {t_referencia:8.2f}s | atual {t_atual:8.2f}s | "
+        f"{t_referencia / t_atual:5.1f}x | resultados idênticos: {iguais}"
+    )
+
+
+if __name__ == "__main__":
+    main()
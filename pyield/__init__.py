@@ -15,6 +15,8 @@ from pyield.bc.sgs import ptax, ptax_serie
 from pyield.fwd import forward, forwards, forwards_expr
 from pyield.interpolador import Interpolador, interpolar
 from pyield.relogio import agora, hoje
+from pyield import rede
+from pyield import sensibilidade
 from pyield.tpf import lft, ltn, ntnb, ntnb1, ntnbp, ntnc, ntnf
 
 try:
@@ -46,7 +48,9 @@ __all__ = [
     "ntnf",
     "ptax",
     "ptax_serie",
+    "rede",
     "selic",
+    "sensibilidade",
     "tpf",
 ]
 
@@ -1,40 +1,219 @@
 """Cache com expiração por tempo (TTL) para proteger APIs externas contra
 chamadas repetidas acidentais (ex.: re-execução de célula em notebook).
+
+O cache é seguro para uso entre threads, descarta primeiro as entradas usadas
+há mais tempo (LRU), respeita um orçamento de memória em bytes e coalesce
+chamadas simultâneas com a mesma chave: enquanto a primeira busca está em
+andamento, as demais aguardam o resultado em vez de repetir a requisição.
 """
 
+import sys
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from functools import wraps
+from typing import Any, NamedTuple
+
+import polars as pl
 
 _TTL_PADRAO = 60  # segundos
 _TAMANHO_MAXIMO = 16
+_BYTES_MAXIMO = 256 * 1024**2  # por função decorada
+
+
+class CacheInfo(NamedTuple):
+    acertos: int
+    falhas: int
+    descartes: int
+    tamanho: int
+    tamanho_maximo: int
+    bytes: int
+    bytes_maximo: int
+
+
+class _SemChave(Exception):
+    """Argumento que não pode ser convertido em chave de cache."""
+
+
+class _Entrada(NamedTuple):
+    resultado: Any
+    expira_em: float
+    bytes: int
+
+
+def _congelar(valor: Any) -> Any:
+    """Converte o argumento em um valor hasheável equivalente."""
+    match valor:
+        case pl.Series():
+            return ("Series", valor.name, str(valor.dtype), tuple(valor.to_list()))
+        case pl.DataFrame():
+            colunas = tuple((nome, str(tipo)) for nome, tipo in valor.schema.items())
+            return ("DataFrame", colunas, tuple(valor.iter_rows()))
+        case list() | tuple():
+            return (type(valor).__name__, tuple(_congelar(v) for v in valor))
+        case dict():
+            itens = ((k, _congelar(v)) for k, v in valor.items())
+            return ("dict", tuple(sorted(itens, key=lambda item: repr(item[0]))))
+        case set() | frozenset():
+            return ("set", frozenset(_congelar(v) for v in valor))
+    try:
+        hash(valor)
+    except TypeError as e:
+        raise _SemChave from e
+    return valor
+
+
+def _montar_chave(args: tuple, kwargs: dict) -> tuple:
+    chave = _congelar(args), _congelar(kwargs)
+    try:
+        # Valores aninhados (ex.: listas dentro de um DataFrame) também
+        # precisam ser hasheáveis
+        hash(chave)
+    except TypeError as e:
+        raise _SemChave from e
+    return chave
+
+
+def _estimar_bytes(valor: Any) -> int:
+    """Estimativa do tamanho em memória de um resultado em cache."""
+    match valor:
+        case bytes() | bytearray() | str():
+            return len(valor)
+        case pl.DataFrame() | pl.Series():
+            return int(valor.estimated_size())
+        case list() | tuple():
+            return sys.getsizeof(valor) + sum(_estimar_bytes(v) for v in valor)
+        case dict():
+            return sys.getsizeof(valor) + sum(
+                _estimar_bytes(k) + _estimar_bytes(v) for k, v in valor.items()
+            )
+    return sys.getsizeof(valor)
+
 
+class _CacheTTL:
+    """Estado de cache de uma função decorada com :func:`ttl_cache`."""
 
-def ttl_cache(ttl: int = _TTL_PADRAO, maxsize: int = _TAMANHO_MAXIMO):
+    def __init__(self, ttl: float, maxsize: int, max_bytes: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entradas: OrderedDict[Any, _Entrada] = OrderedDict()
+        # Buscas em andamento, compartilhadas pelas chamadas simultâneas
+        self._em_andamento: dict[Any, Future] = {}
+        self._trava = threading.Lock()
+        self._zerar_contadores()
+
+    def _zerar_contadores(self) -> None:
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+        self.bytes = 0
+
+    def chamar(self, func, args: tuple, kwargs: dict):
+        try:
+            chave = _montar_chave(args, kwargs)
+        except _SemChave:
+            with self._trava:
+                self.falhas += 1
+            return func(*args, **kwargs)
+
+        with self._trava:
+            entrada = self._entradas.get(chave)
+            if entrada is not None and time.monotonic() < entrada.expira_em:
+                self._entradas.move_to_end(chave)
+                self.acertos += 1
+                return entrada.resultado
+            if entrada is not None:
+                self._remover(chave)
+            futuro = self._em_andamento.get(chave)
+            lider = futuro is None
+            if lider:
+                futuro = self._em_andamento[chave] = Future()
+                self.falhas += 1
+            else:
+                self.acertos += 1
+
+        if not lider:
+            # Outra thread já está buscando a mesma chave: aguarda o resultado
+            return futuro.result()
+
+        try:
+            resultado = func(*args, **kwargs)
+        except BaseException as e:
+            with self._trava:
+                del self._em_andamento[chave]
+            futuro.set_exception(e)
+            raise
+        with self._trava:
+            del self._em_andamento[chave]
+            self._guardar(chave, resultado)
+        futuro.set_result(resultado)
+        return resultado
+
+    def _guardar(self, chave, resultado) -> None:
+        tamanho = _estimar_bytes(resultado)
+        if tamanho > self.max_bytes:
+            return
+        if chave in self._entradas:
+            self._remover(chave)
+        expira_em = time.monotonic() + self.ttl
+        self._entradas[chave] = _Entrada(resultado, expira_em, tamanho)
+        self.bytes += tamanho
+        # Descarta as entradas usadas há mais tempo até caber nos limites
+        while len(self._entradas) > self.maxsize or self.bytes > self.max_bytes:
+            self._remover(next(iter(self._entradas)))
+            self.descartes += 1
+
+    def _remover(self, chave) -> None:
+        self.bytes -= self._entradas.pop(chave).bytes
+
+    def info(self) -> CacheInfo:
+        with self._trava:
+            return CacheInfo(
+                acertos=self.acertos,
+                falhas=self.falhas,
+                descartes=self.descartes,
+                tamanho=len(self._entradas),
+                tamanho_maximo=self.maxsize,
+                bytes=self.bytes,
+                bytes_maximo=self.max_bytes,
+            )
+
+    def limpar(self) -> None:
+        with self._trava:
+            self._entradas.clear()
+            self._zerar_contadores()
+
+
+def ttl_cache(
+    ttl: int = _TTL_PADRAO,
+    maxsize: int = _TAMANHO_MAXIMO,
+    max_bytes: int = _BYTES_MAXIMO,
+):
     """Decorador de cache com expiração por tempo.
 
+    A função decorada ganha ``cache_info()``, com acertos, falhas, descartes
+    e ocupação do cache, e ``cache_clear()``, que esvazia o cache e zera os
+    contadores. Argumentos não hasheáveis como listas, dicionários e
+    ``pl.Series`` são convertidos em chave pelo conteúdo.
+
     Args:
         ttl: Tempo de vida de cada entrada em segundos.
         maxsize: Número máximo de entradas no cache.
+        max_bytes: Memória máxima estimada ocupada pelos resultados. Um
+            resultado maior que esse limite é devolvido, mas não guardado.
     """
 
     def decorador(func):
-        _cache: dict = {}
+        cache = _CacheTTL(ttl, maxsize, max_bytes)
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            chave = (args, tuple(sorted(kwargs.items())))
-            agora = time.monotonic()
-            if chave in _cache:
-                resultado, expira_em = _cache[chave]
-                if agora < expira_em:
-                    return resultado
-            resultado = func(*args, **kwargs)
-            _cache[chave] = (resultado, agora + ttl)
-            # Remove entrada mais antiga quando excede o tamanho máximo
-            if len(_cache) > maxsize:
-                _cache.pop(next(iter(_cache)))
-            return resultado
+            return cache.chamar(func, args, kwargs)
 
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.limpar
         return wrapper
 
     return decorador
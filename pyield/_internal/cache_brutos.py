@@ -0,0 +1,442 @@
+"""Cache persistente de downloads brutos (ZIPs, CSVs e planilhas das fontes).
+
+Arquivos publicados para datas passadas não mudam: com o cache ativo, cada um
+é baixado uma única vez e reaproveitado entre processos. Entradas de datas
+passadas nunca expiram; as de hoje (ou sem data, como a "publicação mais
+recente") valem por ``ttl_hoje`` segundos. O total ocupado é limitado por
+``bytes_maximo``, descartando primeiro as entradas acessadas há mais tempo.
+
+O armazenamento é endereçado por conteúdo: cada arquivo é guardado pelo seu
+SHA-256, e as entradas ``fonte/data/variante`` apontam para esse hash. Assim,
+conteúdos idênticos ocupam espaço uma única vez, e um arquivo corrompido em
+disco é detectado na leitura e baixado de novo.
+
+O cache fica ativo quando ``PYIELD_CACHE_DIR`` está definida, em
+``PYIELD_CACHE_DIR/brutos`` (arquivos) ou ``PYIELD_CACHE_DIR/brutos.sqlite3``
+se ``PYIELD_CACHE_BACKEND=sqlite``. :func:`configurar` permite escolher o
+backend e os limites diretamente.
+"""
+
+import contextlib
+import datetime as dt
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from functools import cache
+from pathlib import Path
+from typing import NamedTuple, Protocol
+
+from pyield import relogio
+from pyield._internal.data_cache import VARIAVEL_DIRETORIO_CACHE
+
+VARIAVEL_BACKEND = "PYIELD_CACHE_BACKEND"
+_TTL_HOJE = 3_600  # segundos
+_BYTES_MAXIMO = 2 * 1024**3
+# Ao exceder o limite, libera espaço até esta fração dele
+_FRACAO_APOS_LIMPEZA = 0.9
+
+registro = logging.getLogger(__name__)
+
+
+class Entrada(NamedTuple):
+    chave: str
+    digest: str
+    tamanho: int
+    gravado_em: float
+    acessado_em: float
+
+
+class Backend(Protocol):
+    """Armazenamento de conteúdos por SHA-256 e das entradas que os apontam."""
+
+    def ler(self, chave: str) -> tuple[bytes, Entrada] | None: ...
+
+    def gravar(self, chave: str, conteudo: bytes, digest: str) -> None: ...
+
+    def remover(self, chave: str) -> None: ...
+
+    def entradas(self) -> list[Entrada]: ...
+
+    def tamanho_total(self) -> int: ...
+
+
+def _gravar_atomicamente(caminho: Path, conteudo: bytes) -> None:
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    descritor, temporario = tempfile.mkstemp(dir=caminho.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(descritor, "wb") as arquivo:
+            arquivo.write(conteudo)
+        Path(temporario).replace(caminho)
+    except BaseException:
+        Path(temporario).unlink(missing_ok=True)
+        raise
+
+
+def _ler_entrada(caminho: Path) -> Entrada | None:
+    try:
+        dados = json.loads(caminho.read_text(encoding="utf-8"))
+        return Entrada(acessado_em=caminho.stat().st_mtime, **dados)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+class BackendArquivos:
+    """Backend em diretório: ``objetos/<hash>`` e ``entradas/<hash da chave>``.
+
+    O horário do último acesso de cada entrada é o ``mtime`` do seu arquivo
+    de metadados, atualizado a cada leitura. As referências a cada objeto e o
+    tamanho total ficam num índice em memória, montado na primeira gravação ou
+    remoção e atualizado a cada uma delas: gravações de outros processos no
+    mesmo diretório só entram no índice de uma nova instância.
+    """
+
+    def __init__(self, diretorio: str | os.PathLike[str]) -> None:
+        self.diretorio = Path(diretorio).expanduser()
+        self._objetos = self.diretorio / "objetos"
+        self._entradas = self.diretorio / "entradas"
+        self._trava = threading.Lock()
+        self._referencias: Counter[str] | None = None
+        self._tamanhos: dict[str, int] = {}
+        self._total = 0
+
+    def _carregar_indice(self) -> Counter[str]:
+        # Chamado com a trava: varre o diretório uma única vez por instância
+        if self._referencias is None:
+            self._referencias = Counter(e.digest for e in self.entradas())
+            objetos = self._objetos.glob("*/*") if self._objetos.exists() else []
+            self._tamanhos = {
+                p.name: p.stat().st_size for p in objetos if not p.name.startswith(".")
+            }
+            self._total = sum(self._tamanhos.values())
+        return self._referencias
+
+    def _liberar(self, digest: str) -> None:
+        # O objeto só sai quando nenhuma outra entrada aponta para ele
+        referencias = self._carregar_indice()
+        referencias[digest] -= 1
+        if referencias[digest] > 0:
+            return
+        del referencias[digest]
+        self._caminho_objeto(digest).unlink(missing_ok=True)
+        self._total -= self._tamanhos.pop(digest, 0)
+
+    def _caminho_objeto(self, digest: str) -> Path:
+        return self._objetos / digest[:2] / digest
+
+    def _caminho_entrada(self, chave: str) -> Path:
+        nome = hashlib.sha256(chave.encode()).hexdigest()
+        return self._entradas / f"{nome}.json"
+
+    def ler(self, chave: str) -> tuple[bytes, Entrada] | None:
+        caminho = self._caminho_entrada(chave)
+        entrada = _ler_entrada(caminho)
+        if entrada is None:
+            return None
+        try:
+            conteudo = self._caminho_objeto(entrada.digest).read_bytes()
+            agora = time.time()
+            os.utime(caminho, (agora, agora))
+        except OSError:
+            return None
+        return conteudo, entrada
+
+    def gravar(self, chave: str, conteudo: bytes, digest: str) -> None:
+        with self._trava:
+            referencias = self._carregar_indice()
+            caminho = self._caminho_entrada(chave)
+            anterior = _ler_entrada(caminho)
+            # Regrava o objeto mesmo se existir: substitui uma cópia corrompida
+            _gravar_atomicamente(self._caminho_objeto(digest), conteudo)
+            agora = time.time()
+            dados = {
+                "chave": chave,
+                "digest": digest,
+                "tamanho": len(conteudo),
+                "gravado_em": agora,
+            }
+            _gravar_atomicamente(caminho, json.dumps(dados).encode())
+            os.utime(caminho, (agora, agora))
+
+            referencias[digest] += 1
+            self._total += len(conteudo) - self._tamanhos.get(digest, 0)
+            self._tamanhos[digest] = len(conteudo)
+            if anterior is not None:
+                self._liberar(anterior.digest)
+
+    def remover(self, chave: str) -> None:
+        with self._trava:
+            self._carregar_indice()
+            caminho = self._caminho_entrada(chave)
+            entrada = _ler_entrada(caminho)
+            caminho.unlink(missing_ok=True)
+            if entrada is not None:
+                self._liberar(entrada.digest)
+
+    def entradas(self) -> list[Entrada]:
+        if not self._entradas.exists():
+            return []
+        lidas = (_ler_entrada(p) for p in self._entradas.glob("*.json"))
+        return [entrada for entrada in lidas if entrada is not None]
+
+    def tamanho_total(self) -> int:
+        with self._trava:
+            self._carregar_indice()
+            return self._total
+
+
+class BackendSQLite:
+    """Backend em um único arquivo SQLite, com tabelas de objetos e entradas.
+
+    O tamanho total dos objetos fica na tabela ``totais``, atualizada a cada
+    gravação e remoção, para não somar todos os conteúdos a cada consulta.
+    """
+
+    def __init__(self, caminho: str | os.PathLike[str]) -> None:
+        self.caminho = Path(caminho).expanduser()
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        with self._conectar() as conexao:
+            conexao.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS objetos (
+                    digest TEXT PRIMARY KEY,
+                    conteudo BLOB NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS entradas (
+                    chave TEXT PRIMARY KEY,
+                    digest TEXT NOT NULL,
+                    tamanho INTEGER NOT NULL,
+                    gravado_em REAL NOT NULL,
+                    acessado_em REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS entradas_digest ON entradas (digest);
+                CREATE TABLE IF NOT EXISTS totais (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    bytes INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO totais
+                SELECT 0, COALESCE(SUM(LENGTH(conteudo)), 0) FROM objetos;
+                """
+            )
+
+    @contextlib.contextmanager
+    def _conectar(self) -> Iterator[sqlite3.Connection]:
+        # Uma conexão por operação: o backend pode ser usado por várias threads
+        conexao = sqlite3.connect(self.caminho, timeout=30)
+        try:
+            with conexao:
+                yield conexao
+        finally:
+            conexao.close()
+
+    def ler(self, chave: str) -> tuple[bytes, Entrada] | None:
+        with self._conectar() as conexao:
+            linha = conexao.execute(
+                """
+                SELECT e.chave, e.digest, e.tamanho, e.gravado_em, e.acessado_em,
+                       o.conteudo
+                FROM entradas e JOIN objetos o ON o.digest = e.digest
+                WHERE e.chave = ?
+                """,
+                (chave,),
+            ).fetchone()
+            if linha is None:
+                return None
+            conexao.execute(
+                "UPDATE entradas SET acessado_em = ? WHERE chave = ?",
+                (time.time(), chave),
+            )
+        return bytes(linha[5]), Entrada(*linha[:5])
+
+    def gravar(self, chave: str, conteudo: bytes, digest: str) -> None:
+        agora = time.time()
+        with self._conectar() as conexao:
+            anterior = conexao.execute(
+                "SELECT digest FROM entradas WHERE chave = ?", (chave,)
+            ).fetchone()
+            linha = conexao.execute(
+                "SELECT LENGTH(conteudo) FROM objetos WHERE digest = ?", (digest,)
+            ).fetchone()
+            variacao = len(conteudo) - (linha[0] if linha is not None else 0)
+            conexao.execute(
+                "INSERT OR REPLACE INTO objetos (digest, conteudo) VALUES (?, ?)",
+                (digest, conteudo),
+            )
+            conexao.execute(
+                "INSERT OR REPLACE INTO entradas VALUES (?, ?, ?, ?, ?)",
+                (chave, digest, len(conteudo), agora, agora),
+            )
+            conexao.execute(
+                "UPDATE totais SET bytes = bytes + ? WHERE id = 0", (variacao,)
+            )
+            if anterior is not None:
+                self._liberar(conexao, anterior[0])
+
+    def remover(self, chave: str) -> None:
+        with self._conectar() as conexao:
+            linha = conexao.execute(
+                "SELECT digest FROM entradas WHERE chave = ?", (chave,)
+            ).fetchone()
+            if linha is not None:
+                conexao.execute("DELETE FROM entradas WHERE chave = ?", (chave,))
+                self._liberar(conexao, linha[0])
+
+    @staticmethod
+    def _liberar(conexao: sqlite3.Connection, digest: str) -> None:
+        # O objeto só sai quando nenhuma outra entrada aponta para ele
+        if conexao.execute(
+            "SELECT 1 FROM entradas WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone():
+            return
+        linha = conexao.execute(
+            "SELECT LENGTH(conteudo) FROM objetos WHERE digest = ?", (digest,)
+        ).fetchone()
+        if linha is None:
+            return
+        conexao.execute("DELETE FROM objetos WHERE digest = ?", (digest,))
+        conexao.execute("UPDATE totais SET bytes = bytes - ? WHERE id = 0", linha)
+
+    def entradas(self) -> list[Entrada]:
+        with self._conectar() as conexao:
+            linhas = conexao.execute(
+                "SELECT chave, digest, tamanho, gravado_em, acessado_em FROM entradas"
+            ).fetchall()
+        return [Entrada(*linha) for linha in linhas]
+
+    def tamanho_total(self) -> int:
+        with self._conectar() as conexao:
+            (total,) = conexao.execute(
+                "SELECT bytes FROM totais WHERE id = 0"
+            ).fetchone()
+        return total
+
+
+class _Configuracao(NamedTuple):
+    backend: Backend | None
+    bytes_maximo: int
+    ttl_hoje: float
+
+
+# None: segue as variáveis de ambiente a cada chamada
+_configuracao: _Configuracao | None = None
+
+
+def configurar(
+    backend: Backend | None = None,
+    *,
+    bytes_maximo: int = _BYTES_MAXIMO,
+    ttl_hoje: float = _TTL_HOJE,
+) -> None:
+    """Define o backend e os limites do cache de downloads brutos.
+
+    Args:
+        backend: :class:`BackendArquivos`, :class:`BackendSQLite` ou None para
+            desativar o cache.
+        bytes_maximo: Tamanho máximo do cache, em bytes. Padrão: 2 GiB.
+        ttl_hoje: Validade, em segundos, das entradas de hoje ou sem data.
+            Padrão: 1 hora.
+    """
+    global _configuracao  # noqa: PLW0603
+    _configuracao = _Configuracao(backend, bytes_maximo, ttl_hoje)
+
+
+def restaurar_padrao() -> None:
+    """Volta a configurar o cache pelas variáveis de ambiente."""
+    global _configuracao  # noqa: PLW0603
+    _configuracao = None
+
+
+@cache
+def _backend_padrao(tipo: str, diretorio: Path) -> Backend:
+    if tipo == "sqlite":
+        return BackendSQLite(diretorio / "brutos.sqlite3")
+    return BackendArquivos(diretorio / "brutos")
+
+
+def _configuracao_atual() -> _Configuracao:
+    if _configuracao is not None:
+        return _configuracao
+    diretorio = os.environ.get(VARIAVEL_DIRETORIO_CACHE, "").strip()
+    if not diretorio:
+        return _Configuracao(None, _BYTES_MAXIMO, _TTL_HOJE)
+    tipo = os.environ.get(VARIAVEL_BACKEND, "").strip().lower()
+    backend = _backend_padrao(tipo, Path(diretorio).expanduser())
+    return _Configuracao(backend, _BYTES_MAXIMO, _TTL_HOJE)
+
+
+def _montar_chave(fonte: str, data: dt.date | None, variante: str) -> str:
+    referencia = data.isoformat() if data is not None else "recente"
+    return f"{fonte}/{referencia}/{variante}"
+
+
+def _aplicar_limite(backend: Backend, bytes_maximo: int) -> None:
+    if backend.tamanho_total() <= bytes_maximo:
+        return
+    # Libera uma folga abaixo do limite: as gravações seguintes não precisam
+    # listar e ordenar todas as entradas de novo
+    alvo = int(bytes_maximo * _FRACAO_APOS_LIMPEZA)
+    for entrada in sorted(backend.entradas(), key=lambda e: e.acessado_em):
+        if backend.tamanho_total() <= alvo:
+            break
+        backend.remover(entrada.chave)
+
+
+def buscar(
+    fonte: str,
+    data: dt.date | None,
+    baixar: Callable[[], bytes],
+    *,
+    variante: str = "",
+    validar: Callable[[bytes], bool] | None = None,
+) -> bytes:
+    """Devolve o conteúdo do cache ou baixa, guarda e devolve.
+
+    Args:
+        fonte: Identificador da fonte (ex.: ``"b3_boletim"``).
+        data: Data de referência do arquivo. None para publicações sem data
+            (ex.: a mais recente), tratadas como dados de hoje.
+        baixar: Função que baixa o conteúdo bruto.
+        variante: Complemento da chave para arquivos distintos da mesma fonte
+            e data (ex.: formato completo ou simplificado).
+        validar: Função aplicada ao conteúdo recém-baixado; se devolver False,
+            o conteúdo é retornado, mas não é guardado.
+
+    Returns:
+        Conteúdo bruto. Conteúdo vazio nunca é guardado.
+    """
+    configuracao = _configuracao_atual()
+    backend = configuracao.backend
+    if backend is None:
+        return baixar()
+
+    chave = _montar_chave(fonte, data, variante)
+    historico = data is not None and data < relogio.hoje()
+    try:
+        lido = backend.ler(chave)
+    except Exception:
+        registro.warning("Falha ao ler %s do cache de brutos", chave, exc_info=True)
+        lido = None
+    if lido is not None:
+        conteudo, entrada = lido
+        integro = hashlib.sha256(conteudo).hexdigest() == entrada.digest
+        valido = historico or time.time() - entrada.gravado_em < configuracao.ttl_hoje
+        if integro and valido:
+            return conteudo
+        if not integro:
+            registro.warning("Conteúdo corrompido no cache de brutos: %s", chave)
+
+    conteudo = baixar()
+    if not conteudo or (validar is not None and not validar(conteudo)):
+        return conteudo
+    try:
+        backend.gravar(chave, conteudo, hashlib.sha256(conteudo).hexdigest())
+        _aplicar_limite(backend, configuracao.bytes_maximo)
+    except Exception:
+        registro.warning("Falha ao gravar %s no cache de brutos", chave, exc_info=True)
+    return conteudo
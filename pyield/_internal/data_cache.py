@@ -1,15 +1,22 @@
-import functools
+import json
 import logging
+import os
+import tempfile
+import threading
 from enum import Enum
+from pathlib import Path
 from typing import Literal
 
 import polars as pl
 import requests
 
-from pyield._internal.retry import retry_padrao
+from pyield._internal import transporte
 from pyield.relogio import agora
 
 URL_BASE = "https://github.com/crdcj/pyield-data/releases/latest/download"
+# Diretório opcional para persistir os datasets entre processos
+VARIAVEL_DIRETORIO_CACHE = "PYIELD_CACHE_DIR"
+_HTTP_NAO_MODIFICADO = 304
 registro = logging.getLogger(__name__)
 
 
@@ -40,7 +47,6 @@ def _validar_id_dataset(id_dataset: str) -> _Dataset:
         raise ValueError(msg) from e
 
 
-@retry_padrao
 def _carregar_arquivo_github(url_arquivo: str) -> pl.DataFrame:
     """
     Baixa o arquivo usando requests e lê com Polars.
@@ -48,23 +54,114 @@ def _carregar_arquivo_github(url_arquivo: str) -> pl.DataFrame:
     sem precisar da dependência pesada do PyArrow.
     """
     # 1. Baixa os bytes usando requests (já lida com redirects e proxies do sistema)
-    # Adicionando timeout para não travar o processo indefinidamente
-    response = requests.get(url_arquivo, timeout=10)
-
-    # Garante que a requisição foi sucesso (200 OK), senão levanta erro
-    response.raise_for_status()
+    # Adicionando timeout para não travar o processo indefinidamente.
+    # O transporte já levanta erro se a requisição não tiver sucesso (200 OK).
+    response = transporte.get(url_arquivo, timeout=10)
 
     # 2. O Polars lê o buffer como se fosse um arquivo local
     return pl.read_parquet(response.content)
 
 
-@functools.lru_cache(maxsize=8)
-def _obter_dataset_com_ttl(id_dataset: str, chave_data: str) -> pl.DataFrame:
-    _ = chave_data
+def _obter_diretorio_cache() -> Path | None:
+    """Retorna o diretório de cache em disco, se configurado por variável."""
+    diretorio = os.environ.get(VARIAVEL_DIRETORIO_CACHE, "").strip()
+    if not diretorio:
+        return None
+    return Path(diretorio).expanduser()
+
+
+def _baixar_condicional(
+    url_arquivo: str, cabecalhos: dict[str, str]
+) -> requests.Response:
+    """Faz o GET condicional; a resposta pode ser 200 ou 304 (não modificado)."""
+    response = transporte.get(url_arquivo, headers=cabecalhos, timeout=10)
+    return response
+
+
+def _gravar_atomicamente(caminho: Path, conteudo: bytes) -> None:
+    """Grava via arquivo temporário e renomeação, sem expor arquivo parcial."""
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    descritor, temporario = tempfile.mkstemp(dir=caminho.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(descritor, "wb") as arquivo:
+            arquivo.write(conteudo)
+        Path(temporario).replace(caminho)
+    except BaseException:
+        Path(temporario).unlink(missing_ok=True)
+        raise
+
+
+def _ler_metadados(caminho: Path) -> dict[str, str]:
+    try:
+        return json.loads(caminho.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _sincronizar_arquivo_local(
+    config: _Dataset, diretorio: Path, chave_data: str
+) -> Path:
+    """Garante uma cópia local atualizada do dataset e retorna seu caminho.
+
+    A cópia é revalidada no máximo uma vez por dia com GET condicional
+    (``If-None-Match``/``If-Modified-Since``): o arquivo só é baixado de novo
+    se o servidor indicar mudança. Se a revalidação falhar e houver cópia
+    local, ela é usada mesmo desatualizada.
+    """
+    arquivo = diretorio / config.nome_arquivo
+    arquivo_metadados = arquivo.with_name(f"{arquivo.name}.json")
+    metadados = _ler_metadados(arquivo_metadados) if arquivo.exists() else {}
+    if metadados.get("verificado_em") == chave_data:
+        return arquivo
+
+    cabecalhos = {}
+    if etag := metadados.get("etag"):
+        cabecalhos["If-None-Match"] = etag
+    if ultima_modificacao := metadados.get("last_modified"):
+        cabecalhos["If-Modified-Since"] = ultima_modificacao
+
+    url_completa = f"{URL_BASE}/{config.nome_arquivo}"
+    try:
+        response = _baixar_condicional(url_completa, cabecalhos)
+    except Exception:
+        if not arquivo.exists():
+            raise
+        registro.warning(
+            "Falha ao revalidar %s; usando a cópia local em %s",
+            config.descricao,
+            arquivo,
+        )
+        return arquivo
+
+    if response.status_code != _HTTP_NAO_MODIFICADO:
+        _gravar_atomicamente(arquivo, response.content)
+        metadados = {
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+        }
+    metadados["verificado_em"] = chave_data
+    _gravar_atomicamente(arquivo_metadados, json.dumps(metadados).encode())
+    return arquivo
+
+
+# Um único DataFrame por dataset, compartilhado entre chamadas: ao virar o dia,
+# a versão anterior é descartada em vez de ficar retida ao lado da nova.
+_datasets_em_memoria: dict[str, tuple[str, pl.DataFrame]] = {}
+_trava_datasets = threading.Lock()
+# Uma trava de carga por dataset: threads concorrentes não baixam o mesmo
+# arquivo, e a carga de um dataset não bloqueia os demais
+_travas_carga = {dataset: threading.Lock() for dataset in _Dataset}
+
+
+def _carregar_dataset(id_dataset: str, chave_data: str) -> pl.DataFrame:
     config = _validar_id_dataset(id_dataset)
     url_completa = f"{URL_BASE}/{config.nome_arquivo}"
+    diretorio = _obter_diretorio_cache()
     try:
-        return _carregar_arquivo_github(url_completa)
+        if diretorio is None:
+            return _carregar_arquivo_github(url_completa)
+        arquivo = _sincronizar_arquivo_local(config, diretorio, chave_data)
+        return pl.scan_parquet(arquivo).collect()
     except Exception:
         registro.exception(
             "Erro ao carregar dataset '%s' de %s", id_dataset, url_completa
@@ -72,12 +169,88 @@ def _obter_dataset_com_ttl(id_dataset: str, chave_data: str) -> pl.DataFrame:
         raise
 
 
+def _obter_dataset_com_ttl(id_dataset: str, chave_data: str) -> pl.DataFrame:
+    with _travas_carga[_validar_id_dataset(id_dataset)]:
+        with _trava_datasets:
+            em_cache = _datasets_em_memoria.get(id_dataset)
+        if em_cache is not None and em_cache[0] == chave_data:
+            return em_cache[1]
+        df = _carregar_dataset(id_dataset, chave_data)
+        # A versão anterior só é substituída depois que a nova foi carregada
+        with _trava_datasets:
+            _datasets_em_memoria[id_dataset] = (chave_data, df)
+        return df
+
+
+def limpar_datasets_em_memoria() -> None:
+    """Descarta os datasets mantidos em memória (o cache em disco é mantido)."""
+    with _trava_datasets:
+        _datasets_em_memoria.clear()
+
+
+def memoria_datasets() -> dict[str, int]:
+    """Retorna o tamanho estimado, em bytes, de cada dataset mantido em memória.
+
+    Como os DataFrames são compartilhados entre as chamadas, o total é a
+    memória efetivamente retida pelo cache, independentemente de quantas
+    vezes os datasets foram consultados.
+
+    Returns:
+        Dicionário ``{id_dataset: bytes}`` apenas com os datasets carregados.
+    """
+    with _trava_datasets:
+        return {
+            id_dataset: df.estimated_size()
+            for id_dataset, (_, df) in _datasets_em_memoria.items()
+        }
+
+
 def obter_dataset_cacheado(id_dataset: IdDataset) -> pl.DataFrame:
     """
     Obtém um dataset pelo ID. Cache expira diariamente.
 
+    O DataFrame retornado é compartilhado por todas as chamadas, sem cópia, e
+    deve ser tratado como somente leitura: operações Polars usuais já retornam
+    novos DataFrames, mas métodos que alteram o objeto no lugar (ex.:
+    ``insert_column``, ``extend`` ou atribuição de coluna) afetariam os demais
+    consumidores. Nesses casos, use ``.clone()``, que também não copia os dados.
+
+    Se a variável de ambiente ``PYIELD_CACHE_DIR`` estiver definida, o arquivo
+    parquet é mantido nesse diretório e compartilhado entre processos: cada
+    processo revalida a cópia local no máximo uma vez por dia com GET
+    condicional e só baixa o arquivo de novo quando ele muda no servidor.
+
+    Args:
+        id_dataset: "tpf" ou "futuro"
+    """
+    return _obter_dataset_com_ttl(id_dataset.lower(), _obter_chave_data_hoje())
+
+
+def obter_dataset_lazy(id_dataset: IdDataset) -> pl.LazyFrame:
+    """
+    Obtém um dataset pelo ID como ``LazyFrame``, sem materializá-lo.
+
+    Com ``PYIELD_CACHE_DIR`` definida, o ``LazyFrame`` lê diretamente o
+    parquet local (revalidado como em ``obter_dataset_cacheado``): filtros e
+    projeções aplicados antes do ``collect`` são empurrados para a leitura e
+    usam as estatísticas dos row groups, de modo que só as partes relevantes
+    do arquivo são decodificadas. Sem o diretório, não há arquivo a varrer e
+    o ``LazyFrame`` é construído sobre o dataset em memória.
+
     Args:
         id_dataset: "tpf" ou "futuro"
     """
-    df = _obter_dataset_com_ttl(id_dataset.lower(), _obter_chave_data_hoje())
-    return df.clone()
+    chave_data = _obter_chave_data_hoje()
+    diretorio = _obter_diretorio_cache()
+    if diretorio is None:
+        return _obter_dataset_com_ttl(id_dataset.lower(), chave_data).lazy()
+
+    config = _validar_id_dataset(id_dataset)
+    try:
+        arquivo = _sincronizar_arquivo_local(config, diretorio, chave_data)
+    except Exception:
+        registro.exception(
+            "Erro ao sincronizar dataset '%s' em %s", id_dataset, diretorio
+        )
+        raise
+    return pl.scan_parquet(arquivo)
@@ -55,3 +55,43 @@ def truncar(
     if isinstance(values, pl.Series):
         return values.truncate(decimals)
     return float(truncar_decimal(values, decimals))
+
+
+def truncar_expr(expr: pl.Expr | str, decimals: int) -> pl.Expr:
+    """Trunca uma expressão de floats em direção a zero com exatidão decimal.
+
+    Equivale a aplicar ``truncar`` elemento a elemento: o truncamento é feito
+    sobre a representação decimal mais curta de cada float (a mesma de
+    ``str(x)``), e não sobre ``x * 10**decimals``, que sofre erro de
+    arredondamento binário (ex.: ``0.29`` viraria ``0.28``).
+
+    Args:
+        expr: Nome de coluna ou expressão Polars com valores Float64.
+        decimals: Quantidade de casas decimais, maior ou igual a zero.
+
+    Returns:
+        pl.Expr: Expressão Float64 truncada. Valores nulos, NaN e infinitos são
+            preservados.
+
+    Examples:
+        >>> df = pl.DataFrame({"x": [0.29, -3.14159, 9.7e-06, float("nan"), None]})
+        >>> df.select(truncar_expr("x", 2))["x"].to_list()
+        [0.29, -3.14, 0.0, nan, None]
+    """
+    if decimals < 0:
+        raise ValueError("decimals must be non-negative")
+
+    if isinstance(expr, str):
+        expr = pl.col(expr)
+    texto = expr.cast(pl.Float64).cast(pl.String)
+    # Floats pequenos são formatados em notação científica (ex.: "9.7e-6"):
+    # o Decimal com escala ampla os reescreve em notação posicional.
+    texto = (
+        pl.when(texto.str.contains("e", literal=True))
+        .then(texto.str.to_decimal(scale=30).cast(pl.String))
+        .otherwise(texto)
+    )
+    truncado = texto.str.extract(rf"^(-?\d+(?:\.\d{{0,{decimals}}})?)").cast(pl.Float64)
+    # NaN, infinitos e floats grandes demais para o Decimal já são inteiros
+    # ou não têm casas a truncar.
+    return pl.coalesce(truncado, expr)
@@ -0,0 +1,239 @@
+"""Transporte HTTP compartilhado pelos módulos que buscam dados externos.
+
+Cada host tem sua própria ``requests.Session``, com pool de conexões
+keep-alive: consultas seguidas ao mesmo host (ex.: várias datas da ANBIMA ou
+várias séries do SGS) reaproveitam a conexão TCP/TLS em vez de abrir uma nova
+a cada chamada. Sobre a sessão ficam o limite de taxa opcional por host
+(token bucket), a política de :func:`retry_padrao` e métricas de uso.
+
+As sessões não guardam cookies entre chamadas, como ``requests.get``: cookies
+recebidos valem só para os redirecionamentos da própria requisição.
+
+:func:`configurar`, :func:`metricas` e :func:`fechar` são públicas em
+``pyield.rede``.
+
+Uso típico nos módulos de busca::
+
+    resposta = transporte.get(url, timeout=10)  # já com raise_for_status
+    transporte.configurar("api.bcb.gov.br", requisicoes_por_segundo=5)
+    transporte.metricas()  # requisições, conexões e latência por host
+"""
+
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+
+import polars as pl
+import requests
+from requests.adapters import HTTPAdapter
+
+from pyield._internal.retry import retry_padrao
+
+# Conexões mantidas abertas por host (padrão do requests.Session)
+_TAMANHO_POOL_PADRAO = 10
+
+
+class _BaldeTokens:
+    """Limite de taxa por token bucket: ``rajada`` requisições imediatas e,
+    depois, no máximo ``taxa`` requisições por segundo."""
+
+    def __init__(self, taxa: float, rajada: int) -> None:
+        self.taxa = taxa
+        self.rajada = rajada
+        self._tokens = float(rajada)
+        self._atualizado = time.monotonic()
+        self._trava = threading.Lock()
+
+    def aguardar(self) -> None:
+        with self._trava:
+            agora = time.monotonic()
+            decorrido = agora - self._atualizado
+            self._tokens = min(self.rajada, self._tokens + decorrido * self.taxa)
+            self._atualizado = agora
+            # O token é reservado já aqui (saldo pode ficar negativo), de modo
+            # que threads concorrentes esperam em fila, e não todas juntas.
+            self._tokens -= 1
+            espera = -self._tokens / self.taxa if self._tokens < 0 else 0.0
+        if espera > 0:
+            time.sleep(espera)
+
+
+class _Host:
+    """Sessão, limite de taxa e métricas de um host."""
+
+    def __init__(self, tamanho_pool: int) -> None:
+        self.sessao = requests.Session()
+        # Nenhum domínio permitido: a sessão não guarda cookies entre chamadas
+        self.sessao.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self.balde: _BaldeTokens | None = None
+        self.requisicoes = 0
+        self.falhas = 0
+        self.latencia_total = 0.0
+        self.latencia_maxima = 0.0
+        # Conexões abertas por adaptadores já substituídos em montar_pool
+        self._conexoes_anteriores = 0
+        self._trava = threading.Lock()
+        self.montar_pool(tamanho_pool)
+
+    def montar_pool(self, tamanho_pool: int) -> None:
+        if self.sessao.adapters:
+            self._conexoes_anteriores = self.conexoes_abertas()
+        self.tamanho_pool = tamanho_pool
+        adaptador = HTTPAdapter(pool_maxsize=tamanho_pool)
+        self.sessao.mount("https://", adaptador)
+        self.sessao.mount("http://", adaptador)
+
+    def registrar(self, latencia: float, falhou: bool) -> None:
+        with self._trava:
+            self.requisicoes += 1
+            self.falhas += falhou
+            self.latencia_total += latencia
+            self.latencia_maxima = max(self.latencia_maxima, latencia)
+
+    def conexoes_abertas(self) -> int:
+        # Cada pool do urllib3 conta as conexões que precisou criar; as
+        # demais requisições reaproveitaram uma conexão já aberta.
+        total = self._conexoes_anteriores
+        for adaptador in set(self.sessao.adapters.values()):
+            pools = adaptador.poolmanager.pools
+            total += sum(pools[chave].num_connections for chave in pools.keys())
+        return total
+
+
+_hosts: dict[str, _Host] = {}
+_trava_hosts = threading.Lock()
+
+
+def _nome_host(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def _obter_host(nome: str) -> _Host:
+    with _trava_hosts:
+        if nome not in _hosts:
+            _hosts[nome] = _Host(_TAMANHO_POOL_PADRAO)
+        return _hosts[nome]
+
+
+def configurar(
+    host: str,
+    *,
+    tamanho_pool: int | None = None,
+    requisicoes_por_segundo: float | None = None,
+    rajada: int = 1,
+) -> None:
+    """Ajusta o pool de conexões e o limite de taxa de um host.
+
+    Args:
+        host: Nome do host, com a porta se não for a padrão
+            (ex.: ``"api.bcb.gov.br"``).
+        tamanho_pool: Número máximo de conexões mantidas abertas para o host.
+            Se None (padrão), mantém o valor atual (inicialmente 10).
+        requisicoes_por_segundo: Taxa máxima de requisições ao host. Se None
+            (padrão), remove o limite.
+        rajada: Requisições permitidas de imediato antes de o limite de taxa
+            valer. Padrão: 1.
+    """
+    alvo = _obter_host(host.lower())
+    if tamanho_pool is not None and tamanho_pool != alvo.tamanho_pool:
+        alvo.montar_pool(tamanho_pool)
+    if requisicoes_por_segundo is None:
+        alvo.balde = None
+    else:
+        alvo.balde = _BaldeTokens(requisicoes_por_segundo, rajada)
+
+
+@retry_padrao
+def _requisitar(metodo: str, url: str, **kwargs) -> requests.Response:
+    host = _obter_host(_nome_host(url))
+    if host.balde is not None:
+        host.balde.aguardar()
+    inicio = time.perf_counter()
+    falhou = True
+    try:
+        resposta = host.sessao.request(metodo, url, **kwargs)
+        falhou = not resposta.ok
+    finally:
+        host.registrar(time.perf_counter() - inicio, falhou)
+    resposta.raise_for_status()
+    return resposta
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET pela sessão do host, com limite de taxa e ``retry_padrao``.
+
+    Aceita os mesmos argumentos de ``requests.get``.
+
+    Raises:
+        requests.HTTPError: Se a resposta final tiver status de erro (4xx/5xx).
+    """
+    return _requisitar("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """POST pela sessão do host, com limite de taxa e ``retry_padrao``.
+
+    Aceita os mesmos argumentos de ``requests.post``.
+
+    Raises:
+        requests.HTTPError: Se a resposta final tiver status de erro (4xx/5xx).
+    """
+    return _requisitar("POST", url, **kwargs)
+
+
+def metricas() -> pl.DataFrame:
+    """Métricas acumuladas de uso do transporte, uma linha por host.
+
+    Returns:
+        DataFrame com as colunas:
+            * host (String): host consultado.
+            * requisicoes (Int64): requisições feitas, incluindo novas
+              tentativas.
+            * falhas (Int64): requisições com erro de rede ou status 4xx/5xx.
+            * conexoes_abertas (Int64): conexões TCP criadas.
+            * conexoes_reaproveitadas (Int64): requisições que usaram uma
+              conexão já aberta.
+            * latencia_media (Float64): latência média em segundos.
+            * latencia_maxima (Float64): maior latência em segundos.
+    """
+    with _trava_hosts:
+        hosts = sorted(_hosts.items())
+    linhas = []
+    for nome, host in hosts:
+        with host._trava:
+            requisicoes = host.requisicoes
+            falhas = host.falhas
+            latencia_total = host.latencia_total
+            latencia_maxima = host.latencia_maxima
+        conexoes = host.conexoes_abertas()
+        linhas.append(
+            {
+                "host": nome,
+                "requisicoes": requisicoes,
+                "falhas": falhas,
+                "conexoes_abertas": conexoes,
+                "conexoes_reaproveitadas": max(requisicoes - conexoes, 0),
+                "latencia_media": latencia_total / requisicoes if requisicoes else None,
+                "latencia_maxima": latencia_maxima,
+            }
+        )
+    schema = {
+        "host": pl.String,
+        "requisicoes": pl.Int64,
+        "falhas": pl.Int64,
+        "conexoes_abertas": pl.Int64,
+        "conexoes_reaproveitadas": pl.Int64,
+        "latencia_media": pl.Float64,
+        "latencia_maxima": pl.Float64,
+    }
+    return pl.DataFrame(linhas, schema=schema)
+
+
+def fechar() -> None:
+    """Fecha as sessões de todos os hosts e zera configurações e métricas."""
+    with _trava_hosts:
+        hosts = list(_hosts.values())
+        _hosts.clear()
+    for host in hosts:
+        host.sessao.close()
@@ -10,21 +10,19 @@ import datetime as dt
 
 import polars as pl
 import polars.selectors as ps
-import requests
 from lxml.html import HtmlElement, HTMLParser
 from lxml.html import fromstring as html_fromstring
 
 import pyield._internal.converters as cv
+from pyield._internal import transporte
 from pyield._internal.br_numbers import float_br, inteiro_m
 from pyield._internal.cache import ttl_cache
-from pyield._internal.retry import retry_padrao
 from pyield._internal.types import DateLike
 
 URL_IMA = "https://www.anbima.com.br/informacoes/ima/ima-quantidade-mercado.asp"
 
 
 @ttl_cache()
-@retry_padrao
 def _buscar_conteudo_url(data_referencia: dt.date) -> bytes:
     data_referencia_str = data_referencia.strftime("%d/%m/%Y")
     payload = {
@@ -35,8 +33,7 @@ def _buscar_conteudo_url(data_referencia: dt.date) -> bytes:
         "Dt_Ref": f"{data_referencia_str}",
     }
 
-    resposta = requests.post(URL_IMA, data=payload, timeout=10)
-    resposta.raise_for_status()
+    resposta = transporte.post(URL_IMA, data=payload, timeout=10)
     if "Não há dados disponíveis" in resposta.text:
         return b""
     return resposta.content
@@ -23,12 +23,11 @@ import zipfile as zf
 from pathlib import Path
 
 import polars as pl
-import requests
 
 from pyield import du
+from pyield._internal import cache_brutos, transporte
 from pyield._internal.br_numbers import float_br, taxa_br
 from pyield._internal.converters import converter_datas, data_referencia_valida
-from pyield._internal.retry import retry_padrao
 from pyield._internal.types import DateLike
 
 type _CaminhoArquivo = str | os.PathLike[str]
@@ -66,11 +65,13 @@ def _montar_url_arquivo(data: dt.date) -> str:
     return url_arquivo
 
 
-@retry_padrao
 def _obter_csv(data: dt.date) -> bytes:
+    return cache_brutos.buscar("anbima_taxas", data, lambda: _baixar_csv(data))
+
+
+def _baixar_csv(data: dt.date) -> bytes:
     url_arquivo = _montar_url_arquivo(data)
-    resposta = requests.get(url_arquivo, timeout=10)
-    resposta.raise_for_status()
+    resposta = transporte.get(url_arquivo, timeout=10)
     return resposta.content
 
 
@@ -30,17 +30,27 @@ Ref: https://www.b3.com.br/data/files/16/70/29/9C/6219D710C8F297D7AC094EA8/Catal
 import datetime as dt
 import io
 import logging
-import re
+import multiprocessing
+import os
 import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
 
 import polars as pl
-import requests
 from lxml import etree
 
 import pyield._internal.converters as cv
+from pyield import du, relogio
+from pyield._internal import cache_brutos, transporte
 from pyield._internal.cache import ttl_cache
-from pyield._internal.retry import retry_padrao
 from pyield._internal.types import DateLike, any_is_empty
 from pyield.b3._contratos import normalizar_contratos
 from pyield.b3._validar_pregao import data_negociacao_valida
@@ -48,6 +58,7 @@ from pyield.b3._validar_pregao import data_negociacao_valida
 __all__ = [
     "baixar_zip",
     "buscar",
+    "buscar_periodo",
     "ler",
 ]
 
@@ -99,16 +110,31 @@ COLUNAS_PRICE_REPORT: list[tuple[str, str, type[pl.DataType]]] = [
 # Schema completo: nome_xml → tipo_polars. Garante ordem e tipagem constante.
 SCHEMA_PRICE_REPORT = pl.Schema({nome: tipo for _, nome, tipo in COLUNAS_PRICE_REPORT})
 
+# Registros lidos entre limpezas da árvore parcial no parsing em streaming
+_REGISTROS_POR_LIMPEZA = 256
+
+# Downloads simultâneos em buscar_periodo (não excede o pool padrão de conexões
+# por host do transporte HTTP, que é 10)
+_MAX_DOWNLOADS = 4
+_ARQUIVO_PARTICAO = "dados.parquet"
+# Marcador, na pasta da partição, de pregão sem boletim (já buscado)
+_ARQUIVO_SEM_DADOS = "sem_dados"
+
+# Namespace das mensagens BVMF.217 (Price Report) dentro do arquivo da B3
+_NS_PRICE_REPORT = "{urn:bvmf.217.01.xsd}"
+_TAG_PRIC_RPT = f"{_NS_PRICE_REPORT}PricRpt"
+_CAMINHO_TICKER = f"{_NS_PRICE_REPORT}SctyId/{_NS_PRICE_REPORT}TckrSymb"
+
 logger = logging.getLogger(__name__)
-_SESSAO = requests.Session()
-_SESSAO.headers["User-Agent"] = (
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    " (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
-)
+_CABECALHOS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        " (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
+    )
+}
 
 
 @ttl_cache()
-@retry_padrao
 def baixar_zip(data: DateLike, boletim_completo: bool = False) -> bytes:
     """Baixa o ZIP bruto do Boletim de Negociação da B3.
 
@@ -134,55 +160,93 @@ def baixar_zip(data: DateLike, boletim_completo: bool = False) -> bytes:
     if not data_negociacao_valida(data):
         return bytes()
 
-    data_str = data.strftime("%y%m%d")
+    conteudo_zip, xml_bytes = _baixar_boletim(data, boletim_completo)
+    if not _xml_do_boletim(conteudo_zip, xml_bytes):
+        return bytes()
+    return conteudo_zip
+
+
+def _baixar_boletim(
+    data: dt.date, boletim_completo: bool
+) -> tuple[bytes, bytes | None]:
+    """Baixa o ZIP do boletim e devolve também o XML, se já foi extraído.
+
+    Quando o ZIP é baixado agora, a validação do cache de brutos extrai o XML;
+    ele é devolvido para não descompactar o mesmo ZIP outra vez. É ``None``
+    quando o ZIP sai do cache ou não há cache configurado.
+    """
+    extraidos: list[bytes] = []
+
+    def validar(conteudo_zip: bytes) -> bool:
+        extraidos.append(_extrair_xml_valido(conteudo_zip))
+        return bool(extraidos[-1])
+
+    conteudo_zip = _baixar_conteudo(data, boletim_completo, validar)
+    return conteudo_zip, extraidos[-1] if extraidos else None
+
+
+def _xml_do_boletim(conteudo_zip: bytes, xml_bytes: bytes | None) -> bytes:
+    """XML já extraído ou, se ainda não houver, extraído do ZIP."""
+    if xml_bytes is None:
+        return _extrair_xml_valido(conteudo_zip)
+    return xml_bytes
+
+
+def _baixar_conteudo(
+    data: dt.date, boletim_completo: bool, validar: Callable[[bytes], bool]
+) -> bytes:
+    # Sem ttl_cache: downloads em lote (buscar_periodo) não devem reter ZIPs.
+    # No cache de brutos em disco, só entram ZIPs que passam em ``validar``.
     prefixo = "PR" if boletim_completo else "SPRD"
-    url = f"https://www.b3.com.br/pesquisapregao/download?filelist={prefixo}{data_str}.zip"
+    return cache_brutos.buscar(
+        "b3_boletim",
+        data,
+        lambda: _baixar_da_b3(data, prefixo),
+        variante=prefixo,
+        validar=validar,
+    )
 
-    resposta = _SESSAO.get(url, timeout=(5, 10))
-    resposta.raise_for_status()
 
-    if not _zip_valido(resposta.content):
-        return bytes()
+def _baixar_da_b3(data: dt.date, prefixo: str) -> bytes:
+    data_str = data.strftime("%y%m%d")
+    url = f"https://www.b3.com.br/pesquisapregao/download?filelist={prefixo}{data_str}.zip"
+
+    resposta = transporte.get(url, headers=_CABECALHOS, timeout=(5, 10))
     return resposta.content
 
 
-def _zip_tem_xml_valido(conteudo_zip: bytes) -> bool:  # noqa: PLR0911
-    with zipfile.ZipFile(io.BytesIO(conteudo_zip), "r") as zip_externo:
-        nomes = zip_externo.namelist()
-        if not nomes:
-            logger.debug("ZIP externo do boletim está vazio.")
-            return False
-        if zip_externo.testzip() is not None:
-            logger.debug("ZIP externo do boletim contém arquivo corrompido.")
-            return False
+@ttl_cache()
+def _baixar_xml(data: dt.date, boletim_completo: bool) -> bytes:
+    """Baixa o boletim e devolve o XML já validado, ou ``b""`` se inválido.
+
+    O cache guarda o XML extraído, e não o ZIP, para que consultas repetidas
+    da mesma data não descompactem o arquivo outra vez.
+    """
+    return _xml_do_boletim(*_baixar_boletim(data, boletim_completo))
 
-        conteudo_interno = zip_externo.read(nomes[0])
-        with zipfile.ZipFile(io.BytesIO(conteudo_interno), "r") as zip_interno:
-            nomes_xml = [
-                nome for nome in zip_interno.namelist() if nome.endswith(".xml")
-            ]
-            if not nomes_xml:
-                logger.debug("ZIP interno do boletim não contém XML.")
-                return False
-            if zip_interno.testzip() is not None:
-                logger.debug("ZIP interno do boletim contém arquivo corrompido.")
-                return False
 
-    return True
+def _extrair_xml_valido(conteudo_zip: bytes) -> bytes:
+    """Valida e extrai o XML do ZIP aninhado numa única descompressão.
 
+    ``ZipFile.read`` confere o CRC do membro lido, o que dispensa uma
+    passada prévia de ``testzip()`` sobre os dois níveis do ZIP.
 
-def _zip_valido(conteudo_zip: bytes) -> bool:
-    """Verifica se o ZIP bruto do boletim contém um XML legível."""
+    Returns:
+        XML em bytes, ou ``b""`` se o ZIP for pequeno demais, ilegível,
+        corrompido ou não contiver XML.
+    """
     tamanho_minimo = 1024  # ZIP válido ~2KB; 1KB detecta arquivos "sem dados"
     if len(conteudo_zip) < tamanho_minimo:
         logger.debug("ZIP do boletim ignorado: tamanho menor que o mínimo.")
-        return False
+        return bytes()
 
     try:
-        return _zip_tem_xml_valido(conteudo_zip)
+        return _extrair(conteudo_zip)
+    except ValueError as erro:
+        logger.debug("ZIP do boletim sem XML: %s.", erro)
     except (zipfile.BadZipFile, KeyError, OSError, RuntimeError):
         logger.debug("ZIP do boletim inválido ou ilegível.")
-        return False
+    return bytes()
 
 
 def _extrair(conteudo_zip: bytes) -> bytes:
@@ -213,20 +277,6 @@ def _extrair(conteudo_zip: bytes) -> bytes:
             return zip_interno.read(nomes_xml[-1])
 
 
-def _xpath_elementos_xml(
-    elemento: etree._ElementTree | etree._Element,
-    expressao: str,
-    *,
-    namespaces: dict[str, str] | None = None,
-) -> list[etree._Element]:
-    resultado = elemento.xpath(expressao, namespaces=namespaces)
-    if not isinstance(resultado, list) or not all(
-        isinstance(item, etree._Element) for item in resultado
-    ):
-        raise TypeError("XPath deveria retornar uma lista de elementos XML.")
-    return [item for item in resultado if isinstance(item, etree._Element)]
-
-
 def _extrair_dados_contrato(pric_rpt: etree._Element) -> dict | None:
     dados = {}
     tem_ticker = False
@@ -275,10 +325,49 @@ def _extrair_dados_contrato(pric_rpt: etree._Element) -> dict | None:
     return dados
 
 
-def _parsear_xml_registros(xml_bytes: bytes) -> list[dict]:
-    namespaces = {"ns": "urn:bvmf.217.01.xsd"}
-    analisador = etree.XMLParser(
-        ns_clean=True,
+def _descartar_processados(pric_rpt: etree._Element) -> None:
+    """Remove da árvore parcial tudo o que antecede o registro atual.
+
+    Cada ``PricRpt`` vem dentro de ``BizGrp/Document``, ao lado de um
+    ``AppHdr``: apagar só os irmãos anteriores do próprio registro não
+    liberaria esses envelopes, por isso a limpeza sobe pelos ancestrais.
+    """
+    for ancestral in pric_rpt.iterancestors():
+        pai = ancestral.getparent()
+        if pai is None:
+            break
+        del pai[: pai.index(ancestral)]
+
+
+def _ticker_aceito(
+    ticker: str, prefixos: tuple[str, ...], comprimento_ticker: int | None
+) -> bool:
+    if comprimento_ticker and len(ticker) != comprimento_ticker:
+        return False
+    return not prefixos or ticker.startswith(prefixos)
+
+
+def _parsear_xml_colunas(
+    xml_bytes: bytes,
+    prefixos: tuple[str, ...] = (),
+    comprimento_ticker: int | None = None,
+) -> tuple[dict[str, list[str | None]], int]:
+    """Lê os registros ``PricRpt`` em streaming, direto para colunas.
+
+    A árvore parcial é podada periodicamente, de modo que a memória não
+    cresce com o tamanho do XML, e os filtros de ticker são aplicados durante
+    a leitura para que instrumentos fora do filtro nunca sejam materializados.
+
+    Returns:
+        Colunas (como texto) dos registros que passaram pelos filtros e total
+        de registros com ticker no XML, filtrados ou não.
+    """
+    colunas: dict[str, list[str | None]] = {nome: [] for nome in SCHEMA_PRICE_REPORT}
+    total_registros = lidos = 0
+    eventos = etree.iterparse(
+        io.BytesIO(xml_bytes),
+        events=("end",),
+        tag=_TAG_PRIC_RPT,
         remove_blank_text=True,
         remove_comments=True,
         recover=True,
@@ -286,53 +375,55 @@ def _parsear_xml_registros(xml_bytes: bytes) -> list[dict]:
         no_network=True,
         load_dtd=False,
     )
-    arvore = etree.parse(io.BytesIO(xml_bytes), parser=analisador)
-    elementos = _xpath_elementos_xml(arvore, "//ns:PricRpt", namespaces=namespaces)
-    registros = [
-        dados
-        for pric_rpt in elementos
-        if (dados := _extrair_dados_contrato(pric_rpt)) is not None
-    ]
-    return registros
-
-
-def _converter_para_df(registros: list[dict]) -> pl.DataFrame:
-    # Schema explícito garante que todas as colunas existam no DataFrame,
-    # mesmo que os primeiros registros não tenham todas as chaves.
-    # (pl.DataFrame infere colunas de ~50 primeiras linhas por padrão.)
+    for _, pric_rpt in eventos:
+        # O ticker é lido antes do restante para descartar cedo os registros
+        # fora do filtro, sem percorrer seus demais campos.
+        ticker = pric_rpt.findtext(_CAMINHO_TICKER)
+        if ticker and _ticker_aceito(ticker, prefixos, comprimento_ticker):
+            dados = _extrair_dados_contrato(pric_rpt)
+            if dados is not None:
+                for nome, valores in colunas.items():
+                    valores.append(dados.get(nome))
+        total_registros += bool(ticker)
+        lidos += 1
+        if lidos % _REGISTROS_POR_LIMPEZA == 0:
+            _descartar_processados(pric_rpt)
+
+    return colunas, total_registros
+
+
+def _converter_para_df(colunas: dict[str, list[str | None]]) -> pl.DataFrame:
+    # Schema explícito garante que todas as colunas existam com tipo estável,
+    # inclusive quando nenhum registro passa pelos filtros.
     schema_str = {nome: pl.String for nome in SCHEMA_PRICE_REPORT}
-    df = pl.DataFrame(registros, schema=schema_str)
+    df = pl.DataFrame(colunas, schema=schema_str)
     df = df.with_columns(TradDt=pl.col("TradDt").str.to_date("%Y-%m-%d"))
     return df.cast(SCHEMA_PRICE_REPORT, strict=False)
 
 
-def _processar_xml_extraido(xml_bytes: bytes) -> pl.DataFrame:
-    registros = _parsear_xml_registros(xml_bytes)
-    if not registros:
+def _processar_xml_extraido(
+    xml_bytes: bytes,
+    prefixos: list[str] | None = None,
+    comprimento_ticker: int | None = None,
+) -> pl.DataFrame:
+    colunas, total_registros = _parsear_xml_colunas(
+        xml_bytes, tuple(prefixos or ()), comprimento_ticker
+    )
+    if not total_registros:
         return pl.DataFrame()
-    return _converter_para_df(registros).sort("TckrSymb")
+    return _converter_para_df(colunas).sort("TckrSymb")
 
 
-def _filtrar_df(
-    df: pl.DataFrame,
-    prefixos: list[str],
+def _obter_df_boletim(
+    data: dt.date,
+    boletim_completo: bool,
+    prefixos: list[str] | None = None,
     comprimento_ticker: int | None = None,
 ) -> pl.DataFrame:
-    ticker = pl.col("TckrSymb")
-    if comprimento_ticker:
-        df = df.filter(ticker.str.len_chars() == comprimento_ticker)
-    if prefixos:
-        padrao = f"^({'|'.join(re.escape(prefixo) for prefixo in prefixos)})"
-        df = df.filter(ticker.str.contains(padrao))
-    return df.sort("TckrSymb")
-
-
-def _obter_df_boletim(data: dt.date, boletim_completo: bool) -> pl.DataFrame:
-    dados_zip = baixar_zip(data, boletim_completo)
-    if not dados_zip:
+    xml_bytes = _baixar_xml(data, boletim_completo)
+    if not xml_bytes:
         return pl.DataFrame()
-    xml_bytes = _extrair(dados_zip)
-    return _processar_xml_extraido(xml_bytes)
+    return _processar_xml_extraido(xml_bytes, prefixos, comprimento_ticker)
 
 
 def buscar(
@@ -449,14 +540,222 @@ def buscar(
     if not data_negociacao_valida(data):
         return pl.DataFrame()
 
-    df = _obter_df_boletim(data, boletim_completo)
-    if df.is_empty() or prefixo_ticker is None:
-        return df
+    if prefixo_ticker is None:
+        return _obter_df_boletim(data, boletim_completo)
 
     prefixos = normalizar_contratos(prefixo_ticker)
     if not prefixos:
         return pl.DataFrame()
-    return _filtrar_df(df, prefixos, comprimento_ticker)
+    return _obter_df_boletim(data, boletim_completo, prefixos, comprimento_ticker)
+
+
+def _parsear_zip(
+    conteudo_zip: bytes,
+    xml_bytes: bytes | None,
+    prefixos: list[str] | None,
+    comprimento_ticker: int | None,
+) -> pl.DataFrame:
+    # Executada nos processos de parsing de buscar_periodo: precisa ser
+    # uma função de módulo para ser serializada pelo pickle. Se o XML não veio
+    # da validação do download, a extração é feita aqui, uma só vez.
+    xml_bytes = _xml_do_boletim(conteudo_zip, xml_bytes)
+    if not xml_bytes:
+        return pl.DataFrame()
+    return _processar_xml_extraido(xml_bytes, prefixos, comprimento_ticker)
+
+
+def _caminho_particao(destino: Path, data: dt.date) -> Path:
+    return destino / f"TradDt={data.isoformat()}" / _ARQUIVO_PARTICAO
+
+
+def _pregao_buscado(destino: Path, data: dt.date) -> bool:
+    particao = _caminho_particao(destino, data)
+    return particao.exists() or particao.with_name(_ARQUIVO_SEM_DADOS).exists()
+
+
+def _marcar_sem_dados(destino: Path, data: dt.date) -> None:
+    marcador = _caminho_particao(destino, data).with_name(_ARQUIVO_SEM_DADOS)
+    marcador.parent.mkdir(parents=True, exist_ok=True)
+    marcador.touch()
+
+
+def _gravar_particao(df: pl.DataFrame, caminho: Path) -> None:
+    # Grava em arquivo temporário e renomeia: uma execução interrompida nunca
+    # deixa uma partição parcial que seria tomada como concluída.
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    temporario = caminho.with_suffix(".tmp")
+    df.write_parquet(temporario)
+    temporario.replace(caminho)
+
+
+def _executor_parsing(processos: int) -> Executor:
+    if processos <= 1:
+        # Parsing no próprio processo, mantendo a mesma interface de Future
+        return ThreadPoolExecutor(max_workers=1)
+    # "spawn" evita fork com as threads de download já em execução
+    contexto = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=processos, mp_context=contexto)
+
+
+def _processar_periodo(
+    datas: list[dt.date],
+    boletim_completo: bool,
+    prefixos: list[str] | None,
+    comprimento_ticker: int | None,
+    processos: int,
+) -> Iterator[tuple[dt.date, pl.DataFrame]]:
+    """Baixa em threads e parseia em processos, entregando cada pregão pronto.
+
+    No máximo ``_MAX_DOWNLOADS + processos`` pregões ficam em andamento
+    (baixando, na fila de parsing ou parseando): o próximo download só começa
+    quando um parsing termina, e a memória não cresce com o tamanho do período.
+    """
+    restantes = iter(datas)
+    with (
+        ThreadPoolExecutor(max_workers=min(_MAX_DOWNLOADS, len(datas))) as downloads,
+        _executor_parsing(processos) as parsing,
+    ):
+        datas_futuros: dict[Future, dt.date] = {}
+        futuros_download: set[Future] = set()
+
+        def baixar_proxima() -> None:
+            data = next(restantes, None)
+            if data is None:
+                return
+            futuro = downloads.submit(_baixar_boletim, data, boletim_completo)
+            datas_futuros[futuro] = data
+            futuros_download.add(futuro)
+
+        for _ in range(_MAX_DOWNLOADS + processos):
+            baixar_proxima()
+        # Um único laço sobre downloads e parsings: cada pregão é entregue
+        # assim que fica pronto, sem esperar o fim dos demais downloads.
+        while datas_futuros:
+            concluidos, _ = wait(datas_futuros, return_when=FIRST_COMPLETED)
+            for futuro in concluidos:
+                data = datas_futuros.pop(futuro)
+                if futuro not in futuros_download:
+                    yield data, futuro.result()
+                    baixar_proxima()
+                    continue
+                futuros_download.remove(futuro)
+                conteudo_zip, xml_bytes = futuro.result()
+                # Entre processos vai o ZIP, muitas vezes menor que o XML;
+                # o XML já extraído só é reaproveitado no próprio processo.
+                if processos > 1:
+                    xml_bytes = None
+                novo = parsing.submit(
+                    _parsear_zip, conteudo_zip, xml_bytes, prefixos, comprimento_ticker
+                )
+                datas_futuros[novo] = data
+
+
+def buscar_periodo(  # noqa: PLR0913
+    inicio: DateLike,
+    fim: DateLike,
+    prefixo_ticker: str | list[str] | None = None,
+    comprimento_ticker: int | None = None,
+    boletim_completo: bool = False,
+    *,
+    destino: str | os.PathLike[str] | None = None,
+    processos: int = 1,
+) -> pl.DataFrame:
+    """Busca o Boletim de Negociação da B3 para todos os pregões de um período.
+
+    Equivale a chamar :func:`buscar` para cada pregão entre ``inicio`` e
+    ``fim``, mas baixa os ZIPs em paralelo (threads sobre a sessão HTTP do
+    módulo) e, com ``processos`` maior que 1, faz o parsing dos XMLs em um
+    pool de processos. Só alguns pregões ficam em memória ao mesmo tempo: um
+    novo download começa apenas quando um pregão termina de ser processado.
+
+    Com ``destino``, cada pregão é gravado assim que processado em um dataset
+    parquet particionado por data (``destino/TradDt=AAAA-MM-DD/dados.parquet``).
+    As partições existentes funcionam como checkpoint: numa nova execução, os
+    pregões já gravados não são baixados novamente. Pregões anteriores a hoje
+    sem boletim publicado também são marcados (arquivo ``sem_dados`` na pasta
+    da partição) e não são buscados de novo; apague o marcador para repetir a
+    busca. Use um ``destino`` por combinação de filtros, pois o checkpoint
+    considera apenas a data.
+
+    Args:
+        inicio: Data inicial do período (inclusiva).
+        fim: Data final do período (inclusiva).
+        prefixo_ticker: Prefixo do ticker B3 ou lista de prefixos, como em
+            :func:`buscar`. Se None (padrão), retorna todos os ativos.
+        comprimento_ticker: Comprimento exato do ticker para filtrar registros.
+            Se None (padrão), não filtra por comprimento.
+        boletim_completo: Se False (padrão), usa o simplified price report
+            (SPR). Se True, usa o price report completo (PR).
+        destino: Diretório do dataset parquet particionado. Se None (padrão),
+            nada é gravado em disco.
+        processos: Número de processos de parsing. Com 1 (padrão), o parsing
+            é feito no processo atual. Mais processos só compensam em
+            períodos longos, em que o custo de iniciar o pool se dilui.
+
+    Returns:
+        pl.DataFrame: Registros de todos os pregões do período, com as colunas
+        documentadas em :func:`buscar`, ordenados por data e ticker. Com
+        ``destino``, inclui os pregões gravados em execuções anteriores.
+        Retorna DataFrame vazio se nenhum pregão tiver dados.
+
+    Raises:
+        requests.HTTPError: Se o download de algum pregão falhar.
+
+    Examples:
+        >>> import pyield as yd
+        >>> df = yd.b3.boletim.buscar_periodo("22-04-2024", "26-04-2024", "DI1")
+        >>> df["TradDt"].n_unique()
+        5
+    """
+    if any_is_empty(inicio) or any_is_empty(fim):
+        return pl.DataFrame()
+
+    prefixos = None
+    if prefixo_ticker is not None:
+        prefixos = normalizar_contratos(prefixo_ticker)
+        if not prefixos:
+            return pl.DataFrame()
+
+    datas = [data for data in du.gerar(inicio, fim) if data_negociacao_valida(data)]
+    pasta = Path(destino) if destino is not None else None
+    if pasta is not None:
+        datas = [d for d in datas if not _pregao_buscado(pasta, d)]
+
+    dfs = []
+    if datas:
+        for data, df in _processar_periodo(
+            datas, boletim_completo, prefixos, comprimento_ticker, processos
+        ):
+            # DataFrame sem colunas: pregão sem boletim. O de hoje ainda pode
+            # ser publicado e não é marcado.
+            if df.width == 0:
+                if pasta is not None and data < relogio.hoje():
+                    _marcar_sem_dados(pasta, data)
+                continue
+            if pasta is None:
+                dfs.append(df)
+            else:
+                _gravar_particao(df, _caminho_particao(pasta, data))
+
+    if pasta is not None:
+        return _ler_periodo_gravado(pasta, inicio, fim)
+    if not dfs:
+        return pl.DataFrame()
+    return pl.concat(dfs).sort("TradDt", "TckrSymb")
+
+
+def _ler_periodo_gravado(pasta: Path, inicio: DateLike, fim: DateLike) -> pl.DataFrame:
+    if not any(pasta.glob(f"TradDt=*/{_ARQUIVO_PARTICAO}")):
+        return pl.DataFrame()
+    data_inicio = cv.converter_datas(inicio)
+    data_fim = cv.converter_datas(fim)
+    arquivos = pasta / f"TradDt=*/{_ARQUIVO_PARTICAO}"
+    return (
+        pl.scan_parquet(arquivos, hive_partitioning=False)
+        .filter(pl.col("TradDt").is_between(data_inicio, data_fim))
+        .sort("TradDt", "TckrSymb")
+        .collect()
+    )
 
 
 def ler(
@@ -494,11 +793,10 @@ def ler(
 
     xml_bytes = _extrair(conteudo) if conteudo[:4] == b"PK\x03\x04" else conteudo
 
-    df = _processar_xml_extraido(xml_bytes)
-    if df.is_empty() or prefixo_ticker is None:
-        return df
+    if prefixo_ticker is None:
+        return _processar_xml_extraido(xml_bytes)
 
     prefixos = normalizar_contratos(prefixo_ticker)
     if not prefixos:
         return pl.DataFrame()
-    return _filtrar_df(df, prefixos, comprimento_ticker)
+    return _processar_xml_extraido(xml_bytes, prefixos, comprimento_ticker)
@@ -30,11 +30,10 @@ import datetime as dt
 import logging
 
 import polars as pl
-import requests
 
 from pyield import relogio
+from pyield._internal import transporte
 from pyield._internal.cache import ttl_cache
-from pyield._internal.retry import retry_padrao
 
 URL_BASE_INTRADIA = "https://cotacao.b3.com.br/mds/api/v1/DerivativeQuotation"
 
@@ -76,16 +75,18 @@ COLUNAS_INTRADIA: list[tuple[str, str, type[pl.DataType]]] = [
 MAPEAMENTO = {orig: novo for orig, novo, _ in COLUNAS_INTRADIA}
 TIPOS = {orig: tipo for orig, _, tipo in COLUNAS_INTRADIA}
 
+_CABECALHOS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        " (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
+    )
+}
+
 
 @ttl_cache(ttl=10)
-@retry_padrao
 def _buscar_json_intradia(contrato: str) -> list[dict]:
     url = f"{URL_BASE_INTRADIA}/{contrato}"
-    cabecalhos = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"  # noqa: E501
-    }
-    resposta = requests.get(url, headers=cabecalhos, timeout=10)
-    resposta.raise_for_status()
+    resposta = transporte.get(url, headers=_CABECALHOS, timeout=10)
     resposta.encoding = "utf-8"
 
     if "Quotation not available" in resposta.text:
@@ -1,9 +1,8 @@
 """Helpers compartilhados para acesso à API OData do BCB (olinda.bcb.gov.br)."""
 
 import polars as pl
-import requests
 
-from pyield._internal.retry import retry_padrao
+from pyield._internal import transporte
 
 
 def montar_url(url_base: str, parametros: dict[str, str]) -> str:
@@ -18,11 +17,9 @@ def montar_url(url_base: str, parametros: dict[str, str]) -> str:
     return url_base + "&".join(partes) + "&$format=text/csv"
 
 
-@retry_padrao
 def buscar_csv(url: str) -> bytes:
     """Busca CSV da API OData do BCB com retry automático."""
-    r = requests.get(url, timeout=10)
-    r.raise_for_status()
+    r = transporte.get(url, timeout=10)
     return r.content
 
 
@@ -16,20 +16,22 @@ valores e retorna o VNA único.
 """
 
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
-import requests
+import polars as pl
 
+from pyield._internal import transporte
 from pyield._internal.cache import ttl_cache
 from pyield._internal.converters import converter_datas, data_referencia_valida
-from pyield._internal.retry import retry_padrao
-from pyield._internal.types import DateLike, any_is_empty
+from pyield._internal.types import DateLike, DatesLike, any_is_empty
 
 CODIGO_LFT = "210100"
+# Downloads simultâneos dos arquivos diários em vna_serie
+_MAX_DOWNLOADS = 4
 
 
 @ttl_cache()
-@retry_padrao
 def _baixar_texto(data_referencia: dt.date) -> str:
     """Baixa o arquivo diário do SELIC no site do BCB."""
     # Exemplo: https://www3.bcb.gov.br/novoselic/rest/arquivosDiarios/pub/download/3/20240418APC238
@@ -37,8 +39,7 @@ def _baixar_texto(data_referencia: dt.date) -> str:
     url_file = f"{data_referencia.strftime('%Y%m%d')}APC238"
     url = url_base + url_file
 
-    response = requests.get(url, timeout=10)
-    response.raise_for_status()
+    response = transporte.get(url, timeout=10)
     return response.text
 
 
@@ -117,3 +118,47 @@ def vna(data: DateLike | None = None) -> Decimal:
     linhas = _obter_linhas(tabela)
     valores = _extrair_valores_lft(linhas)
     return _validar_valores(valores)
+
+
+def vna_serie(datas: DatesLike) -> pl.DataFrame:
+    """Busca o VNA da LFT para várias datas de referência.
+
+    Equivale a aplicar :func:`vna` a cada data, mas cada data distinta é
+    buscada uma única vez e os arquivos diários do SELIC são baixados em
+    paralelo.
+
+    Args:
+        datas: Datas de referência.
+
+    Returns:
+        DataFrame Polars na ordem de ``datas``.
+
+    Output Columns:
+        - data (Date): Data de referência.
+        - vna (Float64): VNA da LFT com seis casas decimais. ``NaN`` para
+            datas nulas ou datas de referência inválidas.
+
+    Raises:
+        ValueError: Se os valores VNA de alguma data forem divergentes.
+        requests.exceptions.HTTPError: Se alguma requisição ao BCB falhar.
+
+    Examples:
+        >>> from pyield import lft
+        >>> lft.vna_serie(["31-05-2024", "01-06-2024"])["vna"].to_list()
+        [14903.01148, nan]
+    """
+    serie = pl.Series("data", converter_datas(datas), dtype=pl.Date)
+    unicas = serie.drop_nulls().unique().to_list()
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(_MAX_DOWNLOADS, len(unicas)))
+    ) as executor:
+        valores = [float(v) for v in executor.map(vna, unicas)]
+    vnas = pl.DataFrame(
+        {"data": unicas, "vna": valores},
+        schema={"data": pl.Date, "vna": pl.Float64},
+    )
+    return (
+        serie.to_frame()
+        .join(vnas, on="data", how="left", maintain_order="left")
+        .with_columns(pl.col("vna").fill_null(float("nan")))
+    )
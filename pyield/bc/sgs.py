@@ -30,10 +30,10 @@ import polars as pl
 import requests
 
 from pyield import relogio
+from pyield._internal import transporte
 from pyield._internal.br_numbers import pct_para_decimal
 from pyield._internal.cache import ttl_cache
 from pyield._internal.converters import converter_datas, data_referencia_valida
-from pyield._internal.retry import retry_padrao
 from pyield._internal.types import DateLike, any_is_empty
 
 URL_BASE = "https://api.bcb.gov.br/dados/serie/bcdata.sgs."
@@ -62,10 +62,8 @@ class SerieSGS(Enum):
 
 
 @ttl_cache()
-@retry_padrao
 def _chamar_api(url_api: str) -> list[dict[str, str]]:
-    resposta = requests.get(url_api, timeout=30)
-    resposta.raise_for_status()
+    resposta = transporte.get(url_api, timeout=30)
     return resposta.json()
 
 
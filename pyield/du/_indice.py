@@ -0,0 +1,173 @@
+"""Índice pré-calculado de dias úteis para contagem e deslocamento por lookup.
+
+Para cada lista de feriados, guarda a contagem acumulada de dias úteis desde
+``DATA_INICIAL`` e a sequência dos próprios dias úteis. Assim, contar dias
+úteis entre duas datas é a diferença de duas posições do acumulado, e deslocar
+uma data é uma consulta na sequência de dias úteis, ambas via ``gather``.
+"""
+
+import datetime as dt
+from collections.abc import Callable
+from functools import cache
+from typing import Final, Literal, NamedTuple
+
+import polars as pl
+
+from pyield.du import feriados_br
+
+DATA_INICIAL: Final = dt.date(1990, 1, 1)
+DATA_FINAL: Final = dt.date(2100, 12, 31)
+
+# Posição de DATA_INICIAL em dias desde 1970-01-01 (representação de pl.Date)
+_POSICAO_INICIAL: Final = (DATA_INICIAL - dt.date(1970, 1, 1)).days
+_TOTAL_DIAS: Final = (DATA_FINAL - DATA_INICIAL).days + 1
+
+ListaFeriados = Literal["anterior", "atual"]
+
+
+class _Indice(NamedTuple):
+    # acumulado[i]: dias úteis em [DATA_INICIAL, DATA_INICIAL + i dias).
+    # Tem _TOTAL_DIAS + 1 posições para que acumulado[i + 1] exista no último dia.
+    acumulado: pl.Series
+    # dias_uteis[k]: k-ésimo dia útil a partir de DATA_INICIAL (base zero)
+    dias_uteis: pl.Series
+
+
+@cache
+def _indice(lista: ListaFeriados) -> _Indice:
+    feriados = feriados_br.ANTERIORES if lista == "anterior" else feriados_br.ATUAIS
+    datas = pl.date_range(
+        DATA_INICIAL,
+        DATA_FINAL + dt.timedelta(days=1),
+        eager=True,
+    )
+    eh_util = datas.dt.is_business_day(holidays=feriados)
+    acumulado = eh_util.cast(pl.Int32).cum_sum().shift(1, fill_value=0)
+    return _Indice(
+        acumulado=acumulado.rename("acumulado"),
+        dias_uteis=datas.head(-1).filter(eh_util.head(-1)).rename("dias_uteis"),
+    )
+
+
+def _posicao(data: pl.Expr) -> pl.Expr:
+    return data.cast(pl.Int32) - _POSICAO_INICIAL
+
+
+def _consultar(serie: pl.Series, posicao: pl.Expr) -> pl.Expr:
+    # Posições fora do índice viram nulo em vez de erro de gather
+    dentro = posicao.is_between(0, serie.len() - 1)
+    return pl.when(dentro).then(pl.lit(serie).gather(posicao.clip(0, serie.len() - 1)))
+
+
+def _por_calendario(
+    calculo: Callable[[ListaFeriados], pl.Expr],
+    data_referencia: pl.Expr,
+    calendario: Literal["auto", "anterior", "atual"],
+) -> pl.Expr:
+    match calendario:
+        case "anterior" | "atual":
+            return calculo(calendario)
+        case "auto":
+            return (
+                pl.when(data_referencia < feriados_br.DATA_TRANSICAO)
+                .then(calculo("anterior"))
+                .otherwise(calculo("atual"))
+            )
+        case _:
+            raise ValueError("Opção inválida para calendario.")
+
+
+def contar_expr(
+    inicio: pl.Expr,
+    fim: pl.Expr,
+    calendario: Literal["auto", "anterior", "atual"],
+) -> pl.Expr:
+    """Equivalente a ``pl.business_day_count`` por lookup no índice.
+
+    Datas fora de ``DATA_INICIAL``..``DATA_FINAL`` resultam em nulo.
+    """
+    # As datas entram uma única vez num struct: a conversão de ``inicio`` e
+    # ``fim`` não é refeita a cada consulta ao índice.
+    return (
+        pl.struct(inicio.alias("inicio"), fim.alias("fim"))
+        .map_batches(
+            lambda lote: _calcular_lote(lote, _contagem_expr(calendario)),
+            return_dtype=pl.Int64,
+            is_elementwise=True,
+        )
+        .alias(_nome_saida(inicio))
+    )
+
+
+def deslocar_expr(
+    data: pl.Expr,
+    deslocamento: int | pl.Expr,
+    ajuste: Literal["seguinte", "anterior"],
+    calendario: Literal["auto", "anterior", "atual"],
+) -> pl.Expr:
+    """Equivalente a ``Expr.dt.add_business_days`` por lookup no índice.
+
+    Datas de origem ou resultados fora de ``DATA_INICIAL``..``DATA_FINAL``
+    resultam em nulo.
+    """
+    if isinstance(deslocamento, int):
+        deslocamento = pl.lit(deslocamento)
+    colunas = pl.struct(data.alias("data"), deslocamento.alias("deslocamento"))
+    return colunas.map_batches(
+        lambda lote: _calcular_lote(lote, _deslocada_expr(ajuste, calendario)),
+        return_dtype=pl.Date,
+        is_elementwise=True,
+    ).alias(_nome_saida(data))
+
+
+def _nome_saida(origem: pl.Expr) -> str:
+    # Mesmo nome de saída das funções nativas do Polars (o da coluna de origem)
+    return origem.meta.output_name(raise_if_undetermined=False) or "literal"
+
+
+def _calcular_lote(lote: pl.Series, expr: pl.Expr) -> pl.Series:
+    return lote.struct.unnest().select(expr).to_series()
+
+
+def _contagem_expr(calendario: Literal["auto", "anterior", "atual"]) -> pl.Expr:
+    inicio = pl.col("inicio")
+    posicao_inicio = _posicao(inicio)
+    posicao_fim = _posicao(pl.col("fim"))
+    # Como no Polars, a contagem é em [inicio, fim) e, com inicio > fim, é a
+    # contagem negativa em (fim, inicio]: as duas posições andam um dia.
+    ajuste = (posicao_inicio > posicao_fim).cast(pl.Int32)
+
+    def contar(lista: ListaFeriados) -> pl.Expr:
+        acumulado = _indice(lista).acumulado
+        return _consultar(acumulado, posicao_fim + ajuste) - _consultar(
+            acumulado, posicao_inicio + ajuste
+        )
+
+    dentro = posicao_inicio.is_between(0, _TOTAL_DIAS - 1) & posicao_fim.is_between(
+        0, _TOTAL_DIAS - 1
+    )
+    contagem = pl.when(dentro).then(_por_calendario(contar, inicio, calendario))
+    return contagem.cast(pl.Int64)
+
+
+def _deslocada_expr(
+    ajuste: Literal["seguinte", "anterior"],
+    calendario: Literal["auto", "anterior", "atual"],
+) -> pl.Expr:
+    data = pl.col("data")
+    deslocamento = pl.col("deslocamento")
+    posicao = _posicao(data)
+    dentro = posicao.is_between(0, _TOTAL_DIAS - 1)
+
+    def deslocar(lista: ListaFeriados) -> pl.Expr:
+        indice = _indice(lista)
+        # Dias úteis estritamente antes da data: é o ordinal da própria data,
+        # se útil, ou do dia útil seguinte. Com ajuste "anterior", o ordinal
+        # vem dos dias úteis até a data (inclusive), menos um.
+        if ajuste == "seguinte":
+            ordinal = _consultar(indice.acumulado, posicao)
+        else:
+            ordinal = _consultar(indice.acumulado, posicao + 1) - 1
+        return _consultar(indice.dias_uteis, ordinal + deslocamento)
+
+    return pl.when(dentro).then(_por_calendario(deslocar, data, calendario))
@@ -7,11 +7,12 @@ import pyield._internal.converters as cv
 import pyield._internal.types as tp
 from pyield import relogio
 from pyield._internal.types import ArrayLike, DateLike, DatesLike
-from pyield.du import feriados_br
+from pyield.du import _indice, feriados_br
 
 Calendario = Literal["auto", "anterior", "atual"]
 Ajuste = Literal["seguinte", "anterior"]
 LimitesInclusivos = Literal["ambos", "inicio", "fim", "nenhum"]
+Motor = Literal["polars", "indice"]
 
 
 def _traduzir_ajuste(
@@ -82,6 +83,7 @@ def contar_expr(
     inicio: pl.Expr | str | dt.date,
     fim: pl.Expr | str | dt.date,
     calendario: Calendario = "auto",
+    motor: Motor = "polars",
 ) -> pl.Expr:
     """Cria uma expressão Polars para contar dias úteis (com suporte a LazyFrame).
 
@@ -95,6 +97,10 @@ def contar_expr(
             vigente antes de 26-12-2023, ``"atual"`` usa a lista vigente a partir
             dessa data e ``"auto"`` seleciona a lista por linha com base em
             ``inicio``. Padrão: ``"auto"``.
+        motor: ``"polars"`` usa as funções de dias úteis do Polars com a
+            lista de feriados. ``"indice"`` consulta um índice pré-calculado de
+            dias úteis (1990 a 2100), mais rápido em grandes volumes; datas fora
+            desse intervalo resultam em nulo. Padrão: ``"polars"``.
 
     Returns:
         Uma ``pl.Expr`` que resulta em Int64.
@@ -138,6 +144,9 @@ def contar_expr(
     else:
         fim = cv.converter_datas_expr(fim)
 
+    if motor == "indice":
+        return _indice.contar_expr(inicio, fim, calendario)
+
     return pl.business_day_count(
         start=inicio,
         end=fim,
@@ -150,30 +159,35 @@ def contar(
     inicio: DatesLike,
     fim: DatesLike | DateLike | None,
     calendario: Calendario = ...,
+    motor: Motor = ...,
 ) -> pl.Series: ...
 @overload
 def contar(
     inicio: DateLike | None,
     fim: DatesLike,
     calendario: Calendario = ...,
+    motor: Motor = ...,
 ) -> pl.Series: ...
 @overload
 def contar(
     inicio: DateLike,
     fim: DateLike,
     calendario: Calendario = ...,
+    motor: Motor = ...,
 ) -> int: ...
 @overload
 def contar(
     inicio: DateLike,
     fim: None,
     calendario: Calendario = ...,
+    motor: Motor = ...,
 ) -> None: ...
 @overload
 def contar(
     inicio: None,
     fim: DateLike | None,
     calendario: Calendario = ...,
+    motor: Motor = ...,
 ) -> None: ...
 
 
@@ -181,6 +195,7 @@ def contar(
     inicio: None | DateLike | DatesLike,
     fim: None | DateLike | DatesLike,
     calendario: Calendario = "auto",
+    motor: Motor = "polars",
 ) -> None | int | pl.Series:
     """Conta dias úteis entre ``inicio`` (inclusivo) e ``fim`` (exclusivo).
 
@@ -213,6 +228,10 @@ def contar(
             vigente antes de 26-12-2023, ``"atual"`` usa a lista vigente a partir
             dessa data e ``"auto"`` seleciona a lista por elemento com base em
             ``inicio``. Padrão: ``"auto"``.
+        motor: ``"polars"`` usa as funções de dias úteis do Polars com a
+            lista de feriados. ``"indice"`` consulta um índice pré-calculado de
+            dias úteis (1990 a 2100), mais rápido em grandes volumes; datas fora
+            desse intervalo resultam em nulo. Padrão: ``"polars"``.
 
     Returns:
         Inteiro ou ``None`` se ``inicio`` e ``fim`` forem datas únicas, ou Series
@@ -240,6 +259,10 @@ def contar(
         >>> du.contar("20-11-2024", "21-11-2024", calendario="anterior")
         1
 
+        Mesma contagem pelo índice pré-calculado de dias úteis:
+        >>> du.contar("15-12-2023", "01-01-2024", motor="indice")
+        10
+
         Contagem negativa quando ``inicio`` é posterior a ``fim``:
         >>> du.contar("08-01-2023", "01-01-2023")
         -5
@@ -277,7 +300,7 @@ def contar(
             data={"inicio": inicio, "fim": fim},
             nan_to_null=True,
         )
-        .select(dias_uteis=contar_expr("inicio", "fim", calendario))
+        .select(dias_uteis=contar_expr("inicio", "fim", calendario, motor))
         .get_column("dias_uteis")
     )
 
@@ -292,6 +315,7 @@ def deslocar_expr(
     deslocamento: int | pl.Expr | str,
     ajuste: Ajuste = "seguinte",
     calendario: Calendario = "auto",
+    motor: Motor = "polars",
 ) -> pl.Expr:
     """Cria uma expressão Polars para somar dias úteis.
 
@@ -308,6 +332,10 @@ def deslocar_expr(
             vigente antes de 26-12-2023, ``"atual"`` usa a lista vigente a partir
             dessa data e ``"auto"`` seleciona a lista por linha com base em
             ``data``. Padrão: ``"auto"``.
+        motor: ``"polars"`` usa as funções de dias úteis do Polars com a
+            lista de feriados. ``"indice"`` consulta um índice pré-calculado de
+            dias úteis (1990 a 2100), mais rápido em grandes volumes; datas fora
+            desse intervalo resultam em nulo. Padrão: ``"polars"``.
 
     Returns:
         Uma ``pl.Expr`` que resulta em Date.
@@ -351,6 +379,9 @@ def deslocar_expr(
 
     data = cv.converter_datas_expr(data)
 
+    if motor == "indice":
+        return _indice.deslocar_expr(data, deslocamento, ajuste, calendario)
+
     return data.dt.add_business_days(
         n=deslocamento,
         roll=_traduzir_ajuste(ajuste),
@@ -364,6 +395,7 @@ def deslocar(
     deslocamento: ArrayLike | int | None,
     ajuste: Ajuste = ...,
     calendario: Calendario = ...,
+    motor: Motor = ...,
 ) -> pl.Series: ...
 @overload
 def deslocar(
@@ -371,6 +403,7 @@ def deslocar(
     deslocamento: ArrayLike,
     ajuste: Ajuste = ...,
     calendario: Calendario = ...,
+    motor: Motor = ...,
 ) -> pl.Series: ...
 @overload
 def deslocar(
@@ -378,6 +411,7 @@ def deslocar(
     deslocamento: int,
     ajuste: Ajuste = ...,
     calendario: Calendario = ...,
+    motor: Motor = ...,
 ) -> dt.date: ...
 @overload
 def deslocar(
@@ -385,6 +419,7 @@ def deslocar(
     deslocamento: int,
     ajuste: Ajuste = ...,
     calendario: Calendario = ...,
+    motor: Motor = ...,
 ) -> None: ...
 @overload
 def deslocar(
@@ -392,6 +427,7 @@ def deslocar(
     deslocamento: None,
     ajuste: Ajuste = ...,
     calendario: Calendario = ...,
+    motor: Motor = ...,
 ) -> None: ...
 
 
@@ -400,6 +436,7 @@ def deslocar(
     deslocamento: int | ArrayLike | None,
     ajuste: Ajuste = "seguinte",
     calendario: Calendario = "auto",
+    motor: Motor = "polars",
 ) -> dt.date | pl.Series | None:
     """Desloca data(s) por um número de dias úteis com regime de feriados brasileiro.
 
@@ -450,6 +487,10 @@ def deslocar(
             vigente antes de 26-12-2023, ``"atual"`` usa a lista vigente a partir
             dessa data e ``"auto"`` seleciona a lista por elemento com base em
             ``datas``. Padrão: ``"auto"``.
+        motor: ``"polars"`` usa as funções de dias úteis do Polars com a
+            lista de feriados. ``"indice"`` consulta um índice pré-calculado de
+            dias úteis (1990 a 2100), mais rápido em grandes volumes; datas fora
+            desse intervalo resultam em nulo. Padrão: ``"polars"``.
 
     Returns:
         Um ``date`` Python para entradas escalares, uma Series Polars de datas para
@@ -577,6 +618,7 @@ def deslocar(
                 deslocamento="deslocamento",
                 ajuste=ajuste,
                 calendario=calendario,
+                motor=motor,
             )
         )
         .get_column("data_ajustada")
@@ -1,16 +1,25 @@
 """Contratos futuros negociados na B3."""
 
 from pyield.futuro import di1
+from pyield.futuro.coletor import IntradiaColetor
 from pyield.futuro.contratos import vencimento, vencimento_expr
-from pyield.futuro.historico import datas_disponiveis, enriquecer, historico
-from pyield.futuro.intradia import intradia
+from pyield.futuro.historico import (
+    datas_disponiveis,
+    enriquecer,
+    historico,
+    historico_lazy,
+)
+from pyield.futuro.intradia import intradia, intradia_varios
 
 __all__ = [
+    "IntradiaColetor",
     "datas_disponiveis",
     "di1",
     "enriquecer",
     "historico",
+    "historico_lazy",
     "intradia",
+    "intradia_varios",
     "vencimento",
     "vencimento_expr",
 ]
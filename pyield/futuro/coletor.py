@@ -0,0 +1,245 @@
+"""Coleta periódica de cotações intradia de futuros com histórico em disco.
+
+O :class:`IntradiaColetor` consulta :func:`pyield.futuro.intradia` para uma
+lista de contratos em intervalos fixos e acumula as mudanças num log
+append-only de arquivos parquet, organizado por dia e contrato::
+
+    diretorio/
+        2026-03-10/
+            DI1/
+                093000_000000.parquet
+                093100_000000.parquet
+            DOL/
+                ...
+
+Cada arquivo guarda apenas as linhas que mudaram desde a coleta anterior do
+mesmo contrato. As consultas (:meth:`IntradiaColetor.snapshot` e
+:meth:`IntradiaColetor.serie`) leem esse log, sem nova chamada à B3.
+"""
+
+import datetime as dt
+import logging
+import os
+import threading
+from pathlib import Path
+
+import polars as pl
+
+from pyield import relogio
+from pyield.futuro.intradia import intradia
+
+logger = logging.getLogger(__name__)
+
+_INTERVALO_PADRAO = 60.0  # segundos
+_COLUNA_HORARIO = "horario_coleta"
+_CHAVE = "codigo_negociacao"
+# Colunas que definem se um vencimento mudou entre duas coletas. Apenas as
+# presentes no contrato são usadas (ex.: ``taxa_ultima`` só em contratos de taxa).
+_COLUNAS_MUDANCA = (
+    "preco_ultimo",
+    "taxa_ultima",
+    "numero_negocios",
+    "volume_negociado",
+)
+
+
+class IntradiaColetor:
+    """Coleta cotações intradia de futuros e guarda as mudanças em disco.
+
+    Args:
+        contratos: Contrato ou lista de contratos futuros da B3
+            (ex.: ``["DI1", "DAP", "DOL"]``).
+        diretorio: Diretório do log de coletas. É criado se não existir e pode
+            ser reaproveitado entre execuções.
+        intervalo: Segundos entre coletas quando em execução com
+            :meth:`iniciar`. Padrão: 60.
+
+    Examples:
+        >>> coletor = yd.futuro.IntradiaColetor(["DI1", "DOL"], "coletas")
+        >>> coletor.iniciar()  # doctest: +SKIP
+        >>> df = coletor.snapshot()  # doctest: +SKIP
+        >>> ticks = coletor.serie("DI1F27")  # doctest: +SKIP
+        >>> coletor.parar()  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        contratos: str | list[str],
+        diretorio: str | os.PathLike[str],
+        intervalo: float = _INTERVALO_PADRAO,
+    ) -> None:
+        if isinstance(contratos, str):
+            contratos = [contratos]
+        self.contratos = [c.strip().upper() for c in contratos if c.strip()]
+        self.diretorio = Path(diretorio)
+        self.intervalo = intervalo
+        # Dia e última versão coletada de cada contrato, base do próximo diff
+        self._ultimos: dict[str, tuple[dt.date, pl.DataFrame]] = {}
+        self._trava = threading.Lock()
+        self._parada = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def coletar(self) -> int:
+        """Executa uma rodada de coleta para todos os contratos.
+
+        Returns:
+            Número de linhas novas gravadas no log.
+        """
+        horario = relogio.agora().replace(tzinfo=None)
+        total = 0
+        with self._trava:
+            for contrato in self.contratos:
+                try:
+                    df = intradia(contrato)
+                except Exception:
+                    logger.exception("Falha na coleta intradia de %s.", contrato)
+                    continue
+                total += self._registrar(contrato, df, horario)
+        return total
+
+    def iniciar(self) -> None:
+        """Inicia as coletas periódicas numa thread em segundo plano."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._parada.clear()
+        self._thread = threading.Thread(
+            target=self._executar, name="IntradiaColetor", daemon=True
+        )
+        self._thread.start()
+
+    def parar(self, timeout: float | None = None) -> None:
+        """Interrompe as coletas periódicas e aguarda a thread terminar."""
+        self._parada.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def snapshot(
+        self,
+        horario: dt.datetime | None = None,
+        contrato: str | None = None,
+    ) -> pl.DataFrame:
+        """Reconstrói o estado dos vencimentos num dado horário.
+
+        Para cada ``codigo_negociacao``, devolve a última linha coletada até
+        ``horario`` (inclusive), no dia de ``horario``.
+
+        Args:
+            horario: Horário de coleta desejado, no fuso de Brasília e sem
+                timezone. Se None (padrão), usa o horário atual.
+            contrato: Restringe o resultado a um contrato. Se None (padrão),
+                inclui todos os contratos coletados.
+
+        Returns:
+            DataFrame com as colunas de :func:`pyield.futuro.intradia` e
+            ``horario_coleta``. Retorna DataFrame vazio se não houver coletas.
+        """
+        if horario is None:
+            horario = relogio.agora().replace(tzinfo=None)
+        df = self._ler_log([horario.date()], contrato)
+        if df.is_empty():
+            return df
+        return (
+            df.filter(pl.col(_COLUNA_HORARIO) <= horario)
+            .group_by(_CHAVE, maintain_order=True)
+            .last()
+            .sort(_CHAVE)
+        )
+
+    def serie(
+        self,
+        codigo_negociacao: str | list[str],
+        inicio: dt.datetime | None = None,
+        fim: dt.datetime | None = None,
+    ) -> pl.DataFrame:
+        """Série temporal das mudanças coletadas de um ou mais vencimentos.
+
+        Args:
+            codigo_negociacao: Código ou lista de códigos de negociação
+                (ex.: ``"DI1F27"``).
+            inicio: Primeiro horário de coleta (inclusivo). Se None (padrão),
+                começa no dia atual.
+            fim: Último horário de coleta (inclusivo). Se None (padrão),
+                vai até o horário atual.
+
+        Returns:
+            DataFrame com uma linha por mudança registrada, ordenado por
+            código e ``horario_coleta``.
+        """
+        if isinstance(codigo_negociacao, str):
+            codigo_negociacao = [codigo_negociacao]
+        agora = relogio.agora().replace(tzinfo=None)
+        fim = fim or agora
+        inicio = inicio or dt.datetime.combine(fim.date(), dt.time())
+
+        dias = pl.date_range(inicio.date(), fim.date(), eager=True).to_list()
+        contratos = {codigo[:3] for codigo in codigo_negociacao}
+        dfs = [self._ler_log(dias, contrato) for contrato in sorted(contratos)]
+        dfs = [df for df in dfs if not df.is_empty()]
+        if not dfs:
+            return pl.DataFrame()
+        return (
+            pl.concat(dfs, how="diagonal_relaxed")
+            .filter(
+                pl.col(_CHAVE).is_in(codigo_negociacao),
+                pl.col(_COLUNA_HORARIO).is_between(inicio, fim),
+            )
+            .sort(_CHAVE, _COLUNA_HORARIO)
+        )
+
+    def _executar(self) -> None:
+        while not self._parada.is_set():
+            self.coletar()
+            self._parada.wait(self.intervalo)
+
+    def _registrar(self, contrato: str, df: pl.DataFrame, horario: dt.datetime) -> int:
+        if df.is_empty():
+            return 0
+        dia = horario.date()
+        dia_anterior, anterior = self._ultimos.get(contrato, (None, None))
+        if anterior is None or dia_anterior != dia:
+            # Início do dia ou retomada: o diff parte do que já está no log
+            anterior = self.snapshot(horario, contrato)
+        novas = _linhas_alteradas(df, anterior)
+        self._ultimos[contrato] = (dia, df)
+        if novas.is_empty():
+            return 0
+
+        novas = novas.with_columns(pl.lit(horario).alias(_COLUNA_HORARIO))
+        pasta = self.diretorio / dia.isoformat() / contrato
+        pasta.mkdir(parents=True, exist_ok=True)
+        # Grava em arquivo temporário e renomeia: o log nunca contém um
+        # arquivo parcial, mesmo se o processo for interrompido.
+        destino = pasta / f"{horario:%H%M%S_%f}.parquet"
+        temporario = destino.with_suffix(".tmp")
+        novas.write_parquet(temporario)
+        temporario.replace(destino)
+        return novas.height
+
+    def _ler_log(self, dias: list[dt.date], contrato: str | None) -> pl.DataFrame:
+        arquivos = []
+        for dia in dias:
+            pasta_dia = self.diretorio / dia.isoformat()
+            padrao = f"{contrato.upper()}/*.parquet" if contrato else "*/*.parquet"
+            arquivos.extend(sorted(pasta_dia.glob(padrao)))
+        if not arquivos:
+            return pl.DataFrame()
+        # Colunas opcionais (ex.: ofertas) podem faltar em algumas coletas
+        return pl.concat(
+            [pl.read_parquet(arquivo) for arquivo in arquivos],
+            how="diagonal_relaxed",
+        ).sort(_COLUNA_HORARIO, maintain_order=True)
+
+
+def _linhas_alteradas(atual: pl.DataFrame, anterior: pl.DataFrame) -> pl.DataFrame:
+    """Linhas de ``atual`` novas ou com último preço/volume diferente."""
+    colunas = [c for c in _COLUNAS_MUDANCA if c in atual.columns]
+    if anterior.is_empty() or not set(colunas).issubset(anterior.columns):
+        return atual
+    referencia = anterior.select(_CHAVE, *colunas)
+    comparacao = atual.join(referencia, on=_CHAVE, how="left", suffix="_anterior")
+    # Vencimento novo: chave ausente na coleta anterior
+    mudou = ~pl.col(_CHAVE).is_in(referencia.get_column(_CHAVE).implode())
+    for coluna in colunas:
+        mudou |= pl.col(coluna).ne_missing(pl.col(f"{coluna}_anterior"))
+    return comparacao.filter(mudou).select(atual.columns)
@@ -6,7 +6,7 @@ import polars.selectors as cs
 import pyield._internal.converters as cv
 from pyield import du
 from pyield._internal.br_numbers import pct_para_decimal
-from pyield._internal.data_cache import obter_dataset_cacheado
+from pyield._internal.data_cache import obter_dataset_lazy
 from pyield._internal.types import DateLike, DatesLike, any_is_empty
 from pyield.b3._validar_pregao import data_negociacao_valida
 from pyield.futuro import contratos as ct
@@ -101,14 +101,31 @@ _RENOMEAR_COLUNAS_PR = {
 }
 
 
-def _obter_cache_filtrado(contrato: str) -> pl.DataFrame:
-    """Carrega o dataset PR cacheado e filtra por contrato."""
-    return obter_dataset_cacheado("futuro").filter(
+def _obter_cache_filtrado(contrato: str) -> pl.LazyFrame:
+    """Varre o dataset PR cacheado filtrando por contrato na leitura."""
+    return obter_dataset_lazy("futuro").filter(
         pl.col("TckrSymb").str.starts_with(contrato)
     )
 
 
-def _enriquecer_dados(df: pl.DataFrame, contrato: str) -> pl.DataFrame:
+def _filtrar_contrato(lf: pl.LazyFrame, contrato: str) -> pl.LazyFrame:
+    lf = lf.rename(_RENOMEAR_COLUNAS_PR)
+    return lf.filter(
+        pl.col("codigo_negociacao").str.starts_with(contrato),
+        pl.col("codigo_negociacao").str.len_chars() == _COMPRIMENTO_TICKER,
+    )
+
+
+def _enriquecer_contrato(lf: pl.LazyFrame, contrato: str) -> pl.LazyFrame:
+    lf = lf.with_columns(
+        data_vencimento=ct.vencimento_expr("codigo_negociacao", contrato)
+    )
+    lf = _enriquecer_dados(lf, contrato)
+    lf = _selecionar_colunas_saida(lf, contrato)
+    return lf.sort("data_referencia", "data_vencimento")
+
+
+def _enriquecer_dados(df: pl.LazyFrame, contrato: str) -> pl.LazyFrame:
     df = df.with_columns(
         dias_uteis=du.contar_expr("data_referencia", "data_vencimento"),
         dias_corridos=(
@@ -138,12 +155,13 @@ def _enriquecer_dados(df: pl.DataFrame, contrato: str) -> pl.DataFrame:
     return df
 
 
-def _selecionar_colunas_saida(df: pl.DataFrame, contrato: str) -> pl.DataFrame:
+def _selecionar_colunas_saida(df: pl.LazyFrame, contrato: str) -> pl.LazyFrame:
     if contrato in ct.CONTRATOS_TAXA:
         colunas = _COLUNAS_CONTRATO_TAXA
     else:
         colunas = _COLUNAS_CONTRATO_PRECO
-    return df.select(c for c in colunas if c in df.columns)
+    disponiveis = df.collect_schema().names()
+    return df.select(c for c in colunas if c in disponiveis)
 
 
 def buscar_historico_cacheado(datas: list[dt.date], contrato: str) -> pl.DataFrame:
@@ -151,8 +169,8 @@ def buscar_historico_cacheado(datas: list[dt.date], contrato: str) -> pl.DataFra
     if not datas:
         return pl.DataFrame()
 
-    df = _obter_cache_filtrado(contrato)
-    df = df.filter(pl.col("TradDt").is_in(datas))
+    df = _obter_cache_filtrado(contrato).filter(pl.col("TradDt").is_in(datas))
+    df = df.collect()
     if df.is_empty():
         return pl.DataFrame()
 
@@ -177,20 +195,11 @@ def enriquecer(df: pl.DataFrame, contrato: str) -> pl.DataFrame:
     if df.is_empty():
         return pl.DataFrame()
 
-    df = df.rename(_RENOMEAR_COLUNAS_PR)
-    df = df.filter(
-        pl.col("codigo_negociacao").str.starts_with(contrato),
-        pl.col("codigo_negociacao").str.len_chars() == _COMPRIMENTO_TICKER,
-    )
+    df = _filtrar_contrato(df.lazy(), contrato).collect()
     if df.is_empty():
         return pl.DataFrame()
-    df = df.with_columns(
-        data_vencimento=ct.vencimento_expr("codigo_negociacao", contrato)
-    )
-    df = _enriquecer_dados(df, contrato)
-    df = _selecionar_colunas_saida(df, contrato)
 
-    return df.sort("data_referencia", "data_vencimento")
+    return _enriquecer_contrato(df.lazy(), contrato).collect()
 
 
 def historico(data: DateLike | DatesLike, contrato: str) -> pl.DataFrame:
@@ -294,6 +303,59 @@ def historico(data: DateLike | DatesLike, contrato: str) -> pl.DataFrame:
     return buscar_historico_cacheado([dados_convertidos], contrato)
 
 
+def historico_lazy(
+    contrato: str,
+    inicio: DateLike | None = None,
+    fim: DateLike | None = None,
+) -> pl.LazyFrame:
+    """Varre o histórico de futuros no dataset PR cacheado sem carregá-lo.
+
+    Versão lazy de ``historico`` para períodos: os filtros de contrato (prefixo
+    do ticker) e de período são aplicados na leitura do parquet em cache e
+    usam as estatísticas dos row groups, de modo que consultas de poucos dias
+    não decodificam o histórico inteiro. Os filtros de período são inclusivos.
+
+    Args:
+        contrato: Contrato futuro na B3 (ex.: ``DI1``, ``DOL``).
+        inicio: Data inicial do período. Se omitida, não limita o início.
+        fim: Data final do período. Se omitida, não limita o fim.
+
+    Returns:
+        LazyFrame Polars com as mesmas colunas e ordenação de ``historico``.
+
+    Raises:
+        ValueError: Se ``inicio`` for posterior a ``fim``.
+
+    Notes:
+        Prefira ``inicio`` e ``fim`` a filtrar ``data_referencia`` no
+        resultado: as colunas derivadas (ex.: ``taxa_forward``) dependem de
+        todos os vencimentos da data e impedem que filtros posteriores sejam
+        empurrados para a leitura.
+
+        A leitura parcial do arquivo só ocorre com o cache em disco habilitado
+        pela variável de ambiente ``PYIELD_CACHE_DIR``. Sem ela, o
+        ``LazyFrame`` é construído sobre o histórico em memória.
+
+    Examples:
+        >>> lf = yd.futuro.historico_lazy("DI1", inicio="29-05-2024", fim="31-05-2024")
+        >>> lf.collect()["data_referencia"].unique().sort().to_list()
+        [datetime.date(2024, 5, 29), datetime.date(2024, 5, 31)]
+    """
+    data_inicio = cv.converter_datas(inicio) if inicio is not None else None
+    data_fim = cv.converter_datas(fim) if fim is not None else None
+    if data_inicio is not None and data_fim is not None and data_inicio > data_fim:
+        msg = "inicio deve ser menor ou igual a fim."
+        raise ValueError(msg)
+
+    lf = _obter_cache_filtrado(contrato)
+    if data_inicio is not None:
+        lf = lf.filter(pl.col("TradDt") >= data_inicio)
+    if data_fim is not None:
+        lf = lf.filter(pl.col("TradDt") <= data_fim)
+
+    return _enriquecer_contrato(_filtrar_contrato(lf, contrato), contrato)
+
+
 def datas_disponiveis(contrato: str) -> pl.Series:
     """Retorna as datas disponíveis no dataset histórico cacheado.
 
@@ -315,9 +377,8 @@ def datas_disponiveis(contrato: str) -> pl.Series:
     """
     return (
         _obter_cache_filtrado(contrato)
-        .get_column("TradDt")
-        .drop_nulls()
-        .unique()
-        .sort()
+        .select(pl.col("TradDt").drop_nulls().unique().sort())
+        .collect()
+        .to_series()
         .alias("data_referencia")
     )
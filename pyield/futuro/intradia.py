@@ -1,3 +1,5 @@
+import asyncio
+
 import polars as pl
 import polars.selectors as cs
 
@@ -22,6 +24,10 @@ _PRECO_PARA_TAXA_INTRADIA = {
     "preco_oferta_venda": "taxa_oferta_venda",
 }
 
+# Consultas simultâneas em intradia_varios. Fica abaixo do pool de conexões do
+# transporte HTTP (10 por host), para que todas as conexões sejam reaproveitadas.
+_MAX_CONCORRENCIA = 6
+
 # Ordem preferida de colunas na saída. Colunas preco_* e taxa_* são
 # mutuamente exclusivas — o rename no preprocessamento garante isso.
 _ORDEM_COLUNAS = (
@@ -132,7 +138,52 @@ def intradia(contrato: str) -> pl.DataFrame:
         return pl.DataFrame()
     if not intradia_disponivel():
         return pl.DataFrame()
+    return _buscar_intradia(contrato)
+
+
+async def intradia_varios(
+    contratos: list[str],
+    max_concorrencia: int = _MAX_CONCORRENCIA,
+) -> dict[str, pl.DataFrame]:
+    """Busca os dados intradia de vários contratos futuros em paralelo.
+
+    Versão assíncrona de :func:`intradia` para vários contratos: as consultas
+    à B3 são feitas simultaneamente, reaproveitando as conexões HTTP, em vez
+    de uma após a outra.
+
+    Args:
+        contratos: Lista de contratos futuros negociados na B3
+            (ex.: ``["DI1", "DAP", "DOL"]``).
+        max_concorrencia: Número máximo de consultas simultâneas. Padrão: 6.
+
+    Returns:
+        Dicionário ``{contrato: DataFrame}`` na ordem de ``contratos``, com as
+        mesmas colunas de :func:`intradia`. Fora do horário de pregão, todos
+        os DataFrames são vazios.
+
+    Examples:
+        >>> import asyncio
+        >>> dfs = asyncio.run(yd.futuro.intradia_varios(["DI1", "DOL"]))
+        >>> list(dfs)
+        ['DI1', 'DOL']
+    """
+    contratos = list(dict.fromkeys(c for c in contratos if c))
+    if not intradia_disponivel():
+        return {contrato: pl.DataFrame() for contrato in contratos}
+
+    semaforo = asyncio.Semaphore(max_concorrencia)
+
+    async def buscar(contrato: str) -> pl.DataFrame:
+        async with semaforo:
+            # requests é síncrono: cada consulta roda numa thread, e o
+            # transporte compartilhado mantém as conexões com a B3 abertas.
+            return await asyncio.to_thread(_buscar_intradia, contrato)
+
+    resultados = await asyncio.gather(*(buscar(c) for c in contratos))
+    return dict(zip(contratos, resultados, strict=True))
+
 
+def _buscar_intradia(contrato: str) -> pl.DataFrame:
     df = derivativo_intradia(contrato)
     if df.is_empty():
         return pl.DataFrame()
@@ -188,6 +188,10 @@ class Interpolador:
         com expressões Polars) ou a função top-level ``interpolar`` (curva
         única ou multi-curva sem Polars).
 
+        O vértice seguinte a cada DU é localizado de uma só vez com
+        ``search_sorted`` e a fórmula do método é avaliada de forma colunar,
+        sem chamadas Python por linha.
+
         Args:
             du: Sequência de DUs (lista, tupla, ``pl.Series``, ``np.ndarray``,
                 etc.) com os pontos a interpolar.
@@ -197,10 +201,57 @@ class Interpolador:
             da entrada. ``null`` quando o DU for nulo, negativo, ou estiver
             acima do maior vértice conhecido com ``extrapolar=False``.
         """
-        s_dus = pl.Series(name="taxa_interpolada", values=du, dtype=pl.Int64)
-        return s_dus.map_elements(
-            self._taxa_interpolada, return_dtype=pl.Float64
-        ).fill_nan(None)
+        s_dus = pl.Series(name="du", values=du, dtype=pl.Int64)
+        dus = self._df.get_column("dus")
+        txs = self._df.get_column("txs")
+
+        # k tal que dus[k-1] < du <= dus[k]. Os índices são limitados às pontas
+        # da curva, cujos casos são tratados separadamente abaixo.
+        ultimo = len(dus) - 1
+        k = dus.search_sorted(s_dus, side="left").cast(pl.Int64)
+        k = k.clip(min(1, ultimo), ultimo)
+        j = (k - 1).clip(0, ultimo)
+        df = pl.DataFrame(
+            {
+                "du": s_dus,
+                "du_j": dus.gather(j),
+                "tx_j": txs.gather(j),
+                "du_k": dus.gather(k),
+                "tx_k": txs.gather(k),
+            }
+        )
+
+        colunas = [pl.col(c) for c in ("du", "du_j", "tx_j", "du_k", "tx_k")]
+        match self._method:
+            case "linear":
+                expr_meio = _linear_expr(*colunas)
+            case "flat_forward":
+                expr_meio = _flat_forward_expr(*colunas)
+            case _:
+                msg = f"Método de interpolação '{self._method}' não reconhecido."
+                raise ValueError(msg)
+
+        nulo = pl.lit(None, dtype=pl.Float64)
+        taxa = (
+            pl.when(pl.col("du").is_null() | (pl.col("du") < 0))
+            .then(nulo)
+            .when(pl.col("du") < self._dus[0])
+            .then(self._txs[0])
+            .when(pl.col("du") > self._dus[-1])
+            .then(pl.lit(self._txs[-1]) if self._extrapolate else nulo)
+            .when(pl.col("du") == pl.col("du_j"))
+            .then(pl.col("tx_j"))
+            .when(pl.col("du") == pl.col("du_k"))
+            .then(pl.col("tx_k"))
+            .otherwise(expr_meio.fill_nan(None))
+        )
+        # Execução lazy para que o Polars reaproveite subexpressões comuns.
+        return (
+            df.lazy()
+            .select(taxa_interpolada=taxa)
+            .collect()
+            .get_column("taxa_interpolada")
+        )
 
     def interpolar_expr(self, du: str | pl.Expr) -> pl.Expr:
         """Cria expressão Polars que interpola taxas para uma coluna de DU.
@@ -210,6 +261,10 @@ class Interpolador:
         cálculo de inflação implícita na mesma chamada). A curva e o método são
         os configurados na instância.
 
+        A interpolação é colunar (``search_sorted`` sobre os vértices e fórmula
+        avaliada pelo Polars), sem chamadas Python por linha. A expressão é
+        elemento a elemento, podendo ser dividida em lotes pelo motor do Polars.
+
         Args:
             du: Nome de coluna ou expressão Polars com os DUs alvo. A coluna
                 deve ser inteira (será convertida para Int64 internamente).
@@ -238,7 +293,9 @@ class Interpolador:
             └─────┴──────────┘
         """
         expr = pl.col(du) if isinstance(du, str) else du
-        return expr.map_batches(self._interpolar_serie, return_dtype=pl.Float64)
+        return expr.map_batches(
+            self._interpolar_serie, return_dtype=pl.Float64, is_elementwise=True
+        )
 
     def _taxa_interpolada(self, du: int) -> float:
         """Encontra o ponto de interpolação apropriado e retorna a taxa de juros.
@@ -308,6 +365,38 @@ class Interpolador:
         return len(self._df)
 
 
+def _linear_expr(
+    du: pl.Expr,
+    du_j: pl.Expr,
+    tx_j: pl.Expr,
+    du_k: pl.Expr,
+    tx_k: pl.Expr,
+) -> pl.Expr:
+    """Expressão da interpolação linear entre os vértices ``j`` e ``k``."""
+    return tx_j + (du - du_j) * (tx_k - tx_j) / (du_k - du_j)
+
+
+def _flat_forward_expr(
+    du: pl.Expr,
+    du_j: pl.Expr,
+    tx_j: pl.Expr,
+    du_k: pl.Expr,
+    tx_k: pl.Expr,
+) -> pl.Expr:
+    """Expressão da interpolação flat forward entre os vértices ``j`` e ``k``.
+
+    Segue a mesma ordem de operações de :meth:`Interpolador.flat_forward`.
+    """
+    # Siglas: fa = fator acumulado; ft = fator de tempo.
+    au = du / 252
+    au_j = du_j / 252
+    au_k = du_k / 252
+    fa_j = (1 + tx_j).pow(au_j)
+    fa_k = (1 + tx_k).pow(au_k)
+    ft = (au - au_j) / (au_k - au_j)
+    return (fa_j * (fa_k / fa_j).pow(ft)).pow(1 / au) - 1
+
+
 def interpolar(  # noqa: PLR0913
     dus_alvo: pl.Series,
     dus_curva: pl.Series,
@@ -475,13 +564,13 @@ def interpolar(  # noqa: PLR0913
     )
 
     # Flat-forward: tx = (fⱼ^auⱼ * (fₖ^auₖ / fⱼ^auⱼ)^ft)^(1/au) - 1
-    au = pl.col("du_alvo") / 252
-    au_j = pl.col("du_j") / 252
-    au_k = pl.col("du_k") / 252
-    fa_j = (1 + pl.col("tx_j")).pow(au_j)
-    fa_k = (1 + pl.col("tx_k")).pow(au_k)
-    ft = (au - au_j) / (au_k - au_j)
-    expr_meio = (fa_j * (fa_k / fa_j).pow(ft)).pow(1 / au) - 1
+    expr_meio = _flat_forward_expr(
+        pl.col("du_alvo"),
+        pl.col("du_j"),
+        pl.col("tx_j"),
+        pl.col("du_k"),
+        pl.col("tx_k"),
+    )
 
     taxa = (
         pl.when(pl.col("du_alvo").is_null() | pl.col("du_min").is_null())
@@ -18,12 +18,11 @@ dicionário {período: valor} (ex.: {"202501": "0.16", "202502": "1.31"}).
 """
 
 import polars as pl
-import requests
 
+from pyield._internal import transporte
 from pyield._internal.br_numbers import pct_para_decimal
 from pyield._internal.cache import ttl_cache
 from pyield._internal.converters import converter_datas
-from pyield._internal.retry import retry_padrao
 from pyield._internal.types import DateLike, any_is_empty
 
 _URL_BASE = "https://servicodados.ibge.gov.br/api/v3/agregados/1737/periodos/"
@@ -33,11 +32,9 @@ _VAR_INDICE = 2266
 
 
 @ttl_cache()
-@retry_padrao
 def _buscar_dados_api(url: str) -> dict[str, str]:
     """Busca dados da API do IBGE e retorna o dicionário da série."""
-    resposta = requests.get(url, timeout=10)
-    resposta.raise_for_status()
+    resposta = transporte.get(url, timeout=10)
     dados = resposta.json()
     if not dados:
         raise ValueError(f"Nenhum dado disponível para a URL: {url}")
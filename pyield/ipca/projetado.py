@@ -4,9 +4,9 @@ from dataclasses import dataclass
 import polars as pl
 import requests
 
+from pyield._internal import transporte
 from pyield._internal.cache import ttl_cache
 from pyield._internal.excel import ler_sem_cabecalho
-from pyield._internal.retry import retry_padrao
 
 _URL_XLS = "https://www.anbima.com.br/informacoes/indicadores/arqs/indicadores.xls"
 
@@ -19,12 +19,10 @@ class ProjecaoIndicador:
 
 
 @ttl_cache()
-@retry_padrao
 def _baixar_planilha() -> bytes:
     """Baixa o arquivo XLS de indicadores da ANBIMA e retorna os bytes."""
     try:
-        r = requests.get(_URL_XLS, timeout=10)
-        r.raise_for_status()
+        r = transporte.get(_URL_XLS, timeout=10)
         return r.content
     except requests.exceptions.RequestException as e:
         raise ConnectionError(f"Erro ao acessar a planilha da ANBIMA: {e}")
@@ -0,0 +1,18 @@
+"""Conexões HTTP usadas pelo PYield para buscar dados externos.
+
+Cada host (ANBIMA, B3, BCB, Tesouro...) tem uma sessão própria com pool de
+conexões keep-alive, novas tentativas em erros transitórios e métricas de
+uso. Este módulo permite limitar a taxa de requisições a um host, ajustar o
+tamanho do pool, consultar as métricas e fechar as conexões abertas.
+
+Examples:
+    >>> import pyield as yd
+    >>> yd.rede.configurar("api.bcb.gov.br", requisicoes_por_segundo=5)
+    >>> yd.rede.metricas().columns[:3]
+    ['host', 'requisicoes', 'falhas']
+    >>> yd.rede.fechar()
+"""
+
+from pyield._internal.transporte import configurar, fechar, metricas
+
+__all__ = ["configurar", "fechar", "metricas"]
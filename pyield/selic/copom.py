@@ -18,11 +18,10 @@ import datetime
 import logging
 
 import polars as pl
-import requests
 
 from pyield import du, relogio
+from pyield._internal import transporte
 from pyield._internal.converters import converter_datas
-from pyield._internal.retry import retry_padrao
 from pyield._internal.types import DateLike
 
 logger = logging.getLogger(__name__)
@@ -56,11 +55,9 @@ _FUTURE_MEETINGS_2026: list[tuple[datetime.date, datetime.date]] = [
 _ALL_FUTURE_MEETINGS: list[tuple[datetime.date, datetime.date]] = _FUTURE_MEETINGS_2026
 
 
-@retry_padrao
 def _chamar_api_atas(quantidade: int = 500) -> list[dict]:
     """Fetch raw COPOM meeting list from the BCB atas API."""
-    resposta = requests.get(URL_ATAS, params={"quantidade": quantidade}, timeout=10)
-    resposta.raise_for_status()
+    resposta = transporte.get(URL_ATAS, params={"quantidade": quantidade}, timeout=10)
     return resposta.json().get("conteudo", [])
 
 
@@ -33,13 +33,13 @@ if the calendar has gaps for very recently announced future meetings.
 
 import datetime as dt
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import polars as pl
-import requests
 
 import pyield._internal.converters as cv
 from pyield import du
-from pyield._internal.retry import retry_padrao
+from pyield._internal import transporte
 from pyield._internal.types import DateLike
 from pyield.b3 import boletim
 
@@ -64,6 +64,8 @@ _MONTH_CODES: dict[str, int] = {
 # Polars-compatible replacement map (str → str, cast later)
 _MONTH_CODE_STR: dict[str, str] = {k: str(v) for k, v in _MONTH_CODES.items()}
 _CPM_TICKER_LENGTH = 13
+# Pregões baixados simultaneamente (SPR e CSV de preços de ajuste)
+_MAX_DOWNLOADS = 4
 
 # Mapeamento mínimo para consumo do módulo CPM a partir do schema XML bruto.
 _RENOMEAR_COLUNAS_CPM = {
@@ -100,7 +102,6 @@ _CSV_ESQUEMA = {k: v[0] for k, v in _CSV_CONFIG_COLUNAS.items()}
 _CSV_MAPA_RENOMEACAO = {k: v[1] for k, v in _CSV_CONFIG_COLUNAS.items()}
 
 
-@retry_padrao
 def _buscar_csv(data: dt.date) -> bytes:
     """Busca o CSV diário de derivativos consolidados na B3."""
     url = "https://arquivos.b3.com.br/bdi/table/export/csv"
@@ -118,10 +119,9 @@ def _buscar_csv(data: dt.date) -> bytes:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",  # noqa: E501
         "Accept": "application/json, text/plain, */*",
     }
-    resposta = requests.post(
+    resposta = transporte.post(
         url, params=parametros, json=carga, headers=cabecalhos, timeout=(5, 30)
     )
-    resposta.raise_for_status()
     return resposta.content
 
 
@@ -281,6 +281,78 @@ def data(date: DateLike) -> pl.DataFrame:
     df = df.rename(_RENOMEAR_COLUNAS_CPM, strict=False)
     df = df.with_columns(data_referencia=trade_date)
 
+    # preco_ajuste: "Preço de Referência" da B3 via endpoint CSV.
+    # O XML SPR para contratos de opções não contém este campo;
+    # o XML é usado apenas para obter a lista de contratos (códigos de negociação).
+    precos_ajuste = _fetch_settlement_prices(trade_date).with_columns(
+        data_referencia=pl.lit(trade_date)
+    )
+    return _enriquecer(df, precos_ajuste, _calendario())
+
+
+def _dados_pregao(trade_date: dt.date) -> tuple[pl.DataFrame, pl.DataFrame] | None:
+    """SPR e preços de ajuste de um pregão, ou None se não houver dados."""
+    try:
+        df = boletim.buscar(trade_date, prefixo_ticker="CPM")
+    except Exception:
+        logger.exception("CPM: falha ao baixar SPR para %s.", trade_date)
+        return None
+    if df.is_empty():
+        return None
+    df = df.rename(_RENOMEAR_COLUNAS_CPM, strict=False)
+    df = df.with_columns(data_referencia=trade_date)
+    precos_ajuste = _fetch_settlement_prices(trade_date).with_columns(
+        data_referencia=pl.lit(trade_date)
+    )
+    return df, precos_ajuste
+
+
+def _dados_periodo(inicio: DateLike, fim: DateLike) -> pl.DataFrame:
+    """
+    Versão de :func:`data` para todos os pregões entre ``inicio`` e ``fim``.
+
+    O SPR e os preços de ajuste de cada pregão são baixados em threads e o
+    calendário do COPOM é carregado uma única vez. Como em :func:`data`, uma
+    falha no download do SPR descarta apenas o pregão afetado.
+    """
+    datas = du.gerar(inicio, fim).to_list()
+    if not datas:
+        return _empty_schema()
+    with ThreadPoolExecutor(max_workers=min(_MAX_DOWNLOADS, len(datas))) as executor:
+        pregoes = [
+            pregao
+            for pregao in executor.map(_dados_pregao, datas)
+            if pregao is not None
+        ]
+    if not pregoes:
+        return _empty_schema()
+    df = pl.concat(df for df, _ in pregoes)
+    precos_ajuste = pl.concat(precos for _, precos in pregoes)
+    return _enriquecer(df, precos_ajuste, _calendario())
+
+
+def _calendario() -> pl.DataFrame:
+    """Calendário do COPOM com as chaves de junção (mês e ano da reunião)."""
+    # Import adiado para evitar risco de dependência circular no nível do módulo.
+    from pyield.selic import copom  # noqa: PLC0415
+
+    return copom.calendar().select(
+        _mes_reuniao=pl.col("EndDate").dt.month().cast(pl.Int32),
+        _ano_reuniao=pl.col("EndDate").dt.year().cast(pl.Int32),
+        data_fim_reuniao=pl.col("EndDate"),
+        data_expiracao=pl.col("ExpiryDate"),
+    )
+
+
+def _enriquecer(
+    df: pl.DataFrame, precos_ajuste: pl.DataFrame, calendario: pl.DataFrame
+) -> pl.DataFrame:
+    """
+    Deriva os campos do código de negociação e junta calendário e preços.
+
+    ``df`` tem ``data_referencia`` e ``codigo_negociacao``; ``precos_ajuste``
+    tem ``data_referencia``, ``codigo_negociacao`` e ``preco_ajuste``.
+    """
     # Extrai tipo de opção (codigo_negociacao[6]) e variação de strike (codigo_negociacao[7:13])
     # inteiramente com expressões de string Polars — sem loops Python.
     df = df.with_columns(
@@ -312,17 +384,7 @@ def data(date: DateLike) -> pl.DataFrame:
     )
 
     # Join with COPOM calendar to get MeetingEndDate and the correct ExpiryDate.
-    # Import is deferred to avoid a module-level circular dependency risk.
-    from pyield.selic import copom  # noqa: PLC0415
-
-    cal = copom.calendar().select(
-        _mes_reuniao=pl.col("EndDate").dt.month().cast(pl.Int32),
-        _ano_reuniao=pl.col("EndDate").dt.year().cast(pl.Int32),
-        data_fim_reuniao=pl.col("EndDate"),
-        data_expiracao=pl.col("ExpiryDate"),
-    )
-
-    df = df.join(cal, on=["_mes_reuniao", "_ano_reuniao"], how="left").drop(
+    df = df.join(calendario, on=["_mes_reuniao", "_ano_reuniao"], how="left").drop(
         "_mes_reuniao", "_ano_reuniao"
     )
 
@@ -331,14 +393,16 @@ def data(date: DateLike) -> pl.DataFrame:
         dias_uteis=du.contar_expr("data_referencia", "data_expiracao").cast(pl.Int32)
     )
 
-    # preco_ajuste: "Preço de Referência" da B3 via endpoint CSV.
-    # O XML SPR para contratos de opções não contém este campo;
-    # o XML é usado acima apenas para obter a lista de contratos (códigos de negociação).
-    precos_ajuste = _fetch_settlement_prices(trade_date)
-    if not precos_ajuste.is_empty():
-        df = df.join(precos_ajuste, on="codigo_negociacao", how="left")
-    else:
-        df = df.with_columns(preco_ajuste=pl.lit(None, dtype=pl.Float64))
+    # Contratos sem preço no CSV ficam com preco_ajuste nulo.
+    df = df.join(
+        precos_ajuste.select(
+            "data_referencia",
+            "codigo_negociacao",
+            pl.col("preco_ajuste").cast(pl.Float64),
+        ),
+        on=["data_referencia", "codigo_negociacao"],
+        how="left",
+    )
 
     return df.select(
         pl.col("data_referencia"),
@@ -349,4 +413,4 @@ def data(date: DateLike) -> pl.DataFrame:
         pl.col("variacao_strike_bps"),
         pl.col("preco_ajuste"),
         pl.col("dias_uteis"),
-    ).sort("data_expiracao", "variacao_strike_bps")
+    ).sort("data_referencia", "data_expiracao", "variacao_strike_bps")
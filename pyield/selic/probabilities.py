@@ -107,10 +107,13 @@ def _empty_schema() -> pl.DataFrame:
 def _add_meeting_rank(df: pl.DataFrame) -> pl.DataFrame:
     """
     Adiciona ranking_reuniao: 1 = data_expiracao mais próxima, 2 = seguinte, etc.
-    Calculado como dense rank sobre data_expiracao.
+    Calculado como dense rank sobre data_expiracao em cada data_referencia.
     """
     return df.with_columns(
-        ranking_reuniao=pl.col("data_expiracao").rank("dense").cast(pl.Int32)
+        ranking_reuniao=pl.col("data_expiracao")
+        .rank("dense")
+        .over("data_referencia")
+        .cast(pl.Int32)
     )
 
 
@@ -187,25 +190,39 @@ def _add_probabilities(df: pl.DataFrame) -> pl.DataFrame:
     been called so DI1Rate and DiscountExp are present.
 
     RawProb  = SettlementPrice * DiscountExp / 100
-    Prob     = RawProb / sum(RawProb) within ExpiryDate group
+    Prob     = RawProb / sum(RawProb) within (TradeDate, ExpiryDate) group
     CumProb  = cumulative sum of Prob, sorted by StrikeChangeBps ascending
     """
     df = _add_discount_factors(df)
+    reuniao = ["data_referencia", "data_expiracao"]
 
     return (
-        df.sort(["data_expiracao", "variacao_strike_bps"])
+        df.sort([*reuniao, "variacao_strike_bps"])
         .with_columns(
             prob_bruta=(pl.col("preco_ajuste") * pl.col("fator_desconto") / 100),
         )
         .with_columns(
-            prob=(
-                pl.col("prob_bruta") / pl.col("prob_bruta").sum().over("data_expiracao")
-            ),
+            prob=(pl.col("prob_bruta") / pl.col("prob_bruta").sum().over(reuniao)),
         )
-        .with_columns(prob_acumulada=pl.col("prob").cum_sum().over("data_expiracao"))
+        .with_columns(prob_acumulada=pl.col("prob").cum_sum().over(reuniao))
     )
 
 
+def _calculate(raw: pl.DataFrame, option_type: str) -> pl.DataFrame:
+    """Probabilities for every (TradeDate, meeting) in the raw CPM frame."""
+    df = (
+        raw.filter(pl.col("tipo_opcao") == option_type)
+        # Excluir strikes sem preço de ajuste — ver docstring do módulo.
+        .filter(pl.col("preco_ajuste").is_not_null())
+        .pipe(_add_meeting_rank)
+        .pipe(_add_probabilities)
+        .select(_empty_schema().columns)
+        .sort(["data_referencia", "ranking_reuniao", "variacao_strike_bps"])
+    )
+
+    return df if not df.is_empty() else _empty_schema()
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -266,30 +283,55 @@ def all_meetings(
     if raw.is_empty():
         return _empty_schema()
 
-    df = (
-        raw.filter(pl.col("tipo_opcao") == option_type)
-        # Excluir strikes sem preço de ajuste — ver docstring do módulo.
-        .filter(pl.col("preco_ajuste").is_not_null())
-        .pipe(_add_meeting_rank)
-        .pipe(_add_probabilities)
-        .select(
-            "data_referencia",
-            "data_fim_reuniao",
-            "data_expiracao",
-            "ranking_reuniao",
-            "variacao_strike_bps",
-            "dias_uteis",
-            "preco_ajuste",
-            "taxa_di1",
-            "fator_desconto",
-            "prob_bruta",
-            "prob",
-            "prob_acumulada",
-        )
-        .sort(["ranking_reuniao", "variacao_strike_bps"])
-    )
+    return _calculate(raw, option_type)
 
-    return df if not df.is_empty() else _empty_schema()
+
+def historico(
+    inicio: DateLike,
+    fim: DateLike,
+    option_type: str = "call",
+) -> pl.DataFrame:
+    """
+    Implied COPOM probabilities for every trade date between `inicio` and
+    `fim`, in long format.
+
+    Equivalent to concatenating :func:`all_meetings` for each trade date, but
+    the CPM inputs (SPR ZIPs and settlement-price CSVs) of all dates are
+    fetched concurrently, the COPOM calendar is loaded once and the DI1
+    rates for all (TradeDate, ExpiryDate) pairs are interpolated in a single
+    vectorized call.
+
+    Parameters
+    ----------
+    inicio, fim : DateLike
+        Inclusive range of trade dates.
+    option_type : {"call", "put"}
+        Which side to use. Default "call".
+
+    Returns
+    -------
+    pl.DataFrame
+        Same columns as all_meetings().  MeetingRank is assigned within each
+        TradeDate.  Sorted by (TradeDate, MeetingRank, StrikeChangeBps).
+        Trade dates without priced CPM contracts are absent; returns an
+        empty DataFrame with the correct schema if none has data.
+
+    Examples:
+        >>> import pyield as yd
+        >>> import polars as pl
+        >>> df = yd.selic.probabilities.historico(
+        ...     "27-01-2025", "31-01-2025"
+        ... )  # doctest: +SKIP
+        >>> proxima = df.filter(pl.col("ranking_reuniao") == 1)  # doctest: +SKIP
+        >>> proxima.pivot(  # doctest: +SKIP
+        ...     "variacao_strike_bps", index="data_referencia", values="prob"
+        ... )
+    """
+    raw = cpm._dados_periodo(inicio, fim)
+    if raw.is_empty():
+        return _empty_schema()
+
+    return _calculate(raw, option_type)
 
 
 def meeting(
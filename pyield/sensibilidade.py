@@ -0,0 +1,474 @@
+"""Sensibilidade e cenários de instrumentos prefixados em curvas de juros.
+
+Os instrumentos são precificados pelo valor presente dos seus fluxos de caixa,
+descontados por taxas interpoladas (flat forward) na curva PRE
+(``tpf.curva_pre``), na curva de ajuste do DI1 (``di1.dados``) ou numa curva
+informada. As curvas alteradas são empilhadas, uma por cenário, e
+interpoladas numa única chamada multi-curva de :func:`pyield.interpolar`.
+
+Colunas dos instrumentos:
+    - instrumento (String): "LTN", "NTN-F" ou "DI1".
+    - data_vencimento (Date): Vencimento do título ou do contrato.
+    - quantidade (Float64, opcional): Quantidade usada por :func:`cenarios`.
+"""
+
+import datetime as dt
+from typing import Literal
+
+import polars as pl
+
+import pyield._internal.converters as cv
+from pyield import du
+from pyield._internal.types import DateLike
+from pyield.futuro import di1
+from pyield.interpolador import interpolar
+from pyield.tpf import curva_pre
+from pyield.tpf.titulos import _utils as utils
+from pyield.tpf.titulos import ntnf
+
+TipoCurva = Literal["PRE", "DI1"]
+
+INSTRUMENTOS = ("LTN", "NTN-F", "DI1")
+_VALORES_FACE = {"LTN": 1000.0, "NTN-F": 1000.0, "DI1": 100_000.0}
+_COLUNAS_OBRIGATORIAS = ("instrumento", "data_vencimento")
+_SCHEMA_ID = {"id_instrumento": pl.UInt32}
+
+
+def dv01_vertices(
+    instrumentos: pl.DataFrame,
+    data_referencia: DateLike,
+    curva: TipoCurva | pl.DataFrame = "PRE",
+    choque: float = 0.0001,
+) -> pl.DataFrame:
+    """Calcula o DV01 de cada instrumento em relação a cada vértice da curva.
+
+    Cada vértice é deslocado isoladamente em ``choque`` e todos os
+    instrumentos são reprecificados por interpolação flat forward na curva
+    alterada. As N curvas alteradas e a curva base são interpoladas de uma só
+    vez, como N + 1 curvas agrupadas por cenário, em vez de N
+    reprecificações completas.
+
+    O PU teórico é ``Σ fluxo / (1 + taxa) ** (du / 252)``, sem os
+    truncamentos da STN ou da B3. Fluxos após o último vértice usam a última
+    taxa da curva; fluxos antes do primeiro vértice, a primeira.
+
+    Args:
+        instrumentos: Instrumentos a avaliar (ver colunas na documentação do
+            módulo).
+        data_referencia: Data da curva e da liquidação dos instrumentos.
+        curva: ``"PRE"`` para ``tpf.curva_pre``, ``"DI1"`` para a curva de
+            ajuste do DI1 ou um DataFrame com as colunas ``dias_uteis`` e
+            ``taxa`` (taxas zero em formato decimal).
+        choque: Deslocamento aplicado a cada vértice, em formato decimal.
+            Padrão: 0,0001 (1 bp).
+
+    Returns:
+        DataFrame Polars com as colunas de ``instrumentos`` na ordem
+        original, o PU na curva base e uma coluna por vértice (a matriz
+        instrumento × vértice). Instrumentos vencidos ficam nulos.
+
+    Output Columns:
+        - pu (Float64): PU teórico na curva base.
+        - <dias úteis do vértice> (Float64): ``pu`` menos o PU com o vértice
+            deslocado (positivo para instrumentos comprados). As colunas são
+            nomeadas pelos dias úteis de cada vértice, em ordem crescente.
+
+    Raises:
+        ValueError: Se faltarem colunas, se houver instrumento não suportado,
+            se ``curva`` for inválida ou se a curva não tiver vértices.
+
+    Examples:
+        >>> from pyield import sensibilidade
+        >>> curva = pl.DataFrame(
+        ...     {"dias_uteis": [252, 504, 756], "taxa": [0.14, 0.135, 0.13]}
+        ... )
+        >>> instrumentos = pl.DataFrame(
+        ...     {
+        ...         "instrumento": ["LTN", "DI1"],
+        ...         "data_vencimento": ["01-01-2027", "01-07-2026"],
+        ...     }
+        ... )
+        >>> sensibilidade.dv01_vertices(instrumentos, "02-01-2025", curva)
+        shape: (2, 6)
+        ┌─────────────┬─────────────────┬──────────────┬──────────┬──────────┬─────┐
+        │ instrumento ┆ data_vencimento ┆ pu           ┆ 252      ┆ 504      ┆ 756 │
+        │ ---         ┆ ---             ┆ ---          ┆ ---      ┆ ---      ┆ --- │
+        │ str         ┆ str             ┆ f64          ┆ f64      ┆ f64      ┆ f64 │
+        ╞═════════════╪═════════════════╪══════════════╪══════════╪══════════╪═════╡
+        │ LTN         ┆ 01-01-2027      ┆ 777.392352   ┆ 0.000812 ┆ 0.135337 ┆ 0.0 │
+        │ DI1         ┆ 01-07-2026      ┆ 82678.837486 ┆ 3.741136 ┆ 7.052614 ┆ 0.0 │
+        └─────────────┴─────────────────┴──────────────┴──────────┴──────────┴─────┘
+    """
+    data = cv.converter_datas(data_referencia)
+    vertices = _obter_curva(curva, data)
+    fluxos = _gerar_fluxos(instrumentos, data)
+    curvas = _curvas_vertice_a_vertice(vertices, choque)
+    pus = _reprecificar(fluxos, curvas).collect()
+
+    base = pus.filter(pl.col("cenario") == 0).select("id_instrumento", "pu")
+    nomes = [str(v) for v in vertices["dias_uteis"]]
+    matriz = (
+        pus.filter(pl.col("cenario") > 0)
+        .join(base, on="id_instrumento", suffix="_base")
+        .select(
+            "id_instrumento",
+            vertice=pl.col("cenario").replace_strict(
+                range(1, len(nomes) + 1), nomes, return_dtype=pl.String
+            ),
+            dv01=pl.col("pu_base") - pl.col("pu"),
+        )
+        .pivot(on="vertice", index="id_instrumento", values="dv01")
+        .join(base, on="id_instrumento")
+    )
+    colunas = [
+        pl.col(c) if c in matriz.columns else pl.lit(None, dtype=pl.Float64).alias(c)
+        for c in ["pu", *nomes]
+    ]
+    resultado = (
+        pl.DataFrame({"id_instrumento": range(len(instrumentos))}, schema=_SCHEMA_ID)
+        .join(matriz, on="id_instrumento", how="left", maintain_order="left")
+        .select(colunas)
+    )
+    return instrumentos.with_columns(resultado.get_columns())
+
+
+def cenarios(
+    instrumentos: pl.DataFrame,
+    data_referencia: DateLike,
+    choques: pl.DataFrame,
+    curva: TipoCurva | pl.DataFrame = "PRE",
+    agregar: bool = False,
+) -> pl.DataFrame:
+    """Reprecifica os instrumentos em vários cenários de choques na curva.
+
+    ``choques`` é uma matriz cenário × prazo: cada linha é um cenário
+    (deslocamento paralelo, inclinação, variação histórica etc.) e cada coluna
+    um prazo em dias úteis com o choque, em formato decimal, somado à taxa
+    zero. O choque de cada vértice da curva é interpolado linearmente entre
+    os prazos informados e constante fora deles, de modo que uma única coluna
+    representa um deslocamento paralelo.
+
+    Todas as curvas (a base e uma por cenário) são interpoladas numa única
+    chamada multi-curva de :func:`pyield.interpolar`, agrupadas pelo
+    cenário, e a reprecificação da carteira em todos os cenários é feita numa
+    só consulta lazy. A precificação é a mesma de :func:`dv01_vertices`.
+
+    Args:
+        instrumentos: Instrumentos a avaliar (ver colunas na documentação do
+            módulo). A coluna opcional ``quantidade`` (padrão 1) pondera o
+            resultado de cada instrumento.
+        data_referencia: Data da curva e da liquidação dos instrumentos.
+        choques: DataFrame com a coluna ``cenario`` (identificadores únicos)
+            e uma coluna por prazo, nomeada pelos dias úteis (ex.: ``"252"``).
+            Choques nulos são ignorados na interpolação do cenário.
+        curva: ``"PRE"``, ``"DI1"`` ou um DataFrame com ``dias_uteis`` e
+            ``taxa``, como em :func:`dv01_vertices`.
+        agregar: Se True, soma os resultados da carteira por cenário.
+
+    Returns:
+        DataFrame Polars ordenado por cenário (na ordem de ``choques``) e
+        instrumento, com a coluna ``cenario`` e as colunas de
+        ``instrumentos``. Se ``agregar=True``, uma linha por cenário.
+        Instrumentos vencidos não aparecem.
+
+    Output Columns:
+        - cenario: Identificador do cenário, como em ``choques``.
+        - pu (Float64): PU teórico no cenário (ausente se ``agregar=True``).
+        - variacao (Float64): PU no cenário menos o PU na curva base
+            (ausente se ``agregar=True``).
+        - financeiro (Float64): ``pu * quantidade`` (somado por cenário se
+            ``agregar=True``).
+        - resultado (Float64): ``variacao * quantidade`` (somado por cenário
+            se ``agregar=True``).
+
+    Raises:
+        ValueError: Se ``choques`` não tiver a coluna ``cenario``, tiver
+            cenários repetidos ou prazos que não sejam inteiros positivos,
+            além dos casos de :func:`dv01_vertices`.
+
+    Examples:
+        >>> from pyield import sensibilidade
+        >>> curva = pl.DataFrame(
+        ...     {"dias_uteis": [252, 504, 756], "taxa": [0.14, 0.135, 0.13]}
+        ... )
+        >>> instrumentos = pl.DataFrame(
+        ...     {
+        ...         "instrumento": ["LTN", "DI1"],
+        ...         "data_vencimento": ["01-01-2027", "01-07-2026"],
+        ...         "quantidade": [1000, -5],
+        ...     }
+        ... )
+        >>> choques = pl.DataFrame(
+        ...     {
+        ...         "cenario": ["paralelo", "inclinacao"],
+        ...         "252": [0.01, -0.005],
+        ...         "756": [0.01, 0.005],
+        ...     }
+        ... )
+        >>> sensibilidade.cenarios(
+        ...     instrumentos, "02-01-2025", choques, curva, agregar=True
+        ... )
+        shape: (2, 3)
+        ┌────────────┬───────────────┬──────────────┐
+        │ cenario    ┆ financeiro    ┆ resultado    │
+        │ ---        ┆ ---           ┆ ---          │
+        │ str        ┆ f64           ┆ f64          │
+        ╞════════════╪═══════════════╪══════════════╡
+        │ paralelo   ┆ 355897.604931 ┆ -8100.559261 │
+        │ inclinacao ┆ 363100.378278 ┆ -897.785914  │
+        └────────────┴───────────────┴──────────────┘
+    """
+    data = cv.converter_datas(data_referencia)
+    pontos = _preparar_choques(choques)
+    vertices = _obter_curva(curva, data)
+    fluxos = _gerar_fluxos(instrumentos, data)
+    curvas = _curvas_choques(vertices, pontos, choques.height)
+
+    pus = _reprecificar(fluxos, curvas)
+    quantidade = (
+        pl.col("quantidade").cast(pl.Float64)
+        if "quantidade" in instrumentos.columns
+        else pl.lit(1.0)
+    )
+    posicoes = instrumentos.lazy().with_row_index("id_instrumento")
+    consulta = (
+        pus.filter(pl.col("cenario") > 0)
+        .join(
+            pus.filter(pl.col("cenario") == 0).select("id_instrumento", pu_base="pu"),
+            on="id_instrumento",
+        )
+        .join(
+            posicoes.select("id_instrumento", quantidade.alias("_quantidade")),
+            on="id_instrumento",
+        )
+        .with_columns(variacao=pl.col("pu") - pl.col("pu_base"))
+        .with_columns(
+            financeiro=pl.col("pu") * pl.col("_quantidade"),
+            resultado=pl.col("variacao") * pl.col("_quantidade"),
+        )
+    )
+    # Devolve os identificadores de ``choques`` no lugar dos ids internos
+    nomes = choques.lazy().select(
+        _id=pl.int_range(1, pl.len() + 1, dtype=pl.Int64), cenario="cenario"
+    )
+    consulta = consulta.rename({"cenario": "_id"})
+    if agregar:
+        # Cenários sem instrumentos a vencer também aparecem, com zero
+        return (
+            nomes.join(
+                consulta.group_by("_id").agg(pl.col("financeiro", "resultado").sum()),
+                on="_id",
+                how="left",
+            )
+            .sort("_id")
+            .select("cenario", pl.col("financeiro", "resultado").fill_null(0))
+            .collect()
+        )
+    return (
+        nomes.join(consulta, on="_id")
+        .join(posicoes, on="id_instrumento")
+        .sort("_id", "id_instrumento")
+        .select(
+            "cenario",
+            *instrumentos.columns,
+            "pu",
+            "variacao",
+            "financeiro",
+            "resultado",
+        )
+        .collect()
+    )
+
+
+def _obter_curva(curva: TipoCurva | pl.DataFrame, data: dt.date) -> pl.DataFrame:
+    """Retorna os vértices da curva (``dias_uteis``, ``taxa``) em ordem de prazo."""
+    if isinstance(curva, pl.DataFrame):
+        df = curva.select("dias_uteis", "taxa")
+    elif curva == "PRE":
+        df = curva_pre(data).select("dias_uteis", taxa="taxa_zero")
+    elif curva == "DI1":
+        df = di1.dados(data)
+        if not df.is_empty():
+            df = df.select("dias_uteis", taxa="taxa_ajuste")
+    else:
+        raise ValueError("curva deve ser 'PRE', 'DI1' ou um DataFrame.")
+
+    if not df.is_empty():
+        df = (
+            df.select(
+                pl.col("dias_uteis").cast(pl.Int64),
+                pl.col("taxa").cast(pl.Float64),
+            )
+            .drop_nulls()
+            .drop_nans()
+            .filter(pl.col("dias_uteis") > 0)
+            .unique("dias_uteis", keep="last")
+            .sort("dias_uteis")
+        )
+    if df.is_empty():
+        raise ValueError(f"A curva não tem vértices válidos em {data}.")
+    return df
+
+
+def _gerar_fluxos(instrumentos: pl.DataFrame, data: dt.date) -> pl.DataFrame:
+    """Fluxos de caixa dos instrumentos (``id_instrumento``, ``dias_uteis``,
+    ``valor_pagamento``) a partir da data de referência."""
+    faltantes = [c for c in _COLUNAS_OBRIGATORIAS if c not in instrumentos.columns]
+    if faltantes:
+        raise ValueError(f"Colunas obrigatórias ausentes: {', '.join(faltantes)}.")
+
+    df = instrumentos.with_row_index("id_instrumento").select(
+        "id_instrumento",
+        pl.col("instrumento").cast(pl.String),
+        data_liquidacao=pl.lit(data, dtype=pl.Date),
+        data_vencimento=cv.converter_datas_expr("data_vencimento"),
+    )
+    desconhecidos = df.filter(~pl.col("instrumento").is_in(INSTRUMENTOS))
+    if not desconhecidos.is_empty():
+        nomes = desconhecidos["instrumento"].unique().sort()
+        raise ValueError(f"Instrumentos não suportados: {', '.join(map(str, nomes))}.")
+
+    # LTN e DI1: um único fluxo, o valor de face no vencimento
+    simples = df.filter(
+        pl.col("instrumento") != "NTN-F",
+        pl.col("data_vencimento") > pl.col("data_liquidacao"),
+    ).select(
+        "id_instrumento",
+        dias_uteis=du.contar_expr("data_liquidacao", "data_vencimento"),
+        valor_pagamento=pl.col("instrumento").replace_strict(
+            _VALORES_FACE, return_dtype=pl.Float64
+        ),
+    )
+    df_ntnf = df.filter(pl.col("instrumento") == "NTN-F")
+    fluxos_ntnf = utils.gerar_fluxos_colunares(
+        df_ntnf, ntnf.VALOR_CUPOM, ntnf.VALOR_FINAL
+    ).join(df_ntnf.select("id_instrumento").with_row_index("id_linha"), on="id_linha")
+    return pl.concat(
+        [simples, fluxos_ntnf.select(simples.columns)], how="vertical_relaxed"
+    ).filter(pl.col("dias_uteis") > 0)
+
+
+def _curvas_vertice_a_vertice(vertices: pl.DataFrame, choque: float) -> pl.DataFrame:
+    """Empilha a curva base (cenário 0) e uma curva por vértice deslocado.
+
+    O cenário ``i`` desloca apenas o i-ésimo vértice em ordem de prazo.
+    """
+    cenarios = pl.DataFrame({"cenario": range(len(vertices) + 1)})
+    return (
+        vertices.with_row_index("posicao", offset=1)
+        .join(cenarios, how="cross")
+        .select(
+            pl.col("cenario").cast(pl.Int64),
+            "dias_uteis",
+            taxa=pl.col("taxa")
+            + pl.when(pl.col("posicao") == pl.col("cenario")).then(choque).otherwise(0),
+        )
+    )
+
+
+def _preparar_choques(choques: pl.DataFrame) -> pl.DataFrame:
+    """Converte a matriz de choques para o formato longo com ids inteiros.
+
+    O cenário ``i`` (a partir de 1) é a i-ésima linha de ``choques``.
+    """
+    if "cenario" not in choques.columns:
+        raise ValueError("choques deve ter a coluna 'cenario'.")
+    if choques["cenario"].is_duplicated().any():
+        raise ValueError("Os cenários de choques devem ser únicos.")
+    colunas = [c for c in choques.columns if c != "cenario"]
+    if not colunas or not all(c.isdigit() and int(c) > 0 for c in colunas):
+        raise ValueError(
+            "As colunas de choques devem ser prazos em dias úteis (inteiros positivos)."
+        )
+    return (
+        choques.select(pl.col(colunas).cast(pl.Float64))
+        .with_row_index("cenario", offset=1)
+        .unpivot(index="cenario", variable_name="prazo", value_name="choque")
+        .select(
+            pl.col("cenario").cast(pl.Int64),
+            pl.col("prazo").cast(pl.Int64),
+            "choque",
+        )
+        .drop_nulls()
+        .drop_nans()
+    )
+
+
+def _curvas_choques(
+    vertices: pl.DataFrame, pontos: pl.DataFrame, n_cenarios: int
+) -> pl.DataFrame:
+    """Empilha a curva base (cenário 0) e uma curva por cenário de choques.
+
+    ``pontos`` traz os choques em formato longo (``cenario``, ``prazo``,
+    ``choque``). O choque de cada vértice é interpolado linearmente entre os
+    prazos informados e mantido constante fora deles. Cenários sem nenhum
+    choque em ``pontos`` repetem a curva base.
+    """
+    ids = pl.DataFrame({"cenario": range(n_cenarios + 1)})
+    grade = vertices.join(ids.cast(pl.Int64), how="cross").sort("cenario", "dias_uteis")
+    pontos = pontos.sort("cenario", "prazo")
+    grade = grade.join_asof(
+        pontos.rename({"prazo": "prazo_j", "choque": "choque_j"}),
+        by="cenario",
+        left_on="dias_uteis",
+        right_on="prazo_j",
+        strategy="backward",
+        check_sortedness=False,
+    ).join_asof(
+        pontos.rename({"prazo": "prazo_k", "choque": "choque_k"}),
+        by="cenario",
+        left_on="dias_uteis",
+        right_on="prazo_k",
+        strategy="forward",
+        check_sortedness=False,
+    )
+    peso_k = (pl.col("dias_uteis") - pl.col("prazo_j")) / (
+        pl.col("prazo_k") - pl.col("prazo_j")
+    )
+    choque = (
+        pl.when(pl.col("prazo_k").is_null() | (pl.col("prazo_k") == pl.col("prazo_j")))
+        .then(pl.col("choque_j"))
+        .when(pl.col("prazo_j").is_null())
+        .then(pl.col("choque_k"))
+        .otherwise(
+            pl.col("choque_j") + peso_k * (pl.col("choque_k") - pl.col("choque_j"))
+        )
+    )
+    # O cenário 0 (curva base) e cenários sem nenhum choque não são deslocados
+    return grade.select(
+        "cenario", "dias_uteis", taxa=pl.col("taxa") + choque.fill_null(0)
+    )
+
+
+def _reprecificar(fluxos: pl.DataFrame, curvas: pl.DataFrame) -> pl.LazyFrame:
+    """PU de cada instrumento em cada curva, agrupada pela coluna ``cenario``.
+
+    A taxa de desconto só depende do cenário e do prazo: cada par distinto é
+    interpolado uma vez, numa única chamada multi-curva, e o desconto dos
+    fluxos de todos os instrumentos fica numa consulta lazy.
+    """
+    prazos = (
+        fluxos.select("dias_uteis")
+        .unique()
+        .join(curvas.select("cenario").unique(), how="cross")
+    )
+    taxas = prazos.with_columns(
+        taxa=interpolar(
+            dus_alvo=prazos["dias_uteis"],
+            dus_curva=curvas["dias_uteis"],
+            taxas_curva=curvas["taxa"],
+            datas_alvo=prazos["cenario"],
+            datas_curva=curvas["cenario"],
+            extrapolar=True,
+        )
+    )
+    vp = pl.col("valor_pagamento") / (1 + pl.col("taxa")).pow(
+        pl.col("dias_uteis") / 252
+    )
+    return (
+        fluxos.lazy()
+        .join(taxas.lazy(), on="dias_uteis")
+        .group_by("id_instrumento", "cenario")
+        # Soma em ordem de prazo: o resultado não depende da ordem da junção
+        .agg(pu=vp.sort_by("dias_uteis").sum())
+    )
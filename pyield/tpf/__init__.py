@@ -1,20 +1,28 @@
 """Títulos Públicos Federais."""
 
 from pyield.anbima.imaq import estoque
-from pyield.tpf import secundario
-from pyield.tpf._taxas import TipoTPF, taxas, taxas_historicas, vencimentos
+from pyield.tpf import carteira, secundario
+from pyield.tpf._taxas import (
+    TipoTPF,
+    taxas,
+    taxas_historicas,
+    taxas_historicas_lazy,
+    vencimentos,
+)
 from pyield.tpf.benchmark import benchmarks
 from pyield.tpf.dealers import dealers
 from pyield.tpf.leiloes import leiloes
 from pyield.tpf.rmd import rmd
 from pyield.tpf.titulos import lft, ltn, ntnb, ntnb1, ntnbp, ntnc, ntnf
 from pyield.tpf.titulos._utils import premios_pre
-from pyield.tpf.titulos.pre import curva_pre
+from pyield.tpf.titulos.pre import curva_pre, curva_pre_historica
 
 __all__ = [
     "TipoTPF",
     "benchmarks",
+    "carteira",
     "curva_pre",
+    "curva_pre_historica",
     "dealers",
     "estoque",
     "leiloes",
@@ -30,5 +38,6 @@ __all__ = [
     "secundario",
     "taxas",
     "taxas_historicas",
+    "taxas_historicas_lazy",
     "vencimentos",
 ]
@@ -4,7 +4,7 @@ import polars as pl
 import requests
 
 from pyield._internal.converters import converter_datas, data_referencia_valida
-from pyield._internal.data_cache import obter_dataset_cacheado
+from pyield._internal.data_cache import obter_dataset_lazy
 from pyield._internal.types import DateLike
 from pyield.anbima import taxas as _anbima_taxas
 
@@ -34,9 +34,9 @@ def _mapear_tipo_titulo(tipo_titulo: str) -> list[str]:
     return mapa_titulos.get(tipo_titulo, [tipo_titulo])
 
 
-def _obter_historico() -> pl.DataFrame:
-    """Carrega o histórico de taxas de TPF usado pela camada de negócio."""
-    return obter_dataset_cacheado("tpf")
+def _obter_historico() -> pl.LazyFrame:
+    """Varre o histórico de taxas de TPF usado pela camada de negócio."""
+    return obter_dataset_lazy("tpf")
 
 
 def _vencimentos_historicos(titulo: TipoTPF) -> pl.DataFrame:
@@ -54,6 +54,61 @@ def _vencimentos_historicos(titulo: TipoTPF) -> pl.DataFrame:
     )
 
 
+def taxas_historicas_lazy(
+    inicio: DateLike | None = None,
+    fim: DateLike | None = None,
+    titulo: TipoTPF | None = None,
+) -> pl.LazyFrame:
+    """Varre o histórico de taxas e preços indicativos de TPFs sem carregá-lo.
+
+    Versão lazy de ``taxas_historicas``: os filtros de período e de título são
+    aplicados na leitura do parquet em cache e usam as estatísticas dos row
+    groups, de modo que consultas de poucos dias não decodificam o histórico
+    inteiro. Filtros adicionais aplicados ao ``LazyFrame`` antes do
+    ``collect`` também são empurrados para a leitura.
+
+    Args:
+        inicio: Data inicial do período. Se omitida, não limita o início.
+        fim: Data final do período. Se omitida, não limita o fim.
+        titulo: Tipo do título público federal. Aceita ``LFT``, ``NTN-B``,
+            ``NTN-C``, ``LTN``, ``NTN-F`` ou ``PRE``.
+
+    Returns:
+        LazyFrame Polars com as mesmas colunas e ordenação de
+        ``taxas_historicas``.
+
+    Raises:
+        ValueError: Se ``inicio`` for posterior a ``fim``.
+
+    Notes:
+        A leitura parcial do arquivo só ocorre com o cache em disco habilitado
+        pela variável de ambiente ``PYIELD_CACHE_DIR``. Sem ela, o
+        ``LazyFrame`` é construído sobre o histórico em memória.
+
+    Examples:
+        >>> lf = yd.tpf.taxas_historicas_lazy(inicio="02-01-2025", titulo="LTN")
+        >>> df = lf.filter(pl.col("taxa_indicativa") > 0.15).collect()
+    """
+    data_inicio = converter_datas(inicio) if inicio is not None else None
+    data_fim = converter_datas(fim) if fim is not None else None
+    if data_inicio is not None and data_fim is not None and data_inicio > data_fim:
+        msg = "inicio deve ser menor ou igual a fim."
+        raise ValueError(msg)
+
+    lf = _obter_historico()
+    if data_inicio is not None:
+        lf = lf.filter(pl.col("data_referencia") >= data_inicio)
+    if data_fim is not None:
+        lf = lf.filter(pl.col("data_referencia") <= data_fim)
+    if titulo:
+        tipos_titulo = _mapear_tipo_titulo(titulo)
+        lf = lf.filter(pl.col("titulo").is_in(tipos_titulo))
+
+    return lf.select(_COLUNAS_SAIDA).sort(
+        "data_referencia", "titulo", "data_vencimento"
+    )
+
+
 def taxas_historicas(
     inicio: DateLike | None = None,
     fim: DateLike | None = None,
@@ -93,27 +148,7 @@ def taxas_historicas(
         ...     inicio="01-01-2025", fim="31-01-2025", titulo="PRE"
         ... )
     """
-    data_inicio = converter_datas(inicio) if inicio is not None else None
-    data_fim = converter_datas(fim) if fim is not None else None
-    if data_inicio is not None and data_fim is not None and data_inicio > data_fim:
-        msg = "inicio deve ser menor ou igual a fim."
-        raise ValueError(msg)
-
-    df = _obter_historico()
-    if df.is_empty():
-        return df
-
-    if data_inicio is not None:
-        df = df.filter(pl.col("data_referencia") >= data_inicio)
-    if data_fim is not None:
-        df = df.filter(pl.col("data_referencia") <= data_fim)
-    if titulo:
-        tipos_titulo = _mapear_tipo_titulo(titulo)
-        df = df.filter(pl.col("titulo").is_in(tipos_titulo))
-
-    return df.select(_COLUNAS_SAIDA).sort(
-        "data_referencia", "titulo", "data_vencimento"
-    )
+    return taxas_historicas_lazy(inicio, fim, titulo).collect()
 
 
 def taxas(
@@ -154,11 +189,9 @@ def taxas(
         return pl.DataFrame()
 
     try:
-        df = _obter_historico()
+        df = _obter_historico().filter(pl.col("data_referencia") == data).collect()
     except (requests.exceptions.RequestException, pl.exceptions.PolarsError):
         df = pl.DataFrame()
-    if not df.is_empty():
-        df = df.filter(pl.col("data_referencia") == data)
     if df.is_empty():
         df = _anbima_taxas.buscar(data)
 
@@ -22,11 +22,10 @@ Exemplo de resposta JSON da API:
 import logging
 
 import polars as pl
-import requests
 
 from pyield import relogio
+from pyield._internal import transporte
 from pyield._internal.cache import ttl_cache
-from pyield._internal.retry import retry_padrao
 
 registro = logging.getLogger(__name__)
 
@@ -36,13 +35,11 @@ URL_BASE_API = (
 
 
 @ttl_cache()
-@retry_padrao
 def _buscar_json_api(incluir_historico: bool) -> dict:
     """Busca os dados brutos de benchmarks na API do Tesouro Nacional."""
     param = "S" if incluir_historico else "N"
     url = f"{URL_BASE_API}?incluir_historico={param}"
-    resposta = requests.get(url, timeout=10)
-    resposta.raise_for_status()
+    resposta = transporte.get(url, timeout=10)
     return resposta.json()
 
 
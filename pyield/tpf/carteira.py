@@ -0,0 +1,526 @@
+"""Precificação e risco de carteiras de títulos públicos federais.
+
+Recebe um DataFrame de posições (uma linha por posição) e aplica, em formato
+colunar, as mesmas funções de precificação dos módulos de cada título
+(``ltn``, ``ntnf``, ``ntnb``, ``ntnc`` e ``lft``). Posições com o mesmo
+título, liquidação, vencimento, taxa, PU e VNA são precificadas uma única
+vez, e cada título é calculado numa só passada vetorizada.
+
+Colunas das posições:
+    - titulo (String): "LTN", "NTN-F", "NTN-B", "NTN-C" ou "LFT".
+    - data_vencimento (Date): Vencimento do título.
+    - quantidade (Float64): Quantidade de títulos (negativa para vendidos).
+    - taxa (Float64, opcional): Taxa de precificação em formato decimal.
+    - pu (Float64, opcional): PU do título. Se a taxa for nula, é usado para
+      obter a taxa implícita.
+    - vna (Float64, opcional): VNA de NTN-B, NTN-C e LFT. Quando ausente e
+      necessário (para obter o PU pela taxa ou a taxa pelo PU), é buscado em
+      ``ntnb.vna_serie``, ``ntnc.vna_serie`` ou ``lft.vna_serie``.
+    - data_liquidacao (Date, opcional): Data de liquidação. Se ausente, usa o
+      argumento ``data_liquidacao`` das funções.
+
+Cada posição precisa de ``taxa`` ou ``pu``. Quando os dois são informados, o
+PU informado é preservado e usado como base do DV01.
+"""
+
+from collections.abc import Callable, Sequence
+
+import polars as pl
+
+import pyield._internal.converters as conversores
+from pyield import du
+from pyield._internal.types import DateLike
+from pyield.tpf.titulos import _utils as utils
+from pyield.tpf.titulos import lft, ltn, ntnb, ntnc, ntnf
+
+TITULOS = ("LTN", "NTN-F", "NTN-B", "NTN-C", "LFT")
+# Vértices em dias úteis: 1, 3 e 6 meses; 1, 2, 3, 5, 10 e 20 anos
+VERTICES_PADRAO = (21, 63, 126, 252, 504, 756, 1260, 2520, 5040)
+
+_LIQ = "data_liquidacao"
+_VENC = "data_vencimento"
+_TITULOS_VNA = ("NTN-B", "NTN-C", "LFT")
+_COLUNAS_OBRIGATORIAS = ("titulo", "data_vencimento", "quantidade")
+_CHAVES_INSTRUMENTO = (
+    "titulo",
+    "data_liquidacao",
+    "data_vencimento",
+    "taxa",
+    "pu",
+    "vna",
+)
+_SCHEMA_INSTRUMENTOS = {
+    "id_instrumento": pl.UInt32,
+    "titulo": pl.String,
+    "data_liquidacao": pl.Date,
+    "data_vencimento": pl.Date,
+    "taxa": pl.Float64,
+    "pu": pl.Float64,
+    "vna": pl.Float64,
+    "duration": pl.Float64,
+    "dv01": pl.Float64,
+}
+_COLUNAS_CALCULADAS = ("vna", "taxa", "pu", "duration", "dv01")
+
+
+def precificar(
+    posicoes: pl.DataFrame,
+    data_liquidacao: DateLike | None = None,
+) -> pl.DataFrame:
+    """Calcula PU, duration e DV01 de cada posição da carteira.
+
+    Os cálculos de cada título são os mesmos de ``pu``/``cotacao``, ``taxa``,
+    ``duration`` e ``dv01`` dos módulos ``ltn``, ``ntnf``, ``ntnb``, ``ntnc``
+    e ``lft``, avaliados por expressões colunares sobre todas as posições.
+    Para a LFT, a duration é o prazo em anos úteis e o DV01 é a variação do
+    PU para 1 bp na taxa, como na LTN.
+
+    Args:
+        posicoes: Posições da carteira (ver colunas na documentação do
+            módulo).
+        data_liquidacao: Data de liquidação usada quando ``posicoes`` não tem
+            a coluna ``data_liquidacao``.
+
+    Returns:
+        DataFrame Polars com as colunas de ``posicoes`` na ordem original,
+        com ``taxa``, ``pu`` e ``vna`` preenchidos e as colunas de risco
+        acrescentadas.
+
+    Output Columns:
+        - vna (Float64): VNA usado (nulo quando não foi necessário).
+        - taxa (Float64): Taxa informada ou implícita no PU.
+        - pu (Float64): PU informado ou calculado pela taxa.
+        - duration (Float64): Macaulay duration em anos úteis.
+        - dv01 (Float64): DV01 de um título, em R$.
+        - financeiro (Float64): ``pu * quantidade``.
+        - dv01_financeiro (Float64): ``dv01 * quantidade``.
+
+    Raises:
+        ValueError: Se faltarem colunas obrigatórias, se houver título não
+            suportado ou se a data de liquidação não for informada.
+
+    Examples:
+        >>> from pyield.tpf import carteira
+        >>> posicoes = pl.DataFrame(
+        ...     {
+        ...         "titulo": ["LTN", "NTN-F"],
+        ...         "data_vencimento": ["01-01-2030", "01-01-2035"],
+        ...         "quantidade": [1000, -500],
+        ...         "taxa": [0.12145, 0.11921],
+        ...     }
+        ... )
+        >>> df = carteira.precificar(posicoes, "05-07-2024")
+        >>> df["pu"].to_list()
+        [535.279902, 895.359254]
+    """
+    df = _agrupar_instrumentos(_preparar_posicoes(posicoes, data_liquidacao))
+    instrumentos = _precificar_instrumentos(df)
+    return _juntar_resultados(df, instrumentos, posicoes)
+
+
+def dv01_fluxos(
+    posicoes: pl.DataFrame,
+    data_liquidacao: DateLike | None = None,
+    vertices: Sequence[int] = VERTICES_PADRAO,
+    agregar: bool = False,
+) -> pl.DataFrame:
+    """Distribui o DV01 de cada posição entre vértices de prazo pelos fluxos.
+
+    O DV01 é o da taxa própria de cada posição, mapeado nos vértices pelos
+    prazos dos fluxos de caixa. Para o DV01 de choques em vértices de uma
+    curva (PRE ou DI1), use ``sensibilidade.dv01_vertices``.
+
+    Cada fluxo de caixa contribui com ``pu * (vp / soma_vp) * t / (1 + taxa)
+    * 0,0001``, em que ``vp`` é o valor presente do fluxo na taxa da posição e
+    ``t`` o prazo em anos úteis. A contribuição é repartida linearmente entre
+    os dois vértices que cercam o fluxo (fluxos antes do primeiro ou depois do
+    último vértice vão inteiros para ele). A soma por posição é o DV01 pela
+    duration modificada, ``pu * duration / (1 + taxa) * 0,0001``, próximo ao
+    DV01 por reprecificação de :func:`precificar`.
+
+    Args:
+        posicoes: Posições da carteira (ver colunas na documentação do
+            módulo).
+        data_liquidacao: Data de liquidação usada quando ``posicoes`` não tem
+            a coluna ``data_liquidacao``.
+        vertices: Prazos dos vértices em dias úteis.
+        agregar: Se True, soma o DV01 financeiro por título e vértice.
+
+    Returns:
+        DataFrame Polars em formato longo, ordenado por posição e vértice (ou
+        por título e vértice, se ``agregar=True``). Vértices sem exposição não
+        aparecem.
+
+    Output Columns:
+        - id_posicao (UInt32): Linha da posição em ``posicoes`` (ausente se
+            ``agregar=True``).
+        - titulo (String): Título da posição.
+        - data_vencimento (Date): Vencimento (ausente se ``agregar=True``).
+        - vertice (Int64): Prazo do vértice em dias úteis.
+        - dv01 (Float64): DV01 de um título atribuído ao vértice (ausente se
+            ``agregar=True``).
+        - dv01_financeiro (Float64): DV01 atribuído multiplicado pela
+            quantidade.
+
+    Raises:
+        ValueError: Se ``vertices`` estiver vazio ou tiver prazos não
+            positivos, além dos casos de :func:`precificar`.
+
+    Examples:
+        >>> from pyield.tpf import carteira
+        >>> posicoes = pl.DataFrame(
+        ...     {
+        ...         "titulo": ["LTN", "NTN-F"],
+        ...         "data_vencimento": ["01-01-2030", "01-01-2035"],
+        ...         "quantidade": [1000, -500],
+        ...         "taxa": [0.12145, 0.11921],
+        ...     }
+        ... )
+        >>> df = carteira.dv01_fluxos(posicoes, "05-07-2024", agregar=True)
+        >>> df.columns
+        ['titulo', 'vertice', 'dv01_financeiro']
+    """
+    grade = _validar_vertices(vertices)
+    df = _agrupar_instrumentos(_preparar_posicoes(posicoes, data_liquidacao))
+    instrumentos = _precificar_instrumentos(df, riscos=False)
+    por_vertice = _distribuir_em_vertices(_fluxos_dv01(instrumentos), grade)
+
+    resultado = (
+        df.select(
+            "id_posicao", "id_instrumento", "titulo", "data_vencimento", "quantidade"
+        )
+        .join(por_vertice, on="id_instrumento", how="inner")
+        .with_columns(dv01_financeiro=pl.col("dv01") * pl.col("quantidade"))
+    )
+    if agregar:
+        return (
+            resultado.group_by("titulo", "vertice")
+            .agg(pl.col("dv01_financeiro").sum())
+            .sort(
+                pl.col("titulo").replace_strict(TITULOS, range(len(TITULOS))), "vertice"
+            )
+        )
+    return resultado.select(
+        "id_posicao", "titulo", "data_vencimento", "vertice", "dv01", "dv01_financeiro"
+    ).sort("id_posicao", "vertice")
+
+
+def _preparar_posicoes(
+    posicoes: pl.DataFrame, data_liquidacao: DateLike | None
+) -> pl.DataFrame:
+    """Valida as posições e normaliza tipos e colunas opcionais."""
+    faltantes = [c for c in _COLUNAS_OBRIGATORIAS if c not in posicoes.columns]
+    if faltantes:
+        raise ValueError(f"Colunas obrigatórias ausentes: {', '.join(faltantes)}.")
+    if "taxa" not in posicoes.columns and "pu" not in posicoes.columns:
+        raise ValueError("As posições devem ter a coluna 'taxa' ou 'pu'.")
+
+    if "data_liquidacao" in posicoes.columns:
+        liquidacao = conversores.converter_datas_expr("data_liquidacao")
+    elif data_liquidacao is not None:
+        liquidacao = pl.lit(conversores.converter_datas(data_liquidacao), pl.Date)
+    else:
+        raise ValueError(
+            "Informe a data de liquidação pelo argumento ou pela coluna "
+            "'data_liquidacao'."
+        )
+
+    def opcional(coluna: str) -> pl.Expr:
+        if coluna in posicoes.columns:
+            return pl.col(coluna).cast(pl.Float64)
+        return pl.lit(None, dtype=pl.Float64)
+
+    df = posicoes.with_row_index("id_posicao").select(
+        "id_posicao",
+        pl.col("titulo").cast(pl.String),
+        liquidacao.alias("data_liquidacao"),
+        conversores.converter_datas_expr("data_vencimento"),
+        pl.col("quantidade").cast(pl.Float64),
+        taxa=opcional("taxa"),
+        pu=opcional("pu"),
+        vna=opcional("vna"),
+    )
+    desconhecidos = df.filter(~pl.col("titulo").is_in(TITULOS))["titulo"].unique()
+    if not desconhecidos.is_empty():
+        raise ValueError(
+            f"Títulos não suportados: {', '.join(map(str, desconhecidos.sort()))}."
+        )
+    return df
+
+
+def _agrupar_instrumentos(df: pl.DataFrame) -> pl.DataFrame:
+    """Atribui um ``id_instrumento`` a cada combinação distinta de entradas."""
+    instrumentos = (
+        df.select(_CHAVES_INSTRUMENTO)
+        .unique(maintain_order=True)
+        .with_row_index("id_instrumento")
+    )
+    # Nulos em taxa, pu ou vna também precisam casar na junção de volta
+    return df.join(instrumentos, on=_CHAVES_INSTRUMENTO, how="left", nulls_equal=True)
+
+
+def _precificar_instrumentos(df: pl.DataFrame, riscos: bool = True) -> pl.DataFrame:
+    """Precifica cada instrumento distinto, um título por vez."""
+    instrumentos = df.select("id_instrumento", *_CHAVES_INSTRUMENTO).unique(
+        "id_instrumento", maintain_order=True
+    )
+    instrumentos = _adicionar_vna(instrumentos)
+    resultados = [
+        _precificar_titulo(grupo, titulo, riscos)
+        for (titulo,), grupo in instrumentos.group_by("titulo", maintain_order=True)
+    ]
+    if not resultados:
+        return pl.DataFrame(schema=_SCHEMA_INSTRUMENTOS)
+    return pl.concat(
+        [
+            r.select(*[c for c in _SCHEMA_INSTRUMENTOS if c in r.columns])
+            for r in resultados
+        ]
+    )
+
+
+def _juntar_resultados(
+    df: pl.DataFrame, instrumentos: pl.DataFrame, posicoes: pl.DataFrame
+) -> pl.DataFrame:
+    """Leva os resultados dos instrumentos de volta às posições originais."""
+    calculados = df.join(
+        instrumentos.select("id_instrumento", *_COLUNAS_CALCULADAS),
+        on="id_instrumento",
+        how="left",
+        maintain_order="left",
+        suffix="_calculado",
+    ).select(
+        "data_liquidacao",
+        "data_vencimento",
+        *[pl.col(f"{c}_calculado").alias(c) for c in _COLUNAS_CALCULADAS[:3]],
+        *_COLUNAS_CALCULADAS[3:],
+        financeiro=pl.col("pu_calculado") * pl.col("quantidade"),
+        dv01_financeiro=pl.col("dv01") * pl.col("quantidade"),
+    )
+    return posicoes.with_columns(calculados.get_columns())
+
+
+def _adicionar_vna(instrumentos: pl.DataFrame) -> pl.DataFrame:
+    """Busca o VNA dos instrumentos que precisam dele e não o informaram."""
+    pendentes = instrumentos.filter(
+        pl.col("titulo").is_in(_TITULOS_VNA),
+        pl.col("vna").is_null(),
+        pl.col("taxa").is_null() | pl.col("pu").is_null(),
+    )
+    if pendentes.is_empty():
+        return instrumentos
+
+    chaves = ["titulo", "data_liquidacao", "data_vencimento"]
+    buscados = pl.concat(
+        _BUSCAR_VNA[titulo](grupo.select(chaves).unique())
+        for (titulo,), grupo in pendentes.group_by("titulo", maintain_order=True)
+    )
+    return (
+        instrumentos.join(buscados, on=chaves, how="left", maintain_order="left")
+        .with_columns(vna=pl.coalesce("vna", "_vna_buscado"))
+        .drop("_vna_buscado")
+    )
+
+
+def _buscar_vna_ntnb(pares: pl.DataFrame) -> pl.DataFrame:
+    serie = ntnb.vna_serie(pares["data_liquidacao"].unique())
+    return pares.join(
+        serie.select(data_liquidacao="data", _vna_buscado="vna"),
+        on="data_liquidacao",
+        how="left",
+    )
+
+
+def _buscar_vna_ntnc(pares: pl.DataFrame) -> pl.DataFrame:
+    return pl.concat(
+        grupo.with_columns(
+            _vna_buscado=ntnc.vna_serie(grupo["data_liquidacao"], vencimento)["vna"]
+        )
+        for (vencimento,), grupo in pares.group_by("data_vencimento")
+    )
+
+
+def _buscar_vna_lft(pares: pl.DataFrame) -> pl.DataFrame:
+    serie = lft.vna_serie(pares["data_liquidacao"].unique())
+    return pares.join(
+        serie.select(data_liquidacao="data", _vna_buscado="vna"),
+        on="data_liquidacao",
+        how="left",
+    )
+
+
+def _completar(df: pl.DataFrame, coluna: str, expr: pl.Expr) -> pl.DataFrame:
+    """Preenche os nulos de ``coluna`` avaliando ``expr`` só nessas linhas."""
+    faltantes = df.filter(pl.col(coluna).is_null())
+    if faltantes.is_empty():
+        return df
+    return df.update(
+        faltantes.select("id_instrumento", expr.alias(coluna)), on="id_instrumento"
+    )
+
+
+def _pu_vna(cotacao: pl.Expr) -> pl.Expr:
+    """PU de títulos indexados: ``trunc6(trunc6(vna) * trunc6(cotacao))``."""
+    return pl.struct(pl.col("vna"), cotacao.alias("cotacao")).map_batches(
+        lambda linhas: utils.multiplicar_truncado(
+            linhas.struct.field("vna"), linhas.struct.field("cotacao")
+        ).fill_null(float("nan")),
+        return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def _precificar_titulo(df: pl.DataFrame, titulo: str, riscos: bool) -> pl.DataFrame:
+    """Completa taxa e PU e, se ``riscos``, calcula duration e DV01."""
+    expressoes = _expressoes_titulo(titulo)
+    df = _completar(df, "taxa", expressoes["taxa"])
+    df = _completar(df, "pu", expressoes["pu"])
+    if not riscos:
+        return df
+    return df.with_columns(duration=expressoes["duration"], dv01=expressoes["dv01"])
+
+
+def _expressoes_titulo(titulo: str) -> dict[str, pl.Expr]:
+    """Expressões colunares de taxa, PU, duration e DV01 de cada título."""
+    if titulo == "LTN":
+        return {
+            "taxa": ltn.taxa_expr(_LIQ, _VENC, "pu"),
+            "pu": ltn.pu_expr(_LIQ, _VENC, "taxa"),
+            "duration": ltn.duration_expr(_LIQ, _VENC),
+            "dv01": ltn.dv01_expr(_LIQ, _VENC, "taxa", "pu"),
+        }
+    if titulo == "NTN-F":
+        return {
+            "taxa": ntnf.taxa_expr(_LIQ, _VENC, "pu"),
+            "pu": ntnf.pu_expr(_LIQ, _VENC, "taxa"),
+            "duration": ntnf.duration_expr(_LIQ, _VENC, "taxa"),
+            "dv01": ntnf.dv01_expr(_LIQ, _VENC, "taxa", "pu"),
+        }
+    if titulo in {"NTN-B", "NTN-C"}:
+        modulo = ntnb if titulo == "NTN-B" else ntnc
+        return {
+            "taxa": modulo.taxa_expr(_LIQ, _VENC, "vna", "pu"),
+            "pu": _pu_vna(modulo.cotacao_expr(_LIQ, _VENC, "taxa")),
+            "duration": modulo.duration_expr(_LIQ, _VENC, "taxa"),
+            "dv01": modulo.dv01_expr(_LIQ, _VENC, "taxa", "pu"),
+        }
+    # LFT: mesma convenção do dv01 dos demais títulos, com a taxa normalizada e
+    # a taxa acrescida de 1 bp arredondada em oito casas
+    taxa = utils.normalizar_taxa_precificacao_expr("taxa")
+    cotacao_1 = lft.cotacao_expr(_LIQ, _VENC, taxa)
+    cotacao_2 = lft.cotacao_expr(_LIQ, _VENC, (taxa + 0.0001).round(8))
+    return {
+        "taxa": lft.taxa_expr(_LIQ, _VENC, "vna", "pu"),
+        "pu": _pu_vna(lft.cotacao_expr(_LIQ, _VENC, "taxa")),
+        # Título sem cupons: a duration é o prazo em anos úteis, como na LTN
+        "duration": ltn.duration_expr(_LIQ, _VENC),
+        "dv01": pl.col("pu") * (1 - cotacao_2 / cotacao_1),
+    }
+
+
+def _fluxos_dv01(instrumentos: pl.DataFrame) -> pl.DataFrame:
+    """Contribuição de cada fluxo de caixa para o DV01 de cada instrumento."""
+    partes = []
+    for (titulo,), grupo in instrumentos.group_by("titulo", maintain_order=True):
+        if titulo in _VALORES_PAGAMENTO:
+            fluxos = utils.gerar_fluxos_colunares(grupo, *_VALORES_PAGAMENTO[titulo]())
+        else:
+            # LTN e LFT: um único fluxo no vencimento
+            fluxos = grupo.select(
+                id_linha=pl.int_range(pl.len(), dtype=pl.UInt32),
+                valor_pagamento=pl.lit(1.0),
+                dias_uteis=du.contar_expr(_LIQ, _VENC),
+            ).filter(pl.col("dias_uteis") > 0)
+        linhas = grupo.select("id_instrumento", "taxa", "pu").with_row_index("id_linha")
+        partes.append(
+            fluxos.select("id_linha", "valor_pagamento", "dias_uteis").join(
+                linhas, on="id_linha", how="left"
+            )
+        )
+    if not partes:
+        return pl.DataFrame(
+            schema={
+                "id_instrumento": pl.UInt32,
+                "dias_uteis": pl.Int64,
+                "dv01": pl.Float64,
+            }
+        )
+
+    anos_uteis = pl.col("dias_uteis") / 252
+    vp = pl.col("valor_pagamento") / (1 + pl.col("taxa")) ** anos_uteis
+    peso = vp / vp.sum().over("id_instrumento")
+    return pl.concat(partes).select(
+        "id_instrumento",
+        pl.col("dias_uteis").cast(pl.Int64),
+        dv01=0.0001 * pl.col("pu") * peso * anos_uteis / (1 + pl.col("taxa")),
+    )
+
+
+def _distribuir_em_vertices(fluxos: pl.DataFrame, grade: pl.Series) -> pl.DataFrame:
+    """Reparte linearmente o DV01 de cada fluxo entre os vértices vizinhos."""
+    vertices = pl.DataFrame({"vertice": grade})
+    fluxos = (
+        fluxos.sort("dias_uteis")
+        .join_asof(
+            vertices.select("vertice", anterior="vertice"),
+            left_on="dias_uteis",
+            right_on="vertice",
+            strategy="backward",
+        )
+        .drop("vertice")
+        .join_asof(
+            vertices.select("vertice", posterior="vertice"),
+            left_on="dias_uteis",
+            right_on="vertice",
+            strategy="forward",
+        )
+        .drop("vertice")
+        .with_columns(
+            anterior=pl.coalesce("anterior", "posterior"),
+            posterior=pl.coalesce("posterior", "anterior"),
+        )
+    )
+    intervalo = pl.col("posterior") - pl.col("anterior")
+    peso_posterior = (
+        pl.when(intervalo > 0)
+        .then((pl.col("dias_uteis") - pl.col("anterior")) / intervalo)
+        .otherwise(0.0)
+    )
+    return (
+        pl.concat(
+            [
+                fluxos.select(
+                    "id_instrumento",
+                    vertice="anterior",
+                    dv01=pl.col("dv01") * (1 - peso_posterior),
+                ),
+                fluxos.select(
+                    "id_instrumento",
+                    vertice="posterior",
+                    dv01=pl.col("dv01") * peso_posterior,
+                ),
+            ]
+        )
+        .filter(pl.col("dv01") != 0)
+        .group_by("id_instrumento", "vertice")
+        .agg(pl.col("dv01").sum())
+    )
+
+
+def _validar_vertices(vertices: Sequence[int]) -> pl.Series:
+    grade = pl.Series("vertice", list(vertices), dtype=pl.Int64).unique().sort()
+    if grade.is_empty() or grade.min() <= 0:
+        raise ValueError("Os vértices devem ser prazos positivos em dias úteis.")
+    return grade
+
+
+_BUSCAR_VNA: dict[str, Callable[[pl.DataFrame], pl.DataFrame]] = {
+    "NTN-B": _buscar_vna_ntnb,
+    "NTN-C": _buscar_vna_ntnc,
+    "LFT": _buscar_vna_lft,
+}
+_VALORES_PAGAMENTO: dict[str, Callable[[], tuple[pl.Expr | float, pl.Expr | float]]] = {
+    "NTN-F": lambda: (ntnf.VALOR_CUPOM, ntnf.VALOR_FINAL),
+    "NTN-B": lambda: (ntnb.VALOR_CUPOM, ntnb.VALOR_FINAL),
+    "NTN-C": ntnc._valores_pagamento_expr,
+}
@@ -1,12 +1,11 @@
 """Instituições credenciadas como dealers pelo Tesouro Nacional."""
 
 import polars as pl
-import requests
 
 from pyield import relogio
 from pyield._internal import converters as cv
+from pyield._internal import transporte
 from pyield._internal.cache import ttl_cache
-from pyield._internal.retry import retry_padrao
 from pyield._internal.types import DateLike
 
 URL_API = "https://apiapex.tesouro.gov.br/aria/v1/api-leiloes-pub/custom/dealers"
@@ -25,11 +24,9 @@ def _df_vazio() -> pl.DataFrame:
 
 
 @ttl_cache(ttl=_TTL_UMA_HORA_EM_SEGUNDOS)
-@retry_padrao
 def _buscar_dealers() -> dict:
     """Busca os dados brutos de dealers na API do Tesouro Nacional."""
-    resposta = requests.get(URL_API, timeout=10)
-    resposta.raise_for_status()
+    resposta = transporte.get(URL_API, timeout=10)
     return resposta.json()
 
 
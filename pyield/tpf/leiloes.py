@@ -2,14 +2,13 @@ import datetime as dt
 import logging
 
 import polars as pl
-import requests
 from polars import selectors as cs
 
 from pyield import du
 from pyield._internal import converters as cv
+from pyield._internal import transporte
 from pyield._internal.br_numbers import pct_para_decimal
 from pyield._internal.cache import ttl_cache
-from pyield._internal.retry import retry_padrao
 from pyield._internal.types import DateLike, DatesLike, any_is_empty
 from pyield.bc.sgs import ptax_serie
 from pyield.tpf.titulos import ltn, ntnb, ntnf
@@ -95,7 +94,6 @@ ORDEM_FINAL_COLUNAS = [
 
 
 @ttl_cache()
-@retry_padrao
 def _buscar_dados_leiloes(
     data_leilao: dt.date | None = None,
     ano_inicial: int | None = None,
@@ -145,8 +143,7 @@ def _buscar_dados_leiloes(
     if ano_inicial is not None:
         parametros["anoinicial"] = str(ano_inicial)
 
-    resposta = requests.get(endpoint_api, params=parametros, timeout=10)
-    resposta.raise_for_status()
+    resposta = transporte.get(endpoint_api, params=parametros, timeout=10)
     dados = resposta.json()
     if "registros" not in dados or not dados["registros"]:
         return []
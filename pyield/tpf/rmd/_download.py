@@ -3,11 +3,10 @@
 import io
 import zipfile as zf
 
-import requests
 from lxml import html
 
+from pyield._internal import cache_brutos, transporte
 from pyield._internal.cache import ttl_cache
-from pyield._internal.retry import retry_padrao
 
 URL_BASE = (
     "https://www.tesourotransparente.gov.br/publicacoes/relatorio-mensal-da-divida-rmd"
@@ -16,11 +15,9 @@ _TIMEOUT_SEGUNDOS = 60
 _TTL_UM_DIA = 86_400  # segundos
 
 
-@retry_padrao
 def _buscar_conteudo(url: str) -> bytes:
     """Busca o conteúdo de uma URL, seguindo redirects, com retry."""
-    resposta = requests.get(url, timeout=_TIMEOUT_SEGUNDOS)
-    resposta.raise_for_status()
+    resposta = transporte.get(url, timeout=_TIMEOUT_SEGUNDOS)
     return resposta.content
 
 
@@ -50,6 +47,10 @@ def _extrair_excel(conteudo_zip: bytes) -> bytes:
 @ttl_cache(ttl=_TTL_UM_DIA)
 def baixar_planilha_rmd() -> bytes:
     """Baixa e extrai a planilha Excel do anexo mais recente do RMD."""
+    return cache_brutos.buscar("tesouro_rmd", None, _baixar_planilha)
+
+
+def _baixar_planilha() -> bytes:
     url_anexo = _buscar_url_anexo()
     conteudo_zip = _buscar_conteudo(url_anexo)
     return _extrair_excel(conteudo_zip)
@@ -3,12 +3,11 @@
 import datetime as dt
 
 import polars as pl
-import requests
 
 from pyield import du, relogio
+from pyield._internal import transporte
 from pyield._internal.br_numbers import float_br, inteiro_br, taxa_br
 from pyield._internal.cache import ttl_cache
-from pyield._internal.retry import retry_padrao
 
 URL_BASE_TEMPO_REAL = (
     "https://www3.bcb.gov.br/novoselic/rest/precosNegociacao/pub/download/estatisticas/"
@@ -19,13 +18,11 @@ HORA_FIM_TEMPO_REAL = dt.time(22, 0, 0)
 
 
 @ttl_cache()
-@retry_padrao
 def _buscar_csv_intradia() -> bytes:
     hoje = relogio.hoje()
     data_formatada = hoje.strftime("%d-%m-%Y")
     url = f"{URL_BASE_TEMPO_REAL}{data_formatada}"
-    resposta = requests.get(url, timeout=30)  # API costuma levar ~10s
-    resposta.raise_for_status()
+    resposta = transporte.get(url, timeout=30)  # API costuma levar ~10s
     return resposta.content
 
 
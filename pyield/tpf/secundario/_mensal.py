@@ -1,5 +1,6 @@
 """Dados mensais do mercado secundário de TPFs no sistema Selic do BCB."""
 
+import calendar
 import datetime as dt
 import io
 import os
@@ -8,13 +9,12 @@ from pathlib import Path
 
 import polars as pl
 import polars.selectors as ps
-import requests
 
 from pyield import relogio
+from pyield._internal import cache_brutos, transporte
 from pyield._internal.br_numbers import float_br
 from pyield._internal.cache import ttl_cache
 from pyield._internal.converters import converter_datas
-from pyield._internal.retry import retry_padrao
 from pyield._internal.types import DateLike, any_is_empty
 
 URL_BASE_MENSAL = "https://www4.bcb.gov.br/pom/demab/negociacoes/download"
@@ -57,10 +57,8 @@ def nome_arquivo_mensal(data: DateLike, extragrupo: bool = False) -> str:
 
 
 @ttl_cache()
-@retry_padrao
 def _baixar_url_zip(url_arquivo: str) -> bytes:
-    resposta = requests.get(url_arquivo, allow_redirects=True, timeout=60)
-    resposta.raise_for_status()
+    resposta = transporte.get(url_arquivo, allow_redirects=True, timeout=60)
     return resposta.content
 
 
@@ -90,6 +88,19 @@ def baixar_zip(data: DateLike, extragrupo: bool = False) -> bytes:
         >>> conteudo = yd.tpf.secundario.baixar_zip("07-01-2025")  # doctest: +SKIP
     """
     arquivo = nome_arquivo_mensal(data, extragrupo)
+    # O arquivo do mês só deixa de mudar após o último dia do mês
+    data_alvo = _data_mensal(data)
+    _, dias_no_mes = calendar.monthrange(data_alvo.year, data_alvo.month)
+    fim_mes = data_alvo.replace(day=dias_no_mes)
+    return cache_brutos.buscar(
+        "bcb_secundario_mensal",
+        fim_mes,
+        lambda: _baixar_zip_validado(arquivo),
+        variante=arquivo,
+    )
+
+
+def _baixar_zip_validado(arquivo: str) -> bytes:
     conteudo_zip = _baixar_url_zip(f"{URL_BASE_MENSAL}/{arquivo}")
     _validar_zip(conteudo_zip, arquivo)
     return conteudo_zip
@@ -1,57 +1,89 @@
 """Bootstrap de forwards para a curva zero de NTN-B."""
 
-import datetime as dt
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import partial
 
 import polars as pl
 
+import pyield._internal.converters as conversores
 from pyield import du
 from pyield._internal.types import ArrayLike, DateLike, DatesLike, any_is_empty
 from pyield.tpf.titulos import _utils as utils
 
 DIA_VENCIMENTO = 15
 MAX_EXPANSOES_INTERVALO = 32
+MAX_ITERACOES_NEWTON = 50
+TOLERANCIA_NEWTON = 1e-14
 
+_SCHEMA_CURVA = {
+    "data_vencimento": pl.Date,
+    "dias_uteis": pl.Int64,
+    "taxa_zero": pl.Float64,
+    "taxa_forward": pl.Float64,
+}
+_SCHEMA_LOTE = {"data_referencia": pl.Date, **_SCHEMA_CURVA}
 
-def _gerar_vertices_mensais(
-    data_liquidacao: dt.date, ultimo_vencimento: dt.date
-) -> list[dt.date]:
-    """Gera vértices mensais no dia 15."""
-    ancora = utils.subtrair_meses(data_liquidacao.replace(day=DIA_VENCIMENTO), 1)
-    datas = pl.date_range(ancora, ultimo_vencimento, interval="1mo", eager=True)
-    return datas.filter(datas.is_between(data_liquidacao, ultimo_vencimento)).to_list()
 
+def _vertices_mensais(titulos: pl.DataFrame) -> pl.DataFrame:
+    """Gera os vértices mensais no dia 15 de cada data de referência.
 
-def _taxas_zero_por_forwards(
-    dias_uteis: list[int], taxas_forward: list[float]
-) -> list[float]:
-    """Acumula taxas zero a partir de forwards constantes por trecho."""
-    taxas_zero = [taxas_forward[0]]
-
-    for du_anterior, du_atual, taxa_forward in zip(
-        dias_uteis[:-1], dias_uteis[1:], taxas_forward[1:], strict=True
-    ):
-        taxa_zero_anterior = taxas_zero[-1]
-        fator_acumulado = (1 + taxa_zero_anterior) ** (du_anterior / 252)
-        fator_forward = (1 + taxa_forward) ** ((du_atual - du_anterior) / 252)
-        taxas_zero.append((fator_acumulado * fator_forward) ** (252 / du_atual) - 1)
-
-    return taxas_zero
+    Os vértices vão da data de referência (inclusiva) até o último vencimento
+    da data, com os dias úteis contados a partir da data de referência.
+    """
+    referencia = pl.col("data_referencia")
+    return (
+        titulos.group_by("data_referencia")
+        .agg(ultimo_vencimento=pl.col("data_vencimento").max())
+        .select(
+            "data_referencia",
+            data_vencimento=pl.date_ranges(
+                pl.date(referencia.dt.year(), referencia.dt.month(), DIA_VENCIMENTO),
+                "ultimo_vencimento",
+                interval="1mo",
+            ),
+        )
+        .explode("data_vencimento")
+        .filter(pl.col("data_vencimento") >= referencia)
+        .with_columns(dias_uteis=du.contar_expr("data_referencia", "data_vencimento"))
+        .sort("data_referencia", "data_vencimento")
+    )
 
 
-def _calcular_cotacao(
-    fluxos: pl.DataFrame, dias_uteis: pl.Series, taxas: list[float]
-) -> float:
-    """Calcula a cotação dos fluxos pela taxa de cada prazo."""
-    return utils.calcular_pv(
-        fluxos_caixa=fluxos["valor_pagamento"],
-        taxas=taxas,
-        prazos=dias_uteis / 252,
-    )
+@dataclass
+class _CurvaForwards:
+    """Curva zero construída trecho a trecho pela calibração sequencial.
 
+    ``taxas_zero`` e ``taxas_forward`` crescem a cada título calibrado; os
+    vértices já acumulados ficam fixos durante a calibração dos seguintes.
+    """
 
-def _resolver_taxa_forward(
+    dias_uteis: list[int]
+    taxas_zero: list[float] = field(default_factory=list)
+    taxas_forward: list[float] = field(default_factory=list)
+
+    def fator_desconto(self, indice: int) -> float:
+        """Fator de desconto de um vértice já calibrado (1 antes do primeiro)."""
+        if indice < 0:
+            return 1.0
+        return 1 / (1 + self.taxas_zero[indice]) ** (self.dias_uteis[indice] / 252)
+
+    def estender(self, indice_final: int, taxa_forward: float) -> None:
+        """Acumula as taxas zero até ``indice_final`` com forward constante."""
+        for indice in range(len(self.taxas_zero), indice_final + 1):
+            if indice == 0:
+                taxa_zero = taxa_forward
+            else:
+                du_anterior = self.dias_uteis[indice - 1]
+                du_atual = self.dias_uteis[indice]
+                fator_acumulado = (1 + self.taxas_zero[-1]) ** (du_anterior / 252)
+                fator_forward = (1 + taxa_forward) ** ((du_atual - du_anterior) / 252)
+                taxa_zero = (fator_acumulado * fator_forward) ** (252 / du_atual) - 1
+            self.taxas_zero.append(taxa_zero)
+            self.taxas_forward.append(taxa_forward)
+
+
+def _resolver_por_bissecao(
     erro: Callable[[float], float], taxa_inicial: float
 ) -> float:
     """Resolve uma taxa forward por bisseção."""
@@ -79,63 +111,137 @@ def _resolver_taxa_forward(
     return utils._metodo_bissecao(erro, limite_inferior, limite_superior)
 
 
-def _taxas_forward_vertices(
-    vertices: list[dt.date],
-    vencimentos: list[dt.date],
-    taxas_forward: list[float],
-) -> list[float]:
-    """Seleciona a taxa do próximo vencimento quando necessário."""
-    indice_titulo = 0
-    resultado = []
-    for vertice in vertices:
-        while vertice > vencimentos[indice_titulo]:
-            indice_titulo += 1
-        resultado.append(taxas_forward[indice_titulo])
-    return resultado
-
-
-@dataclass
-class _ContextoBootstrapForwards:
-    """Dados compartilhados pela calibração sequencial de forwards."""
+def _resolver_taxa_forward(
+    erro_e_derivada: Callable[[float], tuple[float, float]], taxa_inicial: float
+) -> float:
+    """Resolve uma taxa forward por Newton, com bisseção como salvaguarda.
 
-    data_liquidacao: dt.date
-    vertices: list[dt.date]
-    dias_vertices: list[int]
-    indice_por_data: dict[dt.date, int]
-    vencimentos: list[dt.date]
-    taxas_tir: list[float]
-    taxas_forward: list[float]
+    O erro de preço é convexo e decrescente no forward, então Newton converge
+    a partir da TIR em poucas iterações. Se sair do domínio (forward <= -100%),
+    divergir ou não convergir, a bisseção com busca de intervalo assume.
+    """
+    taxa = taxa_inicial
+    for _ in range(MAX_ITERACOES_NEWTON):
+        try:
+            erro, derivada = erro_e_derivada(taxa)
+        except OverflowError:
+            break
+        if derivada == 0:
+            break
+        passo = erro / derivada
+        taxa -= passo
+        if not taxa > -1:
+            break
+        if abs(passo) < TOLERANCIA_NEWTON:
+            return taxa
+
+    return _resolver_por_bissecao(lambda t: erro_e_derivada(t)[0], taxa_inicial)
 
 
 def _calibrar_taxa_forward(
-    contexto: _ContextoBootstrapForwards,
-    indice_titulo: int,
+    curva: _CurvaForwards,
+    fluxos: list[tuple[int, float]],
+    taxa_tir: float,
 ) -> float:
-    """Calibra um forward para reproduzir a cotação de uma NTN-B."""
-    from pyield.tpf.titulos.ntnb import fluxos_caixa  # noqa: PLC0415
-
-    vencimento = contexto.vencimentos[indice_titulo]
-    fluxos = fluxos_caixa(contexto.data_liquidacao, vencimento)
-    dias_fluxos = du.contar(contexto.data_liquidacao, fluxos["data_pagamento"])
-    indices_fluxos = [
-        contexto.indice_por_data[data] for data in fluxos["data_pagamento"]
-    ]
-    cotacao_alvo = _calcular_cotacao(
-        fluxos, dias_fluxos, [contexto.taxas_tir[indice_titulo]] * fluxos.height
+    """Calibra o forward do próximo trecho para reproduzir a cotação pela TIR.
+
+    Os fluxos anteriores ao trecho são descontados pela curva já calibrada e
+    somados uma única vez. Dentro do trecho, o fator de desconto de um vértice
+    é o do início do trecho vezes ``(1 + f) ** -(DU - DU_inicio) / 252``, de
+    modo que cada avaliação do erro percorre apenas os fluxos do trecho.
+    """
+    dias_uteis = curva.dias_uteis
+    inicio = len(curva.taxas_zero)
+    du_inicio = dias_uteis[inicio - 1] if inicio > 0 else 0
+    desconto_inicio = curva.fator_desconto(inicio - 1)
+
+    cotacao_alvo = sum(
+        valor / (1 + taxa_tir) ** (dias_uteis[indice] / 252) for indice, valor in fluxos
+    )
+    vp_fixo = sum(
+        valor * curva.fator_desconto(indice)
+        for indice, valor in fluxos
+        if indice < inicio
     )
+    trecho = [
+        (valor * desconto_inicio, (dias_uteis[indice] - du_inicio) / 252)
+        for indice, valor in fluxos
+        if indice >= inicio
+    ]
 
-    def erro(taxa_forward: float) -> float:
-        contexto.taxas_forward[indice_titulo] = taxa_forward
-        curva_zero = _taxas_zero_por_forwards(
-            contexto.dias_vertices,
-            _taxas_forward_vertices(
-                contexto.vertices, contexto.vencimentos, contexto.taxas_forward
-            ),
+    def erro_e_derivada(taxa_forward: float) -> tuple[float, float]:
+        vp = vp_fixo
+        derivada = 0.0
+        for valor, prazo in trecho:
+            vp_fluxo = valor / (1 + taxa_forward) ** prazo
+            vp += vp_fluxo
+            derivada -= vp_fluxo * prazo / (1 + taxa_forward)
+        return vp - cotacao_alvo, derivada
+
+    return _resolver_taxa_forward(erro_e_derivada, taxa_tir)
+
+
+def _calibrar_curva(
+    dias_uteis: list[int],
+    indices_vencimentos: list[int],
+    taxas_tir: list[float],
+    primeiro_fluxo: int,
+) -> _CurvaForwards:
+    """Calibra os forwards título a título, do menor para o maior vencimento.
+
+    ``indices_vencimentos`` são as posições dos vencimentos entre os vértices
+    mensais. Os fluxos de cada NTN-B caem a cada seis vértices a partir do
+    vencimento, a partir de ``primeiro_fluxo`` (o primeiro vértice posterior
+    à liquidação).
+    """
+    from pyield.tpf.titulos.ntnb import VALOR_CUPOM, VALOR_FINAL  # noqa: PLC0415
+
+    curva = _CurvaForwards(dias_uteis)
+    for indice_vencimento, taxa_tir in zip(indices_vencimentos, taxas_tir, strict=True):
+        indices_fluxos = range(indice_vencimento, primeiro_fluxo - 1, -6)
+        fluxos = [
+            (indice, VALOR_FINAL if indice == indice_vencimento else VALOR_CUPOM)
+            for indice in reversed(indices_fluxos)
+        ]
+        taxa_forward = _calibrar_taxa_forward(curva, fluxos, taxa_tir)
+        curva.estender(indice_vencimento, taxa_forward)
+    return curva
+
+
+def _taxas_zero_datas(
+    titulos: pl.DataFrame, incluir_vertices: bool = False
+) -> pl.DataFrame:
+    """Curvas zero de todas as datas de referência de ``titulos``.
+
+    ``titulos`` tem as colunas ``data_referencia``, ``data_vencimento`` e
+    ``taxa``, com vencimentos posteriores à data de referência.
+    """
+    vertices = _vertices_mensais(titulos).join(
+        titulos,
+        on=["data_referencia", "data_vencimento"],
+        how="left",
+        maintain_order="left",
+    )
+    taxas_zero = []
+    taxas_forward = []
+    for df in vertices.partition_by("data_referencia", maintain_order=True):
+        eh_vencimento = df["taxa"].is_not_null()
+        curva = _calibrar_curva(
+            dias_uteis=df["dias_uteis"].to_list(),
+            indices_vencimentos=eh_vencimento.arg_true().to_list(),
+            taxas_tir=df["taxa"].drop_nulls().to_list(),
+            primeiro_fluxo=int(df["data_vencimento"][0] == df["data_referencia"][0]),
         )
-        taxas_fluxos = [curva_zero[indice] for indice in indices_fluxos]
-        return _calcular_cotacao(fluxos, dias_fluxos, taxas_fluxos) - cotacao_alvo
+        taxas_zero.extend(curva.taxas_zero)
+        taxas_forward.extend(curva.taxas_forward)
 
-    return _resolver_taxa_forward(erro, contexto.taxas_tir[indice_titulo])
+    df = vertices.with_columns(
+        taxa_zero=pl.Series(taxas_zero, dtype=pl.Float64),
+        taxa_forward=pl.Series(taxas_forward, dtype=pl.Float64),
+    )
+    if not incluir_vertices:
+        df = df.filter(pl.col("taxa").is_not_null())
+    return df.select(_SCHEMA_LOTE.keys())
 
 
 def taxas_zero(
@@ -184,7 +290,7 @@ def taxas_zero(
 
         Para cada título, do menor para o maior vencimento, a função calcula a
         cotação-alvo \(P_i^{\mathrm{TIR}}\) descontando seus fluxos pela TIR
-        observada. Em seguida, busca por bisseção o forward (f_i) que zera:
+        observada. Em seguida, busca o forward (f_i) que zera:
 
         \[
         E_i(f_i) =
@@ -194,15 +300,18 @@ def taxas_zero(
 
         Os forwards e taxas zero já calibrados nos títulos curtos permanecem
         fixos durante a calibração dos títulos longos. Por isso, cada etapa tem
-        apenas uma incógnita e é resolvida por bisseção quando há mudança de
-        sinal no intervalo pesquisado.
+        apenas uma incógnita: o valor presente dos fluxos anteriores ao trecho
+        é calculado uma vez, e só os fluxos do trecho dependem de \(f_i\).
+        Como \(E_i\) é convexa e decrescente em \(f_i\), a raiz é obtida pelo
+        método de Newton partindo da TIR.
 
         **Convergência condicional**
 
-        A bisseção é determinística quando encontra um intervalo que contém uma
-        raiz. A função tenta expandir o limite superior para encontrar esse
-        intervalo, mas pode não encontrá-lo para entradas incompatíveis ou
-        extremos. Nesse caso, a calibração não produz uma curva e lança
+        Se Newton não convergir, a função recorre à bisseção, que é
+        determinística quando encontra um intervalo que contém uma raiz. A
+        função tenta expandir o limite superior para encontrar esse intervalo,
+        mas pode não encontrá-lo para entradas incompatíveis ou extremos.
+        Nesse caso, a calibração não produz uma curva e lança
         ``RuntimeError``.
 
         **Precisão do método**
@@ -244,52 +353,65 @@ def taxas_zero(
         data_liquidacao, vencimentos, taxas
     )
     if vencimentos.is_empty():
-        return pl.DataFrame(
-            schema={
-                "data_vencimento": pl.Date,
-                "dias_uteis": pl.Int64,
-                "taxa_zero": pl.Float64,
-                "taxa_forward": pl.Float64,
-            }
-        )
+        return pl.DataFrame(schema=_SCHEMA_CURVA)
 
-    titulos = pl.DataFrame({"data_vencimento": vencimentos, "taxa_tir": taxas}).sort(
-        "data_vencimento"
-    )
-    vencimentos_ordenados = titulos["data_vencimento"].to_list()
-    taxas_tir = titulos["taxa_tir"].to_list()
-    ultimo_vencimento = vencimentos_ordenados[-1]
-    vertices = _gerar_vertices_mensais(liquidacao, ultimo_vencimento)
-    dias_uteis = du.contar(liquidacao, pl.Series(vertices)).to_list()
-    indice_por_data = {data: indice for indice, data in enumerate(vertices)}
-    contexto = _ContextoBootstrapForwards(
-        liquidacao,
-        vertices,
-        dias_uteis,
-        indice_por_data,
-        vencimentos_ordenados,
-        taxas_tir,
-        taxas_tir.copy(),
+    titulos = pl.DataFrame({"data_vencimento": vencimentos, "taxa": taxas}).select(
+        data_referencia=pl.lit(liquidacao),
+        data_vencimento="data_vencimento",
+        taxa="taxa",
     )
+    return _taxas_zero_datas(titulos, incluir_vertices).drop("data_referencia")
 
-    for indice_titulo in range(len(vencimentos_ordenados)):
-        contexto.taxas_forward[indice_titulo] = _calibrar_taxa_forward(
-            contexto, indice_titulo
-        )
 
-    forwards_vertices = _taxas_forward_vertices(
-        vertices, vencimentos_ordenados, contexto.taxas_forward
-    )
-    curva_zero = _taxas_zero_por_forwards(dias_uteis, forwards_vertices)
-    df = pl.DataFrame(
-        {
-            "data_vencimento": vertices,
-            "dias_uteis": dias_uteis,
-            "taxa_zero": curva_zero,
-            "taxa_forward": forwards_vertices,
-        }
+def taxas_zero_lote(
+    df: pl.DataFrame,
+    incluir_vertices: bool = False,
+    processos: int = 1,
+) -> pl.DataFrame:
+    """Calcula a curva zero pelo bootstrap de forwards para várias datas.
+
+    Versão em lote de :func:`taxas_zero` para painéis históricos. Cada data de
+    referência é usada como data de liquidação; os vértices mensais e os dias
+    úteis de todas as datas são gerados de uma só vez.
+
+    Args:
+        df: TIRs das NTN-B em formato longo, com as colunas
+            ``data_referencia``, ``data_vencimento`` e ``taxa``.
+        incluir_vertices: Se True, inclui todos os vértices mensais da curva.
+            Padrão False, retornando apenas os vencimentos informados.
+        processos: Número de processos usados na calibração. Com mais de um,
+            as datas são divididas em lotes contíguos processados em paralelo.
+            Padrão: 1 (no processo atual).
+
+    Returns:
+        pl.DataFrame: Colunas de :func:`taxas_zero` precedidas de
+        ``data_referencia``, ordenadas por data de referência e vencimento.
+        Vencimentos menores ou iguais à data de referência são ignorados.
+
+    Raises:
+        RuntimeError: Se não for possível encontrar um intervalo válido para
+            alguma taxa forward.
+
+    Output Columns:
+        - data_referencia (Date): Data de referência (liquidação).
+        - data_vencimento (Date): Data do vértice da curva.
+        - dias_uteis (Int64): Dias úteis entre liquidação e vértice.
+        - taxa_zero (Float64): Taxa zero real anualizada.
+        - taxa_forward (Float64): Taxa forward anualizada do trecho.
+    """
+    titulos = (
+        df.select(
+            conversores.converter_datas_expr("data_referencia"),
+            conversores.converter_datas_expr("data_vencimento"),
+            pl.col("taxa").cast(pl.Float64),
+        )
+        .drop_nulls()
+        .filter(pl.col("data_vencimento") > pl.col("data_referencia"))
     )
+    if titulos.is_empty():
+        return pl.DataFrame(schema=_SCHEMA_LOTE)
 
-    if not incluir_vertices:
-        df = df.filter(pl.col("data_vencimento").is_in(vencimentos_ordenados))
-    return df
+    funcao = partial(_taxas_zero_datas, incluir_vertices=incluir_vertices)
+    return utils.processar_por_data(funcao, titulos, processos).sort(
+        "data_referencia", "data_vencimento"
+    )
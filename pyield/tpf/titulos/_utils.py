@@ -1,17 +1,31 @@
 import datetime as dt
 import logging
-from collections.abc import Callable
+import math
+import multiprocessing
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
 
 import polars as pl
 
 import pyield._internal.converters as conversores
-from pyield._internal.numbers import truncar
+from pyield import du
+from pyield._internal.numbers import truncar, truncar_expr
 from pyield._internal.types import DateLike, any_is_empty
 from pyield.tpf._taxas import TipoTPF
 
 logger = logging.getLogger(__name__)
 
+# Parâmetros da busca de raiz (intervalo de taxas e bisseção)
+TAXA_INICIAL = 0.01
+PASSO_INICIAL = 0.01
+FATOR_CRESCIMENTO = 1.6
+MAX_TENTATIVAS = 100
+TAXA_MIN = -1.0
+TAXA_MAX = 10.00
+TOLERANCIA = 1e-12
+MAX_ITERACOES = 100
+
 COLUNAS_DADOS_TPF = (
     "data_referencia",
     "titulo",
@@ -166,25 +180,80 @@ def gerar_datas_pagamento(
     ).sort()
 
 
-def adicionar_duration(
+def gerar_fluxos_colunares(
     df: pl.DataFrame,
-    funcao_duration: Callable[[dt.date, dt.date, float], float],
+    valor_cupom: pl.Expr | float,
+    valor_final: pl.Expr | float,
+    intervalo_meses: int = 6,
 ) -> pl.DataFrame:
-    """Adiciona `duration` e `prazo_medio` ao DataFrame.
+    """Explode cada linha de ``df`` nos seus fluxos contratuais (formato longo).
 
-    Calcula a Macaulay Duration via ``funcao_duration`` (row-wise) e define
-    `prazo_medio` igual a `duration`.
+    ``df`` deve conter ``data_liquidacao`` e ``data_vencimento`` (Date). As
+    datas seguem ``gerar_datas_pagamento`` (liquidação exclusiva, vencimento
+    inclusivo, ordem crescente) e ``valor_cupom``/``valor_final`` podem ser
+    expressões sobre ``data_vencimento``.
+
+    Output Columns:
+        - id_linha (UInt32): Posição da linha de origem em ``df``.
+        - data_pagamento (Date): Data contratual do pagamento.
+        - valor_pagamento (Float64): Valor do pagamento.
+        - dias_uteis (Int64): Dias úteis entre liquidação e pagamento.
     """
-    return df.with_columns(
-        duration=pl.struct(
-            "data_referencia", "data_vencimento", "taxa_indicativa"
-        ).map_elements(
-            lambda s: funcao_duration(
-                s["data_referencia"], s["data_vencimento"], s["taxa_indicativa"]
-            ),
-            return_dtype=pl.Float64,
-        ),
-    ).with_columns(prazo_medio=pl.col("duration"))
+    df = (
+        df.select("data_liquidacao", "data_vencimento")
+        .with_row_index("id_linha")
+        .filter(pl.col("data_vencimento") > pl.col("data_liquidacao"))
+    )
+    # Limite superior de períodos por linha; o excesso é filtrado adiante
+    meses = (
+        (pl.col("data_vencimento").dt.year() - pl.col("data_liquidacao").dt.year())
+        * 12
+        + pl.col("data_vencimento").dt.month()
+        - pl.col("data_liquidacao").dt.month()
+    )
+    max_periodos = df.select(meses.max() // intervalo_meses + 2).item() or 0
+    periodos = pl.LazyFrame(
+        {"periodo": range(max_periodos)}, schema={"periodo": pl.Int64}
+    )
+    fluxos = (
+        df.lazy()
+        .join(periodos, how="cross")
+        .filter(pl.col("periodo") <= meses // intervalo_meses + 1)
+        .sort("id_linha", pl.col("periodo"), descending=[False, True])
+        .with_columns(
+            data_pagamento=pl.col("data_vencimento").dt.offset_by(
+                pl.format("-{}mo", pl.col("periodo") * intervalo_meses)
+            )
+        )
+        .filter(pl.col("data_pagamento") > pl.col("data_liquidacao"))
+    )
+    # Linhas com a mesma liquidação compartilham datas de cupom: os dias
+    # úteis são contados uma única vez por par de datas
+    pares = (
+        fluxos.select("data_liquidacao", "data_pagamento")
+        .unique()
+        .with_columns(dias_uteis=du.contar_expr("data_liquidacao", "data_pagamento"))
+    )
+    return (
+        fluxos.join(
+            pares,
+            on=["data_liquidacao", "data_pagamento"],
+            how="left",
+            maintain_order="left",
+        )
+        .select(
+            "id_linha",
+            "data_pagamento",
+            valor_pagamento=pl.when(
+                pl.col("data_pagamento") == pl.col("data_vencimento")
+            )
+            .then(valor_final)
+            .otherwise(valor_cupom)
+            .cast(pl.Float64),
+            dias_uteis="dias_uteis",
+        )
+        .collect()
+    )
 
 
 def adicionar_dv01(df: pl.DataFrame) -> pl.DataFrame:
@@ -198,6 +267,11 @@ def normalizar_taxa_precificacao(taxa: float | Decimal) -> float:
     return truncar(taxa, 8)
 
 
+def normalizar_taxa_precificacao_expr(taxa: pl.Expr | str) -> pl.Expr:
+    """Versão em expressão de ``normalizar_taxa_precificacao``."""
+    return truncar_expr(taxa, 8)
+
+
 def calcular_pv(
     fluxos_caixa: pl.Series | list[float],
     taxas: pl.Series | list[float],
@@ -260,6 +334,111 @@ def calcular_pv(
     return float(valores_presentes.sum())
 
 
+def bootstrap_taxas_zero(  # noqa: PLR0913
+    anos_uteis: Sequence[float],
+    precos: Sequence[float | None],
+    taxas_diretas: Sequence[float | None],
+    *,
+    valor_cupom: float,
+    valor_final: float,
+    passo_cupom: int,
+) -> list[float | None]:
+    """Resolve sequencialmente as taxas zero de uma grade de vencimentos.
+
+    Núcleo comum do bootstrap de NTN-F e NTN-B. A grade deve estar em ordem
+    crescente e ter espaçamento uniforme, de modo que os cupons anteriores do
+    vértice ``i`` ocupem as posições ``i - passo_cupom``, ``i - 2 *
+    passo_cupom``, ... O valor presente de cada cupom é guardado em buffer
+    assim que sua taxa é resolvida, e nenhum DataFrame é reconstruído no laço.
+
+    Args:
+        anos_uteis: Prazo de cada vértice em anos úteis.
+        precos: Preço-alvo de cada vértice. Ignorado onde houver taxa direta;
+            preço nulo resulta em taxa nula.
+        taxas_diretas: Taxa zero já conhecida de cada vértice (ex.: LTN ou
+            TIR antes do primeiro vencimento) ou None para resolver pelo preço.
+        valor_cupom: Valor de cada cupom.
+        valor_final: Valor do último pagamento (principal e cupom).
+        passo_cupom: Número de vértices da grade entre dois cupons.
+
+    Returns:
+        list[float | None]: Taxa zero de cada vértice. Se algum cupom anterior
+        não tiver taxa, o resultado do vértice é NaN, como em ``calcular_pv``.
+    """
+    n = len(anos_uteis)
+    taxas: list[float | None] = [None] * n
+    vp_cupons: list[float | None] = [None] * n
+
+    for i in range(n):
+        taxa = taxas_diretas[i]
+        preco = precos[i]
+        if taxa is None and preco is not None:
+            cupons = vp_cupons[i % passo_cupom : i : passo_cupom]
+            if None in cupons:
+                vp_anteriores = float("nan")
+            else:
+                # Soma via Polars para manter a ordem de acumulação de calcular_pv
+                vp_anteriores = float(pl.Series(cupons, dtype=pl.Float64).sum())
+            fator_preco = valor_final / (preco - vp_anteriores)
+            taxa = fator_preco ** (1 / anos_uteis[i]) - 1
+
+        taxas[i] = taxa
+        if taxa is not None:
+            vp_cupons[i] = valor_cupom / (1 + taxa) ** anos_uteis[i]
+
+    return taxas
+
+
+def calcular_precos(
+    linhas: pl.DataFrame,
+    valor_cupom: pl.Expr | float,
+    valor_final: pl.Expr | float,
+    casas_vp: int,
+) -> pl.Series:
+    """Soma dos valores presentes truncada em 6 casas para todas as linhas.
+
+    Versão colunar de ``ntnf._calcular_pu`` (``casas_vp=9``) e de ``cotacao``
+    de NTN-B e NTN-C (``casas_vp=12``): cada fluxo é descontado na taxa
+    normalizada, arredondado em ``casas_vp`` casas e a soma é truncada em
+    seis. ``linhas`` deve conter ``data_liquidacao``, ``data_vencimento`` e
+    ``taxa``. Linhas sem taxa ou sem fluxos resultam em NaN.
+    """
+    df = preparar_linhas(linhas, "taxa")
+    fluxos = gerar_fluxos_colunares(df, valor_cupom, valor_final)
+    somas = somar_vp_fluxos(fluxos, df["taxa"], casas_vp)
+    return pl.select(
+        pl.when(pl.lit(df["taxa"]).is_not_null())
+        .then(truncar_expr(pl.lit(somas), 6))
+        .otherwise(float("nan"))
+    ).to_series()
+
+
+def processar_por_data(
+    funcao: Callable[[pl.DataFrame], pl.DataFrame],
+    df: pl.DataFrame,
+    processos: int,
+) -> pl.DataFrame:
+    """Aplica ``funcao`` a lotes contíguos de datas de referência de ``df``.
+
+    Com ``processos`` maior que 1, os lotes são processados em paralelo em um
+    pool de processos e ``funcao`` precisa ser uma função de módulo para ser
+    serializada pelo pickle. Os resultados são concatenados na ordem dos lotes.
+    """
+    datas = df["data_referencia"].unique().sort().to_list()
+    if processos <= 1 or len(datas) <= 1:
+        return funcao(df)
+
+    tamanho_lote = math.ceil(len(datas) / processos)
+    lotes = [
+        df.filter(pl.col("data_referencia").is_in(datas[i : i + tamanho_lote]))
+        for i in range(0, len(datas), tamanho_lote)
+    ]
+    # "spawn" evita fork de um processo que pode ter threads em execução
+    contexto = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(lotes), mp_context=contexto) as executor:
+        return pl.concat(executor.map(funcao, lotes))
+
+
 def _encontrar_intervalo_raiz(
     func: Callable[[float], float],
 ) -> tuple[float, float] | None:
@@ -270,41 +449,34 @@ def _encontrar_intervalo_raiz(
     intervalo realista. A função 'func' é a que calcula a diferença de
     preço dado uma taxa.
     """
-    taxa_inicial: float = 0.01
-    passo: float = 0.01
-    fator_crescimento: float = 1.6
-    max_tentativas: int = 100
-    taxa_min: float = -1.0
-    taxa_max: float = 10.00
-
-    f0 = func(taxa_inicial)
+    f0 = func(TAXA_INICIAL)
     if abs(f0) == 0:
-        return (taxa_inicial, taxa_inicial)
+        return (TAXA_INICIAL, TAXA_INICIAL)
 
-    a, fa = taxa_inicial, f0
-    b = taxa_inicial + passo
-    passo_atual = passo
-    for _ in range(max_tentativas):
-        if b > taxa_max:
+    a, fa = TAXA_INICIAL, f0
+    b = TAXA_INICIAL + PASSO_INICIAL
+    passo_atual = PASSO_INICIAL
+    for _ in range(MAX_TENTATIVAS):
+        if b > TAXA_MAX:
             break
         fb = func(b)
         if fa * fb < 0:
             return (a, b)
         a, fa = b, fb
-        passo_atual *= fator_crescimento
+        passo_atual *= FATOR_CRESCIMENTO
         b += passo_atual
 
-    a, fa = taxa_inicial, f0
-    b = taxa_inicial - passo
-    passo_atual = passo
-    for _ in range(max_tentativas):
-        if b < taxa_min:
+    a, fa = TAXA_INICIAL, f0
+    b = TAXA_INICIAL - PASSO_INICIAL
+    passo_atual = PASSO_INICIAL
+    for _ in range(MAX_TENTATIVAS):
+        if b < TAXA_MIN:
             break
         fb = func(b)
         if fa * fb < 0:
             return (b, a)
         a, fa = b, fb
-        passo_atual *= fator_crescimento
+        passo_atual *= FATOR_CRESCIMENTO
         b -= passo_atual
 
     return None
@@ -312,8 +484,6 @@ def _encontrar_intervalo_raiz(
 
 def _metodo_bissecao(func: Callable[[float], float], a: float, b: float) -> float:
     """Método da bisseção para encontrar raiz."""
-    TOLERANCIA = 1e-12
-    MAX_ITERACOES = 100
     fa, fb = func(a), func(b)
     if fa * fb > 0:
         logger.warning(
@@ -347,3 +517,286 @@ def encontrar_raiz(func_diferenca_preco: Callable[[float], float]) -> float:
 
     a, b = intervalo
     return _metodo_bissecao(func_diferenca_preco, a, b)
+
+
+def somar_vp_fluxos(
+    fluxos: pl.DataFrame,
+    taxas: pl.Series,
+    casas_vp: int,
+) -> pl.Series:
+    """Soma, por linha, os valores presentes dos fluxos à taxa da linha.
+
+    Vetoriza o núcleo de ``cotacao``/``_calcular_pu``: a taxa é normalizada
+    (truncada em 8 casas), os anos úteis são truncados em 14 casas e cada valor
+    presente é arredondado em ``casas_vp`` casas antes da soma.
+
+    Args:
+        fluxos: Fluxos de ``gerar_fluxos_colunares``.
+        taxas: Uma taxa por linha de origem.
+        casas_vp: Casas decimais do arredondamento de cada valor presente.
+
+    Returns:
+        pl.Series: Soma dos valores presentes por linha (NaN sem fluxos).
+    """
+    taxas_normalizadas = pl.select(
+        normalizar_taxa_precificacao_expr(pl.lit(taxas))
+    ).to_series()
+    vp = (
+        pl.col("valor_pagamento")
+        / (1 + pl.lit(taxas_normalizadas).gather(pl.col("id_linha")))
+        ** (pl.col("dias_uteis") / 252).truncate(14)
+    ).round(casas_vp)
+    return somar_por_linha(fluxos, vp, len(taxas))
+
+
+def somar_por_linha(fluxos: pl.DataFrame, valor: pl.Expr, n: int) -> pl.Series:
+    """Soma ``valor`` (avaliado sobre ``fluxos``) por ``id_linha``.
+
+    Cada soma segue a mesma ordem de acumulação e o mesmo tratamento de nulos
+    de ``pl.Series.sum``. Linhas sem fluxos resultam em NaN.
+    """
+    return somar_colunas_por_linha(fluxos, n, valor=valor)["valor"]
+
+
+def somar_colunas_por_linha(
+    fluxos: pl.DataFrame, n: int, **valores: pl.Expr
+) -> pl.DataFrame:
+    """Versão de ``somar_por_linha`` para várias somas numa única agregação.
+
+    Returns:
+        pl.DataFrame: ``n`` linhas com uma coluna por expressão de ``valores``.
+    """
+    somas = (
+        fluxos.lazy()
+        .select("id_linha", **valores)
+        .group_by("id_linha", maintain_order=True)
+        .agg(*valores)
+        .select("id_linha", pl.col(*valores).list.sum())
+        .collect()
+    )
+    return pl.DataFrame(
+        {
+            nome: _repetir(float("nan"), n).scatter(somas["id_linha"], somas[nome])
+            for nome in valores
+        }
+    )
+
+
+def preparar_linhas(linhas: pl.DataFrame, *colunas: str) -> pl.DataFrame:
+    """Converte as datas e passa para Float64 as colunas numéricas."""
+    return linhas.select(
+        conversores.converter_datas_expr("data_liquidacao"),
+        conversores.converter_datas_expr("data_vencimento"),
+        pl.col(*colunas).cast(pl.Float64),
+    )
+
+
+def calcular_durations(
+    linhas: pl.DataFrame,
+    valor_cupom: pl.Expr | float,
+    valor_final: pl.Expr | float,
+    casas: int | None = None,
+) -> pl.Series:
+    """Calcula a Macaulay duration de títulos com cupom para todas as linhas.
+
+    Versão colunar de ``duration`` de NTN-B, NTN-C e NTN-F: os fluxos são
+    gerados uma única vez e o valor presente e o prazo ponderado são somados
+    numa só agregação. ``linhas`` deve conter ``data_liquidacao``,
+    ``data_vencimento`` e ``taxa``. Se ``casas`` for informado, o resultado é
+    truncado como na versão escalar.
+    """
+    df = preparar_linhas(linhas, "taxa")
+    fluxos = gerar_fluxos_colunares(df, valor_cupom, valor_final)
+    anos_uteis = pl.col("dias_uteis") / 252
+    taxa = pl.lit(df["taxa"]).gather(pl.col("id_linha"))
+    vp = pl.col("valor_pagamento") / (1 + taxa) ** anos_uteis
+    somas = somar_colunas_por_linha(
+        fluxos, df.height, vp=vp, vp_prazo=vp * anos_uteis
+    )
+    durations = somas["vp_prazo"] / somas["vp"]
+    if casas is None:
+        return durations
+    return pl.select(truncar_expr(pl.lit(durations), casas)).to_series()
+
+
+def calcular_dv01s(
+    linhas: pl.DataFrame,
+    valor_cupom: pl.Expr | float,
+    valor_final: pl.Expr | float,
+    casas_vp: int,
+) -> pl.Series:
+    """Calcula o DV01 de títulos com cupom para todas as linhas.
+
+    Versão colunar de ``dv01`` de NTN-B, NTN-C e NTN-F: reprecifica os mesmos
+    fluxos na taxa normalizada e na taxa acrescida de 1 bp (arredondada em 8
+    casas) e aplica a variação relativa ao PU informado. ``linhas`` deve conter
+    ``data_liquidacao``, ``data_vencimento``, ``taxa`` e ``pu``.
+    """
+    df = preparar_linhas(linhas, "taxa", "pu")
+    fluxos = gerar_fluxos_colunares(df, valor_cupom, valor_final)
+    taxas = df.select(
+        taxa=normalizar_taxa_precificacao_expr("taxa"),
+    ).with_columns(
+        # round(taxa + 0.0001, 8): a soma fica a poucos ulps de um múltiplo
+        # exato de 1e-8, então o inteiro mais próximo é o mesmo do Python.
+        taxa_mais_1bp=pl.format(
+            "{}e-8",
+            ((pl.col("taxa") + 0.0001) * 10**8).round().cast(pl.Int64, strict=False),
+        ).cast(pl.Float64),
+    )
+
+    def precificar(coluna: str) -> pl.Series:
+        somas = somar_vp_fluxos(fluxos, taxas[coluna], casas_vp)
+        return pl.select(truncar_expr(pl.lit(somas), 6)).to_series()
+
+    preco_1 = precificar("taxa")
+    preco_2 = precificar("taxa_mais_1bp")
+    return (df["pu"] * (1 - preco_2 / preco_1)).fill_null(float("nan"))
+
+
+def _repetir(valor: float, n: int) -> pl.Series:
+    return pl.repeat(valor, n, dtype=pl.Float64, eager=True)
+
+
+def _escolher(
+    mascara: pl.Series, valor: pl.Series | float, atual: pl.Series
+) -> pl.Series:
+    """Retorna ``valor`` onde ``mascara`` é verdadeira e ``atual`` no resto."""
+    if not isinstance(valor, pl.Series):
+        valor = _repetir(valor, len(atual))
+    return valor.zip_with(mascara, atual)
+
+
+def _encontrar_intervalos_raiz(
+    func: Callable[[pl.Series], pl.Series], n: int
+) -> tuple[pl.Series, pl.Series, pl.Series]:
+    """Versão vetorizada de ``_encontrar_intervalo_raiz``.
+
+    As taxas testadas são as mesmas para todas as linhas; cada linha guarda o
+    primeiro intervalo com troca de sinal. Retorna início, fim e a função no
+    início de cada intervalo (NaN onde não há intervalo).
+    """
+    f0 = func(_repetir(TAXA_INICIAL, n))
+    pendente = f0 != 0
+    inicio = _escolher(~pendente, TAXA_INICIAL, _repetir(float("nan"), n))
+    fim = inicio
+    f_inicio = _escolher(~pendente, f0, _repetir(float("nan"), n))
+
+    for direcao in (1, -1):
+        a, fa = TAXA_INICIAL, f0
+        b = TAXA_INICIAL + direcao * PASSO_INICIAL
+        passo_atual = PASSO_INICIAL
+        for _ in range(MAX_TENTATIVAS):
+            if not pendente.any() or not TAXA_MIN <= b <= TAXA_MAX:
+                break
+            fb = func(_repetir(b, n))
+            achou = pendente & (fa * fb < 0)
+            # Subindo, o intervalo é (a, b); descendo, é (b, a)
+            menor, maior, f_menor = (a, b, fa) if direcao == 1 else (b, a, fb)
+            inicio = _escolher(achou, menor, inicio)
+            fim = _escolher(achou, maior, fim)
+            f_inicio = _escolher(achou, f_menor, f_inicio)
+            pendente &= ~achou
+            a, fa = b, fb
+            passo_atual *= FATOR_CRESCIMENTO
+            b += direcao * passo_atual
+
+    if (pendente & f0.is_not_nan()).any():
+        logger.warning("Não foi possível encontrar intervalo de busca válido")
+    return inicio, fim, f_inicio
+
+
+def _metodo_bissecao_vetorizado(
+    func: Callable[[pl.Series], pl.Series],
+    inicio: pl.Series,
+    fim: pl.Series,
+    f_inicio: pl.Series,
+) -> pl.Series:
+    """Versão vetorizada de ``_metodo_bissecao``, linha a linha."""
+    ativo = inicio.is_not_nan()
+    raizes = _repetir(float("nan"), len(inicio))
+    for _ in range(MAX_ITERACOES):
+        if not ativo.any():
+            break
+        ponto_medio = (inicio + fim) / 2
+        fmeio = func(ponto_medio)
+        convergiu = ativo & (
+            (fmeio.abs() < TOLERANCIA) | ((fim - inicio) / 2 < TOLERANCIA)
+        )
+        raizes = _escolher(convergiu, ponto_medio, raizes)
+        ativo &= ~convergiu
+        troca_fim = ativo & (fmeio * f_inicio < 0)
+        troca_inicio = ativo & ~troca_fim
+        fim = _escolher(troca_fim, ponto_medio, fim)
+        inicio = _escolher(troca_inicio, ponto_medio, inicio)
+        f_inicio = _escolher(troca_inicio, fmeio, f_inicio)
+
+    return _escolher(ativo, (inicio + fim) / 2, raizes)
+
+
+def encontrar_raizes(
+    func_diferenca_preco: Callable[[pl.Series], pl.Series],
+    n: int,
+) -> pl.Series:
+    """Versão vetorizada de ``encontrar_raiz`` para ``n`` problemas independentes.
+
+    ``func_diferenca_preco`` recebe uma série com uma taxa por problema e
+    devolve a série de diferenças de preço. A busca de intervalo e a bisseção
+    repetem, linha a linha, os mesmos passos da versão escalar, de modo que
+    cada raiz é idêntica à obtida por ``encontrar_raiz``.
+
+    Returns:
+        pl.Series: Raízes encontradas (NaN onde não há intervalo válido).
+    """
+
+    def func(taxas: pl.Series) -> pl.Series:
+        return func_diferenca_preco(taxas).fill_null(float("nan"))
+
+    inicio, fim, f_inicio = _encontrar_intervalos_raiz(func, n)
+    return _metodo_bissecao_vetorizado(func, inicio, fim, f_inicio)
+
+
+def multiplicar_truncado(vna: pl.Series, cotacao: pl.Series) -> pl.Series:
+    """Calcula ``trunc6(trunc6(vna) * trunc6(cotacao))`` elemento a elemento.
+
+    Versão colunar do PU de NTN-B/NTN-C: os fatores truncados são convertidos em
+    inteiros na escala 10^6, de modo que o produto e o truncamento são exatos,
+    como na aritmética ``Decimal`` da versão escalar.
+    """
+    escala = 10**6
+
+    def escalar(serie: pl.Series) -> pl.Expr:
+        return (
+            (truncar_expr(pl.lit(serie, dtype=pl.Float64), 6) * escala)
+            .round()
+            .cast(pl.Int64, strict=False)
+        )
+
+    produto = escalar(vna) * escalar(cotacao)
+    truncado = produto.abs() // escala * produto.sign()
+    return pl.select(pl.format("{}e-6", truncado).cast(pl.Float64)).to_series()
+
+
+def calcular_taxas_vna(
+    linhas: pl.DataFrame,
+    valor_cupom: pl.Expr | float,
+    valor_final: pl.Expr | float,
+) -> pl.Series:
+    """Resolve a TIR de NTN-B/NTN-C para todas as linhas de uma vez.
+
+    Inverte ``pu(vna, cotacao(...))`` com ``encontrar_raizes`` sobre fluxos
+    colunares. ``linhas`` deve conter ``data_liquidacao``, ``data_vencimento``,
+    ``vna`` e ``pu``. O resultado é truncado em 8 casas, como em ``taxa``.
+    """
+    df = preparar_linhas(linhas, "vna", "pu").with_columns(
+        pl.when(pl.col("pu") > 0).then("pu").alias("pu")
+    )
+    fluxos = gerar_fluxos_colunares(df, valor_cupom, valor_final)
+
+    def diferenca_preco(taxas: pl.Series) -> pl.Series:
+        somas = somar_vp_fluxos(fluxos, taxas, casas_vp=12)
+        cotacoes = pl.select(truncar_expr(pl.lit(somas), 6)).to_series()
+        return multiplicar_truncado(df["vna"], cotacoes) - df["pu"]
+
+    taxas = encontrar_raizes(diferenca_preco, df.height)
+    return pl.select(truncar_expr(pl.lit(taxas), 8)).to_series()
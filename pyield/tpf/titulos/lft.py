@@ -3,12 +3,13 @@ from decimal import Decimal
 import polars as pl
 
 from pyield import du
-from pyield._internal.numbers import truncar_decimal
+from pyield._internal.numbers import truncar_decimal, truncar_expr
 from pyield._internal.types import DateLike, any_is_empty
 from pyield.bc import lft as _bc_lft
 from pyield.tpf.titulos import _utils as utils
 
 vna = _bc_lft.vna
+vna_serie = _bc_lft.vna_serie
 
 
 def dados(data: DateLike) -> pl.DataFrame:
@@ -165,6 +166,74 @@ def cotacao(
     return truncar_decimal(fator_desconto, 6)
 
 
+def cotacao_expr(
+    data_liquidacao: pl.Expr | str,
+    data_vencimento: pl.Expr | str,
+    taxa: pl.Expr | str,
+) -> pl.Expr:
+    """Cria expressão Polars para a cotação da LFT pela metodologia da STN.
+
+    Versão colunar de ``cotacao``: a taxa é truncada em oito casas, os anos
+    úteis em 14 e a cotação em seis. Cada resultado é igual ao ``Decimal``
+    retornado por ``cotacao`` convertido para float.
+
+    Args:
+        data_liquidacao: Nome de coluna ou expressão Polars com a data de
+            liquidação.
+        data_vencimento: Nome de coluna ou expressão Polars com a data de
+            vencimento.
+        taxa: Nome de coluna ou expressão Polars com a taxa em formato decimal.
+
+    Returns:
+        pl.Expr: Expressão sem alias com a cotação em base 1. Linhas com prazo
+        não positivo resultam em NaN.
+
+    Examples:
+        >>> from pyield import lft
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "liquidacao": ["24-07-2024", "21-05-2008"],
+        ...         "vencimento": ["01-09-2030", "07-03-2014"],
+        ...         "taxa": [0.001717, -0.000200009],
+        ...     }
+        ... )
+        >>> cotacoes = df.select(
+        ...     cotacao=lft.cotacao_expr("liquidacao", "vencimento", "taxa")
+        ... )
+        >>> cotacoes["cotacao"].to_list()
+        [0.989645, 1.001158]
+    """
+    return pl.struct(
+        utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
+        utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
+        utils.coluna_ou_expr(taxa, "taxa"),
+    ).map_batches(_calcular_cotacoes, return_dtype=pl.Float64, is_elementwise=True)
+
+
+def _calcular_cotacoes(linhas: pl.Series) -> pl.Series:
+    df = _preparar_linhas(linhas, "taxa")
+    return df.select(_cotacao_expr(pl.col("taxa"))).to_series()
+
+
+def _preparar_linhas(linhas: pl.Series, *colunas: str) -> pl.DataFrame:
+    """Converte as linhas e adiciona os anos úteis truncados conforme a STN."""
+    df = utils.preparar_linhas(linhas.struct.unnest(), *colunas)
+    return df.with_columns(
+        dias_uteis=du.contar_expr("data_liquidacao", "data_vencimento")
+    ).with_columns(anos_truncados=truncar_expr(pl.col("dias_uteis") / 252, 14))
+
+
+def _cotacao_expr(taxa: pl.Expr) -> pl.Expr:
+    """Cotação truncada em seis casas (NaN sem prazo)."""
+    taxa = utils.normalizar_taxa_precificacao_expr(taxa)
+    fator_desconto = 1 / (1 + taxa) ** pl.col("anos_truncados")
+    return (
+        pl.when(pl.col("dias_uteis") > 0)
+        .then(truncar_expr(fator_desconto, 6))
+        .otherwise(float("nan"))
+    )
+
+
 def taxa(
     data_liquidacao: DateLike,
     data_vencimento: DateLike,
@@ -217,6 +286,67 @@ def taxa(
     return utils.truncar(taxa_encontrada, 8)
 
 
+def taxa_expr(
+    data_liquidacao: pl.Expr | str,
+    data_vencimento: pl.Expr | str,
+    vna: pl.Expr | str,
+    pu: pl.Expr | str,
+) -> pl.Expr:
+    """Cria expressão Polars para a taxa implícita da LFT a partir do PU.
+
+    Todas as linhas são resolvidas de uma vez: a busca de intervalo e a
+    bisseção de ``taxa`` avançam simultaneamente para todas as linhas. Cada
+    resultado é idêntico ao de ``taxa`` com os mesmos argumentos.
+
+    Args:
+        data_liquidacao: Nome de coluna ou expressão Polars com a data de
+            liquidação.
+        data_vencimento: Nome de coluna ou expressão Polars com a data de
+            vencimento.
+        vna: Nome de coluna ou expressão Polars com o VNA.
+        pu: Nome de coluna ou expressão Polars com o PU do título.
+
+    Returns:
+        pl.Expr: Expressão sem alias com a taxa implícita truncada em oito
+        casas decimais. Linhas inválidas resultam em NaN.
+
+    Examples:
+        >>> from pyield import lft
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "liquidacao": ["24-07-2024", "21-05-2008"],
+        ...         "vencimento": ["01-09-2030", "07-03-2014"],
+        ...         "vna": [15785.324502, 3451.215345],
+        ...         "pu": [15621.867466, 3426.649594],
+        ...     }
+        ... )
+        >>> taxas = df.select(
+        ...     taxa=lft.taxa_expr("liquidacao", "vencimento", "vna", "pu")
+        ... )
+        >>> taxas["taxa"].to_list()
+        [0.00171691, 0.00123443]
+    """
+    return pl.struct(
+        utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
+        utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
+        utils.coluna_ou_expr(vna, "vna"),
+        utils.coluna_ou_expr(pu, "pu"),
+    ).map_batches(_calcular_taxas, return_dtype=pl.Float64, is_elementwise=True)
+
+
+def _calcular_taxas(linhas: pl.Series) -> pl.Series:
+    df = _preparar_linhas(linhas, "vna", "pu").with_columns(
+        pl.when((pl.col("pu") > 0) & (pl.col("dias_uteis") > 0)).then("pu").alias("pu")
+    )
+
+    def diferenca_preco(taxas: pl.Series) -> pl.Series:
+        cotacoes = df.select(_cotacao_expr(pl.lit(taxas))).to_series()
+        return utils.multiplicar_truncado(df["vna"], cotacoes) - df["pu"]
+
+    taxas = utils.encontrar_raizes(diferenca_preco, df.height)
+    return pl.select(truncar_expr(pl.lit(taxas), 8)).to_series()
+
+
 def rentabilidade(taxa_lft: float, taxa_di: float) -> float:
     """
     Calcula a rentabilidade da LFT sobre a taxa de DI Futuro.
@@ -3,7 +3,7 @@ from decimal import Decimal
 import polars as pl
 
 from pyield import du, fwd
-from pyield._internal.numbers import truncar_decimal
+from pyield._internal.numbers import truncar_decimal, truncar_expr
 from pyield._internal.types import DateLike, any_is_empty
 from pyield.tpf.titulos import _utils as utils
 
@@ -161,6 +161,76 @@ def pu(
     return truncar_decimal(VALOR_FACE / fator_desconto, 6)
 
 
+def pu_expr(
+    data_liquidacao: pl.Expr | str,
+    data_vencimento: pl.Expr | str,
+    taxa: pl.Expr | str,
+) -> pl.Expr:
+    """Cria expressão Polars para o PU da LTN pela metodologia da STN.
+
+    Versão colunar de ``pu``: a taxa é truncada em oito casas, os anos úteis
+    em 14 e o PU em seis, como no cálculo escalar. Cada resultado é igual ao
+    ``Decimal`` retornado por ``pu`` convertido para float.
+
+    Args:
+        data_liquidacao: Nome de coluna ou expressão Polars com a data de
+            liquidação.
+        data_vencimento: Nome de coluna ou expressão Polars com a data de
+            vencimento.
+        taxa: Nome de coluna ou expressão Polars com a taxa em formato decimal.
+
+    Returns:
+        pl.Expr: Expressão sem alias com o PU. Linhas com prazo não positivo
+        resultam em NaN.
+
+    Examples:
+        >>> from pyield import ltn
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "liquidacao": ["05-07-2024", "21-05-2008"],
+        ...         "vencimento": ["01-01-2030", "01-07-2010"],
+        ...         "taxa": [0.12145, 0.143600009],
+        ...     }
+        ... )
+        >>> precos = df.select(pu=ltn.pu_expr("liquidacao", "vencimento", "taxa"))
+        >>> precos["pu"].to_list()
+        [535.279902, 753.315323]
+    """
+    return pl.struct(
+        utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
+        utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
+        utils.coluna_ou_expr(taxa, "taxa"),
+    ).map_batches(_calcular_pus, return_dtype=pl.Float64, is_elementwise=True)
+
+
+def _calcular_pus(linhas: pl.Series) -> pl.Series:
+    df = _preparar_linhas(linhas, "taxa")
+    return df.select(_pu_expr(pl.col("taxa"))).to_series()
+
+
+def _preparar_linhas(linhas: pl.Series, *colunas: str) -> pl.DataFrame:
+    """Normaliza as linhas e adiciona os anos úteis truncados conforme a STN.
+
+    A taxa, se houver, é truncada em oito casas e os anos úteis em 14.
+    """
+    df = utils.preparar_linhas(linhas.struct.unnest(), *colunas)
+    if "taxa" in colunas:
+        df = df.with_columns(utils.normalizar_taxa_precificacao_expr("taxa"))
+    return df.with_columns(
+        dias_uteis=du.contar_expr("data_liquidacao", "data_vencimento")
+    ).with_columns(anos_truncados=truncar_expr(pl.col("dias_uteis") / 252, 14))
+
+
+def _pu_expr(taxa: pl.Expr) -> pl.Expr:
+    """PU truncado em seis casas para uma taxa já normalizada (NaN sem prazo)."""
+    pu = VALOR_FACE / (1 + taxa) ** pl.col("anos_truncados")
+    return (
+        pl.when(pl.col("dias_uteis") > 0)
+        .then(truncar_expr(pu, 6))
+        .otherwise(float("nan"))
+    )
+
+
 def taxa(
     data_liquidacao: DateLike,
     data_vencimento: DateLike,
@@ -206,6 +276,57 @@ def taxa(
     return utils.truncar(taxa_calculada, 8)
 
 
+def taxa_expr(
+    data_liquidacao: pl.Expr | str,
+    data_vencimento: pl.Expr | str,
+    pu: pl.Expr | str,
+) -> pl.Expr:
+    """Cria expressão Polars para a taxa implícita da LTN a partir do PU.
+
+    Versão colunar de ``taxa``, que inverte algebricamente o PU. Cada
+    resultado é idêntico ao de ``taxa`` com os mesmos argumentos.
+
+    Args:
+        data_liquidacao: Nome de coluna ou expressão Polars com a data de
+            liquidação.
+        data_vencimento: Nome de coluna ou expressão Polars com a data de
+            vencimento.
+        pu: Nome de coluna ou expressão Polars com o PU do título.
+
+    Returns:
+        pl.Expr: Expressão sem alias com a taxa truncada em oito casas
+        decimais. Linhas com PU ou prazo não positivos resultam em NaN.
+
+    Examples:
+        >>> from pyield import ltn
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "liquidacao": ["05-07-2024", "21-05-2008"],
+        ...         "vencimento": ["01-01-2030", "01-07-2010"],
+        ...         "pu": [535.279902, 753.3],
+        ...     }
+        ... )
+        >>> taxas = df.select(taxa=ltn.taxa_expr("liquidacao", "vencimento", "pu"))
+        >>> taxas["taxa"].to_list()
+        [0.12145, 0.14361101]
+    """
+    return pl.struct(
+        utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
+        utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
+        utils.coluna_ou_expr(pu, "pu"),
+    ).map_batches(_calcular_taxas, return_dtype=pl.Float64, is_elementwise=True)
+
+
+def _calcular_taxas(linhas: pl.Series) -> pl.Series:
+    df = _preparar_linhas(linhas, "pu")
+    taxa_calculada = (VALOR_FACE / pl.col("pu")) ** (1 / pl.col("anos_truncados")) - 1
+    return df.select(
+        pl.when((pl.col("pu") > 0) & (pl.col("dias_uteis") > 0))
+        .then(truncar_expr(taxa_calculada, 8))
+        .otherwise(float("nan"))
+    ).to_series()
+
+
 def rentabilidade(taxa_ltn: float, taxa_di: float) -> float:
     """
     Calcula a rentabilidade da LTN sobre a taxa de DI Futuro.
@@ -328,8 +449,9 @@ def dv01_expr(
 ) -> pl.Expr:
     """Cria expressão Polars para o DV01 da LTN.
 
-    O cálculo é aplicado linha a linha e reprifica o PU informado para um
-    aumento de 1 bp na taxa.
+    Reprecifica a LTN na taxa informada e na taxa acrescida de 1 bp, com os
+    mesmos truncamentos de ``pu``, e aplica a variação relativa ao PU
+    informado. Cada resultado é idêntico ao de ``dv01``.
 
     Args:
         data_liquidacao: Nome de coluna ou expressão Polars com a data de
@@ -347,15 +469,17 @@ def dv01_expr(
         utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
         utils.coluna_ou_expr(taxa, "taxa"),
         utils.coluna_ou_expr(pu, "pu"),
-    ).map_elements(
-        lambda s: dv01(
-            s["data_liquidacao"],
-            s["data_vencimento"],
-            s["taxa"],
-            s["pu"],
-        ),
-        return_dtype=pl.Float64,
+    ).map_batches(_calcular_dv01s, return_dtype=pl.Float64, is_elementwise=True)
+
+
+def _calcular_dv01s(linhas: pl.Series) -> pl.Series:
+    df = _preparar_linhas(linhas, "taxa", "pu").with_columns(
+        preco_1=_pu_expr(pl.col("taxa")),
+        preco_2=_pu_expr((pl.col("taxa") + 0.0001).round(8)),
     )
+    return df.select(
+        pl.col("pu") * (1 - pl.col("preco_2") / pl.col("preco_1"))
+    ).to_series()
 
 
 def taxas_forward(data: DateLike) -> pl.DataFrame:
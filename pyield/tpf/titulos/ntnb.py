@@ -22,6 +22,15 @@ MESES_CUPOM = {2, 5, 8, 11}
 VALOR_CUPOM = 0.02956301
 VALOR_FINAL = 1.02956301
 
+_SCHEMA_IMPLICITAS = {
+    "data_vencimento": pl.Date,
+    "dias_uteis": pl.Int64,
+    "taxa_tir_real": pl.Float64,
+    "taxa_zero_real": pl.Float64,
+    "taxa_nominal": pl.Float64,
+    "inflacao_implicita": pl.Float64,
+}
+
 logger = logging.getLogger(__name__)
 
 
@@ -325,6 +334,60 @@ def cotacao(
     return truncar_decimal(vp.sum(), 6)
 
 
+def cotacao_expr(
+    data_liquidacao: pl.Expr | str,
+    data_vencimento: pl.Expr | str,
+    taxa: pl.Expr | str,
+) -> pl.Expr:
+    """Cria expressão Polars para a cotação da NTN-B pela metodologia da STN.
+
+    Os fluxos de caixa de todas as linhas são gerados em formato colunar e
+    descontados numa única agregação, com os mesmos arredondamentos de
+    ``cotacao``. Cada resultado é igual ao ``Decimal`` retornado por
+    ``cotacao`` convertido para float.
+
+    Args:
+        data_liquidacao: Nome de coluna ou expressão Polars com a data de
+            liquidação.
+        data_vencimento: Nome de coluna ou expressão Polars com a data de
+            vencimento.
+        taxa: Nome de coluna ou expressão Polars com a taxa em formato decimal.
+
+    Returns:
+        pl.Expr: Expressão sem alias com a cotação em base 1. Linhas sem
+        fluxos resultam em NaN.
+
+    Examples:
+        >>> from pyield import ntnb
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "liquidacao": ["31-05-2024", "15-08-2024"],
+        ...         "vencimento": ["15-05-2035", "15-08-2032"],
+        ...         "taxa": [0.061490, 0.05929],
+        ...     }
+        ... )
+        >>> cotacoes = df.select(
+        ...     cotacao=ntnb.cotacao_expr("liquidacao", "vencimento", "taxa")
+        ... )
+        >>> cotacoes["cotacao"].to_list()
+        [0.993651, 1.006409]
+    """
+    return pl.struct(
+        utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
+        utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
+        utils.coluna_ou_expr(taxa, "taxa"),
+    ).map_batches(_calcular_cotacoes, return_dtype=pl.Float64, is_elementwise=True)
+
+
+def _calcular_cotacoes(linhas: pl.Series) -> pl.Series:
+    return utils.calcular_precos(
+        linhas.struct.unnest(),
+        VALOR_CUPOM,
+        VALOR_FINAL,
+        casas_vp=12,
+    )
+
+
 def _calcular_pu(
     vna: float | Decimal,
     cotacao: float | Decimal,
@@ -428,39 +491,25 @@ def _criar_df_bootstrap(
         .with_columns(
             anos_uteis=pl.col("dias_uteis") / 252,
             taxa_tir=interpolador_ff.interpolar_expr("dias_uteis"),
-            cupom=pl.lit(VALOR_CUPOM),
-            taxa_zero=pl.lit(None, dtype=pl.Float64),
         )
         .sort("data_vencimento")
     )
 
 
-def _atualizar_taxa_zero(
-    df: pl.DataFrame, vencimento: dt.date, taxa_zero: float
-) -> pl.DataFrame:
-    """Atualiza a taxa zero dentro do loop de bootstrap."""
-    return df.with_columns(
-        pl.when(pl.col("data_vencimento") == vencimento)
-        .then(taxa_zero)
-        .otherwise("taxa_zero")
-        .alias("taxa_zero")
-    )
-
-
-def _calcular_valor_presente_cupons(
-    df: pl.DataFrame,
-    data_liquidacao: dt.date,
-    vencimento: dt.date,
-) -> float:
-    """Calcula o valor presente dos cupons anteriores à maturidade."""
-    datas_fluxo_anteriores = datas_pagamento(data_liquidacao, vencimento).to_list()[:-1]
-    df_temp = df.filter(pl.col("data_vencimento").is_in(datas_fluxo_anteriores))
-
-    return utils.calcular_pv(
-        fluxos_caixa=df_temp["cupom"],
-        taxas=df_temp["taxa_zero"],
-        prazos=df_temp["anos_uteis"],
+def _cotacoes_bootstrap(
+    data_liquidacao: dt.date, df: pl.DataFrame
+) -> list[float | None]:
+    """Cotações das NTN-B sintéticas vencendo nos vértices da grade."""
+    if df.is_empty():
+        return []
+    linhas = df.select(
+        pl.lit(data_liquidacao).alias("data_liquidacao"),
+        "data_vencimento",
+        taxa="taxa_tir",
     )
+    return utils.calcular_precos(
+        linhas, VALOR_CUPOM, VALOR_FINAL, casas_vp=12
+    ).to_list()
 
 
 def taxas_zero(
@@ -578,27 +627,28 @@ def taxas_zero(
 
     df = _criar_df_bootstrap(data_liquidacao, taxas, vencimentos)
 
-    # Bootstrap para calcular taxas zero
-    linhas = df.to_dicts()
+    # Bootstrap para calcular taxas zero. Taxas zero <= primeiro vencimento
+    # são TIR por definição; as demais vêm da cotação descontada dos cupons
+    # anteriores, que na grade trimestral ficam a cada duas posições.
     primeiro_vencimento = vencimentos.min()
-    for linha in linhas:
-        vencimento = linha["data_vencimento"]
-
-        # Taxas zero <= primeiro vencimento são TIR por definição
-        if vencimento <= primeiro_vencimento:
-            taxa_zero = linha["taxa_tir"]
-            df = _atualizar_taxa_zero(df, vencimento, taxa_zero)
-            continue
-
-        # Calcula taxa zero para o vencimento corrente
-        valor_presente_cupons = _calcular_valor_presente_cupons(
-            df, data_liquidacao, vencimento
-        )
-        preco_titulo = float(cotacao(data_liquidacao, vencimento, linha["taxa_tir"]))
-        fator_preco = VALOR_FINAL / (preco_titulo - valor_presente_cupons)
-        taxa_zero = fator_preco ** (1 / linha["anos_uteis"]) - 1
-
-        df = _atualizar_taxa_zero(df, vencimento, taxa_zero)
+    assert isinstance(primeiro_vencimento, dt.date)
+    diretas = df["data_vencimento"] <= primeiro_vencimento
+    taxas_diretas = [
+        taxa if direta else None
+        for taxa, direta in zip(df["taxa_tir"], diretas, strict=True)
+    ]
+    cotacoes = [None] * diretas.sum() + _cotacoes_bootstrap(
+        data_liquidacao, df.filter(~diretas)
+    )
+    taxas_zero_resolvidas = utils.bootstrap_taxas_zero(
+        anos_uteis=df["anos_uteis"].to_list(),
+        precos=cotacoes,
+        taxas_diretas=taxas_diretas,
+        valor_cupom=VALOR_CUPOM,
+        valor_final=VALOR_FINAL,
+        passo_cupom=2,
+    )
+    df = df.with_columns(taxa_zero=pl.Series(taxas_zero_resolvidas, dtype=pl.Float64))
 
     if not incluir_cupons:
         df = df.filter(pl.col("data_vencimento").is_in(vencimentos.to_list()))
@@ -728,6 +778,193 @@ def implicitas(  # noqa: PLR0913
     return df
 
 
+def implicitas_lote(
+    df_tir: pl.DataFrame,
+    df_nominal: pl.DataFrame,
+    *,
+    extrapolar: bool = False,
+    processos: int = 1,
+) -> pl.DataFrame:
+    """Calcula a inflação implícita da NTN-B para várias datas de uma vez.
+
+    Versão em lote de :func:`implicitas` para painéis históricos. Recebe as
+    TIRs das NTN-B e a curva nominal em formato longo, com uma linha por data
+    de referência e vencimento, e usa cada data de referência como data de
+    liquidação. A grade, as cotações e a interpolação das TIRs são calculadas
+    para todas as datas de uma só vez; o bootstrap das taxas zero reais segue
+    o mesmo núcleo de :func:`taxas_zero`. A curva nominal é interpolada pelo
+    caminho multi-curva de ``pyield.interpolar``.
+
+    Args:
+        df_tir: Vértices de NTN-B com as colunas ``data_referencia``,
+            ``data_vencimento`` e ``taxa`` (TIR real).
+        df_nominal: Vértices da curva nominal com as colunas
+            ``data_referencia``, ``data_vencimento`` e ``taxa``. Pode ser DI
+            Futuro, curva PRE ou outra curva nominal.
+        extrapolar: Se `True`, extrapola a curva nominal de cada data fora dos
+            vencimentos informados. Se `False` (padrão), as colunas dependentes
+            da curva nominal ficam nulas fora do intervalo.
+        processos: Número de processos usados no bootstrap. Com mais de um,
+            as datas são divididas em lotes contíguos processados em paralelo.
+            Padrão: 1 (no processo atual).
+
+    Returns:
+        pl.DataFrame: Colunas de :func:`implicitas` precedidas de
+        ``data_referencia``, ordenadas por data de referência e vencimento.
+        Datas sem curva nominal têm as colunas nominais nulas. Vencimentos
+        menores ou iguais à data de referência são ignorados.
+
+    Output Columns:
+        - data_referencia (Date): Data de referência (liquidação).
+        - data_vencimento (Date): Data de vencimento.
+        - dias_uteis (Int64): Dias úteis entre liquidação e vencimento.
+        - taxa_tir_real (Float64): TIR real da NTN-B recebida na entrada.
+        - taxa_zero_real (Float64): Taxa real zero via bootstrap.
+        - taxa_nominal (Float64): Taxa nominal interpolada.
+        - inflacao_implicita (Float64): Inflação implícita (breakeven).
+
+    Examples:
+        >>> df_tir = yd.tpf.taxas_historicas(
+        ...     inicio="15-06-2026", fim="19-06-2026", titulo="NTN-B"
+        ... ).select("data_referencia", "data_vencimento", taxa="taxa_indicativa")
+        >>> df_pre = yd.tpf.curva_pre_historica("15-06-2026", "19-06-2026").select(
+        ...     "data_referencia", "data_vencimento", taxa="taxa_zero"
+        ... )
+        >>> df = yd.ntnb.implicitas_lote(df_tir, df_pre)
+        >>> df["data_referencia"].n_unique()
+        5
+    """
+    df_tir = _preparar_vertices_lote(df_tir)
+    df_nominal = _preparar_vertices_lote(df_nominal)
+    if df_tir.is_empty():
+        return pl.DataFrame(schema={"data_referencia": pl.Date, **_SCHEMA_IMPLICITAS})
+
+    df = (
+        utils.processar_por_data(_taxas_zero_lote, df_tir, processos)
+        .join(df_tir, on=["data_referencia", "data_vencimento", "dias_uteis"])
+        .rename({"taxa": "taxa_tir_real", "taxa_zero": "taxa_zero_real"})
+        .sort("data_referencia", "data_vencimento")
+    )
+    df = df.with_columns(
+        taxa_nominal=interpolador.interpolar(
+            dus_alvo=df["dias_uteis"],
+            dus_curva=df_nominal["dias_uteis"],
+            taxas_curva=df_nominal["taxa"],
+            datas_alvo=df["data_referencia"],
+            datas_curva=df_nominal["data_referencia"],
+            extrapolar=extrapolar,
+        )
+    )
+    return df.select(
+        "data_referencia",
+        "data_vencimento",
+        "dias_uteis",
+        "taxa_tir_real",
+        "taxa_zero_real",
+        "taxa_nominal",
+        inflacao_implicita=(pl.col("taxa_nominal") + 1) / (pl.col("taxa_zero_real") + 1)
+        - 1,
+    )
+
+
+def _preparar_vertices_lote(df: pl.DataFrame) -> pl.DataFrame:
+    """Normaliza os tipos e descarta vértices sem prazo de um painel longo."""
+    return (
+        df.select(
+            conversores.converter_datas_expr("data_referencia"),
+            conversores.converter_datas_expr("data_vencimento"),
+            pl.col("taxa").cast(pl.Float64),
+        )
+        .drop_nulls()
+        .filter(pl.col("data_vencimento") > pl.col("data_referencia"))
+        .with_columns(dias_uteis=du.contar_expr("data_referencia", "data_vencimento"))
+    )
+
+
+def _taxas_zero_lote(df_tir: pl.DataFrame) -> pl.DataFrame:
+    """Taxas zero reais de todas as datas de ``df_tir`` (versão de taxas_zero)."""
+    limites = (
+        df_tir.group_by("data_referencia")
+        .agg(
+            primeiro_vencimento=pl.col("data_vencimento").min(),
+            ultimo_vencimento=pl.col("data_vencimento").max(),
+        )
+        .sort("data_referencia")
+        .with_row_index("id_linha")
+    )
+    # Grade trimestral até o último vencimento de cada data
+    grade = (
+        utils.gerar_fluxos_colunares(
+            limites.select(
+                data_liquidacao="data_referencia",
+                data_vencimento="ultimo_vencimento",
+            ),
+            VALOR_CUPOM,
+            VALOR_FINAL,
+            intervalo_meses=3,
+        )
+        .join(limites, on="id_linha")
+        .select(
+            "id_linha",
+            "data_referencia",
+            data_vencimento="data_pagamento",
+            dias_uteis="dias_uteis",
+            anos_uteis=pl.col("dias_uteis") / 252,
+            direta=pl.col("data_pagamento") <= pl.col("primeiro_vencimento"),
+        )
+    )
+    grade = grade.with_columns(
+        taxa_tir=interpolador.interpolar(
+            dus_alvo=grade["dias_uteis"],
+            dus_curva=df_tir["dias_uteis"],
+            taxas_curva=df_tir["taxa"],
+            datas_alvo=grade["data_referencia"],
+            datas_curva=df_tir["data_referencia"],
+        )
+    )
+    linhas = grade.filter(~pl.col("direta"))
+    cotacoes = utils.calcular_precos(
+        linhas.select(
+            data_liquidacao="data_referencia",
+            data_vencimento="data_vencimento",
+            taxa="taxa_tir",
+        ),
+        VALOR_CUPOM,
+        VALOR_FINAL,
+        casas_vp=12,
+    )
+    grade = grade.join(
+        linhas.select("id_linha", "data_vencimento").with_columns(cotacao=cotacoes),
+        on=["id_linha", "data_vencimento"],
+        how="left",
+    ).with_columns(
+        taxa_direta=pl.when(pl.col("direta")).then("taxa_tir"),
+    )
+
+    # O bootstrap é sequencial dentro de cada data, mas os dados de todas as
+    # datas já estão prontos: o laço só percorre listas
+    taxas_zero: list[float | None] = []
+    for data in grade.partition_by("id_linha", maintain_order=True):
+        taxas_zero += utils.bootstrap_taxas_zero(
+            anos_uteis=data["anos_uteis"].to_list(),
+            precos=data["cotacao"].to_list(),
+            taxas_diretas=data["taxa_direta"].to_list(),
+            valor_cupom=VALOR_CUPOM,
+            valor_final=VALOR_FINAL,
+            passo_cupom=2,
+        )
+
+    return (
+        grade.with_columns(taxa_zero=pl.Series(taxas_zero, dtype=pl.Float64))
+        .join(
+            df_tir.select("data_referencia", "data_vencimento"),
+            on=["data_referencia", "data_vencimento"],
+            how="semi",
+        )
+        .select("data_referencia", "data_vencimento", "dias_uteis", "taxa_zero")
+    )
+
+
 def duration(
     data_liquidacao: DateLike,
     data_vencimento: DateLike,
@@ -781,8 +1018,9 @@ def duration_expr(
 ) -> pl.Expr:
     """Cria expressão Polars para a duration da NTN-B.
 
-    O cálculo é aplicado linha a linha porque a duration depende dos fluxos de
-    caixa do título.
+    Os fluxos de caixa de todas as linhas são gerados em formato colunar e o
+    valor presente e o prazo ponderado são somados numa única agregação. Cada
+    resultado é idêntico ao de ``duration``.
 
     Args:
         data_liquidacao: Nome de coluna ou expressão Polars com a data de
@@ -798,13 +1036,19 @@ def duration_expr(
         utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
         utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
         utils.coluna_ou_expr(taxa, "taxa"),
-    ).map_elements(
-        lambda s: duration(
-            s["data_liquidacao"],
-            s["data_vencimento"],
-            s["taxa"],
-        ),
+    ).map_batches(
+        _calcular_durations,
         return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def _calcular_durations(linhas: pl.Series) -> pl.Series:
+    return utils.calcular_durations(
+        linhas.struct.unnest(),
+        VALOR_CUPOM,
+        VALOR_FINAL,
+        casas=14,
     )
 
 
@@ -854,8 +1098,9 @@ def dv01_expr(
 ) -> pl.Expr:
     """Cria expressão Polars para o DV01 da NTN-B.
 
-    O cálculo é aplicado linha a linha e reprifica o PU informado para um
-    aumento de 1 bp na taxa.
+    Os fluxos de caixa de todas as linhas são gerados em formato colunar e
+    reprecificados na taxa informada e na taxa acrescida de 1 bp. Cada
+    resultado é idêntico ao de ``dv01``.
 
     Args:
         data_liquidacao: Nome de coluna ou expressão Polars com a data de
@@ -873,14 +1118,19 @@ def dv01_expr(
         utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
         utils.coluna_ou_expr(taxa, "taxa"),
         utils.coluna_ou_expr(pu, "pu"),
-    ).map_elements(
-        lambda s: dv01(
-            s["data_liquidacao"],
-            s["data_vencimento"],
-            s["taxa"],
-            s["pu"],
-        ),
+    ).map_batches(
+        _calcular_dv01s,
         return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def _calcular_dv01s(linhas: pl.Series) -> pl.Series:
+    return utils.calcular_dv01s(
+        linhas.struct.unnest(),
+        VALOR_CUPOM,
+        VALOR_FINAL,
+        casas_vp=12,
     )
 
 
@@ -932,6 +1182,68 @@ def taxa(
     return utils.truncar(taxa_encontrada, 8)
 
 
+def taxa_expr(
+    data_liquidacao: pl.Expr | str,
+    data_vencimento: pl.Expr | str,
+    vna: pl.Expr | str,
+    pu: pl.Expr | str,
+) -> pl.Expr:
+    """Cria expressão Polars para a taxa implícita (TIR) da NTN-B.
+
+    Todas as linhas são resolvidas de uma vez: os fluxos de caixa são gerados
+    em formato colunar e a busca de intervalo e a bisseção de ``taxa`` avançam
+    simultaneamente para todas as linhas. Cada resultado é idêntico ao de
+    ``taxa`` com os mesmos argumentos.
+
+    Args:
+        data_liquidacao: Nome de coluna ou expressão Polars com a data de
+            liquidação.
+        data_vencimento: Nome de coluna ou expressão Polars com a data de
+            vencimento.
+        vna: Nome de coluna ou expressão Polars com o VNA.
+        pu: Nome de coluna ou expressão Polars com o PU do título.
+
+    Returns:
+        pl.Expr: Expressão sem alias com a taxa implícita truncada em oito
+        casas decimais. Linhas inválidas resultam em NaN.
+
+    Examples:
+        >>> from pyield import ntnb
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "liquidacao": ["31-05-2024", "15-08-2024"],
+        ...         "vencimento": ["15-05-2035", "15-08-2032"],
+        ...         "vna": [4299.160173, 4315.498383],
+        ...         "pu": [4271.864805, 4343.156412],
+        ...     }
+        ... )
+        >>> taxas = df.select(
+        ...     taxa=ntnb.taxa_expr("liquidacao", "vencimento", "vna", "pu")
+        ... )
+        >>> taxas["taxa"].to_list()
+        [0.06149003, 0.05929003]
+    """
+    return pl.struct(
+        utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
+        utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
+        utils.coluna_ou_expr(vna, "vna"),
+        utils.coluna_ou_expr(pu, "pu"),
+    ).map_batches(
+        _calcular_taxas,
+        return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def _calcular_taxas(linhas: pl.Series) -> pl.Series:
+    return utils.calcular_taxas_vna(
+        linhas.struct.unnest(),
+        VALOR_CUPOM,
+        VALOR_FINAL,
+    )
+
+
 vna = _vna.vna
 vna_projetado = _vna.vna_projetado
+vna_serie = _vna.vna_serie
 vnas = _vna.vnas
@@ -11,6 +11,7 @@ from pyield.tpf.titulos import _bootstrap_forwards
 from pyield.tpf.titulos import _utils as utils
 
 taxas_zero = _bootstrap_forwards.taxas_zero
+taxas_zero_lote = _bootstrap_forwards.taxas_zero_lote
 
 
 def cotacao(
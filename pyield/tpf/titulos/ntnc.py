@@ -29,19 +29,31 @@ VALOR_FINAL_2031 = 1.05830052
 VALOR_CUPOM = 0.02956301
 VALOR_FINAL = 1.02956301
 
+# Ano de vencimento da única NTN-C com cupom de 12% a.a.
+_ANO_VENCIMENTO_2031 = 2031
+
 
 def _obter_valor_cupom(vencimento: dt.date) -> float:
-    if vencimento.year == 2031:  # noqa
+    if vencimento.year == _ANO_VENCIMENTO_2031:
         return VALOR_CUPOM_2031
     return VALOR_CUPOM
 
 
 def _obter_valor_final(vencimento: dt.date) -> float:
-    if vencimento.year == 2031:  # noqa
+    if vencimento.year == _ANO_VENCIMENTO_2031:
         return VALOR_FINAL_2031
     return VALOR_FINAL
 
 
+def _valores_pagamento_expr() -> tuple[pl.Expr, pl.Expr]:
+    """Expressões de cupom e de pagamento final conforme ``data_vencimento``."""
+    eh_2031 = pl.col("data_vencimento").dt.year() == _ANO_VENCIMENTO_2031
+    return (
+        pl.when(eh_2031).then(VALOR_CUPOM_2031).otherwise(VALOR_CUPOM),
+        pl.when(eh_2031).then(VALOR_FINAL_2031).otherwise(VALOR_FINAL),
+    )
+
+
 def dados(data: DateLike) -> pl.DataFrame:
     """
     Busca as taxas indicativas de NTN-C para a data de referência.
@@ -283,6 +295,59 @@ def cotacao(
     return truncar_decimal(vp.sum(), 6)
 
 
+def cotacao_expr(
+    data_liquidacao: pl.Expr | str,
+    data_vencimento: pl.Expr | str,
+    taxa: pl.Expr | str,
+) -> pl.Expr:
+    """Cria expressão Polars para a cotação da NTN-C pela metodologia da STN.
+
+    Os fluxos de caixa de todas as linhas são gerados em formato colunar e
+    descontados numa única agregação, com os mesmos arredondamentos de
+    ``cotacao``. Cada resultado é igual ao ``Decimal`` retornado por
+    ``cotacao`` convertido para float.
+
+    Args:
+        data_liquidacao: Nome de coluna ou expressão Polars com a data de
+            liquidação.
+        data_vencimento: Nome de coluna ou expressão Polars com a data de
+            vencimento.
+        taxa: Nome de coluna ou expressão Polars com a taxa em formato decimal.
+
+    Returns:
+        pl.Expr: Expressão sem alias com a cotação em base 1. Linhas sem
+        fluxos resultam em NaN.
+
+    Examples:
+        >>> from pyield import ntnc
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "liquidacao": ["21-03-2025", "21-05-2008"],
+        ...         "vencimento": ["01-01-2031", "01-03-2011"],
+        ...         "taxa": [0.067626, 0.069000009],
+        ...     }
+        ... )
+        >>> cotacoes = df.select(
+        ...     cotacao=ntnc.cotacao_expr("liquidacao", "vencimento", "taxa")
+        ... )
+        >>> cotacoes["cotacao"].to_list()
+        [1.264958, 0.990981]
+    """
+    return pl.struct(
+        utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
+        utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
+        utils.coluna_ou_expr(taxa, "taxa"),
+    ).map_batches(_calcular_cotacoes, return_dtype=pl.Float64, is_elementwise=True)
+
+
+def _calcular_cotacoes(linhas: pl.Series) -> pl.Series:
+    return utils.calcular_precos(
+        linhas.struct.unnest(),
+        *_valores_pagamento_expr(),
+        casas_vp=12,
+    )
+
+
 def _calcular_pu(
     vna: float | Decimal,
     cotacao: float | Decimal,
@@ -372,6 +437,66 @@ def taxa(
     return utils.truncar(taxa_encontrada, 8)
 
 
+def taxa_expr(
+    data_liquidacao: pl.Expr | str,
+    data_vencimento: pl.Expr | str,
+    vna: pl.Expr | str,
+    pu: pl.Expr | str,
+) -> pl.Expr:
+    """Cria expressão Polars para a taxa implícita (TIR) da NTN-C.
+
+    Todas as linhas são resolvidas de uma vez: os fluxos de caixa são gerados
+    em formato colunar e a busca de intervalo e a bisseção de ``taxa`` avançam
+    simultaneamente para todas as linhas. Cada resultado é idêntico ao de
+    ``taxa`` com os mesmos argumentos.
+
+    Args:
+        data_liquidacao: Nome de coluna ou expressão Polars com a data de
+            liquidação.
+        data_vencimento: Nome de coluna ou expressão Polars com a data de
+            vencimento.
+        vna: Nome de coluna ou expressão Polars com o VNA.
+        pu: Nome de coluna ou expressão Polars com o PU do título.
+
+    Returns:
+        pl.Expr: Expressão sem alias com a taxa implícita truncada em oito
+        casas decimais. Linhas inválidas resultam em NaN.
+
+    Examples:
+        >>> from pyield import ntnc
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "liquidacao": ["21-03-2025", "21-05-2008"],
+        ...         "vencimento": ["01-01-2031", "01-03-2011"],
+        ...         "vna": [6598.913723, 2126.473734],
+        ...         "pu": [8347.348705, 2207.556177],
+        ...     }
+        ... )
+        >>> taxas = df.select(
+        ...     taxa=ntnc.taxa_expr("liquidacao", "vencimento", "vna", "pu")
+        ... )
+        >>> taxas["taxa"].to_list()
+        [0.06762593, 0.04987695]
+    """
+    return pl.struct(
+        utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
+        utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
+        utils.coluna_ou_expr(vna, "vna"),
+        utils.coluna_ou_expr(pu, "pu"),
+    ).map_batches(
+        _calcular_taxas,
+        return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def _calcular_taxas(linhas: pl.Series) -> pl.Series:
+    return utils.calcular_taxas_vna(
+        linhas.struct.unnest(),
+        *_valores_pagamento_expr(),
+    )
+
+
 def duration(
     data_liquidacao: DateLike,
     data_vencimento: DateLike,
@@ -414,8 +539,9 @@ def duration_expr(
 ) -> pl.Expr:
     """Cria expressão Polars para a duration da NTN-C.
 
-    O cálculo é aplicado linha a linha porque a duration depende dos fluxos de
-    caixa do título.
+    Os fluxos de caixa de todas as linhas são gerados em formato colunar e o
+    valor presente e o prazo ponderado são somados numa única agregação. Cada
+    resultado é idêntico ao de ``duration``.
 
     Args:
         data_liquidacao: Nome de coluna ou expressão Polars com a data de
@@ -431,18 +557,24 @@ def duration_expr(
         utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
         utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
         utils.coluna_ou_expr(taxa, "taxa"),
-    ).map_elements(
-        lambda s: duration(
-            s["data_liquidacao"],
-            s["data_vencimento"],
-            s["taxa"],
-        ),
+    ).map_batches(
+        _calcular_durations,
         return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def _calcular_durations(linhas: pl.Series) -> pl.Series:
+    return utils.calcular_durations(
+        linhas.struct.unnest(),
+        *_valores_pagamento_expr(),
+        casas=14,
     )
 
 
 vna = _vna.vna
 vna_projetado = _vna.vna_projetado
+vna_serie = _vna.vna_serie
 vnas = _vna.vnas
 
 
@@ -493,8 +625,9 @@ def dv01_expr(
 ) -> pl.Expr:
     """Cria expressão Polars para o DV01 da NTN-C.
 
-    O cálculo é aplicado linha a linha e reprifica o PU informado para um
-    aumento de 1 bp na taxa.
+    Os fluxos de caixa de todas as linhas são gerados em formato colunar e
+    reprecificados na taxa informada e na taxa acrescida de 1 bp. Cada
+    resultado é idêntico ao de ``dv01``.
 
     Args:
         data_liquidacao: Nome de coluna ou expressão Polars com a data de
@@ -512,12 +645,16 @@ def dv01_expr(
         utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
         utils.coluna_ou_expr(taxa, "taxa"),
         utils.coluna_ou_expr(pu, "pu"),
-    ).map_elements(
-        lambda s: dv01(
-            s["data_liquidacao"],
-            s["data_vencimento"],
-            s["taxa"],
-            s["pu"],
-        ),
+    ).map_batches(
+        _calcular_dv01s,
         return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def _calcular_dv01s(linhas: pl.Series) -> pl.Series:
+    return utils.calcular_dv01s(
+        linhas.struct.unnest(),
+        *_valores_pagamento_expr(),
+        casas_vp=12,
     )
@@ -8,7 +8,7 @@ import polars as pl
 import pyield._internal.converters as cv
 import pyield.interpolador as ip
 from pyield import du
-from pyield._internal.numbers import truncar_decimal
+from pyield._internal.numbers import truncar_decimal, truncar_expr
 from pyield._internal.types import ArrayLike, DateLike, DatesLike, any_is_empty
 from pyield.futuro import di1
 from pyield.tpf.titulos import _utils as utils
@@ -346,6 +346,55 @@ def pu(
     return truncar_decimal(_calcular_pu(data_liquidacao, data_vencimento, taxa), 6)
 
 
+def pu_expr(
+    data_liquidacao: pl.Expr | str,
+    data_vencimento: pl.Expr | str,
+    taxa: pl.Expr | str,
+) -> pl.Expr:
+    """Cria expressão Polars para o PU da NTN-F pela metodologia da STN.
+
+    Os fluxos de caixa de todas as linhas são gerados em formato colunar e
+    descontados numa única agregação, com os mesmos arredondamentos de ``pu``.
+    Cada resultado é igual ao ``Decimal`` retornado por ``pu`` convertido para
+    float.
+
+    Args:
+        data_liquidacao: Nome de coluna ou expressão Polars com a data de
+            liquidação.
+        data_vencimento: Nome de coluna ou expressão Polars com a data de
+            vencimento.
+        taxa: Nome de coluna ou expressão Polars com a taxa em formato decimal.
+
+    Returns:
+        pl.Expr: Expressão sem alias com o PU. Linhas sem fluxos resultam em
+        NaN.
+
+    Examples:
+        >>> from pyield import ntnf
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "liquidacao": ["05-07-2024", "21-05-2008"],
+        ...         "vencimento": ["01-01-2035", "01-01-2014"],
+        ...         "taxa": [0.11921, 0.136600009],
+        ...     }
+        ... )
+        >>> precos = df.select(pu=ntnf.pu_expr("liquidacao", "vencimento", "taxa"))
+        >>> precos["pu"].to_list()
+        [895.359254, 903.075616]
+    """
+    return pl.struct(
+        utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
+        utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
+        utils.coluna_ou_expr(taxa, "taxa"),
+    ).map_batches(_calcular_pus, return_dtype=pl.Float64, is_elementwise=True)
+
+
+def _calcular_pus(linhas: pl.Series) -> pl.Series:
+    return utils.calcular_precos(
+        linhas.struct.unnest(), VALOR_CUPOM, VALOR_FINAL, casas_vp=9
+    )
+
+
 def _filtrar_vertices_futuros(
     liquidacao: dt.date,
     vencimentos: pl.Series,
@@ -509,62 +558,33 @@ def taxas_zero(  # noqa
         .with_columns(
             anos_uteis=pl.col("dias_uteis") / 252,
             taxa_tir=interpolador_ntnf.interpolar_expr("dias_uteis"),
-            cupom=pl.lit(VALOR_CUPOM),
         )
     )
 
-    # 5. Loop de bootstrap (iterativo por dependência sequencial)
+    # 5. Bootstrap (iterativo por dependência sequencial). Até o último
+    # vencimento LTN a taxa zero vem do interpolador LTN; depois, do PU da
+    # NTN-F descontado dos cupons já resolvidos.
     ultimo_vencimento_ltn = vencimentos_ltn.max()
     assert isinstance(ultimo_vencimento_ltn, dt.date)
-
-    lista_vencimentos = df["data_vencimento"]
-    lista_dias_uteis = df["dias_uteis"]
-    lista_anos_uteis = df["anos_uteis"]
-    lista_tir = df["taxa_tir"]
-
-    taxas_spot_resolvidas: list[float | None] = []
-    mapa_spot: dict[dt.date, float | None] = {}
-
-    for i in range(len(df)):
-        data_venc = lista_vencimentos[i]
-        assert isinstance(data_venc, dt.date)
-        dias_uteis_val = int(lista_dias_uteis[i])
-        anos_uteis_val = float(lista_anos_uteis[i])
-        tir_val = float(lista_tir[i])
-
-        # Caso esteja antes (ou igual) ao último vencimento LTN: usar interpolador LTN
-        if data_venc <= ultimo_vencimento_ltn:
-            taxa_zero = interpolador_ltn(dias_uteis_val)
-            taxas_spot_resolvidas.append(taxa_zero)
-            mapa_spot[data_venc] = taxa_zero
-            continue
-
-        # Datas de cupom (exclui último pagamento) para este vencimento
-        datas_fluxo = datas_pagamento(liquidacao, data_venc)[:-1]
-        if len(datas_fluxo) == 0:
-            # Caso improvável, mas protege contra divisão por zero mais adiante
-            taxa_zero = None
-            taxas_spot_resolvidas.append(taxa_zero)
-            mapa_spot[data_venc] = taxa_zero
-            continue
-
-        # Recupera taxas spot já solucionadas para estes cupons
-        taxas_spot_fluxo = [mapa_spot[d] for d in datas_fluxo]
-        periodos_fluxo = du.contar(liquidacao, datas_fluxo) / 252
-        fluxos = [VALOR_CUPOM] * len(datas_fluxo)
-
-        valor_presente_fluxo = utils.calcular_pv(
-            fluxos_caixa=pl.Series(fluxos),
-            taxas=pl.Series(taxas_spot_fluxo),
-            prazos=periodos_fluxo,
-        )
-
-        preco_titulo = _calcular_pu(liquidacao, data_venc, tir_val)
-        fator_preco = VALOR_FINAL / (preco_titulo - valor_presente_fluxo)
-        taxa_zero = fator_preco ** (1 / anos_uteis_val) - 1
-
-        taxas_spot_resolvidas.append(taxa_zero)
-        mapa_spot[data_venc] = taxa_zero
+    zona_ltn = df["data_vencimento"] <= ultimo_vencimento_ltn
+    taxas_diretas = [
+        interpolador_ltn(int(dias_uteis)) if na_zona_ltn else None
+        for dias_uteis, na_zona_ltn in zip(df["dias_uteis"], zona_ltn, strict=True)
+    ]
+    precos = [None] * zona_ltn.sum() + _precos_bootstrap(
+        liquidacao, df.filter(~zona_ltn)
+    )
+    # O primeiro vértice não tem cupons anteriores: sem eles não há como
+    # separar o principal, e a taxa fica nula
+    precos[0] = None
+    taxas_spot_resolvidas = utils.bootstrap_taxas_zero(
+        anos_uteis=df["anos_uteis"].to_list(),
+        precos=precos,
+        taxas_diretas=taxas_diretas,
+        valor_cupom=VALOR_CUPOM,
+        valor_final=VALOR_FINAL,
+        passo_cupom=1,
+    )
 
     # 6. Anexa a coluna taxa_zero
     df = df.with_columns(taxa_zero=pl.Series(taxas_spot_resolvidas, dtype=pl.Float64))
@@ -579,6 +599,18 @@ def taxas_zero(  # noqa
     return df
 
 
+def _precos_bootstrap(liquidacao: dt.date, df: pl.DataFrame) -> list[float | None]:
+    """PUs das NTN-F sintéticas vencendo nos vértices após o último LTN."""
+    if df.is_empty():
+        return []
+    linhas = df.select(
+        pl.lit(liquidacao).alias("data_liquidacao"),
+        "data_vencimento",
+        taxa="taxa_tir",
+    )
+    return utils.calcular_precos(linhas, VALOR_CUPOM, VALOR_FINAL, casas_vp=9).to_list()
+
+
 def rentabilidade(  # noqa
     data_liquidacao: DateLike,
     data_vencimento: DateLike,
@@ -689,8 +721,10 @@ def rentabilidade_expr(
 ) -> pl.Expr:
     """Cria expressão Polars para a rentabilidade da NTN-F sobre a curva DI.
 
-    O cálculo é aplicado linha a linha porque a rentabilidade depende dos fluxos
-    de caixa do título, da interpolação da curva DI e da resolução de raiz.
+    Todas as linhas são resolvidas de uma vez: os fluxos de caixa são gerados
+    em formato colunar, a curva DI é interpolada uma única vez para todos os
+    pagamentos e a busca da TIR DI avança simultaneamente para todas as
+    linhas. Cada resultado é idêntico ao de ``rentabilidade``.
 
     Args:
         data_liquidacao: Data de liquidação para o cálculo.
@@ -707,15 +741,82 @@ def rentabilidade_expr(
     return pl.struct(
         utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
         utils.coluna_ou_expr(taxa_ntnf, "taxa_ntnf"),
-    ).map_elements(
-        lambda row: rentabilidade(
-            data_liquidacao=data_liquidacao,
-            data_vencimento=row["data_vencimento"],
-            taxa_ntnf=row["taxa_ntnf"],
-            vencimentos_di=vencimentos_di,
-            taxas_di=taxas_di,
+    ).map_batches(
+        lambda linhas: _calcular_rentabilidades(
+            linhas, data_liquidacao, vencimentos_di, taxas_di
         ),
         return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def _preparar_fluxos_di(
+    linhas: pl.Series,
+    data_liquidacao: DateLike,
+    vencimentos_di: DatesLike,
+    taxas_di: ArrayLike,
+) -> tuple[pl.DataFrame, pl.DataFrame] | None:
+    """Gera os fluxos colunares com a taxa DI interpolada em cada pagamento."""
+    if any_is_empty(data_liquidacao, vencimentos_di, taxas_di):
+        return None
+
+    liquidacao = cv.converter_datas(data_liquidacao)
+    df = linhas.struct.unnest().select(
+        pl.lit(liquidacao).alias("data_liquidacao"),
+        cv.converter_datas_expr("data_vencimento"),
+        pl.col("taxa_ntnf").cast(pl.Float64),
+    )
+    interpolador_ff = ip.Interpolador(
+        du.contar(liquidacao, vencimentos_di),
+        pl.Series(taxas_di),
+        "flat_forward",
+    )
+    fluxos = utils.gerar_fluxos_colunares(
+        df, VALOR_CUPOM, VALOR_FINAL
+    ).with_columns(
+        anos_uteis=pl.col("dias_uteis") / 252,
+        taxa_di=interpolador_ff.interpolar_expr("dias_uteis"),
+    )
+    return df, fluxos
+
+
+def _calcular_rentabilidades(
+    linhas: pl.Series,
+    data_liquidacao: DateLike,
+    vencimentos_di: DatesLike,
+    taxas_di: ArrayLike,
+) -> pl.Series:
+    preparado = _preparar_fluxos_di(linhas, data_liquidacao, vencimentos_di, taxas_di)
+    if preparado is None:
+        return pl.repeat(float("nan"), len(linhas), dtype=pl.Float64, eager=True)
+    df, fluxos = preparado
+
+    # Como em ``utils.calcular_pv``, taxa DI ausente invalida o preço
+    vp_di = pl.col("valor_pagamento") / (1 + pl.col("taxa_di")) ** pl.col("anos_uteis")
+    precos = utils.somar_por_linha(fluxos, vp_di.fill_null(float("nan")), df.height)
+
+    def diferenca_preco(taxas: pl.Series) -> pl.Series:
+        taxa = pl.lit(taxas).gather(pl.col("id_linha"))
+        vp = pl.col("valor_pagamento") / (1 + taxa) ** pl.col("anos_uteis")
+        return utils.somar_por_linha(fluxos, vp, df.height) - precos
+
+    di_tir = utils.encontrar_raizes(diferenca_preco, df.height)
+    fator_ntnf = (1 + df["taxa_ntnf"]) ** (1 / 252)
+    fator_di = (1 + di_tir) ** (1 / 252)
+    return (
+        pl.DataFrame({"fator_ntnf": fator_ntnf, "fator_di": fator_di})
+        .select(
+            pl.when(pl.col("fator_di").is_nan() | pl.col("fator_ntnf").is_null())
+            .then(float("nan"))
+            .when(pl.col("fator_di") == 1)
+            .then(
+                pl.when(pl.col("fator_ntnf") > 1)
+                .then(float("inf"))
+                .otherwise(0.0)
+            )
+            .otherwise((pl.col("fator_ntnf") - 1) / (pl.col("fator_di") - 1))
+        )
+        .to_series()
     )
 
 
@@ -860,8 +961,9 @@ def premio_limpo_expr(
 ) -> pl.Expr:
     """Cria expressão Polars para o prêmio limpo da NTN-F sobre a curva DI.
 
-    O cálculo é aplicado linha a linha porque o prêmio limpo depende dos fluxos
-    de caixa do título, da interpolação da curva DI e da resolução de raiz.
+    Todas as linhas são resolvidas de uma vez, com os mesmos fluxos colunares
+    e a mesma busca de raiz vetorizada de ``rentabilidade_expr``. Cada
+    resultado é idêntico ao de ``premio_limpo``.
 
     Args:
         data_liquidacao: Data de liquidação para o cálculo.
@@ -878,18 +980,40 @@ def premio_limpo_expr(
     return pl.struct(
         utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
         utils.coluna_ou_expr(taxa_ntnf, "taxa_ntnf"),
-    ).map_elements(
-        lambda row: premio_limpo(
-            data_liquidacao=data_liquidacao,
-            data_vencimento=row["data_vencimento"],
-            taxa_ntnf=row["taxa_ntnf"],
-            vencimentos_di=vencimentos_di,
-            taxas_di=taxas_di,
+    ).map_batches(
+        lambda linhas: _calcular_premios_limpos(
+            linhas, data_liquidacao, vencimentos_di, taxas_di
         ),
         return_dtype=pl.Float64,
+        is_elementwise=True,
     )
 
 
+def _calcular_premios_limpos(
+    linhas: pl.Series,
+    data_liquidacao: DateLike,
+    vencimentos_di: DatesLike,
+    taxas_di: ArrayLike,
+) -> pl.Series:
+    preparado = _preparar_fluxos_di(linhas, data_liquidacao, vencimentos_di, taxas_di)
+    if preparado is None:
+        return pl.repeat(float("nan"), len(linhas), dtype=pl.Float64, eager=True)
+    df, fluxos = preparado
+
+    precos = pl.select(
+        truncar_expr(pl.lit(utils.somar_vp_fluxos(fluxos, df["taxa_ntnf"], 9)), 6)
+    ).to_series()
+
+    def diferenca_preco(premios: pl.Series) -> pl.Series:
+        premio = pl.lit(premios).gather(pl.col("id_linha"))
+        vp = pl.col("valor_pagamento") / (1 + pl.col("taxa_di") + premio) ** pl.col(
+            "anos_uteis"
+        )
+        return utils.somar_por_linha(fluxos, vp, df.height) - precos
+
+    return utils.encontrar_raizes(diferenca_preco, df.height)
+
+
 def duration(
     data_liquidacao: DateLike,
     data_vencimento: DateLike,
@@ -931,8 +1055,9 @@ def duration_expr(
 ) -> pl.Expr:
     """Cria expressão Polars para a duration da NTN-F.
 
-    O cálculo é aplicado linha a linha porque a duration depende dos fluxos de
-    caixa do título.
+    Os fluxos de caixa de todas as linhas são gerados em formato colunar e o
+    valor presente e o prazo ponderado são somados numa única agregação. Cada
+    resultado é idêntico ao de ``duration``.
 
     Args:
         data_liquidacao: Nome de coluna ou expressão Polars com a data de
@@ -948,13 +1073,18 @@ def duration_expr(
         utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
         utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
         utils.coluna_ou_expr(taxa, "taxa"),
-    ).map_elements(
-        lambda s: duration(
-            s["data_liquidacao"],
-            s["data_vencimento"],
-            s["taxa"],
-        ),
+    ).map_batches(
+        _calcular_durations,
         return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def _calcular_durations(linhas: pl.Series) -> pl.Series:
+    return utils.calcular_durations(
+        linhas.struct.unnest(),
+        VALOR_CUPOM,
+        VALOR_FINAL,
     )
 
 
@@ -1003,8 +1133,9 @@ def dv01_expr(
 ) -> pl.Expr:
     """Cria expressão Polars para o DV01 da NTN-F.
 
-    O cálculo é aplicado linha a linha e reprifica o PU informado para um
-    aumento de 1 bp na taxa.
+    Os fluxos de caixa de todas as linhas são gerados em formato colunar e
+    reprecificados na taxa informada e na taxa acrescida de 1 bp. Cada
+    resultado é idêntico ao de ``dv01``.
 
     Args:
         data_liquidacao: Nome de coluna ou expressão Polars com a data de
@@ -1022,14 +1153,19 @@ def dv01_expr(
         utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
         utils.coluna_ou_expr(taxa, "taxa"),
         utils.coluna_ou_expr(pu, "pu"),
-    ).map_elements(
-        lambda s: dv01(
-            s["data_liquidacao"],
-            s["data_vencimento"],
-            s["taxa"],
-            s["pu"],
-        ),
+    ).map_batches(
+        _calcular_dv01s,
         return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def _calcular_dv01s(linhas: pl.Series) -> pl.Series:
+    return utils.calcular_dv01s(
+        linhas.struct.unnest(),
+        VALOR_CUPOM,
+        VALOR_FINAL,
+        casas_vp=9,
     )
 
 
@@ -1077,3 +1213,64 @@ def taxa(
 
     taxa_encontrada = utils.encontrar_raiz(diferenca_preco)
     return utils.truncar(taxa_encontrada, 8)
+
+
+def taxa_expr(
+    data_liquidacao: pl.Expr | str,
+    data_vencimento: pl.Expr | str,
+    pu: pl.Expr | str,
+) -> pl.Expr:
+    """Cria expressão Polars para a TIR implícita da NTN-F.
+
+    Todas as linhas são resolvidas de uma vez: os fluxos de caixa são gerados
+    em formato colunar e a busca de intervalo e a bisseção de ``taxa`` avançam
+    simultaneamente para todas as linhas. Cada resultado é idêntico ao de
+    ``taxa`` com os mesmos argumentos.
+
+    Args:
+        data_liquidacao: Nome de coluna ou expressão Polars com a data de
+            liquidação.
+        data_vencimento: Nome de coluna ou expressão Polars com a data de
+            vencimento.
+        pu: Nome de coluna ou expressão Polars com o PU do título.
+
+    Returns:
+        pl.Expr: Expressão sem alias com a TIR implícita truncada em oito casas
+        decimais. Linhas inválidas resultam em NaN.
+
+    Examples:
+        >>> from pyield import ntnf
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "liquidacao": ["13-03-2026", "21-05-2008"],
+        ...         "vencimento": ["01-01-2035", "01-01-2014"],
+        ...         "pu": [820.995125, 903.039091],
+        ...     }
+        ... )
+        >>> taxas = df.select(taxa=ntnf.taxa_expr("liquidacao", "vencimento", "pu"))
+        >>> taxas["taxa"].to_list()
+        [0.142743, 0.13661101]
+    """
+    return pl.struct(
+        utils.coluna_ou_expr(data_liquidacao, "data_liquidacao"),
+        utils.coluna_ou_expr(data_vencimento, "data_vencimento"),
+        utils.coluna_ou_expr(pu, "pu"),
+    ).map_batches(
+        _calcular_taxas,
+        return_dtype=pl.Float64,
+        is_elementwise=True,
+    )
+
+
+def _calcular_taxas(linhas: pl.Series) -> pl.Series:
+    df = utils.preparar_linhas(linhas.struct.unnest(), "pu").with_columns(
+        pl.when(pl.col("pu") > 0).then("pu").alias("pu")
+    )
+    fluxos = utils.gerar_fluxos_colunares(df, VALOR_CUPOM, VALOR_FINAL)
+
+    def diferenca_preco(taxas: pl.Series) -> pl.Series:
+        somas = utils.somar_vp_fluxos(fluxos, taxas, casas_vp=9)
+        return pl.select(truncar_expr(pl.lit(somas), 6)).to_series() - df["pu"]
+
+    taxas = utils.encontrar_raizes(diferenca_preco, df.height)
+    return pl.select(truncar_expr(pl.lit(taxas), 8)).to_series()
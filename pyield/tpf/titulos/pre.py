@@ -1,9 +1,18 @@
 import polars as pl
 
+import pyield.interpolador as ip
 from pyield import du
 from pyield._internal.types import DateLike
+from pyield.tpf._taxas import taxas_historicas
 from pyield.tpf.titulos import _utils as utils
 
+_SCHEMA_HISTORICO = {
+    "data_referencia": pl.Date,
+    "data_vencimento": pl.Date,
+    "dias_uteis": pl.Int64,
+    "taxa_zero": pl.Float64,
+}
+
 
 def curva_pre(data: DateLike) -> pl.DataFrame:
     """Constrói a curva PRE (taxas zero cupom prefixadas).
@@ -100,6 +109,211 @@ def curva_pre(data: DateLike) -> pl.DataFrame:
     return df.sort("data_vencimento")
 
 
+def curva_pre_historica(
+    inicio: DateLike | None = None,
+    fim: DateLike | None = None,
+    processos: int = 1,
+) -> pl.DataFrame:
+    """Constrói a curva PRE para todas as datas de um período.
+
+    Equivale a chamar :func:`curva_pre` para cada data de referência, mas lê
+    as taxas de LTN e NTN-F do histórico uma única vez e faz o bootstrap de
+    todas as datas em conjunto: a interpolação das curvas, os PUs das NTN-F
+    sintéticas e o valor presente dos cupons são calculados de forma colunar,
+    e o laço sequencial do bootstrap percorre apenas os semestres da curva,
+    não as datas.
+
+    Fonte: ANBIMA, via painel histórico usado por ``yd.tpf.taxas_historicas``.
+
+    Args:
+        inicio: Data inicial do período. Se omitida, não limita o início.
+        fim: Data final do período. Se omitida, não limita o fim.
+        processos: Número de processos usados no bootstrap. Com mais de um,
+            as datas são divididas em lotes contíguos processados em paralelo.
+            Padrão: 1 (no processo atual).
+
+    Returns:
+        DataFrame no formato longo com a curva PRE de cada data de referência,
+        ordenado por data de referência e vencimento. Retorna DataFrame vazio
+        se não houver taxas de LTN e NTN-F no período.
+
+    Output Columns:
+        * data_referencia (Date): data de referência da curva.
+        * data_vencimento (Date): data de vencimento do vértice.
+        * dias_uteis (Int64): dias úteis entre a data de referência e o vencimento.
+        * taxa_zero (Float64): taxa zero cupom anualizada (base 252).
+
+    Raises:
+        ValueError: Se alguma data tiver NTN-F sem dados de LTN para bootstrap.
+
+    Examples:
+        >>> df = yd.tpf.curva_pre_historica("02-06-2025", "06-06-2025")
+        >>> df["data_referencia"].n_unique()
+        5
+    """
+    df = (
+        taxas_historicas(inicio, fim, titulo="PRE")
+        .select("data_referencia", "titulo", "data_vencimento", "taxa_indicativa")
+        .filter(pl.col("data_vencimento") > pl.col("data_referencia"))
+    )
+    if df.is_empty():
+        return pl.DataFrame(schema=_SCHEMA_HISTORICO)
+
+    datas_sem_ltn = (
+        df.group_by("data_referencia")
+        .agg(tem_ltn=(pl.col("titulo") == "LTN").any())
+        .filter(~pl.col("tem_ltn"))["data_referencia"]
+        .sort()
+    )
+    if not datas_sem_ltn.is_empty():
+        datas = ", ".join(str(d) for d in datas_sem_ltn)
+        raise ValueError(
+            "Não é possível construir a curva PRE sem taxas de LTN para bootstrap "
+            f"(datas: {datas})"
+        )
+
+    resultado = utils.processar_por_data(_bootstrap_datas, df, processos)
+    _validar_resultado_final(resultado)
+    return resultado.sort("data_referencia", "data_vencimento")
+
+
+def _bootstrap_datas(df: pl.DataFrame) -> pl.DataFrame:
+    """Curva PRE de todas as datas de ``df`` (taxas de LTN e NTN-F)."""
+    dias_uteis = du.contar_expr("data_referencia", "data_vencimento")
+    df_ltn = df.filter(pl.col("titulo") == "LTN").with_columns(dias_uteis=dias_uteis)
+    df_ntnf = df.filter(pl.col("titulo") == "NTN-F").with_columns(dias_uteis=dias_uteis)
+
+    # LTNs fora dos vencimentos de NTN-F entram na curva com a própria taxa
+    ltn_adicionais = df_ltn.join(
+        df_ntnf, on=["data_referencia", "data_vencimento"], how="anti"
+    ).select(
+        "data_referencia",
+        "data_vencimento",
+        "dias_uteis",
+        taxa_zero=pl.col("taxa_indicativa"),
+    )
+    if df_ntnf.is_empty():
+        return ltn_adicionais
+
+    df_spots = _bootstrap_ntnf(df_ltn, df_ntnf)
+    return pl.concat([df_spots, ltn_adicionais])
+
+
+def _bootstrap_ntnf(df_ltn: pl.DataFrame, df_ntnf: pl.DataFrame) -> pl.DataFrame:
+    """Versão multi-data de ``ntnf.taxas_zero`` (sem as datas de cupom)."""
+    from pyield.tpf.titulos.ntnf import VALOR_CUPOM, VALOR_FINAL  # noqa: PLC0415
+
+    limites = (
+        df_ntnf.group_by("data_referencia")
+        .agg(ultimo_vencimento=pl.col("data_vencimento").max())
+        .join(
+            df_ltn.group_by("data_referencia").agg(
+                ultimo_vencimento_ltn=pl.col("data_vencimento").max()
+            ),
+            on="data_referencia",
+        )
+        .sort("data_referencia")
+        .with_row_index("id_linha")
+    )
+
+    # Todas as datas de pagamento até o último vencimento de NTN-F de cada
+    # data, em ordem crescente dentro de cada data de referência
+    grade = (
+        utils.gerar_fluxos_colunares(
+            limites.select(
+                data_liquidacao="data_referencia",
+                data_vencimento="ultimo_vencimento",
+            ),
+            VALOR_CUPOM,
+            VALOR_FINAL,
+        )
+        .join(limites, on="id_linha")
+        .select(
+            "id_linha",
+            "data_referencia",
+            data_vencimento="data_pagamento",
+            dias_uteis="dias_uteis",
+            anos_uteis=pl.col("dias_uteis") / 252,
+            ordem=pl.int_range(pl.len()).over("id_linha"),
+            zona_ltn=pl.col("data_pagamento") <= pl.col("ultimo_vencimento_ltn"),
+        )
+    )
+    grade = grade.with_columns(
+        taxa_ltn=_interpolar_por_data(grade, df_ltn),
+        taxa_tir=_interpolar_por_data(grade, df_ntnf),
+    )
+    grade = _adicionar_pu_ntnf(grade, VALOR_CUPOM, VALOR_FINAL)
+
+    # O bootstrap é sequencial nos semestres, mas cada semestre é resolvido
+    # para todas as datas de uma vez. ``soma_cupons`` acumula, por data, o
+    # valor presente dos cupons anteriores ao semestre corrente.
+    soma_cupons = pl.repeat(0.0, limites.height, dtype=pl.Float64, eager=True)
+    passos = []
+    for _, semestre in sorted(grade.partition_by("ordem", as_dict=True).items()):
+        ids = semestre["id_linha"]
+        passo = semestre.with_columns(cupons=soma_cupons.gather(ids)).with_columns(
+            taxa_zero=pl.when(pl.col("zona_ltn"))
+            .then(pl.col("taxa_ltn"))
+            # Sem cupons anteriores não há como separar o principal
+            .when(pl.col("ordem") == 0)
+            .then(None)
+            .otherwise(
+                (VALOR_FINAL / (pl.col("pu") - pl.col("cupons")))
+                ** (1 / pl.col("anos_uteis"))
+                - 1
+            )
+        )
+        cupom_vp = VALOR_CUPOM / (1 + passo["taxa_zero"]) ** passo["anos_uteis"]
+        soma_cupons = soma_cupons.scatter(ids, passo["cupons"] + cupom_vp)
+        passos.append(passo)
+
+    return (
+        pl.concat(passos)
+        .join(
+            df_ntnf.select("data_referencia", "data_vencimento"),
+            on=["data_referencia", "data_vencimento"],
+            how="semi",
+        )
+        .select(*_SCHEMA_HISTORICO)
+    )
+
+
+def _interpolar_por_data(grade: pl.DataFrame, df_curva: pl.DataFrame) -> pl.Series:
+    """Interpola (flat forward) a curva de cada data nos vértices da grade."""
+    return ip.interpolar(
+        dus_alvo=grade["dias_uteis"],
+        dus_curva=df_curva["dias_uteis"],
+        taxas_curva=df_curva["taxa_indicativa"],
+        datas_alvo=grade["data_referencia"],
+        datas_curva=df_curva["data_referencia"],
+    )
+
+
+def _adicionar_pu_ntnf(
+    grade: pl.DataFrame, valor_cupom: float, valor_final: float
+) -> pl.DataFrame:
+    """Adiciona o PU de uma NTN-F sintética vencendo em cada vértice da grade.
+
+    Versão colunar de ``ntnf._calcular_pu``, calculada apenas para os
+    vértices após o último vencimento de LTN.
+    """
+    linhas = grade.filter(~pl.col("zona_ltn"))
+    precos = utils.calcular_precos(
+        linhas.select(
+            "id_linha",
+            "ordem",
+            data_liquidacao="data_referencia",
+            data_vencimento="data_vencimento",
+            taxa="taxa_tir",
+        ),
+        valor_cupom,
+        valor_final,
+        casas_vp=9,
+    )
+    pus = linhas.select("id_linha", "ordem").with_columns(pu=precos)
+    return grade.join(pus, on=["id_linha", "ordem"], how="left")
+
+
 def _processar_ltn_adicionais(
     data_referencia: DateLike,
     ltn_nao_em_ntnf: pl.DataFrame,
@@ -3,22 +3,19 @@
 from urllib.parse import urlparse
 
 import polars as pl
-import requests
 from lxml import html
 
+from pyield._internal import cache_brutos, transporte
 from pyield._internal.cache import ttl_cache
 from pyield._internal.excel import ler_sem_cabecalho
-from pyield._internal.retry import retry_padrao
 
 _DOMINIO_ARQUIVOS = "thot-arquivos.tesouro.gov.br"
 _TIMEOUT_SEGUNDOS = 60
 
 
-@retry_padrao
 def _buscar_conteudo(url: str) -> bytes:
     """Busca o conteúdo bruto de uma URL do Tesouro Nacional."""
-    resposta = requests.get(url, timeout=_TIMEOUT_SEGUNDOS)
-    resposta.raise_for_status()
+    resposta = transporte.get(url, timeout=_TIMEOUT_SEGUNDOS)
     return resposta.content
 
 
@@ -43,6 +40,15 @@ def _extrair_url_planilha(conteudo: bytes) -> str:
 @ttl_cache()
 def baixar_planilha(url_publicacao: str) -> bytes:
     """Baixa a planilha mais recente de uma publicação de VNA."""
+    return cache_brutos.buscar(
+        "tesouro_vna",
+        None,
+        lambda: _baixar_planilha(url_publicacao),
+        variante=url_publicacao,
+    )
+
+
+def _baixar_planilha(url_publicacao: str) -> bytes:
     pagina = _buscar_conteudo(url_publicacao)
     url_planilha = _extrair_url_planilha(pagina)
     return _buscar_conteudo(url_planilha)
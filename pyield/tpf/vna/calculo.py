@@ -4,7 +4,7 @@ import datetime as dt
 
 import polars as pl
 
-from pyield._internal.numbers import truncar
+from pyield._internal.numbers import truncar, truncar_expr
 
 LIMITE_INFERIOR_PERCENTUAL = -100.0
 
@@ -66,6 +66,74 @@ def calcular_vna(
     return _aplicar_variacao_pro_rata(vna_inicial, variacao, expoente)
 
 
+def juntar_pontos_vizinhos(df: pl.DataFrame, datas: pl.Series) -> pl.DataFrame:
+    """Junta a cada data os pontos publicados que a cercam.
+
+    Versão colunar da busca de pontos de :func:`calcular_vna`: um
+    ``join_asof`` para trás (que inclui o ponto exato) e outro estritamente
+    para frente sobre os pontos publicados.
+
+    Args:
+        df: DataFrame com as colunas ``data`` (Date) e ``vna`` (Float64),
+            contendo no máximo um ponto publicado por data.
+        datas: Datas para as quais o VNA será obtido ou interpolado.
+
+    Returns:
+        DataFrame na ordem de ``datas`` com as colunas ``data``,
+        ``data_inicial``, ``vna_inicial``, ``data_final`` e ``vna_final``.
+        ``data_inicial`` é igual a ``data`` quando há ponto publicado na data.
+    """
+    pontos = df.select("data", "vna").sort("data")
+    return (
+        pl.DataFrame({"data": datas}, schema={"data": pl.Date})
+        .with_row_index("_ordem")
+        .sort("data")
+        .join_asof(
+            pontos.select("data", data_inicial="data", vna_inicial=pl.col("vna")),
+            on="data",
+            strategy="backward",
+        )
+        .join_asof(
+            pontos.select("data", data_final="data", vna_final=pl.col("vna")),
+            on="data",
+            strategy="forward",
+            allow_exact_matches=False,
+        )
+        .sort("_ordem")
+        .drop("_ordem")
+    )
+
+
+def expressao_vna(fator_variacao: pl.Expr | None = None) -> pl.Expr:
+    """Expressão de :func:`calcular_vna` sobre as colunas de
+    :func:`juntar_pontos_vizinhos`.
+
+    Args:
+        fator_variacao: Fator multiplicativo entre o ponto inicial e o final.
+            Se omitido, é calculado pela razão entre os VNAs dos dois pontos.
+
+    Returns:
+        pl.Expr: VNA truncado em seis casas. Nulo quando não houver pontos
+            publicados dos dois lados da data ou quando o fator for nulo.
+    """
+    if fator_variacao is None:
+        fator_variacao = pl.col("vna_final") / pl.col("vna_inicial")
+    expoente = truncar_expr(
+        (pl.col("data") - pl.col("data_inicial")).dt.total_days()
+        / (pl.col("data_final") - pl.col("data_inicial")).dt.total_days(),
+        14,
+    )
+    # Mesma sequência de operações de _aplicar_variacao_pro_rata
+    variacao = fator_variacao - 1
+    pro_rata = truncar_expr(pl.col("vna_inicial") * (1 + variacao).pow(expoente), 6)
+    return truncar_expr(
+        pl.when(pl.col("data") == pl.col("data_inicial"))
+        .then(pl.col("vna_inicial"))
+        .otherwise(pro_rata),
+        6,
+    )
+
+
 def _aplicar_variacao_pro_rata(
     vna_base: float,
     variacao: float,
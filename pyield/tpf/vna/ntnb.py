@@ -7,8 +7,8 @@ from decimal import Decimal
 import polars as pl
 
 import pyield._internal.converters as conversores
-from pyield._internal.numbers import truncar, truncar_decimal
-from pyield._internal.types import DateLike, any_is_empty
+from pyield._internal.numbers import truncar, truncar_decimal, truncar_expr
+from pyield._internal.types import DateLike, DatesLike, any_is_empty
 from pyield.ipca import historico as _ipca
 from pyield.tpf.vna import _download
 from pyield.tpf.vna import calculo as _vna
@@ -104,6 +104,91 @@ def vna(data: DateLike | None = None) -> Decimal:
     )
 
 
+def vna_serie(datas: DatesLike) -> pl.DataFrame:
+    """Obtém o VNA da NTN-B para várias datas de referência.
+
+    Equivale a aplicar :func:`vna` a cada data, mas os pontos publicados são
+    buscados uma única vez, os pontos que cercam cada data são obtidos por
+    ``join_asof`` e os números-índice do IPCA de todo o período são baixados
+    em uma única chamada. Mantém as precisões da STN: fator do IPCA truncado
+    em dezesseis casas, pró-rata em catorze e VNA em seis.
+
+    Args:
+        datas: Datas de referência.
+
+    Returns:
+        DataFrame Polars na ordem de ``datas``.
+
+    Output Columns:
+        - data (Date): Data de referência.
+        - vna (Float64): VNA da NTN-B truncado em seis casas. ``NaN`` para
+            datas nulas ou fora do intervalo publicado.
+
+    Examples:
+        >>> from pyield import ntnb
+        >>> ntnb.vna_serie(["15-12-2025", "30-12-2025"])["vna"].to_list()
+        [4570.078408, 4577.369436]
+    """
+    datas_convertidas = conversores.converter_datas(datas)
+    df = _vna.juntar_pontos_vizinhos(vnas(), datas_convertidas)
+
+    inicio = (
+        pl.when(pl.col("data").dt.day() >= _DIA_INICIO_VIGENCIA)
+        .then(pl.col("data"))
+        .otherwise(pl.col("data").dt.offset_by("-1mo"))
+        .dt.month_start()
+        .dt.offset_by(f"{_DIA_INICIO_VIGENCIA - 1}d")
+    )
+    # A vigência só é válida com os dois marcos publicados; nesse caso eles
+    # são os próprios pontos vizinhos obtidos acima.
+    pro_rata = (
+        (pl.col("data") != pl.col("data_inicial"))
+        & (pl.col("data_inicial") == inicio)
+        & (pl.col("data_final") == inicio.dt.offset_by("1mo"))
+    )
+    exato = pl.col("data") == pl.col("data_inicial")
+    df = df.with_columns(
+        _periodo_inicial=pl.when(pro_rata).then(_periodo_anterior("data_inicial")),
+        _periodo_final=pl.when(pro_rata).then(_periodo_anterior("data_final")),
+    )
+
+    indices = _obter_indices_ipca(df)
+    df = df.join(
+        indices.select(_periodo_inicial="periodo", _indice_inicial="indice"),
+        on="_periodo_inicial",
+        how="left",
+    ).join(
+        indices.select(_periodo_final="periodo", _indice_final="indice"),
+        on="_periodo_final",
+        how="left",
+    )
+    fator_ipca = truncar_expr(pl.col("_indice_final") / pl.col("_indice_inicial"), 16)
+    return df.select(
+        "data",
+        vna=pl.when(exato | pro_rata)
+        .then(_vna.expressao_vna(fator_ipca))
+        .fill_null(float("nan")),
+    )
+
+
+def _periodo_anterior(coluna: str) -> pl.Expr:
+    """Período YYYYMM do mês anterior ao da data."""
+    mes = pl.col(coluna).dt.offset_by("-1mo")
+    return (mes.dt.year() * 100 + mes.dt.month()).cast(pl.Int64)
+
+
+def _obter_indices_ipca(df: pl.DataFrame) -> pl.DataFrame:
+    """Busca de uma só vez os números-índice dos períodos usados em ``df``."""
+    periodos = pl.concat([df["_periodo_inicial"], df["_periodo_final"]]).drop_nulls()
+    if periodos.is_empty():
+        return pl.DataFrame(schema={"periodo": pl.Int64, "indice": pl.Float64})
+    primeiro, ultimo = periodos.min(), periodos.max()
+    return _ipca.indices(
+        dt.date(primeiro // 100, primeiro % 100, 1),
+        dt.date(ultimo // 100, ultimo % 100, 1),
+    ).select(pl.col("periodo").cast(pl.Int64), pl.col("indice").cast(pl.Float64))
+
+
 def _obter_vigencia(data: dt.date) -> tuple[dt.date, dt.date]:
     """Obtém a vigência mensal 15--15 que contém a data."""
     if data.day >= _DIA_INICIO_VIGENCIA:
@@ -7,7 +7,7 @@ import polars as pl
 
 import pyield._internal.converters as conversores
 from pyield._internal.numbers import truncar_decimal
-from pyield._internal.types import DateLike, any_is_empty
+from pyield._internal.types import DateLike, DatesLike, any_is_empty
 from pyield.tpf.vna import _download
 from pyield.tpf.vna import calculo as _vna
 
@@ -104,6 +104,40 @@ def vna(
     return truncar_decimal(_vna.calcular_vna(df, data_convertida), 6)
 
 
+def vna_serie(datas: DatesLike, vencimento: DateLike) -> pl.DataFrame:
+    """Obtém o VNA da NTN-C de um vencimento para várias datas de referência.
+
+    Equivale a aplicar :func:`vna` a cada data, com os pontos publicados
+    buscados uma única vez e combinados às datas por ``join_asof``.
+
+    Args:
+        datas: Datas de referência.
+        vencimento: Data de vencimento da NTN-C.
+
+    Returns:
+        DataFrame Polars na ordem de ``datas``.
+
+    Output Columns:
+        - data (Date): Data de referência.
+        - vna (Float64): VNA da NTN-C truncado em seis casas. ``NaN`` para
+            datas nulas, fora do intervalo publicado ou sem série para o
+            vencimento.
+
+    Examples:
+        >>> from pyield import ntnc
+        >>> ntnc.vna_serie(["01-12-2025", "16-12-2025"], "01-01-2031")["vna"].to_list()
+        [6450.107485, 6449.641358]
+    """
+    datas_convertidas = conversores.converter_datas(datas)
+    vencimento_convertido = conversores.converter_datas(vencimento)
+    df = vnas().filter(
+        pl.col("anos_vencimento").list.contains(vencimento_convertido.year)
+    )
+    return _vna.juntar_pontos_vizinhos(df, datas_convertidas).select(
+        "data", vna=_vna.expressao_vna().fill_null(float("nan"))
+    )
+
+
 def _obter_vigencia(data: dt.date) -> tuple[dt.date, dt.date]:
     """Obtém a vigência mensal entre primeiros dias que contém a data."""
     inicio = data.replace(day=1)
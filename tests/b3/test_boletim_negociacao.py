@@ -10,8 +10,12 @@ publicado no release de dados de teste.
 
 import datetime as dt
 import gzip
+import importlib
 import io
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 
@@ -32,13 +36,16 @@ def test_boletim_api_publica():
     assert yd.b3.boletim.baixar_zip is modulo_boletim.baixar_zip
     assert yd.b3.boletim.buscar is modulo_boletim.buscar
     assert yd.b3.boletim.ler is modulo_boletim.ler
-    assert yd.b3.boletim.__all__ == ["baixar_zip", "buscar", "ler"]
+    assert yd.b3.boletim.buscar_periodo is modulo_boletim.buscar_periodo
+    assert yd.b3.boletim.__all__ == ["baixar_zip", "buscar", "buscar_periodo", "ler"]
 
 
-def _criar_zip_boletim(nome_xml: str = "PR260112.xml") -> bytes:
+def _criar_zip_boletim(
+    nome_xml: str = "PR260112.xml", xml_bytes: bytes = b"<BizData />"
+) -> bytes:
     zip_interno_bytes = io.BytesIO()
     with zipfile.ZipFile(zip_interno_bytes, "w") as zip_interno:
-        zip_interno.writestr(nome_xml, b"<BizData />")
+        zip_interno.writestr(nome_xml, xml_bytes)
 
     zip_externo_bytes = io.BytesIO()
     with zipfile.ZipFile(zip_externo_bytes, "w") as zip_externo:
@@ -47,28 +54,79 @@ def _criar_zip_boletim(nome_xml: str = "PR260112.xml") -> bytes:
     return zip_externo_bytes.getvalue()
 
 
-def test_zip_valido_reconhece_zip_aninhado_com_xml():
-    assert modulo_boletim._zip_valido(_criar_zip_boletim())
+def test_extrair_xml_valido_reconhece_zip_aninhado_com_xml():
+    assert modulo_boletim._extrair_xml_valido(_criar_zip_boletim())
 
 
-def test_zip_valido_rejeita_conteudo_pequeno_ou_ilegivel():
-    assert not modulo_boletim._zip_valido(b"")
-    assert not modulo_boletim._zip_valido(b"x" * 1024)
+def test_extrair_xml_valido_rejeita_conteudo_pequeno_ou_ilegivel():
+    assert not modulo_boletim._extrair_xml_valido(b"")
+    assert not modulo_boletim._extrair_xml_valido(b"x" * 1024)
 
 
-def test_zip_valido_rejeita_zip_interno_sem_xml():
-    assert not modulo_boletim._zip_valido(_criar_zip_boletim(nome_xml="dados.txt"))
+def test_extrair_xml_valido_rejeita_zip_interno_sem_xml():
+    assert not modulo_boletim._extrair_xml_valido(
+        _criar_zip_boletim(nome_xml="dados.txt")
+    )
+
+
+def test_extrair_xml_valido_rejeita_xml_com_crc_incorreto():
+    # Sem compressão, o XML aparece literalmente nos bytes do ZIP
+    conteudo = _criar_zip_boletim(xml_bytes=b"<BizData>abc</BizData>")
+    corrompido = conteudo.replace(b"abc", b"abd")
+
+    assert corrompido != conteudo
+    assert not modulo_boletim._extrair_xml_valido(corrompido)
+
+
+def test_buscar_extrai_xml_uma_vez_por_data(monkeypatch):
+    chamadas = []
+
+    def baixar(data: dt.date, *_args) -> bytes:
+        chamadas.append(data)
+        xml_bytes = _criar_xml_boletim(["DI1F27"], data.isoformat())
+        return _criar_zip_boletim(xml_bytes=xml_bytes)
+
+    monkeypatch.setattr(modulo_boletim, "_baixar_conteudo", baixar)
+
+    df_di1 = modulo_boletim.buscar("08-01-2026", "DI1")
+    df_todos = modulo_boletim.buscar("08-01-2026")
+
+    assert chamadas == [dt.date(2026, 1, 8)]
+    assert df_di1.equals(df_todos)
+
+
+def test_baixar_zip_extrai_xml_uma_vez_com_cache_de_brutos(monkeypatch, tmp_path):
+    cache_brutos = importlib.import_module("pyield._internal.cache_brutos")
+    cache_brutos.configurar(cache_brutos.BackendArquivos(tmp_path))
+    extracoes = []
+    extrair = modulo_boletim._extrair_xml_valido
+
+    def extrair_contando(conteudo_zip: bytes) -> bytes:
+        extracoes.append(conteudo_zip)
+        return extrair(conteudo_zip)
+
+    class Resposta:
+        content = _criar_zip_boletim(xml_bytes=_criar_xml_boletim(["DI1F27"]))
+
+    monkeypatch.setattr(modulo_boletim, "_extrair_xml_valido", extrair_contando)
+    monkeypatch.setattr(
+        modulo_boletim.transporte, "get", lambda *_args, **_kwargs: Resposta()
+    )
+    try:
+        resultado = modulo_boletim.baixar_zip(dt.date(2026, 1, 14), False)
+    finally:
+        cache_brutos.restaurar_padrao()
+
+    assert resultado == Resposta.content
+    assert len(extracoes) == 1
 
 
 def test_baixar_zip_descarta_zip_invalido(monkeypatch):
     class Resposta:
         content = b"x" * 1024
 
-        def raise_for_status(self):
-            pass
-
     monkeypatch.setattr(
-        modulo_boletim._SESSAO, "get", lambda *_args, **_kwargs: Resposta()
+        modulo_boletim.transporte, "get", lambda *_args, **_kwargs: Resposta()
     )
 
     resultado = modulo_boletim.baixar_zip(dt.date(2026, 1, 13), False)
@@ -88,13 +146,6 @@ def _baixar_xml_remoto(data: str) -> bytes:
     return gzip.decompress(resposta.content)
 
 
-@lru_cache(maxsize=8)
-def _baixar_e_parsear_xml_remoto(data: str) -> pl.DataFrame:
-    """Baixa o XML remoto e parseia em DataFrame completo."""
-    xml_bytes = _baixar_xml_remoto(data)
-    return modulo_boletim.ler(xml_bytes)
-
-
 def _parquet_referencia(data: str, contrato: str) -> Path:
     dia, mes, ano = data.split("-")
     return TEST_DATA_DIR / f"boletim_negociacao_{ano}{mes}{dia}_{contrato}.parquet"
@@ -131,11 +182,183 @@ def _parquet_referencia(data: str, contrato: str) -> Path:
 )
 def test_pipeline_bruto_boletim(data: str, contrato: str):
     """Compara saída bruta do boletim de negociacao com parquet canônico."""
-    df_completo = _baixar_e_parsear_xml_remoto(data)
-    df_resultado = modulo_boletim._filtrar_df(
-        df_completo, [contrato], comprimento_ticker=6
+    xml_bytes = _baixar_xml_remoto(data)
+    df_resultado = modulo_boletim.ler(
+        xml_bytes, prefixo_ticker=contrato, comprimento_ticker=6
     )
     df_esperado = pl.read_parquet(_parquet_referencia(data, contrato))
 
     assert_frame_equal(df_resultado, df_esperado, check_exact=True, check_dtypes=True)
 
+
+def _criar_xml_boletim(tickers: list[str], data: str = "2026-01-12") -> bytes:
+    registros = "".join(
+        "<BizGrp><AppHdr /><Document xmlns='urn:bvmf.217.01.xsd'><PricRpt>"
+        f"<TradDt><Dt>{data}</Dt></TradDt>"
+        f"<SctyId><TckrSymb>{ticker}</TckrSymb></SctyId>"
+        f"<FinInstrmAttrbts><OpnIntrst>{i}</OpnIntrst></FinInstrmAttrbts>"
+        "</PricRpt></Document></BizGrp>"
+        for i, ticker in enumerate(tickers)
+    )
+    return f"<BizData>{registros}</BizData>".encode()
+
+
+def test_ler_filtra_tickers_durante_parsing():
+    # Mais registros que o intervalo de limpeza, para exercitar a poda da árvore
+    tickers = ["DI1F27", "DOLG26", "DI1F27C120"] * 400
+    xml_bytes = _criar_xml_boletim(tickers)
+
+    df_completo = modulo_boletim.ler(xml_bytes)
+    df_filtrado = modulo_boletim.ler(
+        xml_bytes, prefixo_ticker="DI1", comprimento_ticker=6
+    )
+
+    assert df_completo.height == len(tickers)
+    esperado = df_completo.filter(pl.col("TckrSymb") == "DI1F27").sort("OpnIntrst")
+    assert esperado["OpnIntrst"].to_list() == list(range(0, len(tickers), 3))
+    assert_frame_equal(df_filtrado.sort("OpnIntrst"), esperado)
+
+
+def test_ler_sem_registros_filtrados_mantem_schema():
+    df = modulo_boletim.ler(_criar_xml_boletim(["DOLG26"]), prefixo_ticker="DI1")
+
+    assert df.is_empty()
+    assert df.schema == modulo_boletim.SCHEMA_PRICE_REPORT
+
+
+def _simular_downloads(monkeypatch) -> list[dt.date]:
+    datas_baixadas = []
+
+    def baixar(data: dt.date, *_args) -> bytes:
+        datas_baixadas.append(data)
+        xml_bytes = _criar_xml_boletim(["DI1F27", "DOLG26"], data.isoformat())
+        return _criar_zip_boletim(xml_bytes=xml_bytes)
+
+    monkeypatch.setattr(modulo_boletim, "_baixar_conteudo", baixar)
+    return datas_baixadas
+
+
+def test_buscar_periodo_concatena_pregoes(monkeypatch):
+    datas_baixadas = _simular_downloads(monkeypatch)
+
+    df = modulo_boletim.buscar_periodo("09-01-2026", "13-01-2026", "DI1", processos=1)
+
+    # Fim de semana fica de fora: sexta, segunda e terça
+    assert sorted(datas_baixadas) == [
+        dt.date(2026, 1, 9),
+        dt.date(2026, 1, 12),
+        dt.date(2026, 1, 13),
+    ]
+    assert df["TradDt"].to_list() == sorted(datas_baixadas)
+    assert df["TckrSymb"].unique().to_list() == ["DI1F27"]
+    assert df.schema == modulo_boletim.SCHEMA_PRICE_REPORT
+
+
+@pytest.mark.parametrize("processos", [1, 2])
+def test_processar_periodo_envia_zip_aos_processos(monkeypatch, processos):
+    conteudo_zip = _criar_zip_boletim(xml_bytes=_criar_xml_boletim(["DI1F27"]))
+    enviados = []
+
+    def baixar(data, boletim_completo, validar):
+        # Como num download novo com cache de brutos: a validação extrai o XML
+        assert validar(conteudo_zip)
+        return conteudo_zip
+
+    def parsear(conteudo, xml_bytes, *_args):
+        enviados.append((conteudo, xml_bytes))
+        return pl.DataFrame()
+
+    monkeypatch.setattr(modulo_boletim, "_baixar_conteudo", baixar)
+    monkeypatch.setattr(modulo_boletim, "_parsear_zip", parsear)
+    # Threads no lugar do pool de processos, que não enxergaria os stubs
+    monkeypatch.setattr(
+        modulo_boletim, "_executor_parsing", lambda _n: ThreadPoolExecutor(1)
+    )
+
+    list(
+        modulo_boletim._processar_periodo(
+            [dt.date(2026, 1, 12)], False, None, None, processos
+        )
+    )
+
+    ((conteudo, xml_bytes),) = enviados
+    assert conteudo == conteudo_zip
+    if processos > 1:
+        assert xml_bytes is None
+    else:
+        assert xml_bytes == modulo_boletim._extrair_xml_valido(conteudo_zip)
+
+
+def test_processar_periodo_limita_pregoes_em_andamento(monkeypatch):
+    datas = yd.du.gerar("02-02-2026", "27-02-2026").to_list()
+    trava = threading.Lock()
+    iniciados = []
+    entregues = []
+    maximo_em_andamento = 0
+
+    def baixar(data, *_args):
+        nonlocal maximo_em_andamento
+        with trava:
+            iniciados.append(data)
+            em_andamento = len(iniciados) - len(entregues)
+            maximo_em_andamento = max(maximo_em_andamento, em_andamento)
+        return _criar_zip_boletim()
+
+    def parsear_lento(*_args):
+        time.sleep(0.01)
+        return pl.DataFrame()
+
+    monkeypatch.setattr(modulo_boletim, "_baixar_conteudo", baixar)
+    monkeypatch.setattr(modulo_boletim, "_parsear_zip", parsear_lento)
+
+    for data, _df in modulo_boletim._processar_periodo(datas, False, None, None, 1):
+        with trava:
+            entregues.append(data)
+
+    limite = modulo_boletim._MAX_DOWNLOADS + 1
+    assert len(datas) > limite
+    assert sorted(entregues) == datas
+    assert maximo_em_andamento == limite
+
+
+def test_buscar_periodo_marca_pregoes_sem_boletim(monkeypatch, tmp_path):
+    datas_baixadas = []
+
+    def baixar(data: dt.date, *_args) -> bytes:
+        datas_baixadas.append(data)
+        # Sem boletim na sexta (09-01) e ainda não publicado "hoje" (13-01)
+        if data in {dt.date(2026, 1, 9), dt.date(2026, 1, 13)}:
+            return b""
+        xml_bytes = _criar_xml_boletim(["DI1F27"], data.isoformat())
+        return _criar_zip_boletim(xml_bytes=xml_bytes)
+
+    monkeypatch.setattr(modulo_boletim, "_baixar_conteudo", baixar)
+    monkeypatch.setattr(modulo_boletim.relogio, "hoje", lambda: dt.date(2026, 1, 13))
+
+    modulo_boletim.buscar_periodo("09-01-2026", "13-01-2026", destino=tmp_path)
+    datas_baixadas.clear()
+    df = modulo_boletim.buscar_periodo("09-01-2026", "13-01-2026", destino=tmp_path)
+
+    assert datas_baixadas == [dt.date(2026, 1, 13)]
+    assert (tmp_path / "TradDt=2026-01-09" / "sem_dados").exists()
+    assert df["TradDt"].unique().to_list() == [dt.date(2026, 1, 12)]
+
+
+def test_buscar_periodo_retoma_de_particoes_gravadas(monkeypatch, tmp_path):
+    datas_baixadas = _simular_downloads(monkeypatch)
+
+    modulo_boletim.buscar_periodo(
+        "09-01-2026", "12-01-2026", destino=tmp_path, processos=1
+    )
+    datas_baixadas.clear()
+    df = modulo_boletim.buscar_periodo(
+        "09-01-2026", "13-01-2026", destino=tmp_path, processos=1
+    )
+
+    assert datas_baixadas == [dt.date(2026, 1, 13)]
+    assert (tmp_path / "TradDt=2026-01-13" / "dados.parquet").exists()
+    assert df["TradDt"].unique().to_list() == [
+        dt.date(2026, 1, 9),
+        dt.date(2026, 1, 12),
+        dt.date(2026, 1, 13),
+    ]
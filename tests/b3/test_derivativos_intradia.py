@@ -1,8 +1,13 @@
+import asyncio
 import datetime as dt
 import importlib
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+import pytest
+
 modulo_derivativos = importlib.import_module("pyield.b3.derivativos_intradia")
 modulo_futuro_intradia = importlib.import_module("pyield.futuro.intradia")
 
@@ -116,3 +121,75 @@ def test_futuro_intradia_filtra_apenas_futuros(monkeypatch):
         len(codigo) == TAMANHO_CODIGO_NEGOCIACAO_FUTURO
         for codigo in resultado["codigo_negociacao"].to_list()
     )
+
+
+@pytest.fixture
+def servidor_intradia(monkeypatch):
+    """Servidor HTTP local que responde com os JSONs de referência da B3."""
+    requisicoes = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # mantém a conexão aberta entre consultas
+
+        def do_GET(self):
+            contrato = self.path.rsplit("/", 1)[-1]
+            caminho = DIRETORIO_DADOS / f"derivativos_intradia_20260310_{contrato}.json"
+            corpo = caminho.read_bytes() if caminho.exists() else b""
+            requisicoes.append((contrato, self.client_address[1]))
+            self.send_response(200 if corpo else 404)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    host, porta = servidor.server_address
+    monkeypatch.setattr(
+        modulo_derivativos,
+        "URL_BASE_INTRADIA",
+        f"http://{host}:{porta}/mds/api/v1/DerivativeQuotation",
+    )
+    # Sem o ttl_cache: respostas do servidor local não podem vazar para
+    # outros testes
+    monkeypatch.setattr(
+        modulo_derivativos,
+        "_buscar_json_intradia",
+        modulo_derivativos._buscar_json_intradia.__wrapped__,
+    )
+    monkeypatch.setattr(modulo_futuro_intradia, "intradia_disponivel", lambda: True)
+    monkeypatch.setattr(modulo_derivativos.relogio, "agora", _horario_referencia_mock)
+    monkeypatch.setattr(
+        modulo_futuro_intradia.du, "ultimo_dia_util", _data_referencia_mock
+    )
+    yield requisicoes
+    servidor.shutdown()
+    servidor.server_close()
+
+
+def test_intradia_varios_equivale_a_chamadas_sequenciais(servidor_intradia):
+    contratos = ["DI1", "DAP", "DDI", "FRC", "DOL", "IND"]
+
+    resultado = asyncio.run(
+        modulo_futuro_intradia.intradia_varios(contratos, max_concorrencia=3)
+    )
+
+    assert list(resultado) == contratos
+    for contrato in contratos:
+        esperado = modulo_futuro_intradia.intradia(contrato)
+        assert not esperado.is_empty()
+        assert resultado[contrato].equals(esperado)
+
+
+def test_intradia_varios_reaproveita_conexoes(servidor_intradia):
+    contratos = ["DI1", "DAP", "DDI", "FRC", "DOL", "IND"]
+    for _ in range(3):
+        asyncio.run(modulo_futuro_intradia.intradia_varios(contratos, 2))
+
+    portas_cliente = {porta for _, porta in servidor_intradia}
+    assert len(servidor_intradia) == len(contratos) * 3
+    # Com no máximo 2 consultas simultâneas, bastam 2 conexões para todas
+    assert len(portas_cliente) <= 2  # noqa: PLR2004
@@ -27,3 +27,21 @@ def test_vna_retorna_decimal_com_escala_da_fonte(
 
 def test_vna_nulo_retorna_decimal_nan() -> None:
     assert lft.vna(None).is_nan()
+
+
+def test_vna_serie_busca_cada_data_uma_vez(monkeypatch: pytest.MonkeyPatch) -> None:
+    chamadas = []
+
+    def baixar_texto(data):
+        chamadas.append(data)
+        return TEXTO_BCB
+
+    monkeypatch.setattr(lft, "_baixar_texto", baixar_texto)
+
+    # 01-06-2024 é sábado: não é data de referência válida
+    resultado = lft.vna_serie(["31-05-2024", None, "01-06-2024", "31-05-2024"])
+
+    assert len(chamadas) == 1
+    assert resultado.columns == ["data", "vna"]
+    assert resultado["vna"].to_list()[::3] == [14903.01148] * 2
+    assert resultado["vna"][1:3].is_nan().all()
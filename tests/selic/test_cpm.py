@@ -9,6 +9,8 @@ from pathlib import Path
 
 import polars as pl
 import pytest
+import requests
+from polars.testing import assert_frame_equal
 
 import pyield.selic.cpm as modulo_cpm
 from pyield import du
@@ -186,3 +188,65 @@ def test_spot_bdays_to_exp_cpmk25(cpm_fixture):
         .item()
     )
     assert dias_uteis == DIAS_UTEIS_CPMK25
+
+
+# ── Período (_dados_periodo) ─────────────────────────────────────────────
+
+
+def _simular_cpm(monkeypatch, pregoes: dict[datetime.date, list[str]]) -> None:
+    """Substitui SPR, preços de ajuste e calendário por dados sintéticos."""
+
+    def boletim_do_dia(data: datetime.date, **_) -> pl.DataFrame:
+        if data not in pregoes:
+            raise requests.HTTPError(f"SPR indisponível para {data}")
+        return pl.DataFrame({"TradDt": [data] * 2, "TckrSymb": pregoes[data]})
+
+    def precos_do_dia(data: datetime.date) -> pl.DataFrame:
+        return pl.DataFrame(
+            {"codigo_negociacao": pregoes[data][:1], "preco_ajuste": [data.day / 100]}
+        )
+
+    calendario = pl.DataFrame(
+        {
+            "_mes_reuniao": [1, 3],
+            "_ano_reuniao": [2025, 2025],
+            "data_fim_reuniao": [
+                datetime.date(2025, 1, 29),
+                datetime.date(2025, 3, 19),
+            ],
+            "data_expiracao": [datetime.date(2025, 1, 30), datetime.date(2025, 3, 20)],
+        },
+        schema_overrides={"_mes_reuniao": pl.Int32, "_ano_reuniao": pl.Int32},
+    )
+    monkeypatch.setattr(modulo_cpm.boletim, "buscar", boletim_do_dia)
+    monkeypatch.setattr(modulo_cpm, "_fetch_settlement_prices", precos_do_dia)
+    monkeypatch.setattr(modulo_cpm, "_calendario", lambda: calendario)
+
+
+def test_dados_periodo_equivale_a_data_por_pregao(monkeypatch):
+    pregoes = {
+        datetime.date(2025, 1, 28): ["CPMF25C100000", "CPMH25P099500"],
+        datetime.date(2025, 1, 29): ["CPMH25C100000", "CPMF25C099750"],
+    }
+    _simular_cpm(monkeypatch, pregoes)
+
+    resultado = modulo_cpm._dados_periodo("28-01-2025", "29-01-2025")
+
+    esperado = pl.concat(modulo_cpm.data(d) for d in pregoes)
+    assert_frame_equal(resultado, esperado)
+    assert resultado["preco_ajuste"].null_count() == 2  # noqa: PLR2004
+
+
+def test_dados_periodo_descarta_apenas_pregao_com_falha(monkeypatch):
+    # Sem SPR para 28-01: o download desse pregão falha com HTTPError
+    pregoes = {
+        datetime.date(2025, 1, 27): ["CPMF25C100000", "CPMH25P099500"],
+        datetime.date(2025, 1, 29): ["CPMH25C100000", "CPMF25C099750"],
+    }
+    _simular_cpm(monkeypatch, pregoes)
+
+    resultado = modulo_cpm._dados_periodo("27-01-2025", "29-01-2025")
+
+    assert resultado["data_referencia"].unique().sort().to_list() == list(pregoes)
+    esperado = pl.concat(modulo_cpm.data(d) for d in pregoes)
+    assert_frame_equal(resultado, esperado)
@@ -242,3 +242,54 @@ def test_raw_prob_equals_settlement_over_100_when_rate_zero(cpm_patchado):
     diferenca = (df["prob_bruta"] - esperado).abs().max()
     assert isinstance(diferenca, float)
     assert diferenca < TOLERANCIA_NUMERICA
+
+
+# ── historico() ───────────────────────────────────────────────────────────
+
+
+def test_historico_equivale_a_all_meetings_por_data(monkeypatch, cpm_fixture):
+    """Painel de duas datas: o dia 30 já não negocia a reunião de janeiro."""
+    dia_seguinte = cpm_fixture.filter(
+        pl.col("data_expiracao") > datetime.date(2025, 1, 30)
+    ).with_columns(
+        data_referencia=pl.lit(datetime.date(2025, 1, 30)),
+        preco_ajuste=pl.col("preco_ajuste") * 0.9,
+    )
+    painel = pl.concat([cpm_fixture, dia_seguinte])
+    por_data = {
+        d: painel.filter(pl.col("data_referencia") == d)
+        for d in (
+            datetime.date(2025, 1, 29),
+            datetime.date(2025, 1, 30),
+        )
+    }
+    monkeypatch.setattr(modulo_cpm, "_dados_periodo", lambda *_: painel)
+    monkeypatch.setattr(modulo_cpm, "data", lambda data: por_data[data])
+    chamadas = []
+
+    def interpolar_taxas(*, datas_referencia, datas_vencimento, **_):
+        chamadas.append(datas_referencia.n_unique())
+        prazos = (datas_vencimento - datas_referencia).dt.total_days()
+        return (0.12 + prazos / 1e5).alias("taxa_interpolada")
+
+    monkeypatch.setattr(modulo_probabilidades.di1, "interpolar_taxas", interpolar_taxas)
+
+    df = modulo_probabilidades.historico("29-01-2025", "30-01-2025")
+
+    esperado = pl.concat(modulo_probabilidades.all_meetings(data) for data in por_data)
+    assert df.equals(esperado)
+    # Uma chamada com as duas datas no histórico e uma por data no esperado
+    assert chamadas == [2, 1, 1]
+    assert df["taxa_di1"].min() > 0.12  # noqa: PLR2004
+    assert df.group_by("data_referencia").agg(pl.col("ranking_reuniao").min())[
+        "ranking_reuniao"
+    ].to_list() == [1, 1]
+
+
+def test_historico_empty_input(monkeypatch):
+    monkeypatch.setattr(
+        modulo_cpm, "_dados_periodo", lambda *_: modulo_cpm._empty_schema()
+    )
+    resultado = modulo_probabilidades.historico("01-01-2025", "31-01-2025")
+    assert resultado.is_empty()
+    assert resultado.columns == modulo_probabilidades._empty_schema().columns
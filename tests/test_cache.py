@@ -0,0 +1,132 @@
+import importlib
+import threading
+import time
+
+import polars as pl
+import pytest
+
+cache = importlib.import_module("pyield._internal.cache")
+
+
+def _contador_chamadas(**opcoes):
+    chamadas = []
+
+    @cache.ttl_cache(**opcoes)
+    def buscar(*args, **kwargs):
+        chamadas.append((args, kwargs))
+        return len(chamadas)
+
+    return buscar, chamadas
+
+
+def test_descarta_a_entrada_usada_ha_mais_tempo():
+    buscar, chamadas = _contador_chamadas(maxsize=2)
+    buscar("a")
+    buscar("b")
+    buscar("a")  # "a" passa a ser a mais recente
+    buscar("c")  # descarta "b"
+
+    buscar("a")
+    buscar("b")
+
+    assert [args for args, _ in chamadas] == [("a",), ("b",), ("c",), ("b",)]
+    assert buscar.cache_info().descartes == 2  # noqa: PLR2004
+
+
+def test_entrada_expira_apos_ttl(monkeypatch):
+    agora = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: agora[0])
+    buscar, chamadas = _contador_chamadas(ttl=10)
+
+    buscar("a")
+    agora[0] += 9
+    buscar("a")
+    agora[0] += 2
+    buscar("a")
+
+    assert len(chamadas) == 2  # noqa: PLR2004
+
+
+def test_orcamento_de_bytes():
+    @cache.ttl_cache(max_bytes=2_500)
+    def baixar(tamanho: int) -> bytes:
+        return b"x" * tamanho
+
+    baixar(1_000)
+    baixar(1_001)
+    baixar(1_002)  # excede o orçamento: descarta a primeira entrada
+    baixar(5_000)  # maior que o orçamento: não é guardado
+
+    info = baixar.cache_info()
+    assert info.tamanho == 2  # noqa: PLR2004
+    assert info.bytes == 2_003  # noqa: PLR2004
+    assert info.descartes == 1
+
+
+def test_argumentos_nao_hasheaveis_viram_chave():
+    buscar, chamadas = _contador_chamadas()
+
+    buscar(["DI1", "DAP"], filtros={"vencimentos": [2027, 2028]})
+    buscar(["DI1", "DAP"], filtros={"vencimentos": [2027, 2028]})
+    buscar(pl.Series("datas", [1, 2, 3]))
+    buscar(pl.Series("datas", [1, 2, 3]))
+    buscar(pl.Series("datas", [1, 2, 4]))
+
+    assert len(chamadas) == 3  # noqa: PLR2004
+
+
+def test_chamadas_simultaneas_fazem_uma_unica_busca():
+    chamadas = []
+    liberar = threading.Event()
+
+    @cache.ttl_cache()
+    def buscar(chave: str) -> str:
+        chamadas.append(chave)
+        liberar.wait(timeout=5)
+        return chave.upper()
+
+    resultados = []
+    threads = [
+        threading.Thread(target=lambda: resultados.append(buscar("di1")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    liberar.set()
+    for thread in threads:
+        thread.join()
+
+    assert chamadas == ["di1"]
+    assert resultados == ["DI1"] * 8
+    info = buscar.cache_info()
+    assert (info.acertos, info.falhas) == (7, 1)
+
+
+def test_erro_e_repassado_e_nao_fica_em_cache():
+    tentativas = []
+
+    @cache.ttl_cache()
+    def buscar(chave: str) -> str:
+        tentativas.append(chave)
+        if len(tentativas) == 1:
+            raise ConnectionError("falha transitória")
+        return chave
+
+    with pytest.raises(ConnectionError):
+        buscar("a")
+    assert buscar("a") == "a"
+    assert len(tentativas) == 2  # noqa: PLR2004
+
+
+def test_cache_clear_zera_entradas_e_contadores():
+    buscar, chamadas = _contador_chamadas()
+    buscar("a")
+    buscar("a")
+
+    buscar.cache_clear()
+    buscar("a")
+
+    assert len(chamadas) == 2  # noqa: PLR2004
+    info = buscar.cache_info()
+    assert (info.acertos, info.falhas, info.tamanho) == (0, 1, 1)
@@ -0,0 +1,183 @@
+import datetime as dt
+import importlib
+
+import pytest
+
+cache_brutos = importlib.import_module("pyield._internal.cache_brutos")
+
+HOJE = dt.date(2026, 3, 10)
+ONTEM = dt.date(2026, 3, 9)
+
+
+@pytest.fixture(params=["arquivos", "sqlite"])
+def backend(request, tmp_path, monkeypatch):
+    if request.param == "sqlite":
+        backend = cache_brutos.BackendSQLite(tmp_path / "brutos.sqlite3")
+    else:
+        backend = cache_brutos.BackendArquivos(tmp_path / "brutos")
+    monkeypatch.setattr(cache_brutos.relogio, "hoje", lambda: HOJE)
+    cache_brutos.configurar(backend, ttl_hoje=60)
+    yield backend
+    cache_brutos.restaurar_padrao()
+
+
+class _Fonte:
+    """Simula downloads e conta quantas vezes a rede seria acessada."""
+
+    def __init__(self, conteudo: bytes = b"conteudo bruto"):
+        self.conteudo = conteudo
+        self.downloads = 0
+
+    def __call__(self) -> bytes:
+        self.downloads += 1
+        return self.conteudo
+
+
+def _avancar_relogio(monkeypatch, segundos: float) -> None:
+    agora = cache_brutos.time.time() + segundos
+    monkeypatch.setattr(cache_brutos.time, "time", lambda: agora)
+
+
+def test_data_passada_nunca_expira(backend, monkeypatch):
+    fonte = _Fonte()
+    cache_brutos.buscar("anbima_taxas", ONTEM, fonte)
+    _avancar_relogio(monkeypatch, 365 * 86_400)
+
+    assert cache_brutos.buscar("anbima_taxas", ONTEM, fonte) == fonte.conteudo
+    assert fonte.downloads == 1
+
+
+@pytest.mark.parametrize("data", [HOJE, None])
+def test_dados_de_hoje_expiram_apos_ttl(backend, monkeypatch, data):
+    fonte = _Fonte()
+    cache_brutos.buscar("b3_boletim", data, fonte)
+    cache_brutos.buscar("b3_boletim", data, fonte)
+    assert fonte.downloads == 1
+
+    _avancar_relogio(monkeypatch, 61)
+    cache_brutos.buscar("b3_boletim", data, fonte)
+
+    assert fonte.downloads == 2  # noqa: PLR2004
+
+
+def test_chave_separa_fonte_data_e_variante(backend):
+    fonte = _Fonte()
+    cache_brutos.buscar("b3_boletim", ONTEM, fonte, variante="SPRD")
+    cache_brutos.buscar("b3_boletim", ONTEM, fonte, variante="PR")
+    cache_brutos.buscar("b3_boletim", dt.date(2026, 3, 6), fonte, variante="PR")
+    cache_brutos.buscar("anbima_taxas", ONTEM, fonte)
+
+    assert fonte.downloads == 4  # noqa: PLR2004
+    # Conteúdo idêntico é guardado uma única vez
+    assert backend.tamanho_total() == len(fonte.conteudo)
+
+
+def test_conteudo_vazio_ou_invalido_nao_e_guardado(backend):
+    vazia = _Fonte(b"")
+    cache_brutos.buscar("b3_boletim", ONTEM, vazia)
+    cache_brutos.buscar("b3_boletim", ONTEM, vazia)
+
+    invalida = _Fonte(b"<html>manutencao</html>")
+    for _ in range(2):
+        resultado = cache_brutos.buscar(
+            "tesouro_vna", ONTEM, invalida, validar=lambda c: c.startswith(b"PK")
+        )
+
+    assert resultado == invalida.conteudo
+    assert (vazia.downloads, invalida.downloads) == (2, 2)
+    assert backend.entradas() == []
+
+
+def test_limite_de_tamanho_descarta_menos_recente(backend, monkeypatch):
+    cache_brutos.configurar(backend, bytes_maximo=25)
+    fontes = {dia: _Fonte(bytes([dia]) * 10) for dia in (2, 3, 4)}
+    instante = [1_000.0]
+    monkeypatch.setattr(cache_brutos.time, "time", lambda: instante[0])
+
+    def buscar(dia: int) -> None:
+        instante[0] += 1
+        cache_brutos.buscar("anbima_taxas", dt.date(2026, 3, dia), fontes[dia])
+
+    buscar(2)
+    buscar(3)
+    buscar(2)  # o dia 3 passa a ser o menos recente
+    buscar(4)  # excede o limite: descarta o dia 3
+
+    chaves = sorted(e.chave for e in backend.entradas())
+    assert chaves == ["anbima_taxas/2026-03-02/", "anbima_taxas/2026-03-04/"]
+    assert backend.tamanho_total() == 20  # noqa: PLR2004
+
+
+def test_entrada_regravada_libera_conteudo_anterior(backend, monkeypatch):
+    cache_brutos.buscar("b3_boletim", HOJE, _Fonte(b"manha"))
+    cache_brutos.buscar("b3_boletim", ONTEM, _Fonte(b"ontem"))
+    _avancar_relogio(monkeypatch, 61)
+    cache_brutos.buscar("b3_boletim", HOJE, _Fonte(b"fechamento"))
+
+    assert backend.tamanho_total() == len(b"ontem") + len(b"fechamento")
+    backend.remover("b3_boletim/2026-03-09/")
+    backend.remover("b3_boletim/2026-03-10/")
+    assert backend.tamanho_total() == 0
+
+
+@pytest.mark.parametrize(
+    "criar",
+    [
+        lambda d: cache_brutos.BackendArquivos(d / "brutos"),
+        lambda d: cache_brutos.BackendSQLite(d / "brutos.sqlite3"),
+    ],
+)
+def test_nova_instancia_reconstroi_tamanho_total(tmp_path, criar):
+    backend = criar(tmp_path)
+    backend.gravar("a", b"12345", "d1")
+    backend.gravar("b", b"12345", "d1")
+    backend.gravar("c", b"123", "d2")
+
+    reaberto = criar(tmp_path)
+    assert reaberto.tamanho_total() == 8  # noqa: PLR2004
+    reaberto.remover("a")
+    assert reaberto.tamanho_total() == 8  # noqa: PLR2004
+    reaberto.remover("b")
+    assert reaberto.tamanho_total() == 3  # noqa: PLR2004
+
+
+def test_conteudo_corrompido_e_baixado_de_novo(tmp_path, monkeypatch):
+    backend = cache_brutos.BackendArquivos(tmp_path)
+    cache_brutos.configurar(backend)
+    monkeypatch.setattr(cache_brutos.relogio, "hoje", lambda: HOJE)
+    fonte = _Fonte()
+    try:
+        cache_brutos.buscar("anbima_taxas", ONTEM, fonte)
+        (objeto,) = (tmp_path / "objetos").glob("*/*")
+        objeto.write_bytes(b"corrompido")
+
+        assert cache_brutos.buscar("anbima_taxas", ONTEM, fonte) == fonte.conteudo
+        assert cache_brutos.buscar("anbima_taxas", ONTEM, fonte) == fonte.conteudo
+        assert fonte.downloads == 2  # noqa: PLR2004
+    finally:
+        cache_brutos.restaurar_padrao()
+
+
+@pytest.mark.parametrize(
+    ("tipo", "caminho"), [("", "brutos/entradas"), ("sqlite", "brutos.sqlite3")]
+)
+def test_ativado_por_variaveis_de_ambiente(tmp_path, monkeypatch, tipo, caminho):
+    monkeypatch.setenv("PYIELD_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("PYIELD_CACHE_BACKEND", tipo)
+    fonte = _Fonte()
+
+    cache_brutos.buscar("anbima_taxas", ONTEM, fonte)
+    cache_brutos.buscar("anbima_taxas", ONTEM, fonte)
+
+    assert fonte.downloads == 1
+    assert (tmp_path / caminho).exists()
+
+
+def test_sem_cache_configurado_sempre_baixa(monkeypatch):
+    monkeypatch.delenv("PYIELD_CACHE_DIR", raising=False)
+    fonte = _Fonte()
+
+    cache_brutos.buscar("anbima_taxas", ONTEM, fonte)
+    cache_brutos.buscar("anbima_taxas", ONTEM, fonte)
+
+    assert fonte.downloads == 2  # noqa: PLR2004
@@ -0,0 +1,104 @@
+import datetime as dt
+from collections.abc import Callable
+
+import polars as pl
+
+from pyield import relogio
+from pyield.futuro import IntradiaColetor
+from pyield.futuro import coletor as modulo_coletor
+
+INICIO = dt.datetime(2026, 3, 10, 10, 0)
+
+
+def _cotacoes(taxas: list[float], negocios: list[int]) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "codigo_negociacao": ["DI1F27", "DI1F28", "DI1F29"][: len(taxas)],
+            "numero_negocios": negocios,
+            "volume_negociado": [n * 10 for n in negocios],
+            "taxa_ultima": taxas,
+        }
+    )
+
+
+def _simular(monkeypatch, cotacoes: list[pl.DataFrame]) -> Callable[[], None]:
+    """Cada rodada de coleta devolve a próxima cotação, um minuto depois."""
+    horarios = [
+        (INICIO + dt.timedelta(minutes=i)).replace(tzinfo=relogio.BR_TZ)
+        for i in range(len(cotacoes))
+    ]
+    restantes = list(zip(horarios, cotacoes, strict=True))
+    atual = {}
+
+    def agora() -> dt.datetime:
+        return atual.get("horario", horarios[-1])
+
+    def intradia(_contrato: str) -> pl.DataFrame:
+        return atual["cotacoes"]
+
+    def proxima_rodada() -> None:
+        atual["horario"], atual["cotacoes"] = restantes.pop(0)
+
+    monkeypatch.setattr(modulo_coletor.relogio, "agora", agora)
+    monkeypatch.setattr(modulo_coletor, "intradia", intradia)
+    return proxima_rodada
+
+
+def test_coletor_grava_apenas_linhas_alteradas(monkeypatch, tmp_path):
+    proxima_rodada = _simular(
+        monkeypatch,
+        [
+            _cotacoes([0.14, 0.13], [5, 3]),
+            _cotacoes([0.14, 0.13], [5, 3]),
+            _cotacoes([0.141, 0.13, 0.12], [6, 3, 1]),
+        ],
+    )
+    coletor = IntradiaColetor("DI1", tmp_path)
+
+    gravadas = []
+    for _ in range(3):
+        proxima_rodada()
+        gravadas.append(coletor.coletar())
+
+    assert gravadas == [2, 0, 2]
+    serie = coletor.serie("DI1F27", inicio=INICIO)
+    assert serie["taxa_ultima"].to_list() == [0.14, 0.141]
+    assert serie["horario_coleta"].to_list() == [
+        INICIO,
+        INICIO + dt.timedelta(minutes=2),
+    ]
+
+
+def test_snapshot_reconstroi_estado_no_horario(monkeypatch, tmp_path):
+    proxima_rodada = _simular(
+        monkeypatch,
+        [
+            _cotacoes([0.14, 0.13], [5, 3]),
+            _cotacoes([0.141, 0.13], [6, 3]),
+        ],
+    )
+    coletor = IntradiaColetor(["DI1"], tmp_path)
+    for _ in range(2):
+        proxima_rodada()
+        coletor.coletar()
+
+    antes = coletor.snapshot(INICIO + dt.timedelta(seconds=30))
+    depois = coletor.snapshot(INICIO + dt.timedelta(minutes=1))
+
+    assert antes["taxa_ultima"].to_list() == [0.14, 0.13]
+    assert depois["taxa_ultima"].to_list() == [0.141, 0.13]
+    assert depois["codigo_negociacao"].to_list() == ["DI1F27", "DI1F28"]
+
+
+def test_novo_coletor_retoma_diff_do_log(monkeypatch, tmp_path):
+    proxima_rodada = _simular(
+        monkeypatch,
+        [_cotacoes([0.14, 0.13], [5, 3]), _cotacoes([0.14, 0.131], [5, 4])],
+    )
+    proxima_rodada()
+    IntradiaColetor("DI1", tmp_path).coletar()
+
+    proxima_rodada()
+    gravadas = IntradiaColetor("DI1", tmp_path).coletar()
+
+    assert gravadas == 1
@@ -0,0 +1,239 @@
+import datetime as dt
+import importlib
+import io
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from pyield import futuro
+
+data_cache = importlib.import_module("pyield._internal.data_cache")
+
+
+class _ServidorArquivos(BaseHTTPRequestHandler):
+    """Servidor local que imita o GitHub Releases com suporte a ETag."""
+
+    arquivos: dict[str, tuple[bytes, str]] = {}
+    requisicoes: list[tuple[str, int]] = []
+
+    def do_GET(self):
+        nome = self.path.rsplit("/", 1)[-1]
+        if nome not in self.arquivos:
+            self._responder(HTTPStatus.NOT_FOUND)
+            return
+        conteudo, etag = self.arquivos[nome]
+        if self.headers.get("If-None-Match") == etag:
+            self._responder(HTTPStatus.NOT_MODIFIED, etag=etag)
+            return
+        self._responder(HTTPStatus.OK, conteudo, etag)
+
+    def _responder(self, status: int, conteudo: bytes = b"", etag: str = ""):
+        self.requisicoes.append((self.path, status))
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", "Thu, 01 Jan 2026 00:00:00 GMT")
+        self.send_header("Content-Length", str(len(conteudo)))
+        self.end_headers()
+        self.wfile.write(conteudo)
+
+    def log_message(self, *args):
+        pass
+
+
+def _parquet(df: pl.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.write_parquet(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def servidor(monkeypatch, tmp_path):
+    _ServidorArquivos.arquivos = {}
+    _ServidorArquivos.requisicoes = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _ServidorArquivos)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        data_cache, "URL_BASE", f"http://127.0.0.1:{httpd.server_port}/download"
+    )
+    monkeypatch.setenv(data_cache.VARIAVEL_DIRETORIO_CACHE, str(tmp_path))
+    data_cache.limpar_datasets_em_memoria()
+    yield _ServidorArquivos
+    data_cache.limpar_datasets_em_memoria()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _novo_processo(monkeypatch, dia: str) -> None:
+    """Simula um novo processo: cache em memória vazio e data corrente."""
+    data_cache.limpar_datasets_em_memoria()
+    monkeypatch.setattr(data_cache, "_obter_chave_data_hoje", lambda: dia)
+
+
+def test_cache_em_disco_revalida_com_get_condicional(servidor, monkeypatch, tmp_path):
+    df = pl.DataFrame({"data_referencia": [1, 2], "valor": [0.1, 0.2]})
+    servidor.arquivos["anbima_tpf.parquet"] = (_parquet(df), '"v1"')
+
+    _novo_processo(monkeypatch, "2026-01-02")
+    assert_frame_equal(data_cache.obter_dataset_cacheado("tpf"), df)
+    assert (tmp_path / "anbima_tpf.parquet").exists()
+    assert servidor.requisicoes[-1][1] == HTTPStatus.OK
+
+    # Mesmo dia, outro processo: usa o disco sem tocar a rede
+    _novo_processo(monkeypatch, "2026-01-02")
+    assert_frame_equal(data_cache.obter_dataset_cacheado("tpf"), df)
+    assert len(servidor.requisicoes) == 1
+
+    # Dia seguinte: revalida e recebe 304, sem baixar de novo
+    _novo_processo(monkeypatch, "2026-01-03")
+    assert_frame_equal(data_cache.obter_dataset_cacheado("tpf"), df)
+    assert servidor.requisicoes[-1][1] == HTTPStatus.NOT_MODIFIED
+
+
+def test_cache_em_disco_baixa_de_novo_quando_arquivo_muda(servidor, monkeypatch):
+    df_antigo = pl.DataFrame({"data_referencia": [1], "valor": [0.1]})
+    df_novo = pl.DataFrame({"data_referencia": [1, 2], "valor": [0.1, 0.3]})
+    servidor.arquivos["b3_futures.parquet"] = (_parquet(df_antigo), '"v1"')
+
+    _novo_processo(monkeypatch, "2026-01-02")
+    assert_frame_equal(data_cache.obter_dataset_cacheado("futuro"), df_antigo)
+
+    servidor.arquivos["b3_futures.parquet"] = (_parquet(df_novo), '"v2"')
+    _novo_processo(monkeypatch, "2026-01-03")
+    assert_frame_equal(data_cache.obter_dataset_cacheado("futuro"), df_novo)
+    assert [status for _, status in servidor.requisicoes] == [
+        HTTPStatus.OK,
+        HTTPStatus.OK,
+    ]
+
+
+def test_cache_em_disco_usa_copia_local_se_revalidacao_falhar(servidor, monkeypatch):
+    df = pl.DataFrame({"data_referencia": [1], "valor": [0.1]})
+    servidor.arquivos["anbima_tpf.parquet"] = (_parquet(df), '"v1"')
+
+    _novo_processo(monkeypatch, "2026-01-02")
+    data_cache.obter_dataset_cacheado("tpf")
+
+    # Arquivo removido do servidor (404 não é transitório, sem retry)
+    servidor.arquivos.clear()
+    _novo_processo(monkeypatch, "2026-01-03")
+    assert_frame_equal(data_cache.obter_dataset_cacheado("tpf"), df)
+    assert servidor.requisicoes[-1][1] == HTTPStatus.NOT_FOUND
+
+
+def test_dataset_lazy_varre_o_parquet_em_disco(servidor, monkeypatch, tmp_path):
+    df = pl.DataFrame({"data_referencia": [1, 2, 3], "valor": [0.1, 0.2, 0.3]})
+    servidor.arquivos["anbima_tpf.parquet"] = (_parquet(df), '"v1"')
+    _novo_processo(monkeypatch, "2026-01-02")
+
+    filtro = pl.col("data_referencia").is_in([2])
+    lf = data_cache.obter_dataset_lazy("tpf")
+    resultado = lf.filter(filtro).collect()
+
+    assert str(tmp_path / "anbima_tpf.parquet") in lf.explain()
+    assert_frame_equal(resultado, df.filter(filtro))
+    # Dataset completo nunca foi materializado em memória
+    assert data_cache.memoria_datasets() == {}
+
+
+def test_dataset_em_memoria_e_compartilhado_e_contabilizado(servidor, monkeypatch):
+    df = pl.DataFrame({"data_referencia": [1, 2], "valor": [0.1, 0.2]})
+    servidor.arquivos["anbima_tpf.parquet"] = (_parquet(df), '"v1"')
+
+    _novo_processo(monkeypatch, "2026-01-02")
+    primeiro = data_cache.obter_dataset_cacheado("tpf")
+    assert data_cache.obter_dataset_cacheado("tpf") is primeiro
+    assert data_cache.memoria_datasets() == {"tpf": primeiro.estimated_size()}
+
+    # Virada do dia no mesmo processo: a versão anterior deixa de ser retida
+    monkeypatch.setattr(data_cache, "_obter_chave_data_hoje", lambda: "2026-01-03")
+    segundo = data_cache.obter_dataset_cacheado("tpf")
+    assert segundo is not primeiro
+    assert data_cache.memoria_datasets() == {"tpf": segundo.estimated_size()}
+
+
+def test_falha_na_recarga_mantem_versao_anterior(servidor, monkeypatch):
+    df = pl.DataFrame({"data_referencia": [1, 2], "valor": [0.1, 0.2]})
+    servidor.arquivos["anbima_tpf.parquet"] = (_parquet(df), '"v1"')
+    _novo_processo(monkeypatch, "2026-01-02")
+    primeiro = data_cache.obter_dataset_cacheado("tpf")
+
+    def falhar(*_args):
+        raise ConnectionError
+
+    monkeypatch.setattr(data_cache, "_carregar_dataset", falhar)
+    monkeypatch.setattr(data_cache, "_obter_chave_data_hoje", lambda: "2026-01-03")
+    with pytest.raises(ConnectionError):
+        data_cache.obter_dataset_cacheado("tpf")
+
+    assert data_cache.memoria_datasets() == {"tpf": primeiro.estimated_size()}
+
+
+def test_carga_de_um_dataset_nao_bloqueia_os_demais(monkeypatch):
+    data_cache.limpar_datasets_em_memoria()
+    iniciou, liberar = threading.Event(), threading.Event()
+    df = pl.DataFrame({"data_referencia": [1]})
+
+    def carregar(id_dataset: str, _chave_data: str) -> pl.DataFrame:
+        if id_dataset == "tpf":
+            iniciou.set()
+            liberar.wait(timeout=5)
+        return df
+
+    monkeypatch.setattr(data_cache, "_carregar_dataset", carregar)
+    lenta = threading.Thread(target=data_cache.obter_dataset_cacheado, args=("tpf",))
+    lenta.start()
+    try:
+        assert iniciou.wait(timeout=5)
+        assert data_cache.obter_dataset_cacheado("futuro") is df
+        # A carga do TPF ainda estava em andamento
+        assert lenta.is_alive()
+    finally:
+        liberar.set()
+        lenta.join()
+        data_cache.limpar_datasets_em_memoria()
+
+
+def _pr_bruto() -> pl.DataFrame:
+    """Price Report mínimo com dois pregões, DI1 e DOL."""
+    datas = [dt.date(2024, 5, 29)] * 3 + [dt.date(2024, 5, 31)] * 3
+    tickers = ["DI1N24", "DI1F25", "DOLN24"] * 2
+    n = len(datas)
+    return pl.DataFrame(
+        {
+            "TradDt": datas,
+            "TckrSymb": tickers,
+            "OpnIntrst": [100] * n,
+            "TradQty": [10] * n,
+            "FinInstrmQty": [5] * n,
+            "NtlFinVol": [1e6] * n,
+            "BestBidPric": [10.40, 10.50, 5200.0] * 2,
+            "BestAskPric": [10.42, 10.52, 5201.0] * 2,
+            "FrstPric": [10.41, 10.51, 5200.5] * 2,
+            "MinPric": [10.40, 10.50, 5200.0] * 2,
+            "MaxPric": [10.42, 10.52, 5201.0] * 2,
+            "TradAvrgPric": [10.41, 10.51, 5200.5] * 2,
+            "LastPric": [10.41, 10.51, 5200.5] * 2,
+            "AdjstdQt": [99_000.0, 95_000.0, 5200.5] * 2,
+            "AdjstdQtTax": [10.41, 10.51, None] * 2,
+            "MaxTradLmt": [11.0, 11.0, 5400.0] * 2,
+            "MinTradLmt": [10.0, 10.0, 5000.0] * 2,
+        }
+    )
+
+
+def test_historico_futuro_lazy_equivale_a_versao_eager(servidor, monkeypatch):
+    servidor.arquivos["b3_futures.parquet"] = (_parquet(_pr_bruto()), '"v1"')
+    _novo_processo(monkeypatch, "2026-01-02")
+
+    lf = futuro.historico_lazy("DI1", inicio="31-05-2024")
+    resultado = lf.collect()
+
+    assert isinstance(lf, pl.LazyFrame)
+    assert_frame_equal(resultado, futuro.historico("31-05-2024", "DI1"))
+    assert resultado["codigo_negociacao"].to_list() == ["DI1N24", "DI1F25"]
@@ -96,3 +96,34 @@ def test_limites_inclusivos_gerar(
     )
 
     assert resultado.to_list() == datas_esperadas
+
+
+def _pares_datas() -> pl.DataFrame:
+    # Datas em torno da transição de calendário, incluindo fins de semana,
+    # feriados e pares com inicio posterior ao fim
+    datas = pl.date_range(dt.date(2023, 10, 1), dt.date(2024, 2, 29), eager=True)
+    return pl.DataFrame({"inicio": datas, "fim": datas.reverse()}).with_columns(
+        deslocamento=pl.int_range(pl.len()) % 61 - 30
+    )
+
+
+@pytest.mark.parametrize("calendario", ["auto", "anterior", "atual"])
+@pytest.mark.parametrize("ajuste", ["seguinte", "anterior"])
+def test_motor_indice_equivale_ao_polars(calendario: str, ajuste: str) -> None:
+    df = _pares_datas()
+
+    def calcular(motor: str) -> pl.DataFrame:
+        return df.select(
+            contagem=du.contar_expr("inicio", "fim", calendario, motor),
+            data_deslocada=du.deslocar_expr(
+                "inicio", "deslocamento", ajuste, calendario, motor
+            ),
+        )
+
+    assert calcular("indice").equals(calcular("polars"))
+
+
+def test_motor_indice_fora_do_intervalo_resulta_em_nulo() -> None:
+    assert du.contar("01-01-1989", "01-01-2024", motor="indice") is None
+    assert du.deslocar("31-12-2100", 5, motor="indice") is None
+    assert du.deslocar("02-01-2024", 1, motor="indice") == dt.date(2024, 1, 3)
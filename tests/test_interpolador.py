@@ -1,3 +1,6 @@
+import math
+
+import polars as pl
 import pytest
 
 from pyield import Interpolador
@@ -6,3 +9,40 @@ from pyield import Interpolador
 def test_interpolador_rejeita_curva_sem_vertices_validos():
     with pytest.raises(ValueError, match="ao menos um vértice válido"):
         Interpolador([1, 2], [None, float("nan")], "flat_forward")
+
+
+@pytest.mark.parametrize("metodo", ["flat_forward", "linear"])
+@pytest.mark.parametrize("extrapolar", [False, True])
+def test_interpolar_expr_equivale_ao_escalar(metodo, extrapolar):
+    dus = [1, 21, 63, 126, 252, 504, 1260]
+    taxas = [0.1425, 0.1431, 0.1418, 0.1392, 0.1355, 0.1321, 0.1298]
+    interp = Interpolador(dus, taxas, metodo, extrapolar=extrapolar)
+    alvos = [-3, 0, *range(1, 1300, 7), 1260, None]
+
+    resultado = pl.DataFrame({"du": alvos}).select(taxa=interp.interpolar_expr("du"))[
+        "taxa"
+    ]
+
+    for du, taxa in zip(alvos, resultado, strict=True):
+        esperado = float("nan") if du is None else interp(du)
+        if math.isnan(esperado):
+            assert taxa is None
+        else:
+            assert taxa == pytest.approx(esperado, rel=1e-12)
+
+
+def test_interpolar_expr_curva_com_um_vertice():
+    interp = Interpolador([10], [0.12], "flat_forward")
+    df = pl.DataFrame({"du": [5, 10, 15]})
+    resultado = df.select(taxa=interp.interpolar_expr("du"))["taxa"]
+    assert resultado.to_list() == [0.12, 0.12, None]
+
+
+def test_interpolar_expr_em_lazyframe():
+    interp = Interpolador([30, 60, 90], [0.045, 0.05, 0.055], "linear")
+    resultado = (
+        pl.LazyFrame({"du": [45, 60, 75]})
+        .select(taxa=interp.interpolar_expr("du"))
+        .collect()["taxa"]
+    )
+    assert resultado.to_list() == pytest.approx([0.0475, 0.05, 0.0525])
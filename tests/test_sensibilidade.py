@@ -0,0 +1,195 @@
+import datetime as dt
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from pyield import Interpolador, du, ntnf, sensibilidade
+
+DATA = dt.date(2025, 1, 2)
+CURVA = pl.DataFrame(
+    {
+        "dias_uteis": [21, 126, 252, 504, 756, 1260],
+        "taxa": [0.1225, 0.1398, 0.1481, 0.1472, 0.1455, 0.1430],
+    }
+)
+
+
+@pytest.fixture
+def instrumentos():
+    return pl.DataFrame(
+        {
+            "instrumento": ["LTN", "NTN-F", "DI1", "LTN", "DI1"],
+            "data_vencimento": [
+                dt.date(2026, 1, 1),
+                dt.date(2031, 1, 1),
+                dt.date(2027, 7, 1),
+                dt.date(2032, 1, 1),
+                dt.date(2025, 2, 3),
+            ],
+        }
+    )
+
+
+def _pu_escalar(instrumento, vencimento, taxas):
+    """PU pela curva informada, um fluxo por vez com o Interpolador."""
+    interpolador = Interpolador(CURVA["dias_uteis"], taxas, "flat_forward", True)
+    if instrumento == "NTN-F":
+        fluxos = ntnf.fluxos_caixa(DATA, vencimento)
+        datas, valores = fluxos["data_pagamento"], fluxos["valor_pagamento"]
+    else:
+        datas = [vencimento]
+        valores = [100_000.0 if instrumento == "DI1" else 1000.0]
+    return sum(
+        valor / (1 + interpolador(prazo)) ** (prazo / 252)
+        for valor, prazo in zip(valores, du.contar(DATA, datas), strict=True)
+    )
+
+
+def test_dv01_vertices_equivale_a_reprecificar_cada_vertice(instrumentos):
+    resultado = sensibilidade.dv01_vertices(instrumentos, DATA, CURVA)
+
+    nomes = [str(v) for v in CURVA["dias_uteis"]]
+    assert resultado.columns == [*instrumentos.columns, "pu", *nomes]
+    for linha in resultado.iter_rows(named=True):
+        args = linha["instrumento"], linha["data_vencimento"]
+        base = _pu_escalar(*args, CURVA["taxa"])
+        assert linha["pu"] == pytest.approx(base, rel=1e-12)
+        for i, nome in enumerate(nomes):
+            taxas = CURVA["taxa"].scatter(i, CURVA["taxa"][i] + 0.0001)
+            esperado = base - _pu_escalar(*args, taxas)
+            assert linha[nome] == pytest.approx(esperado, rel=1e-8, abs=1e-9)
+
+
+def test_dv01_vertices_soma_proxima_ao_choque_paralelo(instrumentos):
+    resultado = sensibilidade.dv01_vertices(instrumentos, DATA, CURVA)
+    nomes = [str(v) for v in CURVA["dias_uteis"]]
+
+    for linha in resultado.iter_rows(named=True):
+        args = linha["instrumento"], linha["data_vencimento"]
+        paralelo = linha["pu"] - _pu_escalar(*args, CURVA["taxa"] + 0.0001)
+        soma = sum(linha[nome] for nome in nomes)
+        assert soma == pytest.approx(paralelo, rel=1e-3)
+
+
+def test_dv01_vertices_curva_pre(instrumentos, monkeypatch):
+    curva_pre = CURVA.rename({"taxa": "taxa_zero"})
+    monkeypatch.setattr(sensibilidade, "curva_pre", lambda data: curva_pre)
+
+    resultado = sensibilidade.dv01_vertices(instrumentos, DATA)
+
+    esperado = sensibilidade.dv01_vertices(instrumentos, DATA, CURVA)
+    assert_frame_equal(resultado, esperado)
+
+
+def test_dv01_vertices_instrumento_vencido(instrumentos):
+    vencido = instrumentos.with_columns(data_vencimento=pl.lit(DATA))
+    resultado = sensibilidade.dv01_vertices(vencido, DATA, CURVA)
+
+    assert resultado.drop(instrumentos.columns).null_count().row(0) == (5,) * 7
+
+
+def test_dv01_vertices_valida_entradas(instrumentos):
+    with pytest.raises(ValueError, match="instrumento"):
+        sensibilidade.dv01_vertices(instrumentos.drop("instrumento"), DATA, CURVA)
+    with pytest.raises(ValueError, match="NTN-B"):
+        sensibilidade.dv01_vertices(
+            instrumentos.with_columns(instrumento=pl.lit("NTN-B")), DATA, CURVA
+        )
+    with pytest.raises(ValueError, match="curva deve ser"):
+        sensibilidade.dv01_vertices(instrumentos, DATA, "NTN-B")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="vértices válidos"):
+        sensibilidade.dv01_vertices(instrumentos, DATA, CURVA.clear())
+
+
+def test_cenarios_equivale_a_curva_chocada(instrumentos):
+    choques = pl.DataFrame(
+        {
+            "cenario": ["paralelo", "inclinacao"],
+            "126": [0.01, -0.002],
+            "756": [0.01, 0.004],
+        }
+    )
+    resultado = sensibilidade.cenarios(instrumentos, DATA, choques, CURVA)
+
+    assert resultado["cenario"].to_list() == ["paralelo"] * 5 + ["inclinacao"] * 5
+    # Choque constante fora dos prazos informados e linear entre eles
+    prazos = CURVA["dias_uteis"]
+    choque_inclinacao = (-0.002 + (prazos - 126) / 630 * 0.006).clip(-0.002, 0.004)
+    taxas = {
+        "paralelo": CURVA["taxa"] + 0.01,
+        "inclinacao": CURVA["taxa"] + choque_inclinacao,
+    }
+    for linha in resultado.iter_rows(named=True):
+        args = linha["instrumento"], linha["data_vencimento"]
+        pu = _pu_escalar(*args, taxas[linha["cenario"]])
+        assert linha["pu"] == pytest.approx(pu, rel=1e-12)
+        variacao = pu - _pu_escalar(*args, CURVA["taxa"])
+        assert linha["variacao"] == pytest.approx(variacao, rel=1e-8)
+        assert linha["resultado"] == linha["variacao"]
+
+
+def test_cenarios_reproduz_dv01_vertices(instrumentos):
+    nomes = [str(v) for v in CURVA["dias_uteis"]]
+    # Um cenário por vértice, com 1 bp só nesse vértice
+    choques = pl.DataFrame(
+        {"cenario": nomes} | {n: [0.0001 * (n == c) for c in nomes] for n in nomes}
+    )
+    resultado = sensibilidade.cenarios(instrumentos, DATA, choques, CURVA)
+    matriz = sensibilidade.dv01_vertices(instrumentos, DATA, CURVA)
+
+    for nome in nomes:
+        variacao = resultado.filter(pl.col("cenario") == nome)["variacao"]
+        esperado = -matriz[nome].drop_nulls()
+        assert variacao.to_list() == pytest.approx(esperado.to_list(), abs=1e-9)
+
+
+def test_cenarios_agregado(instrumentos):
+    instrumentos = instrumentos.with_columns(quantidade=pl.Series([10, -3, 2, 5, 1]))
+    choques = pl.DataFrame(
+        {"cenario": [3, 1, 2], "252": [0.01, None, -0.01], "1260": [0.02, None, 0.0]}
+    )
+    detalhe = sensibilidade.cenarios(instrumentos, DATA, choques, CURVA)
+    agregado = sensibilidade.cenarios(instrumentos, DATA, choques, CURVA, agregar=True)
+
+    assert agregado.columns == ["cenario", "financeiro", "resultado"]
+    assert agregado["cenario"].to_list() == [3, 1, 2]
+    somas = detalhe.group_by("cenario", maintain_order=True).agg(
+        pl.col("financeiro", "resultado").sum()
+    )
+    assert_frame_equal(agregado, somas)
+    # O cenário sem choques reprecifica pela curva base
+    assert agregado["resultado"][1] == pytest.approx(0, abs=1e-9)
+
+
+def test_cenarios_valida_choques(instrumentos):
+    with pytest.raises(ValueError, match="'cenario'"):
+        sensibilidade.cenarios(instrumentos, DATA, pl.DataFrame({"252": [0.01]}), CURVA)
+    with pytest.raises(ValueError, match="únicos"):
+        sensibilidade.cenarios(
+            instrumentos,
+            DATA,
+            pl.DataFrame({"cenario": ["a", "a"], "252": [0.01, 0.02]}),
+            CURVA,
+        )
+    with pytest.raises(ValueError, match="prazos em dias úteis"):
+        sensibilidade.cenarios(
+            instrumentos, DATA, pl.DataFrame({"cenario": ["a"], "1a": [0.01]}), CURVA
+        )
+
+
+@pytest.mark.parametrize("choque", [None, 0.01])
+def test_cenarios_ultimo_cenario_sem_choques(instrumentos, choque):
+    choques = pl.DataFrame(
+        {"cenario": ["a", "b"], "252": [choque, None]},
+        schema={"cenario": pl.String, "252": pl.Float64},
+    )
+    detalhe = sensibilidade.cenarios(instrumentos, DATA, choques, CURVA)
+    agregado = sensibilidade.cenarios(instrumentos, DATA, choques, CURVA, agregar=True)
+
+    # O cenário sem choques é reprecificado pela curva base, mesmo sendo o último
+    sem_choques = detalhe.filter(pl.col("cenario") == "b")
+    assert sem_choques.height == 5  # noqa: PLR2004
+    assert sem_choques["variacao"].to_list() == pytest.approx([0.0] * 5, abs=1e-9)
+    assert sem_choques["financeiro"].sum() == pytest.approx(agregado["financeiro"][1])
+    assert agregado["financeiro"][1] > 0
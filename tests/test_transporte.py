@@ -0,0 +1,128 @@
+import importlib
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import pyield as yd
+
+retry = importlib.import_module("pyield._internal.retry")
+transporte = importlib.import_module("pyield._internal.transporte")
+
+
+class _Servidor(BaseHTTPRequestHandler):
+    """Servidor local que falha nas primeiras ``falhas`` requisições com 503."""
+
+    protocol_version = "HTTP/1.1"  # mantém a conexão aberta entre requisições
+    falhas = 0
+    requisicoes: list[str] = []
+    cookies: list[str | None] = []
+
+    def do_GET(self):
+        self.requisicoes.append(self.path)
+        self.cookies.append(self.headers.get("Cookie"))
+        if self.path == "/inexistente":
+            self._responder(HTTPStatus.NOT_FOUND)
+        elif self.path == "/login":
+            self._responder(
+                HTTPStatus.FOUND,
+                cabecalhos={"Set-Cookie": "sessao=1", "Location": "/dados"},
+            )
+        elif _Servidor.falhas > 0:
+            _Servidor.falhas -= 1
+            self._responder(HTTPStatus.SERVICE_UNAVAILABLE)
+        else:
+            self._responder(HTTPStatus.OK, b"ok")
+
+    def _responder(
+        self,
+        status: int,
+        conteudo: bytes = b"",
+        cabecalhos: dict[str, str] | None = None,
+    ):
+        self.send_response(status)
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+        self.send_header("Content-Length", str(len(conteudo)))
+        self.end_headers()
+        self.wfile.write(conteudo)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servidor(monkeypatch):
+    _Servidor.falhas = 0
+    _Servidor.requisicoes = []
+    _Servidor.cookies = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Servidor)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setattr(retry, "_calcular_tempo_espera", lambda _tentativa: 0)
+    transporte.fechar()
+    host, porta = httpd.server_address
+    yield f"{host}:{porta}"
+    transporte.fechar()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_requisicoes_reaproveitam_a_conexao(servidor):
+    for _ in range(5):
+        assert transporte.get(f"http://{servidor}/dados", timeout=5).text == "ok"
+
+    metricas = transporte.metricas().to_dicts()
+    assert len(metricas) == 1
+    assert metricas[0]["host"] == servidor
+    assert metricas[0]["requisicoes"] == 5  # noqa: PLR2004
+    assert metricas[0]["conexoes_abertas"] == 1
+    assert metricas[0]["conexoes_reaproveitadas"] == 4  # noqa: PLR2004
+    assert metricas[0]["latencia_maxima"] > 0
+
+
+def test_retry_padrao_em_erro_transitorio(servidor):
+    _Servidor.falhas = 2
+
+    resposta = transporte.get(f"http://{servidor}/dados", timeout=5)
+
+    assert resposta.text == "ok"
+    metricas = transporte.metricas().to_dicts()[0]
+    assert metricas["requisicoes"] == 3  # noqa: PLR2004
+    assert metricas["falhas"] == 2  # noqa: PLR2004
+
+
+def test_erro_definitivo_nao_repete(servidor):
+    with pytest.raises(requests.HTTPError):
+        transporte.get(f"http://{servidor}/inexistente", timeout=5)
+
+    assert _Servidor.requisicoes == ["/inexistente"]
+
+
+def test_limite_de_taxa_por_host(servidor):
+    transporte.configurar(servidor, requisicoes_por_segundo=20, rajada=2)
+
+    inicio = time.perf_counter()
+    for _ in range(6):
+        transporte.get(f"http://{servidor}/dados", timeout=5)
+    decorrido = time.perf_counter() - inicio
+
+    # 2 requisições da rajada e 4 espaçadas de 1/20 s
+    assert decorrido >= 0.19  # noqa: PLR2004
+
+
+def test_cookies_valem_so_para_a_propria_requisicao(servidor):
+    transporte.get(f"http://{servidor}/login", timeout=5)
+    transporte.get(f"http://{servidor}/dados", timeout=5)
+
+    assert _Servidor.requisicoes == ["/login", "/dados", "/dados"]
+    # O redirecionamento recebe o cookie; a chamada seguinte, não
+    assert _Servidor.cookies == [None, "sessao=1", None]
+
+
+def test_rede_expoe_configuracao_e_metricas():
+    assert yd.rede.configurar is transporte.configurar
+    assert yd.rede.metricas is transporte.metricas
+    assert yd.rede.fechar is transporte.fechar
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+import pyield as yd
+
+CAMINHO_PARQUET = Path(__file__).parent / "data" / "tpf_20260206.parquet"
+
+
+@pytest.fixture
+def painel_tpf() -> pl.DataFrame:
+    """Taxas de TPF em dez pregões derivados do arquivo de 06-02-2026.
+
+    Cada pregão soma 1 bp às taxas do anterior, a partir de 02-02-2026.
+    """
+    base = pl.read_parquet(CAMINHO_PARQUET)
+    datas = yd.du.gerar("02-02-2026", "13-02-2026")
+    return pl.concat(
+        base.with_columns(
+            data_referencia=pl.lit(data),
+            taxa_indicativa=pl.col("taxa_indicativa") + i * 0.0001,
+        )
+        for i, data in enumerate(datas)
+    )
@@ -0,0 +1,141 @@
+import datetime as dt
+
+import polars as pl
+import pytest
+
+from pyield import lft, ltn, ntnb, ntnc, ntnf
+from pyield.tpf import carteira
+
+LIQUIDACAO = dt.date(2025, 3, 26)
+VNA_NTNB = 4_495.419721
+VNA_NTNC = 7_245.611463
+VNA_LFT = 16_044.927487
+
+
+@pytest.fixture
+def posicoes():
+    return pl.DataFrame(
+        {
+            "titulo": ["LTN", "NTN-F", "NTN-B", "NTN-C", "LFT", "LTN"],
+            "data_vencimento": [
+                dt.date(2032, 1, 1),
+                dt.date(2035, 1, 1),
+                dt.date(2045, 5, 15),
+                dt.date(2031, 1, 1),
+                dt.date(2029, 3, 1),
+                dt.date(2032, 1, 1),
+            ],
+            "quantidade": [1_000, -500, 200, 50, 30, 400],
+            "taxa": [0.15097, 0.14933, 0.07254, 0.06812, 0.00105, 0.15097],
+            "vna": [None, None, VNA_NTNB, VNA_NTNC, VNA_LFT, None],
+        }
+    )
+
+
+def _esperado(titulo, vencimento, taxa, vna):
+    if titulo == "LTN":
+        pu = ltn.pu(LIQUIDACAO, vencimento, taxa)
+        return pu, ltn.dv01(LIQUIDACAO, vencimento, taxa, pu)
+    if titulo == "NTN-F":
+        pu = ntnf.pu(LIQUIDACAO, vencimento, taxa)
+        return pu, ntnf.dv01(LIQUIDACAO, vencimento, taxa, pu)
+    if titulo == "LFT":
+        return lft.pu(vna, lft.cotacao(LIQUIDACAO, vencimento, taxa)), None
+    modulo = ntnb if titulo == "NTN-B" else ntnc
+    pu = modulo.pu(vna, modulo.cotacao(LIQUIDACAO, vencimento, taxa))
+    return pu, modulo.dv01(LIQUIDACAO, vencimento, taxa, pu)
+
+
+def test_precificar_equivale_as_funcoes_escalares(posicoes):
+    resultado = carteira.precificar(posicoes, LIQUIDACAO)
+
+    assert resultado.columns[: len(posicoes.columns)] == posicoes.columns
+    for linha in resultado.iter_rows(named=True):
+        pu, dv01 = _esperado(
+            linha["titulo"], linha["data_vencimento"], linha["taxa"], linha["vna"]
+        )
+        assert linha["pu"] == float(pu)
+        if dv01 is not None:
+            assert linha["dv01"] == pytest.approx(dv01, rel=1e-12)
+        assert linha["financeiro"] == pytest.approx(float(pu) * linha["quantidade"])
+
+
+def test_precificar_obtem_taxa_pelo_pu(posicoes):
+    precificadas = carteira.precificar(posicoes, LIQUIDACAO)
+    pelo_pu = carteira.precificar(
+        precificadas.select("titulo", "data_vencimento", "quantidade", "pu", "vna"),
+        LIQUIDACAO,
+    )
+
+    diferenca = (pelo_pu["taxa"] - posicoes["taxa"]).abs().max()
+    assert diferenca < 1e-6  # noqa: PLR2004
+    assert pelo_pu["pu"].equals(precificadas["pu"])
+
+
+def test_dv01_fluxos_soma_dv01_pela_duration(posicoes):
+    precificadas = carteira.precificar(posicoes, LIQUIDACAO)
+    vertices = carteira.dv01_fluxos(posicoes, LIQUIDACAO)
+
+    soma = vertices.group_by("id_posicao").agg(pl.col("dv01").sum()).sort("id_posicao")
+    esperado = (
+        precificadas["pu"]
+        * precificadas["duration"]
+        / (1 + precificadas["taxa"])
+        * 0.0001
+    )
+    # Na NTN-F, NTN-B e NTN-C a duration de Macaulay usa os mesmos pesos
+    assert soma["dv01"].to_list() == pytest.approx(esperado.to_list(), rel=1e-9)
+    assert set(vertices["vertice"]) <= set(carteira.VERTICES_PADRAO)
+
+
+def test_dv01_fluxos_agregado(posicoes):
+    detalhado = carteira.dv01_fluxos(posicoes, LIQUIDACAO, vertices=[252, 1260])
+    agregado = carteira.dv01_fluxos(
+        posicoes, LIQUIDACAO, vertices=[252, 1260], agregar=True
+    )
+
+    assert agregado.columns == ["titulo", "vertice", "dv01_financeiro"]
+    assert agregado["titulo"].unique(maintain_order=True).to_list() == [
+        "LTN",
+        "NTN-F",
+        "NTN-B",
+        "NTN-C",
+        "LFT",
+    ]
+    assert agregado["dv01_financeiro"].sum() == pytest.approx(
+        detalhado["dv01_financeiro"].sum()
+    )
+
+
+def test_precificar_valida_entradas(posicoes):
+    with pytest.raises(ValueError, match="quantidade"):
+        carteira.precificar(posicoes.drop("quantidade"), LIQUIDACAO)
+    with pytest.raises(ValueError, match="'taxa' ou 'pu'"):
+        carteira.precificar(posicoes.drop("taxa"), LIQUIDACAO)
+    with pytest.raises(ValueError, match="liquidação"):
+        carteira.precificar(posicoes)
+    with pytest.raises(ValueError, match="NTN-D"):
+        carteira.precificar(posicoes.with_columns(titulo=pl.lit("NTN-D")), LIQUIDACAO)
+    with pytest.raises(ValueError, match="vértices"):
+        carteira.dv01_fluxos(posicoes, LIQUIDACAO, vertices=[0, 252])
+
+
+def test_precificar_busca_vna_ausente(posicoes, monkeypatch):
+    datas = []
+
+    def vna_serie(datas_liquidacao):
+        datas.extend(datas_liquidacao)
+        return pl.DataFrame({"data": datas_liquidacao, "vna": VNA_LFT})
+
+    monkeypatch.setattr(carteira.lft, "vna_serie", vna_serie)
+    lfts = posicoes.filter(pl.col("titulo") == "LFT")
+    pelo_pu = carteira.precificar(
+        carteira.precificar(lfts, LIQUIDACAO).select(
+            "titulo", "data_vencimento", "quantidade", "pu"
+        ),
+        LIQUIDACAO,
+    )
+
+    assert datas == [LIQUIDACAO]
+    assert pelo_pu["vna"].to_list() == [VNA_LFT]
+    assert pelo_pu["taxa"].item() == pytest.approx(lfts["taxa"].item(), abs=1e-6)
@@ -0,0 +1,46 @@
+import importlib
+
+import polars as pl
+import pytest
+
+import pyield as yd
+
+modulo_tpf_taxas = importlib.import_module("pyield.tpf._taxas")
+
+
+@pytest.fixture
+def historico(painel_tpf, monkeypatch):
+    """Histórico de taxas servido pelo painel de dez pregões."""
+    monkeypatch.setattr(modulo_tpf_taxas, "_obter_historico", painel_tpf.lazy)
+    return painel_tpf
+
+
+def test_curva_pre_historica_equivale_a_curva_pre_por_data(historico):
+    resultado = yd.tpf.curva_pre_historica("02-02-2026", "13-02-2026")
+
+    assert resultado["data_referencia"].n_unique() == 10  # noqa: PLR2004
+    for data in resultado["data_referencia"].unique():
+        esperado = yd.tpf.curva_pre(data)
+        obtido = resultado.filter(pl.col("data_referencia") == data)
+        assert obtido["data_vencimento"].equals(esperado["data_vencimento"])
+        assert obtido["dias_uteis"].equals(esperado["dias_uteis"])
+        diferenca = (obtido["taxa_zero"] - esperado["taxa_zero"]).abs().max()
+        assert diferenca < 1e-12  # noqa: PLR2004
+
+
+def test_curva_pre_historica_com_processos(historico):
+    sequencial = yd.tpf.curva_pre_historica()
+    paralelo = yd.tpf.curva_pre_historica(processos=2)
+
+    assert paralelo.equals(sequencial)
+
+
+def test_curva_pre_historica_sem_ltn(historico, monkeypatch):
+    sem_ltn = historico.filter(
+        (pl.col("titulo") != "LTN") | (pl.col("data_referencia") != pl.date(2026, 2, 9))
+    )
+    monkeypatch.setattr(modulo_tpf_taxas, "_obter_historico", sem_ltn.lazy)
+
+    with pytest.raises(ValueError, match="2026-02-09"):
+        yd.tpf.curva_pre_historica()
+    assert yd.tpf.curva_pre_historica(fim="01-01-2026").is_empty()
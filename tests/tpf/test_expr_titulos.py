@@ -1,3 +1,5 @@
+import math
+
 import polars as pl
 import pytest
 
@@ -171,3 +173,133 @@ def test_ntnc_exprs_batem_com_calculos_escalares():
     assert resultado["dv01"][0] == pytest.approx(
         ntnc.dv01(data_liquidacao, data_vencimento, taxa, pu)
     )
+
+
+def test_ntnb_taxa_expr_identica_ao_calculo_escalar():
+    linhas = [
+        ("31-05-2024", "15-05-2035", 4299.160173, 4271.864805),
+        ("15-08-2024", "15-08-2032", 4315.498383, 4343.156412),
+        ("21-05-2008", "15-08-2010", 1728.461136, 1781.867128),
+        ("26-03-2025", "15-08-2060", 4470.979474, 4138.507161),
+        ("15-05-2025", "15-05-2025", 4470.979474, 4138.507161),
+        ("26-03-2025", "15-08-2060", 4470.979474, 0.0),
+    ]
+    df = pl.DataFrame(
+        linhas,
+        schema=["data_liquidacao", "data_vencimento", "vna", "pu"],
+        orient="row",
+    )
+
+    resultado = df.select(
+        taxa=ntnb.taxa_expr("data_liquidacao", "data_vencimento", "vna", "pu")
+    )["taxa"]
+
+    esperado = pl.Series([ntnb.taxa(*linha) for linha in linhas])
+    assert resultado.to_list()[:4] == esperado.to_list()[:4]
+    assert resultado[4:].is_nan().all()
+    assert esperado[4:].is_nan().all()
+
+
+def test_ntnc_taxa_expr_identica_ao_calculo_escalar():
+    linhas = [
+        ("21-03-2025", "01-01-2031", 6598.913723, 8347.348705),
+        ("21-05-2008", "01-03-2011", 2126.473734, 2207.556177),
+        ("21-03-2025", "01-07-2031", 6598.913723, 6701.5),
+    ]
+    df = pl.DataFrame(
+        linhas,
+        schema=["data_liquidacao", "data_vencimento", "vna", "pu"],
+        orient="row",
+    )
+
+    resultado = df.select(
+        taxa=ntnc.taxa_expr("data_liquidacao", "data_vencimento", "vna", "pu")
+    )["taxa"]
+
+    assert resultado.to_list() == [ntnc.taxa(*linha) for linha in linhas]
+
+
+def test_ntnf_taxa_expr_identica_ao_calculo_escalar():
+    linhas = [
+        ("13-03-2026", "01-01-2035", 820.995125),
+        ("21-05-2008", "01-01-2014", 903.039091),
+        ("26-03-2025", "01-01-2027", 1000.0),
+        ("26-03-2025", "01-01-2035", 780.123456),
+    ]
+    lf = pl.LazyFrame(
+        linhas, schema=["data_liquidacao", "data_vencimento", "pu"], orient="row"
+    )
+
+    resultado = lf.select(
+        taxa=ntnf.taxa_expr("data_liquidacao", "data_vencimento", "pu")
+    ).collect()["taxa"]
+
+    assert resultado.to_list() == [ntnf.taxa(*linha) for linha in linhas]
+
+
+def test_ntnf_rentabilidade_e_premio_limpo_expr_identicos_ao_escalar():
+    data_liquidacao = "23-08-2024"
+    vencimentos_di = ["2025-01-01", "2030-01-01", "2035-01-01"]
+    taxas_di = [0.10823, 0.11594, 0.11531]
+    linhas = [
+        ("01-01-2027", 0.112345),
+        ("01-01-2031", 0.116586),
+        ("01-01-2035", 0.116586),
+        ("01-01-2037", 0.118),
+    ]
+    df = pl.DataFrame(linhas, schema=["data_vencimento", "taxa"], orient="row")
+
+    resultado = df.select(
+        rentabilidade=ntnf.rentabilidade_expr(
+            data_liquidacao, "data_vencimento", "taxa", vencimentos_di, taxas_di
+        ),
+        premio_limpo=ntnf.premio_limpo_expr(
+            data_liquidacao, "data_vencimento", "taxa", vencimentos_di, taxas_di
+        ),
+    )
+
+    for i, (vencimento, taxa) in enumerate(linhas):
+        argumentos = (data_liquidacao, vencimento, taxa, vencimentos_di, taxas_di)
+        esperado_rent = ntnf.rentabilidade(*argumentos)
+        obtido_rent = resultado["rentabilidade"][i]
+        assert obtido_rent == esperado_rent or (
+            math.isnan(obtido_rent) and math.isnan(esperado_rent)
+        )
+        assert resultado["premio_limpo"][i] == ntnf.premio_limpo(*argumentos)
+
+
+@pytest.mark.parametrize(
+    ("titulo", "vencimentos"),
+    [
+        (ntnb, ["15-05-2035", "15-08-2060", "15-05-2025", "15-08-2026"]),
+        (ntnf, ["01-01-2035", "01-01-2027", "01-01-2025", "01-01-2029"]),
+        (ntnc, ["01-01-2031", "01-07-2031", "01-01-2025", "01-04-2027"]),
+    ],
+)
+def test_duration_e_dv01_expr_identicos_ao_escalar_em_varias_linhas(
+    titulo, vencimentos
+):
+    linhas = [
+        ("26-03-2025", vencimentos[0], 0.074358, 4138.507161),
+        ("26-03-2025", vencimentos[1], 0.0699, 1234.5),
+        ("26-03-2025", vencimentos[2], 0.1, 1000.0),
+        ("02-09-2024", vencimentos[3], None, 1000.0),
+    ]
+    df = pl.DataFrame(
+        linhas,
+        schema=["data_liquidacao", "data_vencimento", "taxa", "pu"],
+        orient="row",
+    )
+
+    resultado = df.select(
+        duration=titulo.duration_expr("data_liquidacao", "data_vencimento", "taxa"),
+        dv01=titulo.dv01_expr("data_liquidacao", "data_vencimento", "taxa", "pu"),
+    )
+
+    for i, linha in enumerate(linhas):
+        for coluna, esperado in (
+            ("duration", titulo.duration(*linha[:3])),
+            ("dv01", titulo.dv01(*linha)),
+        ):
+            obtido = resultado[coluna][i]
+            assert obtido == esperado or (math.isnan(obtido) and math.isnan(esperado))
@@ -36,6 +36,8 @@ def test_expressoes_rejeitam_prazo_nao_positivo(data_liquidacao: str) -> None:
         }
     ).select(
         duration=ltn.duration_expr("data_liquidacao", "data_vencimento"),
+        pu=ltn.pu_expr("data_liquidacao", "data_vencimento", "taxa"),
+        taxa=ltn.taxa_expr("data_liquidacao", "data_vencimento", "pu"),
         dv01=ltn.dv01_expr(
             "data_liquidacao",
             "data_vencimento",
@@ -45,4 +47,28 @@ def test_expressoes_rejeitam_prazo_nao_positivo(data_liquidacao: str) -> None:
     )
 
     assert math.isnan(df["duration"].item())
+    assert math.isnan(df["pu"].item())
+    assert math.isnan(df["taxa"].item())
     assert math.isnan(df["dv01"].item())
+
+
+def test_expressoes_reproduzem_calculos_escalares() -> None:
+    df = pl.DataFrame(
+        {
+            "data_liquidacao": ["05-07-2024", "21-05-2008", "26-03-2025", "13-03-2026"],
+            "data_vencimento": ["01-01-2030", "01-07-2010", "01-01-2032", "01-01-2027"],
+            "taxa": [0.12145, 0.143600009, 0.150970, 0.148307],
+        }
+    )
+    df = df.with_columns(
+        pu=ltn.pu_expr("data_liquidacao", "data_vencimento", "taxa")
+    ).with_columns(
+        taxa_pu=ltn.taxa_expr("data_liquidacao", "data_vencimento", "pu"),
+        dv01=ltn.dv01_expr("data_liquidacao", "data_vencimento", "taxa", "pu"),
+    )
+
+    for liquidacao, vencimento, taxa, pu, taxa_pu, dv01 in df.iter_rows():
+        pu_escalar = ltn.pu(liquidacao, vencimento, taxa)
+        assert pu == float(pu_escalar)
+        assert taxa_pu == ltn.taxa(liquidacao, vencimento, pu_escalar)
+        assert dv01 == ltn.dv01(liquidacao, vencimento, taxa, pu_escalar)
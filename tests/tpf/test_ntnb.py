@@ -1,4 +1,5 @@
 import datetime as dt
+import importlib
 import math
 from decimal import Decimal
 
@@ -239,6 +240,170 @@ def test_taxas_zero_td_limita_busca_sem_intervalo():
         ntnb_td.taxas_zero(DATA_LIQUIDACAO, VENCIMENTOS, taxas)
 
 
+def test_taxas_zero_reprecificam_a_cotacao_de_cada_vencimento() -> None:
+    curva = yd.ntnb.taxas_zero(
+        DATA_LIQUIDACAO, VENCIMENTOS, TAXAS_TIR, incluir_cupons=True
+    )
+    taxas_zero = dict(zip(curva["data_vencimento"], curva["taxa_zero"], strict=True))
+    anos_uteis = dict(
+        zip(curva["data_vencimento"], curva["dias_uteis"] / 252, strict=True)
+    )
+
+    for vencimento, taxa in zip(VENCIMENTOS[1:], TAXAS_TIR[1:], strict=True):
+        fluxos = yd.ntnb.fluxos_caixa(DATA_LIQUIDACAO, vencimento)
+        vp = sum(
+            valor / (1 + taxas_zero[data]) ** anos_uteis[data]
+            for data, valor in fluxos.iter_rows()
+        )
+        cotacao = float(yd.ntnb.cotacao(DATA_LIQUIDACAO, vencimento, taxa))
+        assert vp == pytest.approx(cotacao, abs=1e-12)
+
+
+@pytest.fixture
+def painel_lote(painel_tpf) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """TIRs de NTN-B e curva LTN do painel de pregões de TPF."""
+    colunas = [
+        "data_referencia",
+        "data_vencimento",
+        pl.col("taxa_indicativa").alias("taxa"),
+    ]
+    return (
+        painel_tpf.filter(pl.col("titulo") == "NTN-B").select(colunas),
+        painel_tpf.filter(pl.col("titulo") == "LTN").select(colunas),
+    )
+
+
+def test_implicitas_lote_equivale_a_implicitas_por_data(painel_lote) -> None:
+    df_tir, df_nominal = painel_lote
+
+    resultado = yd.ntnb.implicitas_lote(df_tir, df_nominal, extrapolar=True)
+
+    assert resultado["data_referencia"].n_unique() == 10  # noqa: PLR2004
+    for data in resultado["data_referencia"].unique():
+        tir = df_tir.filter(pl.col("data_referencia") == data)
+        nominal = df_nominal.filter(pl.col("data_referencia") == data)
+        esperado = yd.ntnb.implicitas(
+            data,
+            tir["data_vencimento"],
+            tir["taxa"],
+            nominal["data_vencimento"],
+            nominal["taxa"],
+            extrapolar=True,
+        )
+        obtido = resultado.filter(pl.col("data_referencia") == data)
+        assert obtido.drop("data_referencia").equals(esperado)
+
+    paralelo = yd.ntnb.implicitas_lote(df_tir, df_nominal, extrapolar=True, processos=2)
+    assert paralelo.equals(resultado)
+
+
+def test_implicitas_lote_vazio(painel_lote) -> None:
+    df_tir, df_nominal = painel_lote
+
+    resultado = yd.ntnb.implicitas_lote(df_tir.clear(), df_nominal)
+
+    assert resultado.is_empty()
+    assert resultado.columns[0] == "data_referencia"
+
+
+def test_taxas_zero_td_lote_equivale_a_taxas_zero_por_data(painel_lote) -> None:
+    df_tir, _ = painel_lote
+
+    resultado = ntnb_td.taxas_zero_lote(df_tir, incluir_vertices=True)
+
+    for data in df_tir["data_referencia"].unique():
+        tir = df_tir.filter(pl.col("data_referencia") == data)
+        esperado = ntnb_td.taxas_zero(
+            data, tir["data_vencimento"], tir["taxa"], incluir_vertices=True
+        )
+        obtido = resultado.filter(pl.col("data_referencia") == data)
+        assert obtido.drop("data_referencia").equals(esperado)
+
+    paralelo = ntnb_td.taxas_zero_lote(df_tir, incluir_vertices=True, processos=2)
+    assert paralelo.equals(resultado)
+    assert ntnb_td.taxas_zero_lote(df_tir.clear()).columns == resultado.columns
+
+
+# Taxas zero da calibração anterior (bisseção com recálculo da curva inteira,
+# tolerância de 1e-12) para as TIRs de NTN-B de 02-02-2026 do painel.
+TAXAS_ZERO_BISSECAO = {
+    dt.date(2026, 2, 6): [
+        0.10250000000163229,
+        0.08244760698335729,
+        0.07782711300617984,
+        0.07665610594345762,
+        0.07690144209908722,
+        0.0766331674258649,
+        0.0766024222128312,
+        0.07667598231834738,
+        0.07542644003770849,
+        0.0752606040698729,
+        0.07337621550459072,
+        0.07186972411707293,
+        0.07054393709321305,
+        0.06940598492367256,
+        0.0703360796569783,
+    ],
+    dt.date(2026, 8, 14): [
+        0.1025,
+        0.08272793032216885,
+        0.07807105654941604,
+        0.07684718363250109,
+        0.07706290037930685,
+        0.07676334377220506,
+        0.07672649314683166,
+        0.07677514994587797,
+        0.07552903517581422,
+        0.07535404356739406,
+        0.07349904284338082,
+        0.07199347234732079,
+        0.07069184482772672,
+        0.06955275406496897,
+        0.0704761396518343,
+    ],
+}
+
+
+@pytest.mark.parametrize("liquidacao", list(TAXAS_ZERO_BISSECAO))
+def test_taxas_zero_td_reproduzem_calibracao_por_bissecao(
+    painel_tpf, liquidacao
+) -> None:
+    ntnbs = painel_tpf.filter(
+        pl.col("data_referencia") == dt.date(2026, 2, 2), pl.col("titulo") == "NTN-B"
+    )
+
+    resultado = ntnb_td.taxas_zero(
+        liquidacao, ntnbs["data_vencimento"], ntnbs["taxa_indicativa"]
+    )
+
+    assert resultado["taxa_zero"].to_list() == pytest.approx(
+        TAXAS_ZERO_BISSECAO[liquidacao], abs=4e-12
+    )
+
+
+def test_taxas_zero_td_recorrem_a_bissecao_quando_newton_falha(monkeypatch) -> None:
+    bootstrap = importlib.import_module("pyield.tpf.titulos._bootstrap_forwards")
+    bissecao = bootstrap._resolver_por_bissecao
+    chamadas = []
+
+    def bissecao_contando(erro, taxa_inicial):
+        chamadas.append(taxa_inicial)
+        return bissecao(erro, taxa_inicial)
+
+    monkeypatch.setattr(bootstrap, "_resolver_por_bissecao", bissecao_contando)
+
+    # Inversão forte: o forward do segundo trecho é muito negativo e Newton,
+    # partindo da TIR, sai do domínio
+    resultado = ntnb_td.taxas_zero(
+        "06-02-2026", ["15-05-2035", "15-08-2040"], [0.30, 0.02]
+    )
+
+    assert chamadas == [0.02]
+    assert resultado["taxa_zero"].to_list() == pytest.approx(
+        [0.29999999999941385, -0.009949090575536501], abs=4e-12
+    )
+
+
 def test_taxas_zero_retornam_vazio_sem_vencimentos_futuros() -> None:
     liquidacao = "17-08-2026"
     vencimentos = ["15-08-2026"]
@@ -80,11 +80,7 @@ def test_buscar_retorna_dados_completos_da_anbima(monkeypatch):
 
 def test_taxas_aplica_regras_publicas_de_tpf(monkeypatch):
     df_completo = pl.read_parquet(CAMINHO_PARQUET)
-    monkeypatch.setattr(
-        modulo_tpf_taxas,
-        "_obter_historico",
-        lambda: df_completo,
-    )
+    monkeypatch.setattr(modulo_tpf_taxas, "_obter_historico", df_completo.lazy)
 
     resultado = yd.tpf.taxas("06-02-2026", titulo="PRE")
 
@@ -110,7 +106,7 @@ def test_taxas_busca_anbima_quando_cache_falha(monkeypatch):
 
 def test_taxas_historicas_aplica_filtros_publicos(monkeypatch):
     df_completo = pl.read_parquet(CAMINHO_PARQUET)
-    monkeypatch.setattr(modulo_tpf_taxas, "_obter_historico", lambda: df_completo)
+    monkeypatch.setattr(modulo_tpf_taxas, "_obter_historico", df_completo.lazy)
 
     resultado = yd.tpf.taxas_historicas(
         inicio="06-02-2026",
@@ -124,6 +120,18 @@ def test_taxas_historicas_aplica_filtros_publicos(monkeypatch):
     assert resultado["data_referencia"].unique().item() == dt.date(2026, 2, 6)
 
 
+def test_taxas_historicas_lazy_equivale_a_versao_eager(monkeypatch):
+    df_completo = pl.read_parquet(CAMINHO_PARQUET)
+    monkeypatch.setattr(modulo_tpf_taxas, "_obter_historico", df_completo.lazy)
+
+    lf = yd.tpf.taxas_historicas_lazy(fim="06-02-2026", titulo="NTN-B")
+
+    assert isinstance(lf, pl.LazyFrame)
+    assert lf.collect().equals(
+        yd.tpf.taxas_historicas(fim="06-02-2026", titulo="NTN-B")
+    )
+
+
 def test_taxas_historicas_rejeita_intervalo_invertido():
     with pytest.raises(ValueError, match="inicio deve ser menor ou igual a fim"):
         yd.tpf.taxas_historicas(inicio="07-02-2026", fim="06-02-2026")
@@ -93,9 +93,11 @@ def test_api_publica_reexporta_implementacao_canonica() -> None:
     assert ntnb.vnas is vna_ntnb.vnas
     assert ntnb.vna is vna_ntnb.vna
     assert ntnb.vna_projetado is vna_ntnb.vna_projetado
+    assert ntnb.vna_serie is vna_ntnb.vna_serie
     assert ntnc.vnas is vna_ntnc.vnas
     assert ntnc.vna is vna_ntnc.vna
     assert ntnc.vna_projetado is vna_ntnc.vna_projetado
+    assert ntnc.vna_serie is vna_ntnc.vna_serie
 
 
 def test_extrair_url_planilha() -> None:
@@ -291,6 +293,95 @@ def test_vna_ntnb_usa_numeros_indice_com_precisao_normativa(
     assert vna_ntnb.vna(data) == Decimal(f"{esperado:.6f}")
 
 
+def test_vna_serie_ntnb_equivale_a_vna_por_data(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        vna_ntnb,
+        "vnas",
+        lambda: pl.DataFrame(
+            {
+                "data": [
+                    dt.date(2025, 12, 15),
+                    dt.date(2026, 1, 15),
+                    dt.date(2026, 7, 15),
+                    dt.date(2026, 8, 15),
+                ],
+                "vna": [
+                    VNA_NTNB_DEZ_2025,
+                    VNA_NTNB_JAN_2026,
+                    VNA_NTNB_JUL_2026,
+                    VNA_NTNB_AGO_2026,
+                ],
+            },
+            schema_overrides={"data": pl.Date},
+        ),
+    )
+    chamadas = []
+
+    def indices(inicio, fim) -> pl.DataFrame:
+        chamadas.append((inicio, fim))
+        return pl.DataFrame(
+            {
+                "periodo": [202511, 202512, 202606, 202607],
+                "indice": [7378.94, 7403.29, 7652.37, 7657.73],
+            }
+        ).filter(
+            pl.col("periodo").is_between(
+                inicio.year * 100 + inicio.month, fim.year * 100 + fim.month
+            )
+        )
+
+    monkeypatch.setattr(vna_ntnb._ipca, "indices", indices)
+    datas = [
+        dt.date(2026, 8, 13),
+        dt.date(2025, 12, 15),
+        None,
+        dt.date(2025, 12, 30),
+        dt.date(2026, 3, 10),
+        dt.date(2026, 8, 14),
+        dt.date(2025, 12, 14),
+    ]
+
+    resultado = vna_ntnb.vna_serie(datas)
+
+    assert len(chamadas) == 1
+    assert resultado["data"].to_list() == datas
+    assert resultado["vna"].to_list()[:2] == [
+        VNA_NTNB_13_AGO_2026,
+        VNA_NTNB_DEZ_2025,
+    ]
+    for data, valor in zip(datas, resultado["vna"], strict=True):
+        assert str(vna_ntnb.vna(data)) == str(Decimal(f"{valor:.6f}"))
+
+
+def test_vna_serie_ntnc_equivale_a_vna_por_data(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        vna_ntnc,
+        "vnas",
+        lambda: pl.DataFrame(
+            {
+                "data": [dt.date(2025, 12, 1), dt.date(2026, 1, 1)],
+                "anos_vencimento": [[2031], [2031]],
+                "vna": [VNA_NTNC_2031_DEZ_2025, VNA_NTNC_2031_JAN_2026],
+            },
+            schema_overrides={"data": pl.Date},
+        ),
+    )
+    datas = [dt.date(2025, 12, 16), dt.date(2025, 12, 1), dt.date(2026, 1, 2)]
+
+    resultado = vna_ntnc.vna_serie(datas, "01-01-2031")
+
+    assert resultado["vna"].to_list()[:2] == [
+        VNA_NTNC_2031_16_DEZ_2025,
+        VNA_NTNC_2031_DEZ_2025,
+    ]
+    assert math.isnan(resultado["vna"][2])
+    assert vna_ntnc.vna_serie(datas, "01-01-2041")["vna"].is_nan().all()
+
+
 def test_vna_ntnc_seleciona_serie_e_calcula_entre_valores_publicados(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None: